@@ -0,0 +1,168 @@
+from datetime import datetime # Olay zamanları için kullanılır.
+from sqlalchemy import event, inspect # SQLAlchemy oturum olayları ve nesne geçmişi için kullanılır.
+from models import db, Course, Lesson, Enrollment, Progress, Assignment, AssignmentSubmission, Quiz, QuizAttempt, ActivityEvent # models.py dosyasındaki modelleri import ediyoruz.
+from cursors import encode_cursor # Sayfalama imleci biçimi
+
+# Olay başlıkları
+TITLES = {
+    'enrollment': 'Yeni Kurs Kaydı',
+    'completion': 'Ders Tamamlandı',
+    'submission': 'Ödev Teslimi',
+    'quiz_attempt': 'Quiz Tamamlandı'
+}
+
+# "<kurs> kursundaki <öğe><ek>" açıklamalarının sonu
+SUFFIXES = {
+    'completion': ' dersini tamamladınız',
+    'submission': ' ödevini teslim ettiniz',
+    'quiz_attempt': ' quizini tamamladınız'
+}
+ENROLLMENT_SUFFIX = ' kursuna kayıt oldunuz'
+
+def describe(kind, course_title, item_title=None): # Canlı olaylar için açıklama metni
+    if kind == 'enrollment':
+        return f'{course_title}{ENROLLMENT_SUFFIX}'
+    return f'{course_title} kursundaki {item_title}{SUFFIXES[kind]}'
+
+def _describe_sql(kind, course_title, item_title=None): # Geri doldurma için aynı metni SQL ifadesi olarak üretir
+    if kind == 'enrollment':
+        return course_title + ENROLLMENT_SUFFIX
+    return course_title + ' kursundaki ' + item_title + SUFFIXES[kind]
+
+def _became(obj, attribute, is_new): # Nesne bu flush'ta ilk kez "tamamlandı" durumuna mı geçti
+    value = getattr(obj, attribute)
+    if not value:
+        return False
+    if is_new:
+        return True
+    history = inspect(obj).attrs[attribute].history
+    return bool(history.added) and not any(history.deleted)
+
+def _event_for(session, obj, is_new): # Yeni/güncellenen nesneden aktivite satırı üretir
+    get = session.get
+    if isinstance(obj, Enrollment) and is_new:
+        course = get(Course, obj.course_id)
+        return obj.student_id, 'enrollment', course, None
+
+    if isinstance(obj, Progress) and _became(obj, 'completed', is_new):
+        enrollment = get(Enrollment, obj.enrollment_id)
+        lesson = get(Lesson, obj.lesson_id)
+        if enrollment and lesson:
+            return enrollment.student_id, 'completion', get(Course, lesson.course_id), lesson.title
+
+    if isinstance(obj, AssignmentSubmission) and is_new:
+        assignment = get(Assignment, obj.assignment_id)
+        lesson = get(Lesson, assignment.lesson_id) if assignment else None
+        if lesson:
+            return obj.user_id, 'submission', get(Course, lesson.course_id), assignment.title
+
+    if isinstance(obj, QuizAttempt) and _became(obj, 'completed_at', is_new):
+        quiz = get(Quiz, obj.quiz_id)
+        lesson = get(Lesson, quiz.lesson_id) if quiz else None
+        if lesson:
+            return obj.user_id, 'quiz_attempt', get(Course, lesson.course_id), quiz.title
+    return None
+
+@event.listens_for(db.session, 'after_flush')
+def _write_activity_events(session, flush_context):
+    rows = []
+    now = datetime.utcnow()
+    for is_new, objects in ((True, session.new), (False, session.dirty)):
+        for obj in objects:
+            found = _event_for(session, obj, is_new)
+            if not found:
+                continue
+            user_id, kind, course, item_title = found
+            course_title = course.title if course else ''
+            rows.append({
+                'user_id': int(user_id),
+                'type': kind,
+                'source_id': obj.id,
+                'course_id': course.id if course else None,
+                'course_title': course_title,
+                'title': TITLES[kind],
+                'description': describe(kind, course_title, item_title),
+                'created_at': now
+            })
+
+    if rows:
+        # Flush sırasında oturuma nesne eklenemez; satırlar aynı bağlantı üzerinden yazılır
+        session.connection().execute(ActivityEvent.__table__.insert(), rows)
+
+def feed(user_id, limit=20, cursor=None, since=None): # Kullanıcının akışını (created_at, id) anahtarıyla sayfalar
+    """Olayları en yeniden eskiye döndürür; (olaylar, sonraki imleç) çifti"""
+    stmt = db.select(ActivityEvent).where(ActivityEvent.user_id == user_id)
+    if since is not None:
+        stmt = stmt.where(ActivityEvent.created_at >= since)
+    if cursor is not None:
+        stmt = stmt.where(db.tuple_(ActivityEvent.created_at, ActivityEvent.id) < cursor)
+
+    events = db.session.scalars(
+        stmt.order_by(ActivityEvent.created_at.desc(), ActivityEvent.id.desc()).limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor(events[-1].created_at, events[-1].id)
+    return events, next_cursor
+
+def _backfill_sources(): # (kaynak model, tür, SELECT kolonları, join'ler, ek koşullar)
+    return [
+        (Enrollment, 'enrollment', [
+            Enrollment.student_id, Course.id, Course.title,
+            _describe_sql('enrollment', Course.title), Enrollment.enrolled_at
+        ], [(Course, Course.id == Enrollment.course_id)], []),
+        (Progress, 'completion', [
+            Enrollment.student_id, Course.id, Course.title,
+            _describe_sql('completion', Course.title, Lesson.title),
+            db.func.coalesce(Progress.completed_at, Progress.updated_at)
+        ], [
+            (Enrollment, Enrollment.id == Progress.enrollment_id),
+            (Lesson, Lesson.id == Progress.lesson_id),
+            (Course, Course.id == Lesson.course_id)
+        ], [Progress.completed == True]),
+        (AssignmentSubmission, 'submission', [
+            AssignmentSubmission.user_id, Course.id, Course.title,
+            _describe_sql('submission', Course.title, Assignment.title), AssignmentSubmission.submitted_at
+        ], [
+            (Assignment, Assignment.id == AssignmentSubmission.assignment_id),
+            (Lesson, Lesson.id == Assignment.lesson_id),
+            (Course, Course.id == Lesson.course_id)
+        ], []),
+        (QuizAttempt, 'quiz_attempt', [
+            QuizAttempt.user_id, Course.id, Course.title,
+            _describe_sql('quiz_attempt', Course.title, Quiz.title), QuizAttempt.completed_at
+        ], [
+            (Quiz, Quiz.id == QuizAttempt.quiz_id),
+            (Lesson, Lesson.id == Quiz.lesson_id),
+            (Course, Course.id == Lesson.course_id)
+        ], [QuizAttempt.completed_at.isnot(None)])
+    ]
+
+def backfill(chunk_size=5000): # Mevcut verilerden activity_events tablosunu doldurur (tekrar çalıştırılabilir)
+    """Her kaynak tablo id aralıkları halinde INSERT ... SELECT ile işlenir; tür başına eklenen satır sayısını döndürür"""
+    inserted = {}
+    for source, kind, columns, joins, criteria in _backfill_sources():
+        inserted[kind] = 0
+        max_id = db.session.scalar(db.select(db.func.max(source.id))) or 0
+        already = db.exists().where(ActivityEvent.type == kind, ActivityEvent.source_id == source.id)
+
+        for start in range(0, max_id, chunk_size):
+            stmt = db.select(
+                columns[0], db.literal(kind), source.id, columns[1], columns[2],
+                db.literal(TITLES[kind]), columns[3], db.func.coalesce(columns[4], db.func.current_timestamp())
+            ).select_from(source)
+            for model, on in joins:
+                stmt = stmt.join(model, on)
+            stmt = stmt.where(source.id > start, source.id <= start + chunk_size, ~already, *criteria)
+
+            result = db.session.execute(
+                db.insert(ActivityEvent).from_select(
+                    ['user_id', 'type', 'source_id', 'course_id', 'course_title', 'title', 'description', 'created_at'],
+                    stmt
+                )
+            )
+            db.session.commit() # Her aralık ayrı işlemde kaydedilir
+            inserted[kind] += max(result.rowcount, 0)
+    return inserted
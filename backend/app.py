@@ -15,6 +15,15 @@ from flask_migrate import Migrate #flask_migrate modülünü import ediyoruz
 from datetime import timedelta #datetime modülünü import ediyoruz
 from dotenv import load_dotenv #dotenv modülünü import ediyoruz
 from config import Config #config modülünü import ediyoruz
+from commands import register_commands #commands modülünü import ediyoruz
+import counters #sayaç olaylarını kaydetmek için counters modülünü import ediyoruz
+import activity_log #aktivite olaylarını kaydetmek için activity_log modülünü import ediyoruz
+import unread_counts #okunmamış bildirim sayaçlarını güncel tutmak için unread_counts modülünü import ediyoruz
+import course_search #kurs arama index'ini güncel tutmak için course_search modülünü import ediyoruz
+import course_suggest #arama önerileri index'i için course_suggest modülünü import ediyoruz
+import course_rank #yeni kurslara sıralama satırı eklemek için course_rank modülünü import ediyoruz
+import course_recommend #silinen kursların komşu satırlarını temizlemek için course_recommend modülünü import ediyoruz
+import quiz_grading #soru/seçenek değişikliklerinde cevap anahtarı sürümünü artırmak için quiz_grading modülünü import ediyoruz
 
 # Ortam değişkenlerini yükle
 load_dotenv()
@@ -78,6 +87,7 @@ def create_app():
     db.init_app(app) #veritabanını başlat
     migrate.init_app(app, db) #veritabanını başlat
     jwt = JWTManager(app) #JWT tokenını başlat
+    register_commands(app) #CLI komutlarını kaydet
 
     # Local uploads dosyalarını serve et
     @app.route('/uploads/<path:filename>')
@@ -187,6 +197,10 @@ def create_app():
             app.logger.info('Database tables created successfully') #veritabanı tablolarını oluştur
         except Exception as e:
             app.logger.error(f'Error creating database tables: {str(e)}') #veritabanı tablolarını oluştur
+        try: #öneri index'ini süreç başlarken oluştur
+            course_suggest.suggester.build()
+        except Exception as e:
+            app.logger.error(f'Error building suggest index: {str(e)}')
     
     @jwt.expired_token_loader #JWT tokenının süresi dolduğunda çalışır
     def expired_token_callback(jwt_header, jwt_payload): #JWT tokenının süresi dolduğunda çalışır
@@ -4,6 +4,7 @@ from sqlalchemy import desc, func #sqlalchemy modülünü import ediyoruz
 import datetime #datetime modülünü import ediyoruz
 from utils import login_required, instructor_required #utils modülünü import ediyoruz
 from flask_jwt_extended import get_jwt #flask_jwt_extended modülünü import ediyoruz
+import notification_outbox #bildirim olaylarını outbox'a yazmak için
 
 assignments = Blueprint('assignments', __name__) #assignments modülünü oluşturuyoruz
 
@@ -225,20 +226,16 @@ def create_assignment(): #create_assignment fonksiyonunu tanımlıyoruz
         )
         
         db.session.add(new_assignment) #new_assignment'i ekle
-        db.session.commit() #commit işlemi yap
+        db.session.flush() #new_assignment.id'nin oluşması için
         
-        # Dersin ait olduğu kursa kayıtlı öğrencilere bildirim gönder
-        enrollments = Enrollment.query.filter_by(course_id=course.id).all() #enrollments'u alıyoruz
-        for enrollment in enrollments: #enrollments'u döngüye sokuyoruz
-            notification = Notification( #notification'u alıyoruz
-                user_id=enrollment.student_id, #user_id'yi alıyoruz
-                course_id=course.id, #course_id'yi alıyoruz
-                type='new_assignment', #type'yi alıyoruz
-                title='Yeni Ödev', #title'yi alıyoruz
-                message=f'"{course.title}" dersinde yeni bir ödev yayınlandı: {new_assignment.title}', #message'yi alıyoruz
-                reference_id=new_assignment.id #reference_id'yi alıyoruz
-            )
-            db.session.add(notification) #notification'i ekle
+        # Bildirim olayı ödevle aynı işlemde outbox'a yazılır
+        notification_outbox.enqueue(
+            course.id, #course_id'yi alıyoruz
+            'new_assignment', #type'yi alıyoruz
+            'Yeni Ödev', #title'yi alıyoruz
+            f'"{course.title}" dersinde yeni bir ödev yayınlandı: {new_assignment.title}', #message'yi alıyoruz
+            reference_id=new_assignment.id #reference_id'yi alıyoruz
+        )
         
         db.session.commit() #commit işlemi yap
         
@@ -0,0 +1,99 @@
+"""Kurs sayfasını beş ayrı istekle ve /courses/<id>/page ile yüklemeyi karşılaştırır.
+
+Kullanım (backend dizininden):
+    python benchmarks/course_page.py --lessons 40 --reviews 2000 --repeat 50
+
+Geçici bir SQLite veritabanına bir kurs, dersleri, değerlendirmeleri ve kayıtlı
+bir öğrencinin ilerlemesini ekler. Önyüzün kullandığı beş çağrı (kurs, dersler,
+değerlendirmeler, kayıt durumu, ilerleme) ile birleşik uç nokta için ortalama
+süre ve sorgu sayısı yazdırılır. Yanıt önbelleği her turda temizlenir
+(soğuk) ya da korunur (önbellekli).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app
+from models import db, User, Course, Lesson, Enrollment, Progress, Review
+from response_cache import cache
+
+def seed(lessons, reviews):
+    db.session.execute(db.insert(User), [
+        {'username': f'kullanici_{i}', 'email': f'kullanici{i}@example.com', 'role': 'instructor' if i == 0 else 'student', 'password_hash': 'x'}
+        for i in range(reviews + 1)
+    ])
+    instructor_id, student_id = db.session.scalars(db.select(User.id).order_by(User.id).limit(2)).all()
+    course = Course(title='Veri Bilimi', description='...', instructor_id=instructor_id)
+    db.session.add(course)
+    db.session.commit()
+    db.session.execute(db.insert(Lesson), [
+        {'title': f'Ders {i}', 'content': 'içerik ' * 2000, 'course_id': course.id, 'order': i}
+        for i in range(lessons)
+    ])
+    enrollment = Enrollment(student_id=student_id, course_id=course.id)
+    db.session.add(enrollment)
+    db.session.commit()
+    lesson_ids = db.session.scalars(db.select(Lesson.id).where(Lesson.course_id == course.id)).all()
+    db.session.execute(db.insert(Progress), [
+        {'enrollment_id': enrollment.id, 'lesson_id': lesson_id, 'completed': i % 2 == 0}
+        for i, lesson_id in enumerate(lesson_ids)
+    ])
+    reviewer_ids = db.session.scalars(db.select(User.id).where(User.role == 'student')).all()
+    db.session.execute(db.insert(Review), [
+        {'course_id': course.id, 'user_id': user_id, 'rating': 1 + user_id % 5, 'comment': 'Güzel kurs'}
+        for user_id in reviewer_ids
+    ])
+    db.session.commit()
+    return course.id, student_id
+
+def measure(client, urls, headers, repeat, cold):
+    statements = []
+    listener = lambda *args: statements.append(1)
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    elapsed = 0.0
+    try:
+        for _ in range(repeat):
+            if cold:
+                cache.clear()
+            started = time.perf_counter()
+            for url in urls:
+                assert client.get(url, headers=headers).status_code == 200, url
+            elapsed += time.perf_counter() - started
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return elapsed / repeat, len(statements) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lessons', type=int, default=40, help='Kurstaki ders sayısı')
+    parser.add_argument('--reviews', type=int, default=2000, help='Kurstaki değerlendirme sayısı')
+    parser.add_argument('--repeat', type=int, default=50, help='Tekrar sayısı')
+    args = parser.parse_args()
+
+    app = create_app()
+    app.logger.disabled = True
+    with app.app_context():
+        course_id, student_id = seed(args.lessons, args.reviews)
+        headers = {'Authorization': f'Bearer {create_access_token(identity=str(student_id))}'}
+        client = app.test_client()
+        sequences = {
+            'beş çağrı': [f'/courses/{course_id}', f'/courses/{course_id}/lessons', f'/courses/{course_id}/reviews',
+                          f'/courses/{course_id}/enrollment-status', f'/enrollments/courses/{course_id}/progress'],
+            '/page': [f'/courses/{course_id}/page'],
+        }
+        print(f'{args.lessons} ders, {args.reviews} değerlendirme')
+        print(f'{"":12}{"soğuk ms":>12}{"sorgu":>8}{"önbellekli ms":>16}{"sorgu":>8}')
+        for name, urls in sequences.items():
+            cold, cold_queries = measure(client, urls, headers, args.repeat, cold=True)
+            warm, warm_queries = measure(client, urls, headers, args.repeat, cold=False)
+            print(f'{name:12}{cold * 1e3:12.2f}{cold_queries:8.1f}{warm * 1e3:16.2f}{warm_queries:8.1f}')
+
+if __name__ == '__main__':
+    main()
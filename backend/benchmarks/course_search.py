@@ -0,0 +1,96 @@
+"""Kurs aramasında ILIKE, tam metin (FTS) ve trigram yollarını karşılaştırır.
+
+Kullanım (backend dizininden):
+    python benchmarks/course_search.py --courses 20000 --repeat 20
+
+Geçici bir SQLite veritabanına Türkçe başlıklı kurslar ekler. Her sorgu için
+ilk 10 sonucun ortalama süresi ve bulunan kurs sayısı yazdırılır. Sorgular
+doğru yazılmış, Türkçe büyük harfli ve yazım hatalı örnekleri içerir.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+from app import create_app
+from models import db, User, Course
+import course_search
+
+SUBJECTS = ['Python', 'İstatistik', 'Işık Tasarımı', 'Çizim', 'Gitar', 'Muhasebe', 'Şan Eğitimi', 'Öğretmenlik',
+            'Veri Bilimi', 'Ağ Güvenliği', 'Fotoğrafçılık', 'Girişimcilik', 'Makine Öğrenmesi', 'Türk Edebiyatı']
+LEVELS = ['Başlangıç', 'Orta', 'İleri']
+WORDS = ['temel', 'uygulamalı', 'proje', 'örnekler', 'sınav', 'hazırlık', 'çalışma', 'kavramlar', 'günlük', 'işler']
+QUERIES = ['python', 'İSTATİSTİK', 'ISIK', 'ogretmenlik', 'pyhton', 'istatisitk', 'fotograf']
+
+def seed(courses):
+    db.session.execute(db.insert(User), [
+        {'username': f'egitmen_{i}', 'email': f'egitmen{i}@example.com', 'role': 'instructor', 'password_hash': 'x'}
+        for i in range(100)
+    ])
+    instructor_ids = db.session.scalars(db.select(User.id)).all()
+    rng = random.Random(42)
+    db.session.execute(db.insert(Course), [
+        {
+            'title': f'{rng.choice(SUBJECTS)} {rng.choice(LEVELS)} {i}',
+            'description': ' '.join(rng.choices(WORDS, k=12)),
+            'instructor_id': rng.choice(instructor_ids)
+        }
+        for i in range(courses)
+    ])
+    db.session.commit()
+    course_search.rebuild() # Toplu ekleme ORM olaylarını atlar
+
+def ilike(text): # Tam metin index'inden önceki search_courses filtresi
+    return (
+        db.select(Course.id).join(User, Course.instructor_id == User.id)
+        .where(db.or_(
+            Course.title.ilike(f'%{text}%'), Course.description.ilike(f'%{text}%'), User.username.ilike(f'%{text}%')
+        ))
+        .order_by(Course.created_at.desc())
+    )
+
+def ranked(search):
+    if search is None:
+        return db.select(Course.id).where(db.false())
+    return db.select(Course.id).join(search, search.c.course_id == Course.id).order_by(search.c.score.desc(), Course.id.desc())
+
+PATHS = {
+    'ilike': ilike,
+    'fts': lambda text: ranked(course_search.match(text)),
+    'trigram': lambda text: ranked(course_search.fuzzy(text)),
+}
+
+def measure(build, text, repeat):
+    total = db.session.scalar(db.select(db.func.count()).select_from(build(text).subquery()))
+    started = time.perf_counter()
+    for _ in range(repeat):
+        db.session.execute(build(text).limit(10)).all()
+    return (time.perf_counter() - started) / repeat, total
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=20000, help='Kurs sayısı')
+    parser.add_argument('--repeat', type=int, default=20, help='Sorgu başına tekrar')
+    args = parser.parse_args()
+
+    app = create_app()
+    app.logger.disabled = True
+    with app.app_context():
+        started = time.perf_counter()
+        seed(args.courses)
+        print(f'{args.courses} kurs, index oluşturma {time.perf_counter() - started:.1f} sn')
+        print(f'{"sorgu":14}' + ''.join(f'{name:>20}' for name in PATHS))
+        for text in QUERIES:
+            cells = []
+            for build in PATHS.values():
+                seconds, total = measure(build, text, args.repeat)
+                cells.append(f'{seconds * 1000:9.2f} ms {total:6d}')
+            print(f'{text:14}' + ''.join(f'{cell:>20}' for cell in cells))
+
+if __name__ == '__main__':
+    main()
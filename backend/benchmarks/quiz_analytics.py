@@ -0,0 +1,106 @@
+"""Quiz soru analizinin büyük deneme sayılarındaki süresini ölçer.
+
+Kullanım (backend dizininden):
+    python benchmarks/quiz_analytics.py --attempts 100000 --questions 20 --repeat 20
+
+Geçici bir SQLite veritabanına bir quiz ve paketli seçimleriyle (quiz_attempt.responses)
+tamamlanmış denemeler ekler. Soruların zorluğu ve öğrencilerin yeteneği rastgele
+seçilir. /analytics için ilk (soğuk) isteğin süresi ve sorgu sayısı, ardından
+önbellekten dönen isteklerin ortalama süresi yazdırılır.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+import numpy as np
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app
+from models import db, User, Course, Lesson, Quiz, QuizQuestion, QuizOption, QuizAttempt
+from quiz_grading import RESPONSE_DTYPE
+
+WRITE_CHUNK = 10000
+
+def seed(attempts, questions, rng):
+    instructor = User(username='egitmen', email='egitmen@example.com', role='instructor', password_hash='x')
+    student = User(username='ogrenci', email='ogrenci@example.com', role='student', password_hash='x')
+    db.session.add_all([instructor, student])
+    db.session.commit()
+    course = Course(title='Veri Bilimi', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    lesson = Lesson(title='Final', content='...', course_id=course.id, order=1)
+    quiz = Quiz(title='Final Sınavı', lesson=lesson)
+    for i in range(questions):
+        question = QuizQuestion(quiz=quiz, question_text=f'Soru {i}', question_type='multiple_choice', points=5)
+        question.options = [QuizOption(option_text=text, is_correct=text == 'A') for text in 'ABCD']
+    db.session.add(quiz)
+    db.session.commit()
+
+    ordered = sorted(quiz.questions, key=lambda q: q.id)
+    question_ids = np.array([q.id for q in ordered], dtype=np.int32)
+    options = np.array([sorted(o.id for o in q.options) for q in ordered], dtype=np.int32) # İlk seçenek doğru
+
+    # Basit madde tepki modeli: yetenek ve zorluk farkına göre doğru cevap olasılığı
+    ability = rng.normal(size=(attempts, 1))
+    difficulty = rng.normal(size=(1, questions))
+    correct = rng.random((attempts, questions)) < 1 / (1 + np.exp(difficulty - ability))
+    picks = np.where(correct, 0, rng.integers(1, 4, size=(attempts, questions)))
+    chosen = options[np.arange(questions), picks]
+
+    started = datetime(2026, 6, 1)
+    for start in range(0, attempts, WRITE_CHUNK):
+        rows = []
+        for i in range(start, min(start + WRITE_CHUNK, attempts)):
+            records = np.empty(questions, dtype=RESPONSE_DTYPE)
+            records['question_id'], records['option_id'] = question_ids, chosen[i]
+            rows.append({'quiz_id': quiz.id, 'user_id': student.id, 'started_at': started,
+                         'completed_at': started + timedelta(seconds=i), 'responses': records.tobytes()})
+        db.session.execute(db.insert(QuizAttempt), rows)
+    db.session.commit()
+    return instructor.id, course.id, lesson.id, quiz.id
+
+def request(client, url, headers):
+    statements = []
+    listener = lambda *args: statements.append(1)
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        started = time.perf_counter()
+        response = client.get(url, headers=headers)
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    assert response.status_code == 200, response.status_code
+    return elapsed, len(statements), response.json
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--attempts', type=int, default=100000, help='Tamamlanmış deneme sayısı')
+    parser.add_argument('--questions', type=int, default=20, help='Quizdeki soru sayısı')
+    parser.add_argument('--repeat', type=int, default=20, help='Önbellekli istek sayısı')
+    args = parser.parse_args()
+
+    app = create_app()
+    app.logger.disabled = True
+    with app.app_context():
+        instructor_id, course_id, lesson_id, quiz_id = seed(args.attempts, args.questions, np.random.default_rng(7))
+        headers = {'Authorization': f'Bearer {create_access_token(identity=str(instructor_id))}'}
+        url = f'/courses/{course_id}/lessons/{lesson_id}/quiz/{quiz_id}/analytics'
+        client = app.test_client()
+
+        cold, cold_queries, data = request(client, url, headers)
+        warm = [request(client, url, headers) for _ in range(args.repeat)]
+        print(f'{data["attempts"]} deneme, {args.questions} soru')
+        print(f'soğuk:      {cold * 1e3:9.1f} ms  {cold_queries} sorgu')
+        print(f'önbellekli: {sum(w[0] for w in warm) / len(warm) * 1e3:9.1f} ms  {warm[0][1]} sorgu')
+        hardest = min(data['questions'], key=lambda q: q['p_value'])
+        print(f'en zor soru: {hardest["text"]} (p={hardest["p_value"]}, ayırt edicilik={hardest["discrimination"]})')
+
+if __name__ == '__main__':
+    main()
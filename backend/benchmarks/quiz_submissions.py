@@ -0,0 +1,111 @@
+"""Sınav bitiminde aynı anda gelen quiz teslimlerini senkron ve kuyruk modunda karşılaştırır.
+
+Kullanım (backend dizininden):
+    python benchmarks/quiz_submissions.py --students 2000 --questions 20 --concurrency 64 --workers 4
+
+Geçici bir SQLite veritabanına bir kurs, quiz ve kayıtlı öğrencileri ekler; her
+öğrenci teslimini `--concurrency` iş parçacığından eşzamanlı gönderir. Her mod
+için tüm teslimlerin yanıtlanma süresi ve istek gecikmesi (p50/p95/en kötü)
+yazdırılır. Kuyruk modunda işçi havuzunun kuyruğu boşaltma süresi ve ilk
+teslimden son puana kadar geçen toplam süre de gösterilir.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+from flask_jwt_extended import create_access_token
+from app import create_app
+from models import db, User, Course, Lesson, Enrollment, Quiz, QuizQuestion, QuizOption, QuizAttempt, QuizAnswer, QuizSubmission, Notification, ActivityEvent
+import quiz_ingest
+
+def seed(students, questions):
+    db.session.execute(db.insert(User), [
+        {'username': f'kullanici_{i}', 'email': f'kullanici{i}@example.com', 'role': 'instructor' if i == 0 else 'student', 'password_hash': 'x'}
+        for i in range(students + 1)
+    ])
+    instructor_id = db.session.scalar(db.select(User.id).where(User.role == 'instructor'))
+    course = Course(title='Veri Bilimi', description='...', instructor_id=instructor_id)
+    db.session.add(course)
+    db.session.commit()
+    lesson = Lesson(title='Final', content='...', course_id=course.id, order=1)
+    quiz = Quiz(title='Final Sınavı', lesson=lesson)
+    for i in range(questions):
+        question = QuizQuestion(quiz=quiz, question_text=f'Soru {i}', question_type='multiple_choice', points=5)
+        question.options = [QuizOption(option_text=text, is_correct=text == 'A') for text in 'ABCD']
+    db.session.add(quiz)
+    db.session.commit()
+    student_ids = db.session.scalars(db.select(User.id).where(User.role == 'student').order_by(User.id)).all()
+    db.session.execute(db.insert(Enrollment), [{'student_id': student_id, 'course_id': course.id} for student_id in student_ids])
+    db.session.commit()
+    options = [sorted(o.id for o in q.options) for q in sorted(quiz.questions, key=lambda q: q.id)]
+    question_ids = sorted(q.id for q in quiz.questions)
+    return course.id, lesson.id, quiz.id, student_ids, question_ids, options
+
+def reset():
+    for model in (QuizSubmission, QuizAnswer, QuizAttempt, Notification, ActivityEvent):
+        db.session.execute(db.delete(model))
+    db.session.commit()
+
+def submit_all(app, url, payloads, concurrency): # Her teslim ayrı istemciyle; (toplam süre, gecikmeler, durum kodları)
+    def send(payload):
+        headers, body = payload
+        started = time.perf_counter()
+        status = app.test_client().post(url, headers=headers, json=body).status_code
+        return time.perf_counter() - started, status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(send, payloads))
+    return time.perf_counter() - started, sorted(r[0] for r in results), {r[1] for r in results}
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=2000, help='Aynı anda teslim eden öğrenci sayısı')
+    parser.add_argument('--questions', type=int, default=20, help='Quizdeki soru sayısı')
+    parser.add_argument('--concurrency', type=int, default=64, help='Eşzamanlı istek gönderen iş parçacığı')
+    parser.add_argument('--workers', type=int, default=4, help='Kuyruk modunda işçi iş parçacığı')
+    parser.add_argument('--batch-size', type=int, default=200, help='İşçinin tek işlemde puanladığı teslim')
+    args = parser.parse_args()
+
+    app = create_app()
+    app.logger.disabled = True
+    with app.app_context():
+        course_id, lesson_id, quiz_id, student_ids, question_ids, options = seed(args.students, args.questions)
+        url = f'/courses/{course_id}/lessons/{lesson_id}/quiz/{quiz_id}/submit'
+        payloads = [(
+            {'Authorization': f'Bearer {create_access_token(identity=str(student_id))}'},
+            {'answers': [{'question_id': question_id, 'selected_option_id': choices[(student_id + i) % 4]}
+                         for i, (question_id, choices) in enumerate(zip(question_ids, options))]}
+        ) for student_id in student_ids]
+
+        print(f'{args.students} öğrenci, {args.questions} soru, {args.concurrency} eşzamanlı istek')
+        print(f'{"":8}{"yanıt sn":>10}{"p50 ms":>9}{"p95 ms":>9}{"max ms":>9}{"işçi sn":>9}{"toplam sn":>11}')
+        for mode in ('sync', 'queue'):
+            reset()
+            app.config['QUIZ_SUBMISSION_MODE'] = mode
+            elapsed, latencies, statuses = submit_all(app, url, payloads, args.concurrency)
+            assert statuses <= {200, 202}, statuses
+            drained = 0.0
+            if mode == 'queue':
+                stats = quiz_ingest.run_pool(app, args.workers, batch_size=args.batch_size)
+                assert stats['graded'] == args.students and not stats['failed'], stats
+                drained = stats['seconds']
+            graded = db.session.scalar(db.select(db.func.count()).select_from(QuizAttempt).where(QuizAttempt.completed_at.isnot(None)))
+            assert graded == args.students, graded
+            print(f'{mode:8}{elapsed:10.2f}{percentile(latencies, 0.5) * 1e3:9.1f}{percentile(latencies, 0.95) * 1e3:9.1f}'
+                  f'{latencies[-1] * 1e3:9.1f}{drained:9.2f}{elapsed + drained:11.2f}')
+            instructor_notifications = db.session.scalar(
+                db.select(db.func.count()).select_from(Notification).where(Notification.type == 'quiz_submitted'))
+            print(f'{"":8}eğitmen bildirimi: {instructor_notifications}')
+
+if __name__ == '__main__':
+    main()
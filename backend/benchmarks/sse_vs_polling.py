@@ -0,0 +1,112 @@
+"""Boşta bekleyen SSE bağlantılarının maliyetini yoklamayla karşılaştırır.
+
+Kullanım (backend dizininden):
+    python benchmarks/sse_vs_polling.py --clients 2000 --poll-interval 60
+
+Geçici bir SQLite veritabanı oluşturur. Yoklama tarafında istemci başına
+unread-count + okunmamış liste isteklerinin ortalama maliyeti ölçülür;
+SSE tarafında aynı sayıda abonenin olduğu toplayıcı turları ölçülür.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+from sqlalchemy import event # SQL sorgularını saymak için
+from flask_jwt_extended import create_access_token
+from app import create_app
+from models import db, User, Course, Notification
+import notification_stream
+
+def seed(clients, per_user):
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    db.session.add(instructor)
+    db.session.commit()
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    db.session.execute(db.insert(User), [
+        {'username': f's{i}', 'email': f's{i}@example.com', 'role': 'student', 'password_hash': 'x'}
+        for i in range(clients)
+    ])
+    user_ids = db.session.scalars(db.select(User.id).where(User.role == 'student')).all()
+    db.session.execute(db.insert(Notification), [
+        {'user_id': user_id, 'course_id': course.id, 'type': 'new_lesson', 'title': 'Ders', 'message': '...', 'is_read': False}
+        for user_id in user_ids for _ in range(per_user)
+    ])
+    db.session.commit()
+    import unread_counts
+    unread_counts.reconcile()
+    return user_ids
+
+class Counter: # Motor üzerinde çalışan sorgu sayısı
+    def __init__(self, engine):
+        self.engine, self.count = engine, 0
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._count)
+        return self
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._count)
+    def _count(self, *args):
+        self.count += 1
+
+def measure_polling(client, user_ids, samples):
+    paths = ['/api/notifications/unread-count', '/courses/notifications/unread?per_page=10']
+    headers = [{'Authorization': f'Bearer {create_access_token(identity=str(user_id))}'} for user_id in user_ids[:samples]]
+    with Counter(db.engine) as counter:
+        started = time.perf_counter()
+        for header in headers:
+            for path in paths:
+                assert client.get(path, headers=header).status_code == 200
+        elapsed = time.perf_counter() - started
+    polls = len(headers) # Bir yoklama = iki istek
+    return elapsed / polls, counter.count / polls
+
+def measure_stream(user_ids, ticks):
+    hub = notification_stream.Hub(notification_stream.LocalBroker())
+    subscriptions = [hub.broker.subscribe(user_id) for user_id in user_ids]
+    hub.tick()
+    with Counter(db.engine) as counter:
+        started = time.perf_counter()
+        for _ in range(ticks):
+            hub.tick()
+            db.session.remove()
+        elapsed = time.perf_counter() - started
+    for user_id, subscription in zip(user_ids, subscriptions):
+        hub.broker.unsubscribe(user_id, subscription)
+    return elapsed / ticks, counter.count / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clients', type=int, default=2000, help='Bağlı istemci sayısı')
+    parser.add_argument('--poll-interval', type=float, default=60, help='Ön yüzün yoklama aralığı (sn)')
+    parser.add_argument('--per-user', type=int, default=20, help='Kullanıcı başına bildirim')
+    parser.add_argument('--samples', type=int, default=200, help='Ölçülecek yoklama sayısı')
+    parser.add_argument('--ticks', type=int, default=50, help='Ölçülecek toplayıcı turu')
+    args = parser.parse_args()
+
+    app = create_app()
+    app.logger.disabled = True
+    with app.app_context():
+        user_ids = seed(args.clients, args.per_user)
+        client = app.test_client()
+
+        poll_seconds, poll_queries = measure_polling(client, user_ids, min(args.samples, len(user_ids)))
+        tick_seconds, tick_queries = measure_stream(user_ids, args.ticks)
+
+    polls_per_second = args.clients / args.poll_interval
+    ticks_per_second = 1 / notification_stream.POLL_SECONDS
+    heartbeat_bytes = args.clients * len(': heartbeat\n\n') / notification_stream.HEARTBEAT_SECONDS
+
+    print(f'{args.clients} boşta istemci, yoklama aralığı {args.poll_interval:g} sn')
+    print(f'{"":10} {"istek/sn":>10} {"sorgu/sn":>10} {"CPU ms/sn":>10}')
+    print(f'{"yoklama":10} {polls_per_second * 2:10.1f} {polls_per_second * poll_queries:10.1f} {polls_per_second * poll_seconds * 1000:10.1f}')
+    print(f'{"sse":10} {0:10.1f} {ticks_per_second * tick_queries:10.1f} {ticks_per_second * tick_seconds * 1000:10.1f}')
+    print(f'SSE heartbeat trafiği: {heartbeat_bytes:.0f} bayt/sn')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Arama önerileri önek index'inin mikro ölçümü.
+
+Kullanım (backend dizininden):
+    python benchmarks/suggest.py --titles 100000 --lookups 20000
+
+Veritabanı kullanmaz: rastgele Türkçe kurs başlıklarıyla PrefixIndex oluşturur,
+oluşturma süresini ve belleğini, 1-6 harflik öneklerin arama gecikme
+yüzdeliklerini ve tek kurs güncellemesinin süresini yazdırır.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from course_suggest import PrefixIndex
+
+SUBJECTS = ['Python', 'İstatistik', 'Işık Tasarımı', 'Çizim', 'Gitar', 'Muhasebe', 'Şan Eğitimi', 'Öğretmenlik',
+            'Veri Bilimi', 'Ağ Güvenliği', 'Fotoğrafçılık', 'Girişimcilik', 'Makine Öğrenmesi', 'Türk Edebiyatı']
+LEVELS = ['Başlangıç', 'Orta', 'İleri', 'Uygulamalı', 'Sertifikalı']
+CATEGORIES = ['yazilim', 'veri', 'muzik', 'sanat', 'is', 'dil', 'egitim']
+
+def rows(count, rng):
+    for i in range(count):
+        yield (i + 1, f'{rng.choice(SUBJECTS)} {rng.choice(LEVELS)} {i}', rng.choice(CATEGORIES),
+               rng.randrange(1000), f'egitmen_{rng.randrange(1000)}')
+
+def percentile(samples, p):
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--titles', type=int, default=100000, help='Kurs sayısı')
+    parser.add_argument('--lookups', type=int, default=20000, help='Ölçülecek arama sayısı')
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    started = time.perf_counter()
+    index = PrefixIndex().load(rows(args.titles, random.Random(42)))
+    build_seconds = time.perf_counter() - started
+    tracemalloc.start() # Ölçüm yavaşlattığından bellek ikinci bir oluşturmada ölçülür
+    PrefixIndex().load(rows(args.titles, random.Random(42)))
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    labels = [label for label in index.labels.values() if label]
+    prefixes = []
+    for _ in range(args.lookups):
+        word = rng.choice(rng.choice(labels).split())
+        prefixes.append(word[:rng.randint(1, 6)])
+
+    samples = []
+    for prefix in prefixes:
+        started = time.perf_counter()
+        index.search(prefix, 10)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+
+    updates = []
+    for course_id in rng.sample(range(1, args.titles + 1), 200):
+        started = time.perf_counter()
+        index.put_course(course_id, f'Yeni Başlık {course_id}', 'veri', 1, 'egitmen_1')
+        updates.append(time.perf_counter() - started)
+    updates.sort()
+
+    print(f'{args.titles} başlık, {len(index.keys)} anahtar, oluşturma {build_seconds:.2f} sn, bellek {memory / 2**20:.1f} MiB')
+    print(f'arama ({args.lookups}): p50 {percentile(samples, 0.5) * 1e6:.1f} µs, '
+          f'p99 {percentile(samples, 0.99) * 1e6:.1f} µs, en çok {samples[-1] * 1e6:.1f} µs')
+    print(f'kurs güncelleme: p50 {percentile(updates, 0.5) * 1e3:.2f} ms, p99 {percentile(updates, 0.99) * 1e3:.2f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+import click # Flask CLI komutları için kullanılır.
+from flask.cli import with_appcontext # Komutların uygulama bağlamında çalışması için kullanılır.
+
+@click.command('db-audit') # Sıcak sorguların planlarını denetler
+@click.option('--verbose', '-v', is_flag=True, help='Tüm sorgu planlarını yazdır.')
+@with_appcontext
+def db_audit_command(verbose):
+    """Kayıtlı sıcak sorgular için EXPLAIN çalıştırır ve tam tablo taramalarını raporlar."""
+    from db_audit import run_audit
+
+    results = run_audit()
+    failed = [result for result in results if not result['ok']]
+
+    for result in results:
+        status = 'OK  ' if result['ok'] else 'SCAN'
+        click.echo(f"[{status}] {result['name']}")
+        lines = result['plan'] if verbose else result['full_scans']
+        for line in lines:
+            click.echo(f'        {line}')
+
+    click.echo(f'{len(results)} sorgu denetlendi, {len(failed)} tanesi tam tarama yapıyor.')
+    if failed:
+        raise SystemExit(1)
+
+@click.command('recount') # Kurs ve ders sayaçlarını yeniden hesaplar
+@click.option('--chunk-size', default=500, show_default=True, help='Her işlemde kontrol edilecek satır sayısı.')
+@click.option('--check', is_flag=True, help='Sadece kontrol et, düzeltme yapma.')
+@with_appcontext
+def recount_command(chunk_size, check):
+    """Sayaç kolonlarını gerçek satır sayılarıyla karşılaştırır ve farklı olanları düzeltir."""
+    from counters import recount
+
+    report = recount(chunk_size=chunk_size, fix=not check)
+    for table, stats in report.items():
+        action = 'hatalı' if check else 'düzeltildi'
+        click.echo(f"{table}: {stats['checked']} satır kontrol edildi, {stats['mismatched']} {action}")
+
+    if check and any(stats['mismatched'] for stats in report.values()):
+        raise SystemExit(1)
+
+@click.command('rebuild-instructor-stats') # Eğitmen istatistik özetlerini baştan hesaplar
+@click.option('--chunk-size', default=200, show_default=True, help='Her işlemde yeniden hesaplanacak eğitmen sayısı.')
+@with_appcontext
+def rebuild_instructor_stats_command(chunk_size):
+    """course_stats, instructor_stats ve instructor_students tablolarını mevcut kayıt ve ilerlemelerden yeniden oluşturur."""
+    from instructor_stats import rebuild
+
+    result = rebuild(chunk_size=chunk_size)
+    click.echo(f"{result['instructors']} eğitmen ve {result['courses']} kurs için istatistikler yeniden oluşturuldu.")
+
+@click.command('backfill-activity') # activity_events tablosunu mevcut verilerden doldurur
+@click.option('--chunk-size', default=5000, show_default=True, help='Her işlemde işlenecek kaynak id aralığı.')
+@with_appcontext
+def backfill_activity_command(chunk_size):
+    """Kayıt, ders tamamlama, ödev teslimi ve quiz denemelerinden eksik aktivite olaylarını oluşturur."""
+    from activity_log import backfill
+
+    inserted = backfill(chunk_size=chunk_size)
+    for kind, count in inserted.items():
+        click.echo(f'{kind}: {count} olay eklendi')
+
+@click.command('notifications-worker') # Outbox'taki bildirim olaylarını alıcılara dağıtır
+@click.option('--once', is_flag=True, help='Bekleyen olaylar bitince çık.')
+@click.option('--claim-size', default=10, show_default=True, help='Tek seferde kiralanacak olay sayısı.')
+@click.option('--batch-size', default=1000, show_default=True, help='Her işlemde bildirim yazılacak alıcı sayısı.')
+@click.option('--lease-seconds', default=60, show_default=True, help='Kira süresi; dolarsa olay başka işçiye geçer.')
+@click.option('--poll-interval', default=1.0, show_default=True, help='Outbox boşken bekleme süresi (saniye).')
+@with_appcontext
+def notifications_worker_command(once, claim_size, batch_size, lease_seconds, poll_interval):
+    """notification_outbox tablosundaki olayları kiralar, alıcılara parça parça yazar ve işlem hızını raporlar."""
+    import time
+    from notification_outbox import drain, default_worker_id
+
+    worker_id = default_worker_id()
+    click.echo(f'Bildirim işçisi başladı: {worker_id}')
+    while True:
+        stats = drain(worker_id, claim_size=claim_size, batch_size=batch_size, lease_seconds=lease_seconds)
+        if stats['events'] or stats['failed']:
+            rate = stats['notifications'] / stats['seconds'] if stats['seconds'] else 0
+            click.echo(
+                f"{stats['events']} olay, {stats['notifications']} bildirim, {stats['failed']} hata "
+                f"({stats['seconds']:.2f} sn, {rate:.0f} bildirim/sn)"
+            )
+        if once:
+            break
+        time.sleep(poll_interval)
+
+@click.command('quiz-worker') # Kuyruktaki quiz teslimlerini toplu puanlar
+@click.option('--once', is_flag=True, help='Bekleyen teslimler bitince çık.')
+@click.option('--workers', default=4, show_default=True, help='Kuyruğu paralel boşaltan iş parçacığı sayısı.')
+@click.option('--batch-size', default=200, show_default=True, help='Tek işlemde puanlanacak teslim sayısı.')
+@click.option('--lease-seconds', default=60, show_default=True, help='Kira süresi; dolarsa teslim başka işçiye geçer.')
+@click.option('--poll-interval', default=1.0, show_default=True, help='Kuyruk boşken bekleme süresi (saniye).')
+@with_appcontext
+def quiz_worker_command(once, workers, batch_size, lease_seconds, poll_interval):
+    """quiz_submission_queue tablosundaki teslimleri kiralar, partiler hâlinde puanlar ve işlem hızını raporlar."""
+    import time
+    from flask import current_app
+    from quiz_ingest import run_pool, default_worker_id
+
+    app = current_app._get_current_object()
+    click.echo(f'Quiz işçisi başladı: {default_worker_id()} ({workers} iş parçacığı)')
+    while True:
+        stats = run_pool(app, workers, batch_size=batch_size, lease_seconds=lease_seconds)
+        if stats['graded'] or stats['failed']:
+            rate = stats['graded'] / stats['seconds'] if stats['seconds'] else 0
+            click.echo(
+                f"{stats['graded']} teslim puanlandı, {stats['batches']} parti, {stats['failed']} hata "
+                f"({stats['seconds']:.2f} sn, {rate:.0f} teslim/sn)"
+            )
+        if once:
+            break
+        time.sleep(poll_interval)
+
+@click.command('reconcile-unread-counts') # Okunmamış bildirim sayaçlarını düzeltir
+@click.option('--chunk-size', default=1000, show_default=True, help='Her işlemde kontrol edilecek kullanıcı sayısı.')
+@click.option('--check', is_flag=True, help='Sadece kontrol et, düzeltme yapma.')
+@with_appcontext
+def reconcile_unread_counts_command(chunk_size, check):
+    """unread_counts tablosunu gerçek okunmamış bildirim sayılarıyla karşılaştırır, eksik ve hatalı satırları düzeltir."""
+    from unread_counts import reconcile
+
+    report = reconcile(chunk_size=chunk_size, fix=not check)
+    action = 'hatalı' if check else 'düzeltildi'
+    click.echo(f"{report['checked']} kullanıcı kontrol edildi, {report['missing']} eksik, {report['mismatched']} {action}")
+
+    if check and (report['missing'] or report['mismatched']):
+        raise SystemExit(1)
+
+@click.command('rebuild-search-index') # Kurs arama index'ini baştan oluşturur
+@click.option('--chunk-size', default=5000, show_default=True, help='Her işlemde indexlenecek kurs id aralığı.')
+@with_appcontext
+def rebuild_search_index_command(chunk_size):
+    """SQLite'ta courses_fts ve course_trigrams tablolarını mevcut kurslardan doldurur (PostgreSQL'de kolonlar üretilmiştir)."""
+    from course_search import rebuild
+
+    total = rebuild(chunk_size=chunk_size)
+    click.echo(f'{total} kurs arama index\'inde.')
+
+@click.command('rank-courses') # Katalog trend puanlarını yeniden hesaplar
+@with_appcontext
+def rank_courses_command():
+    """Son kayıtlar, puan ortalamaları ve tamamlama oranlarından course_rank puanlarını hesaplar."""
+    from course_rank import recompute
+
+    click.echo(f'{recompute()} kursun trend puanı güncellendi.')
+
+@click.command('recommend-courses') # Ortak kayıt komşularını yeniden hesaplar
+@click.option('--top-k', default=20, show_default=True, help='Kurs başına saklanacak komşu sayısı.')
+@with_appcontext
+def recommend_courses_command(top_k):
+    """Kayıtlardan öğrenci x kurs matrisini kurar ve kurs başına en benzer kursları course_neighbors tablosuna yazar."""
+    from course_recommend import recompute
+
+    click.echo(f'{recompute(k=top_k)} komşu satırı yazıldı.')
+
+@click.command('regrade-quiz') # Quiz denemelerini güncel cevap anahtarıyla yeniden puanlar
+@click.argument('quiz_id', type=int)
+@click.option('--chunk-size', default=2000, show_default=True, help='Her işlemde yeniden puanlanacak deneme sayısı.')
+@with_appcontext
+def regrade_quiz_command(quiz_id, chunk_size):
+    """Quizin tamamlanmış denemelerindeki cevapların doğruluk ve puanlarını, ardından deneme puanlarını toplu UPDATE ile yeniden hesaplar."""
+    from quiz_regrade import regrade
+
+    report = regrade(quiz_id, chunk_size=chunk_size)
+    click.echo(
+        f"{report['attempts']} deneme {report['chunks']} parçada yeniden puanlandı: "
+        f"{report['answers']} cevap ve {report['changed']} denemenin puanı değişti."
+    )
+
+def register_commands(app): # Komutları uygulamaya kaydet
+    app.cli.add_command(db_audit_command)
+    app.cli.add_command(recount_command)
+    app.cli.add_command(rebuild_instructor_stats_command)
+    app.cli.add_command(backfill_activity_command)
+    app.cli.add_command(notifications_worker_command)
+    app.cli.add_command(quiz_worker_command)
+    app.cli.add_command(regrade_quiz_command)
+    app.cli.add_command(reconcile_unread_counts_command)
+    app.cli.add_command(rebuild_search_index_command)
+    app.cli.add_command(rank_courses_command)
+    app.cli.add_command(recommend_courses_command)
@@ -23,6 +23,9 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False # SQLALCHEMY_TRACK_MODIFICATIONS'yi alıyoruz.
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key' # JWT_SECRET_KEY'yi alıyoruz.
     
+    # Quiz teslimleri: 'sync' isteğin içinde puanlar, 'queue' kuyruğa yazıp 202 döner (puanlamayı quiz-worker yapar)
+    QUIZ_SUBMISSION_MODE = os.environ.get('QUIZ_SUBMISSION_MODE', 'sync')
+    
     # Engine options
     is_sqlite = 'sqlite' in database_url
     SQLALCHEMY_ENGINE_OPTIONS = {
@@ -0,0 +1,191 @@
+from collections import defaultdict # Sayaç farklarını biriktirmek için kullanılır.
+from sqlalchemy import event, inspect # SQLAlchemy oturum olayları ve nesne durumu için kullanılır.
+from sqlalchemy.orm.attributes import set_committed_value # Bellekteki sayaçları sorgu atmadan düzeltmek için kullanılır.
+from models import db, Course, Lesson, LessonDocument, Enrollment, Review, Quiz, Assignment # models.py dosyasındaki modelleri import ediyoruz.
+
+# (alt model, üst model, yabancı anahtar, üst modeldeki sayaç kolonu)
+COUNTERS = [
+    (Lesson, Course, 'course_id', 'lesson_count'),
+    (Enrollment, Course, 'course_id', 'enrollment_count'),
+    (Review, Course, 'course_id', 'review_count'),
+    (LessonDocument, Lesson, 'lesson_id', 'document_count'),
+    (Quiz, Lesson, 'lesson_id', 'quiz_count'),
+    (Assignment, Lesson, 'lesson_id', 'assignment_count'),
+]
+
+# (alt model, üst model, yabancı anahtar, toplanan kolon, üst modeldeki toplam kolonu)
+SUMS = [
+    (Review, Course, 'course_id', 'rating', 'rating_sum'),
+]
+
+# (alt model, üst model, yabancı anahtar, gruplanan kolon, değer -> üst modeldeki sayaç kolonu)
+BUCKETS = [
+    (Review, Course, 'course_id', 'rating', {rating: f'rating_{rating}_count' for rating in range(1, 6)}),
+]
+
+def _deltas(session): # Flush boyunca biriken farklar: (üst model, id) -> {kolon: fark}
+    return session.info.setdefault('counter_deltas', defaultdict(lambda: defaultdict(int)))
+
+def _add(session, parent, parent_id, column, amount):
+    if parent_id is not None and amount:
+        _deltas(session)[(parent, parent_id)][column] += amount
+
+def _track(session, obj, sign): # Eklenen (+1) veya silinen (-1) nesnenin sayaçlara etkisi
+    for child, parent, fk, column in COUNTERS:
+        if isinstance(obj, child):
+            _add(session, parent, getattr(obj, fk), column, sign)
+    for child, parent, fk, value, column in SUMS:
+        if isinstance(obj, child):
+            _add(session, parent, getattr(obj, fk), column, sign * (getattr(obj, value) or 0))
+    for child, parent, fk, value, columns in BUCKETS:
+        if isinstance(obj, child) and getattr(obj, value) in columns:
+            _add(session, parent, getattr(obj, fk), columns[getattr(obj, value)], sign)
+
+def _track_changes(session, obj): # Güncellenen nesnede yabancı anahtar veya toplanan değer değiştiyse
+    state = inspect(obj)
+    for child, parent, fk, column in COUNTERS:
+        if isinstance(obj, child):
+            history = state.attrs[fk].history
+            if history.deleted and history.added:
+                _add(session, parent, history.deleted[0], column, -1)
+                _add(session, parent, history.added[0], column, 1)
+    for child, parent, fk, value, column in SUMS:
+        if isinstance(obj, child):
+            fk_history = state.attrs[fk].history
+            value_history = state.attrs[value].history
+            if not (fk_history.has_changes() or value_history.has_changes()):
+                continue
+            old_parent = fk_history.deleted[0] if fk_history.deleted else getattr(obj, fk)
+            old_value = value_history.deleted[0] if value_history.deleted else getattr(obj, value)
+            _add(session, parent, old_parent, column, -(old_value or 0))
+            _add(session, parent, getattr(obj, fk), column, getattr(obj, value) or 0)
+    for child, parent, fk, value, columns in BUCKETS:
+        if isinstance(obj, child):
+            fk_history = state.attrs[fk].history
+            value_history = state.attrs[value].history
+            if not (fk_history.has_changes() or value_history.has_changes()):
+                continue
+            old_parent = fk_history.deleted[0] if fk_history.deleted else getattr(obj, fk)
+            old_value = value_history.deleted[0] if value_history.deleted else getattr(obj, value)
+            if old_value in columns:
+                _add(session, parent, old_parent, columns[old_value], -1)
+            if getattr(obj, value) in columns:
+                _add(session, parent, getattr(obj, fk), columns[getattr(obj, value)], 1)
+
+def _keep_old_value(target, value, oldvalue, initiator): # Sadece active_history için; değeri değiştirmez
+    pass
+
+# Süresi dolmuş nesnede değer değişirse eski değer de yüklensin; aksi halde geçmiş boş kalır
+for child, parent, fk, column in COUNTERS:
+    event.listen(getattr(child, fk), 'set', _keep_old_value, active_history=True)
+for child, parent, fk, value, column in [*SUMS, *BUCKETS]:
+    event.listen(getattr(child, value), 'set', _keep_old_value, active_history=True)
+
+@event.listens_for(db.session, 'before_flush')
+def _collect_deleted_and_dirty(session, flush_context, instances):
+    session.info.pop('counter_deltas', None) # Yarıda kalmış önceki flush'ın farklarını at
+    # Silinen nesnelerin yabancı anahtarları flush'tan önce okunur (sonrasında süresi dolmuş olabilir)
+    for obj in session.deleted:
+        _track(session, obj, -1)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            _track_changes(session, obj)
+
+@event.listens_for(db.session, 'after_flush')
+def _apply_counter_deltas(session, flush_context):
+    # Yeni nesnelerin yabancı anahtarları ancak flush sonrasında kesinleşir
+    for obj in session.new:
+        _track(session, obj, 1)
+
+    deltas = session.info.pop('counter_deltas', None)
+    if not deltas:
+        return
+
+    connection = session.connection()
+    for (parent, parent_id), columns in deltas.items():
+        columns = {column: amount for column, amount in columns.items() if amount}
+        if not columns:
+            continue
+        table = parent.__table__
+        # Tek bir atomik UPDATE ile satır kilidi içinde artır/azalt
+        connection.execute(
+            table.update()
+            .where(table.c.id == parent_id)
+            .values({column: table.c[column] + amount for column, amount in columns.items()})
+        )
+
+        # Oturumda yüklü üst nesne varsa bellekteki değeri de güncelle
+        instance = session.identity_map.get(inspect(parent).identity_key_from_primary_key((parent_id,)))
+        if instance is not None:
+            for column, amount in columns.items():
+                if column in instance.__dict__:
+                    set_committed_value(instance, column, (instance.__dict__[column] or 0) + amount)
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard_counter_deltas(session):
+    session.info.pop('counter_deltas', None)
+
+def _actual_counts(parent): # Üst modelin her sayaç kolonu için gerçek değeri hesaplayan alt sorgular
+    expressions = {}
+    for child, owner, fk, column in COUNTERS:
+        if owner is parent:
+            expressions[column] = (
+                db.select(db.func.count()).select_from(child)
+                .where(getattr(child, fk) == parent.id)
+                .scalar_subquery()
+            )
+    for child, owner, fk, value, column in SUMS:
+        if owner is parent:
+            expressions[column] = (
+                db.select(db.func.coalesce(db.func.sum(getattr(child, value)), 0))
+                .where(getattr(child, fk) == parent.id)
+                .scalar_subquery()
+            )
+    for child, owner, fk, value, columns in BUCKETS:
+        if owner is parent:
+            for bucket, column in columns.items():
+                expressions[column] = (
+                    db.select(db.func.count()).select_from(child)
+                    .where(getattr(child, fk) == parent.id, getattr(child, value) == bucket)
+                    .scalar_subquery()
+                )
+    return expressions
+
+def recount(chunk_size=500, fix=True): # Sayaçları gerçek değerlerle karşılaştırır, istenirse düzeltir
+    report = {}
+    for parent in (Course, Lesson):
+        expressions = _actual_counts(parent)
+        columns = list(expressions)
+        checked = 0
+        mismatched = 0
+        last_id = 0
+
+        while True:
+            rows = db.session.execute(
+                db.select(parent.id, *[getattr(parent, c) for c in columns], *expressions.values())
+                .where(parent.id > last_id)
+                .order_by(parent.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            for row in rows:
+                stored = row[1:1 + len(columns)]
+                actual = row[1 + len(columns):]
+                if tuple(stored) != tuple(actual):
+                    mismatched += 1
+                    if fix:
+                        db.session.execute(
+                            db.update(parent).where(parent.id == row[0]).values(dict(zip(columns, actual)))
+                        )
+
+            checked += len(rows)
+            last_id = rows[-1][0]
+            if fix:
+                db.session.commit() # Her parça ayrı işlemde kaydedilir
+            else:
+                db.session.rollback()
+
+        report[parent.__table__.name] = {'checked': checked, 'mismatched': mismatched}
+    return report
@@ -0,0 +1,87 @@
+import threading # Önbellek kilidi için kullanılır.
+import time # Önbellek süresi için kullanılır.
+from sqlalchemy import event, inspect # Kurs değişikliklerinde önbelleği boşaltmak için kullanılır.
+from models import db, Course, User # models.py dosyasındaki modelleri import ediyoruz.
+import course_search # Arama metnini normalize etmek için
+
+# Fiyat aralıkları: (anahtar, en az, en çok); en az hariç, en çok dahil. Ücretsiz kurslar ayrı sayılır.
+PRICE_BUCKETS = [
+    ('free', None, 0),
+    ('0-100', 0, 100),
+    ('100-250', 100, 250),
+    ('250-500', 250, 500),
+    ('500+', 500, None),
+]
+CACHE_SECONDS = 60 # Diğer süreçlerdeki kurs değişiklikleri en geç bu sürede yansır
+CACHE_SIZE = 1000 # En fazla kaç farklı sorgunun facet'i tutulur
+
+EMPTY = {'category': [], 'level': [], 'price': [], 'instructor': []} # Aranabilir kelime yoksa
+
+_cache = {} # anahtar -> (zaman, facet'ler)
+_lock = threading.Lock()
+
+def _price_bucket():
+    whens = [(Course.price <= 0, 'free')]
+    whens += [(Course.price <= high, key) for key, low, high in PRICE_BUCKETS[1:] if high is not None]
+    return db.case(*whens, else_=PRICE_BUCKETS[-1][0])
+
+def cache_key(text, match_type): # Normalize edilmiş arama kelimeleri ve eşleşme türü
+    return match_type, tuple(course_search.terms(text))
+
+def compute(search=None): # Tek gruplanmış sorguyla kategori, seviye, fiyat aralığı ve eğitmen sayıları
+    """search verilirse sadece eşleşen kurslar sayılır; diğer filtreler (kategori, fiyat...) uygulanmaz"""
+    bucket = _price_bucket().label('price_bucket')
+    query = (
+        db.select(Course.category, Course.level, bucket, User.id, User.username, db.func.count(Course.id))
+        .join(User, Course.instructor_id == User.id)
+        .group_by(Course.category, Course.level, bucket, User.id, User.username)
+    )
+    if search is not None:
+        query = query.join(search, search.c.course_id == Course.id)
+
+    categories, levels, prices, instructors = {}, {}, {}, {}
+    for category, level, price_bucket, instructor_id, username, count in db.session.execute(query):
+        categories[category] = categories.get(category, 0) + count
+        levels[level] = levels.get(level, 0) + count
+        prices[price_bucket] = prices.get(price_bucket, 0) + count
+        entry = instructors.setdefault(instructor_id, {'id': instructor_id, 'username': username, 'count': 0})
+        entry['count'] += count
+
+    def ranked(counts):
+        return [{'value': value, 'count': count} for value, count in sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))]
+
+    return {
+        'category': ranked(categories),
+        'level': ranked(levels),
+        'price': [
+            {'key': key, 'min': low, 'max': high, 'count': prices[key]}
+            for key, low, high in PRICE_BUCKETS if key in prices
+        ],
+        'instructor': sorted(instructors.values(), key=lambda entry: (-entry['count'], entry['id'])),
+    }
+
+def get(key, search=None): # Önbellekten veya compute() ile facet'ler
+    now = time.monotonic()
+    with _lock:
+        cached = _cache.get(key)
+    if cached is not None and now - cached[0] < CACHE_SECONDS:
+        return cached[1]
+
+    facets = compute(search)
+    with _lock:
+        if len(_cache) >= CACHE_SIZE: # En eski kayıt atılır
+            del _cache[min(_cache, key=lambda k: _cache[k][0])]
+        _cache[key] = (now, facets)
+    return facets
+
+def clear():
+    with _lock:
+        _cache.clear()
+
+@event.listens_for(db.session, 'after_flush')
+def _invalidate(session, flush_context): # Bu süreçteki kurs değişiklikleri facet'leri hemen eskitir
+    changed = any(isinstance(obj, Course) for obj in (*session.new, *session.dirty, *session.deleted)) or any(
+        isinstance(obj, User) and inspect(obj).attrs.username.history.has_changes() for obj in session.dirty
+    )
+    if changed:
+        clear()
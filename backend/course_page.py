@@ -0,0 +1,95 @@
+from sqlalchemy.orm import joinedload # Eğitmen ve değerlendirme yazarlarını aynı sorguda yüklemek için kullanılır.
+from models import db, Course, Lesson, User, Enrollment, Progress, Review # models.py dosyasındaki modelleri import ediyoruz.
+
+LATEST_REVIEWS = 5 # Sayfada gösterilen son değerlendirme sayısı
+
+def _course(course_id): # Kurs ve eğitmeni tek sorguda
+    return db.session.scalars(
+        db.select(Course).options(joinedload(Course.instructor)).where(Course.id == course_id)
+    ).first()
+
+def _viewer(course_id, user_id): # Kullanıcının rolü ve (varsa) bu kurstaki kaydı tek sorguda
+    return db.session.execute(
+        db.select(User.role, Enrollment.id, Enrollment.enrolled_at)
+        .outerjoin(Enrollment, db.and_(Enrollment.student_id == User.id, Enrollment.course_id == course_id))
+        .where(User.id == user_id)
+    ).first()
+
+def _outline(course_id, enrollment_id): # Ders içerikleri olmadan sıralı ders listesi ve kaydın ilerlemesi
+    return db.session.execute(
+        db.select(Lesson.id, Lesson.title, Lesson.order, Lesson.video_url, Lesson.created_at,
+                  Lesson.document_count, Lesson.quiz_count, Lesson.assignment_count,
+                  Progress.completed, Progress.completed_at)
+        .outerjoin(Progress, db.and_(Progress.lesson_id == Lesson.id, Progress.enrollment_id == enrollment_id))
+        .where(Lesson.course_id == course_id)
+        .order_by(Lesson.order.asc(), Lesson.id.asc())
+    ).all()
+
+def _latest_reviews(course_id): # Son değerlendirmeler yazarlarıyla birlikte
+    return db.session.scalars(
+        db.select(Review).options(joinedload(Review.user))
+        .where(Review.course_id == course_id)
+        .order_by(Review.created_at.desc(), Review.id.desc())
+        .limit(LATEST_REVIEWS)
+    ).all()
+
+def build(course_id, user_id): # Kurs sayfasının tüm verisi; kurs yoksa None
+    """Ders ve değerlendirme sayısından bağımsız olarak en fazla dört sorguyla yüklenir: kurs+eğitmen, kullanıcı+kayıt, ders listesi+ilerleme, son değerlendirmeler"""
+    course = _course(course_id)
+    if course is None:
+        return None
+    viewer = _viewer(course_id, user_id)
+    enrollment_id = viewer.id if viewer is not None and viewer.role == 'student' else None
+    lessons = _outline(course_id, enrollment_id)
+    reviews = _latest_reviews(course_id)
+
+    instructor = course.instructor
+    completed = sum(1 for lesson in lessons if lesson.completed)
+    return {
+        'course': {
+            'id': course.id,
+            'title': course.title,
+            'description': course.description,
+            'category': course.category,
+            'level': course.level,
+            'price': course.price,
+            'image_url': course.image_url,
+            'created_at': course.created_at.isoformat() if course.created_at else None,
+            'updated_at': course.updated_at.isoformat() if course.updated_at else None,
+            'lesson_count': course.lesson_count,
+            'enrollment_count': course.enrollment_count
+        },
+        'instructor': {
+            'id': instructor.id,
+            'username': instructor.username,
+            'bio': instructor.bio,
+            'expertise': instructor.expertise
+        } if instructor else None,
+        'lessons': [{
+            'id': lesson.id,
+            'title': lesson.title,
+            'order': lesson.order,
+            'has_video': bool(lesson.video_url),
+            'created_at': lesson.created_at.isoformat() if lesson.created_at else None,
+            'document_count': lesson.document_count,
+            'quiz_count': lesson.quiz_count,
+            'assignment_count': lesson.assignment_count,
+            'completed': bool(lesson.completed),
+            'completed_at': lesson.completed_at.isoformat() if lesson.completed_at else None
+        } for lesson in lessons],
+        'reviews': {
+            # Ortalama, toplam ve puan dağılımı Course sayaçlarından okunur (bkz. counters.py)
+            'average_rating': course.rating_sum / course.review_count if course.review_count else 0.0,
+            'total_reviews': course.review_count,
+            'rating_histogram': course.rating_histogram(),
+            'latest': [review.to_dict() for review in reviews]
+        },
+        'enrollment': {
+            'is_enrolled': enrollment_id is not None,
+            'enrolled_at': viewer.enrolled_at.isoformat() if enrollment_id is not None and viewer.enrolled_at else None
+        },
+        'progress': {
+            'completed_lessons': completed,
+            'total_progress': completed * 100 / len(lessons) if lessons else 0
+        } if enrollment_id is not None else None
+    }
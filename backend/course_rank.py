@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta # Kayıtların yaşını hesaplamak için kullanılır.
+import numpy as np # Puanları tüm kurslar için vektörel hesaplamak için kullanılır.
+from sqlalchemy import event # Yeni ve silinen kurslar için sıralama satırını yönetmek için kullanılır.
+from models import db, Course, Enrollment, CourseStats, CourseRank # models.py dosyasındaki modelleri import ediyoruz.
+
+WINDOW_DAYS = 90 # Bu süreden eski kayıtlar trend puanına katılmaz
+HALF_LIFE_DAYS = 14 # Kaydın ağırlığı bu sürede yarıya iner
+PRIOR_REVIEWS = 5 # Az değerlendirmeli kursların ortalaması genel ortalamaya bu kadar değerlendirme ağırlığıyla çekilir
+WEIGHTS = {'recent': 1.0, 'rating': 0.6, 'completion': 0.4} # log(1 + kayıt), 0-1 puan, 0-1 tamamlama
+WRITE_CHUNK = 1000 # Tek executemany ile yazılan satır
+
+@event.listens_for(db.session, 'before_flush')
+def _drop_rank_rows(session, flush_context, instances): # Kurs silinmeden önce (yabancı anahtar için)
+    course_ids = [obj.id for obj in session.deleted if isinstance(obj, Course)]
+    if course_ids:
+        session.connection().execute(db.delete(CourseRank).where(CourseRank.course_id.in_(course_ids)))
+
+@event.listens_for(db.session, 'after_flush')
+def _add_rank_rows(session, flush_context): # Yeni kurs sıfır puanla başlar; böylece sıralama iç birleşimle yapılır
+    rows = [{'course_id': obj.id, 'score': 0.0} for obj in session.new if isinstance(obj, Course)]
+    if rows:
+        session.connection().execute(CourseRank.__table__.insert(), rows)
+
+def decayed_counts(index, course_ids, enrolled_at, now): # Kurs başına zamanla azalan kayıt sayısı
+    """index: kurs id'si -> dizi sırası; enrolled_at: datetime64[s] dizisi"""
+    age_days = (np.datetime64(now, 's') - enrolled_at).astype(np.float64) / 86400.0
+    weights = np.exp2(-np.clip(age_days, 0, None) / HALF_LIFE_DAYS)
+    positions = np.fromiter((index[course_id] for course_id in course_ids), dtype=np.int64, count=len(course_ids))
+    return np.bincount(positions, weights=weights, minlength=len(index))
+
+def scores(recent, rating_sum, review_count, completed_lessons, students, lesson_count): # Bileşenler ve toplam puan
+    """Tüm argümanlar kurs sırasıyla hizalanmış NumPy dizileridir"""
+    total_reviews = review_count.sum()
+    prior = rating_sum.sum() / total_reviews if total_reviews else 3.0
+    rating = (rating_sum + prior * PRIOR_REVIEWS) / (review_count + PRIOR_REVIEWS)
+    possible = students * lesson_count
+    completion = np.divide(completed_lessons, possible, out=np.zeros_like(recent), where=possible > 0)
+    completion = np.clip(completion, 0.0, 1.0)
+    score = (
+        WEIGHTS['recent'] * np.log1p(recent)
+        + WEIGHTS['rating'] * (rating - 1.0) / 4.0
+        + WEIGHTS['completion'] * completion
+    )
+    return score, np.where(review_count > 0, rating, np.nan), completion
+
+def recompute(now=None): # Tüm kursların trend puanlarını yeniden hesaplayıp yazar; kurs sayısını döndürür
+    now = now or datetime.utcnow()
+    courses = db.session.execute(
+        db.select(Course.id, Course.rating_sum, Course.review_count, Course.lesson_count,
+                  db.func.coalesce(CourseStats.student_count, 0), db.func.coalesce(CourseStats.completed_lessons, 0))
+        .outerjoin(CourseStats, CourseStats.course_id == Course.id)
+        .order_by(Course.id)
+    ).all()
+    if not courses:
+        return 0
+    ids, rating_sum, review_count, lesson_count, students, completed = (np.array(column) for column in zip(*courses))
+    index = {int(course_id): position for position, course_id in enumerate(ids)}
+
+    enrollments = [
+        (course_id, enrolled_at) for course_id, enrolled_at in db.session.execute(
+            db.select(Enrollment.course_id, Enrollment.enrolled_at)
+            .where(Enrollment.enrolled_at >= now - timedelta(days=WINDOW_DAYS))
+        ) if course_id in index
+    ]
+    if enrollments:
+        course_ids, enrolled_at = zip(*enrollments)
+        recent = decayed_counts(index, course_ids, np.array(enrolled_at, dtype='datetime64[s]'), now)
+    else:
+        recent = np.zeros(len(ids))
+
+    score, rating, completion = scores(
+        recent, rating_sum.astype(np.float64), review_count.astype(np.float64),
+        completed.astype(np.float64), students.astype(np.float64), lesson_count.astype(np.float64)
+    )
+    rows = [
+        {'id': int(course_id), 'new_score': float(s), 'recent': float(r), 'new_rating': None if np.isnan(a) else float(a),
+         'completion': float(c), 'now': now}
+        for course_id, s, r, a, c in zip(ids, score, recent, rating, completion)
+    ]
+
+    # Eksik satırlar (ör. ORM dışı eklenen kurslar) önce oluşturulur, sonra hepsi tek işlemde güncellenir
+    existing = set(db.session.scalars(db.select(CourseRank.course_id)))
+    missing = [{'course_id': row['id'], 'score': 0.0} for row in rows if row['id'] not in existing]
+    if missing:
+        db.session.execute(CourseRank.__table__.insert(), missing)
+    statement = (
+        CourseRank.__table__.update()
+        .where(CourseRank.course_id == db.bindparam('id'))
+        .values(score=db.bindparam('new_score'), recent_enrollments=db.bindparam('recent'), rating=db.bindparam('new_rating'),
+                completion_rate=db.bindparam('completion'), computed_at=db.bindparam('now'))
+    )
+    for start in range(0, len(rows), WRITE_CHUNK):
+        db.session.execute(statement, rows[start:start + WRITE_CHUNK])
+    db.session.execute(db.delete(CourseRank).where(CourseRank.course_id.not_in(db.select(Course.id))))
+    db.session.commit()
+    return len(rows)
@@ -0,0 +1,133 @@
+from datetime import datetime # Hesaplama zamanı için kullanılır.
+import numpy as np # Ağırlık ve benzerlik dizileri için kullanılır.
+from scipy import sparse # Öğrenci x kurs matrisi ve kurs x kurs benzerliği için kullanılır.
+from sqlalchemy import event # Silinen kursların komşu satırlarını temizlemek için kullanılır.
+from models import db, User, Course, Enrollment, CourseNeighbor, CourseRank # models.py dosyasındaki modelleri import ediyoruz.
+from search_text import words # Türkçe katlama
+
+TOP_K = 20 # Kurs başına saklanan komşu sayısı
+INTEREST_WEIGHT = 1.5 # Öğrencinin ilgi alanlarında kursun kategorisi geçiyorsa kaydın ağırlığı
+SHRINKAGE = 5 # Az ortak kayıtlı benzerlikler n / (n + SHRINKAGE) oranında küçültülür
+ROW_CHUNK = 2000 # Benzerlik matrisi bu kadar kurs satırlık parçalarla hesaplanır (bellek sınırı)
+WRITE_CHUNK = 1000 # Tek executemany ile yazılan satır
+
+@event.listens_for(db.session, 'before_flush')
+def _drop_neighbor_rows(session, flush_context, instances): # Kurs silinmeden önce (yabancı anahtar için)
+    course_ids = [obj.id for obj in session.deleted if isinstance(obj, Course)]
+    if course_ids:
+        session.connection().execute(db.delete(CourseNeighbor).where(db.or_(
+            CourseNeighbor.course_id.in_(course_ids), CourseNeighbor.neighbor_id.in_(course_ids)
+        )))
+
+def weights(categories, interests): # Kayıt başına ağırlık: kurs kategorisi öğrencinin ilgi alanlarındaysa daha yüksek
+    """categories ve interests kayıtlarla hizalı listelerdir (kategori, öğrencinin ilgi alanı metni)"""
+    return np.fromiter((
+        INTEREST_WEIGHT if category and interest and set(words(category)) <= set(words(interest)) else 1.0
+        for category, interest in zip(categories, interests)
+    ), dtype=np.float64, count=len(categories))
+
+def top_neighbors(matrix, k=TOP_K): # Sütunları kurs olan öğrenci x kurs matrisinden kurs başına en benzer k kurs
+    """(kurs sırası, komşu sırası, puan) üçlüleri üretir; puan kosinüs benzerliğinin ortak kayıt sayısıyla küçültülmüş hâlidir"""
+    matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0))).ravel()
+    normalized = (matrix @ sparse.diags(np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0))).tocsc()
+    binary = (matrix > 0).astype(np.float64).tocsc()
+    normalized_t, binary_t = normalized.T.tocsr(), binary.T.tocsr()
+
+    for start in range(0, matrix.shape[1], ROW_CHUNK):
+        end = min(start + ROW_CHUNK, matrix.shape[1])
+        similarity = (normalized_t[start:end] @ normalized).tocsr()
+        common = (binary_t[start:end] @ binary).tocsr()
+        common.data = common.data / (common.data + SHRINKAGE)
+        similarity = similarity.multiply(common).tocsr() # Aynı desen: sadece ortak kaydı olan çiftler
+        for row in range(end - start):
+            begin, stop = similarity.indptr[row], similarity.indptr[row + 1]
+            columns, scores = similarity.indices[begin:stop], similarity.data[begin:stop]
+            keep = (columns != start + row) & (scores > 0) # Kursun kendisi komşu değildir
+            columns, scores = columns[keep], scores[keep]
+            if len(scores) > k:
+                best = np.argpartition(-scores, k - 1)[:k]
+                columns, scores = columns[best], scores[best]
+            order = np.lexsort((columns, -scores)) # Puan azalan, eşitlikte kurs sırası
+            for column, score in zip(columns[order], scores[order]):
+                yield start + row, int(column), float(score)
+
+def recompute(k=TOP_K, now=None): # Tüm kursların komşularını yeniden hesaplayıp yazar; yazılan satır sayısını döndürür
+    now = now or datetime.utcnow()
+    course_ids = np.array(db.session.scalars(db.select(Course.id).order_by(Course.id)).all(), dtype=np.int64)
+    rows = db.session.execute(
+        db.select(Enrollment.student_id, Enrollment.course_id, Course.category, User.interests)
+        .join(Course, Course.id == Enrollment.course_id)
+        .join(User, User.id == Enrollment.student_id)
+    ).all()
+
+    records = []
+    if rows and len(course_ids):
+        students, courses, categories, interests = zip(*rows)
+        student_ids, student_positions = np.unique(np.array(students, dtype=np.int64), return_inverse=True)
+        matrix = sparse.csr_matrix(
+            (weights(categories, interests), (student_positions, np.searchsorted(course_ids, np.array(courses, dtype=np.int64)))),
+            shape=(len(student_ids), len(course_ids))
+        )
+        rank, previous = 0, None
+        for course, neighbor, score in top_neighbors(matrix, k):
+            rank = rank + 1 if course == previous else 1
+            previous = course
+            records.append({'course_id': int(course_ids[course]), 'rank': rank, 'neighbor_id': int(course_ids[neighbor]),
+                            'score': score, 'computed_at': now})
+
+    # Okuyucular commit'e kadar eski komşuları görür; tablo tek işlemde değiştirilir
+    db.session.execute(db.delete(CourseNeighbor))
+    for start in range(0, len(records), WRITE_CHUNK):
+        db.session.execute(CourseNeighbor.__table__.insert(), records[start:start + WRITE_CHUNK])
+    db.session.commit()
+    return len(records)
+
+def _course_columns():
+    return (Course.id, Course.title, Course.image_url, Course.category, Course.level, Course.price, Course.instructor_id)
+
+def _serialize(row):
+    return {
+        'id': row.id,
+        'title': row.title,
+        'image_url': row.image_url,
+        'category': row.category,
+        'level': row.level,
+        'price': row.price,
+        'instructor_id': row.instructor_id,
+        'score': round(float(row.score), 4) if row.score is not None else None
+    }
+
+def related(course_id, limit=10): # Kursun saklanan komşuları, birincil anahtar sırasıyla tek sorguda
+    rows = db.session.execute(
+        db.select(*_course_columns(), CourseNeighbor.score)
+        .join(Course, Course.id == CourseNeighbor.neighbor_id)
+        .where(CourseNeighbor.course_id == course_id)
+        .order_by(CourseNeighbor.rank)
+        .limit(limit)
+    ).all()
+    return [_serialize(row) for row in rows]
+
+def for_student(student_id, limit=10): # Kayıtlı kursların komşularından, henüz kayıt olunmamış kurslar
+    """(kurslar, kaynak) döndürür; öğrencinin komşusu olan kaydı yoksa trend sıralamasına düşülür"""
+    enrolled = db.select(Enrollment.course_id).where(Enrollment.student_id == student_id)
+    score = db.func.sum(CourseNeighbor.score).label('score')
+    rows = db.session.execute(
+        db.select(*_course_columns(), score)
+        .join(Course, Course.id == CourseNeighbor.neighbor_id)
+        .where(CourseNeighbor.course_id.in_(enrolled), CourseNeighbor.neighbor_id.not_in(enrolled))
+        .group_by(*_course_columns())
+        .order_by(score.desc(), Course.id)
+        .limit(limit)
+    ).all()
+    if rows:
+        return [_serialize(row) for row in rows], 'co_enrollment'
+
+    rows = db.session.execute(
+        db.select(*_course_columns(), CourseRank.score)
+        .join(CourseRank, CourseRank.course_id == Course.id)
+        .where(Course.id.not_in(enrolled))
+        .order_by(CourseRank.score.desc(), CourseRank.course_id.desc())
+        .limit(limit)
+    ).all()
+    return [_serialize(row) for row in rows], 'trending'
@@ -0,0 +1,211 @@
+from sqlalchemy import event, inspect, DDL # Oturum olayları, nesne geçmişi ve tablo oluşturma olayları için kullanılır.
+from models import db, Course, User # models.py dosyasındaki modelleri import ediyoruz.
+from search_text import normalize, words, trigrams, sql_normalize # Türkçe katlama ve trigram üretimi
+
+MAX_TERMS = 10 # Aramada dikkate alınan en fazla kelime
+FUZZY_THRESHOLD = 0.4 # Bulanık aramada sorgu trigramlarının en az bu oranı eşleşmeli ("pyhton" -> "python" 3/7)
+
+# SQLite: kurs başına bir satırlık FTS5 tablosu (rowid = kurs id'si) ve trigram eşleşme listesi (posting list).
+# İkisi de normalize edilmiş metni tutar ve bu modüldeki oturum olaylarıyla güncel tutulur.
+SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5("
+    "title, description, instructor, tokenize = 'unicode61 remove_diacritics 2')",
+    "CREATE TABLE IF NOT EXISTS course_trigrams ("
+    "trigram TEXT NOT NULL, course_id INTEGER NOT NULL, field INTEGER NOT NULL, "
+    "PRIMARY KEY (trigram, course_id, field)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS ix_course_trigrams_course ON course_trigrams (course_id)",
+]
+SQLITE_DROP = ['DROP TABLE IF EXISTS courses_fts', 'DROP TABLE IF EXISTS course_trigrams']
+BM25_WEIGHTS = '10.0, 3.0, 5.0' # Başlık, açıklama, eğitmen adı
+
+# course_trigrams.field değerleri ve bulanık aramadaki ağırlıkları
+TITLE, INSTRUCTOR, DESCRIPTION = 0, 1, 2
+FIELD_WEIGHTS = {TITLE: 1.0, INSTRUCTOR: 0.9, DESCRIPTION: 0.7}
+
+# PostgreSQL: normalize edilmiş metinden üretilen kolonlar; tsvector için GIN, pg_trgm için GIN trigram index'i.
+# Eğitmen adı users üzerindeki ifade index'leriyle aranır.
+POSTGRES_COURSE_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE courses ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('simple', {sql_normalize('title')}), 'A') || "
+    f"setweight(to_tsvector('simple', {sql_normalize('description')}), 'B')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_courses_search_vector ON courses USING gin (search_vector)",
+    "ALTER TABLE courses ADD COLUMN IF NOT EXISTS search_text text GENERATED ALWAYS AS ("
+    f"{sql_normalize('title')} || ' ' || {sql_normalize('description')}) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_courses_search_text_trgm ON courses USING gin (search_text gin_trgm_ops)",
+]
+POSTGRES_USER_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS ix_users_username_search ON users USING gin (to_tsvector('simple', {sql_normalize('username')}))",
+    f"CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (({sql_normalize('username')}) gin_trgm_ops)",
+]
+
+# db.create_all() ile oluşturulan tablolara da eklensin
+for statement in SQLITE_DDL:
+    event.listen(Course.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+for statement in POSTGRES_COURSE_DDL:
+    event.listen(Course.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+# Arama tabloları metadata'da olmadığından db.drop_all() ile birlikte silinmesi için
+for statement in SQLITE_DROP:
+    event.listen(Course.__table__, 'before_drop', DDL(statement).execute_if(dialect='sqlite'))
+for statement in POSTGRES_USER_DDL:
+    event.listen(User.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+
+def terms(text): # Arama metnindeki normalize edilmiş kelimeler (FTS sözdizimi karakterleri atılır)
+    return words(text)[:MAX_TERMS]
+
+def _postgres():
+    return db.session.get_bind().dialect.name == 'postgresql'
+
+def _username():
+    return db.literal_column(sql_normalize('users.username'))
+
+def match(text): # Tam metin eşleşmesi: (course_id, score) alt sorgusu; kelime yoksa None
+    """Puan büyükse daha alakalıdır; her kelime önek olarak aranır ve hepsi eşleşmelidir"""
+    query_words = terms(text)
+    if not query_words:
+        return None
+
+    if _postgres():
+        query = db.func.to_tsquery('simple', ' & '.join(f'{word}:*' for word in query_words))
+        vector = db.literal_column('courses.search_vector')
+        instructors = db.select(User.id).where(db.func.to_tsvector('simple', _username()).op('@@')(query))
+        return (
+            db.select(Course.id.label('course_id'), db.func.ts_rank(vector, query).label('score'))
+            .where(db.or_(vector.op('@@')(query), Course.instructor_id.in_(instructors)))
+            .subquery('search')
+        )
+
+    return (
+        db.text(
+            f'SELECT rowid AS course_id, -bm25(courses_fts, {BM25_WEIGHTS}) AS score '
+            'FROM courses_fts WHERE courses_fts MATCH :query'
+        )
+        .bindparams(query=' AND '.join(f'"{word}"*' for word in query_words))
+        .columns(course_id=db.Integer, score=db.Float)
+        .subquery('search')
+    )
+
+def fuzzy(text, threshold=FUZZY_THRESHOLD): # Yazım hatasına dayanıklı trigram eşleşmesi: (course_id, score) alt sorgusu
+    """Eşik ağırlıksız benzerliğe (sorgu trigramlarının alandaki payı) uygulanır, puan alan ağırlığıyla çarpılır; trigram yoksa None"""
+    query = ' '.join(terms(text))
+    grams = trigrams(query)
+    if not grams:
+        return None
+
+    if _postgres():
+        # word_similarity: sorgunun metindeki en benzer parçaya benzerliği; <% operatörü trigram index'ini kullanır
+        # ve eşiğini bu ayardan alır (SET LOCAL: sadece bu işlem için)
+        db.session.execute(db.text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+                           {'threshold': str(threshold)})
+        search_text = db.literal_column('courses.search_text')
+        score = db.func.greatest(
+            db.func.word_similarity(query, search_text),
+            db.func.word_similarity(query, db.func.coalesce(
+                db.select(_username()).where(User.id == Course.instructor_id).scalar_subquery(), ''
+            )) * FIELD_WEIGHTS[INSTRUCTOR]
+        )
+        instructors = db.select(User.id).where(db.literal(query).op('<%')(_username()))
+        return (
+            db.select(Course.id.label('course_id'), score.label('score'))
+            .where(db.or_(db.literal(query).op('<%')(search_text), Course.instructor_id.in_(instructors)))
+            .subquery('search')
+        )
+
+    weight = ' '.join(f'WHEN {field} THEN {value}' for field, value in FIELD_WEIGHTS.items())
+    return (
+        db.text(
+            f'SELECT course_id, MAX(hits * CASE field {weight} END) / :gram_count AS score FROM ('
+            'SELECT course_id, field, COUNT(*) AS hits FROM course_trigrams '
+            'WHERE trigram IN :grams GROUP BY course_id, field'
+            ') GROUP BY course_id HAVING MAX(hits) >= :threshold * :gram_count'
+        )
+        .bindparams(db.bindparam('grams', expanding=True))
+        .bindparams(grams=sorted(grams), gram_count=float(len(grams)), threshold=threshold)
+        .columns(course_id=db.Integer, score=db.Float)
+        .subquery('search')
+    )
+
+def reindex(connection, course_ids): # Verilen kursların FTS ve trigram satırlarını veritabanındaki güncel değerlerle yeniden yazar
+    if not course_ids:
+        return
+    ids = db.bindparam('ids', expanding=True)
+    connection.execute(db.text('DELETE FROM courses_fts WHERE rowid IN :ids').bindparams(ids), {'ids': list(course_ids)})
+    connection.execute(db.text('DELETE FROM course_trigrams WHERE course_id IN :ids').bindparams(ids), {'ids': list(course_ids)})
+
+    rows = connection.execute(
+        db.select(Course.id, Course.title, Course.description, User.username)
+        .outerjoin(User, User.id == Course.instructor_id)
+        .where(Course.id.in_(course_ids))
+    ).all()
+    if not rows: # Silinen kurslar
+        return
+
+    # Normalizasyon Python'da yapılır; SQLite'ın lower() fonksiyonu Türkçe harfleri katlamaz
+    connection.execute(
+        db.text('INSERT INTO courses_fts (rowid, title, description, instructor) VALUES (:id, :title, :description, :instructor)'),
+        [
+            {'id': course_id, 'title': normalize(title), 'description': normalize(description), 'instructor': normalize(username)}
+            for course_id, title, description, username in rows
+        ]
+    )
+    postings = [
+        {'trigram': gram, 'course_id': course_id, 'field': field}
+        for course_id, title, description, username in rows
+        for field, value in ((TITLE, title), (INSTRUCTOR, username), (DESCRIPTION, description))
+        for gram in trigrams(value)
+    ]
+    if postings:
+        connection.execute(
+            db.text('INSERT INTO course_trigrams (trigram, course_id, field) VALUES (:trigram, :course_id, :field)'),
+            postings
+        )
+
+def _changed(obj, *attributes):
+    state = inspect(obj)
+    return any(state.attrs[attribute].history.has_changes() for attribute in attributes)
+
+@event.listens_for(db.session, 'after_flush')
+def _sync_search_index(session, flush_context):
+    connection = session.connection()
+    if connection.dialect.name != 'sqlite': # PostgreSQL'de üretilmiş kolonlar kendiliğinden güncellenir
+        return
+
+    course_ids, instructor_ids = set(), set()
+    for obj in session.new:
+        if isinstance(obj, Course):
+            course_ids.add(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, Course) and _changed(obj, 'title', 'description', 'instructor_id'):
+            course_ids.add(obj.id)
+        elif isinstance(obj, User) and _changed(obj, 'username'):
+            instructor_ids.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, Course):
+            course_ids.add(obj.id) # Silinen kursun satırları silinir, yenisi yazılmaz
+
+    if instructor_ids:
+        course_ids.update(connection.execute(
+            db.select(Course.id).where(Course.instructor_id.in_(instructor_ids))
+        ).scalars())
+    reindex(connection, course_ids)
+
+def rebuild(chunk_size=5000): # Arama index'lerini baştan oluşturur; indexlenen kurs sayısını döndürür
+    """SQLite'ta FTS ve trigram tabloları id aralıkları halinde doldurulur; PostgreSQL'de kolonlar üretilmiş olduğundan sadece sayılır"""
+    total = db.session.scalar(db.select(db.func.count(Course.id)))
+    if db.session.get_bind().dialect.name != 'sqlite':
+        return total
+
+    for statement in SQLITE_DDL:
+        db.session.execute(db.text(statement))
+    max_id = db.session.scalar(db.select(db.func.max(Course.id))) or 0
+    for start in range(0, max_id, chunk_size):
+        ids = db.session.scalars(
+            db.select(Course.id).where(Course.id > start, Course.id <= start + chunk_size)
+        ).all()
+        reindex(db.session.connection(), ids)
+        db.session.commit() # Her aralık ayrı işlemde kaydedilir; arama bu sırada çalışmaya devam eder
+    db.session.execute(db.text('DELETE FROM courses_fts WHERE rowid NOT IN (SELECT id FROM courses)'))
+    db.session.execute(db.text('DELETE FROM course_trigrams WHERE course_id NOT IN (SELECT id FROM courses)'))
+    db.session.commit()
+    return total
@@ -0,0 +1,224 @@
+import bisect # Sıralı dizide önek aralığını bulmak için kullanılır.
+import threading # Index kilidi ve arka plan yenilemesi için kullanılır.
+import time # Yenileme aralığı için kullanılır.
+from flask import current_app # Anahtar sınırı aşılınca loglamak için kullanılır.
+from sqlalchemy import event, inspect # Kurs değişikliklerini index'e yansıtmak için kullanılır.
+from models import db, Course, User # models.py dosyasındaki modelleri import ediyoruz.
+from search_text import words # Türkçe katlama
+
+MAX_KEYS = 1_000_000 # Bellek sınırı: index'teki en fazla anahtar (anahtar başına kabaca 200 bayt)
+MAX_LABEL = 120 # Index'e alınan metin uzunluğu sınırı
+MAX_WORDS = 8 # Bir metnin en fazla kaç kelimesinden başlayan anahtar üretilir
+REFRESH_SECONDS = 300 # Diğer süreçlerdeki değişiklikler için yeniden oluşturma aralığı
+
+COURSE, CATEGORY, INSTRUCTOR = 'course', 'category', 'instructor'
+
+def _keys(label): # Metnin her kelimesinden başlayan normalize edilmiş son ekler: "Veri Bilimi" -> "veri bilimi", "bilimi"
+    folded = words(label[:MAX_LABEL])[:MAX_WORDS]
+    return list(dict.fromkeys(' '.join(folded[i:]) for i in range(len(folded)))) # Sıra: tam metin önce, sonra sonraki kelimeler
+
+class PrefixIndex: # Sıralı (anahtar, öğe) dizileri üzerinde ikili arama ile önek tamamlama
+    """Öğeler (tür, id) çiftleridir; kategoriler ve eğitmenler kurs sayısıyla referans sayılır"""
+    def __init__(self):
+        self.keys = [] # Sıralı normalize anahtarlar
+        self.refs = [] # keys ile paralel: (tür, id)
+        self.labels = {} # (tür, id) -> görünen metin
+        self.courses = {} # kurs id'si -> (başlık, kategori, eğitmen id'si)
+        self.uses = {} # (kategori/eğitmen) -> kurs sayısı
+        self.built_at = None
+        self.dropped = 0 # MAX_KEYS yüzünden index'e alınmayan anahtar sayısı
+
+    def _insert(self, ref, label):
+        self.labels[ref] = label
+        for key in _keys(label):
+            if len(self.keys) >= MAX_KEYS:
+                self.dropped += 1
+                continue
+            position = bisect.bisect_right(self.keys, key)
+            self.keys.insert(position, key)
+            self.refs.insert(position, ref)
+
+    def _delete(self, ref):
+        label = self.labels.pop(ref, None)
+        if label is None:
+            return
+        for key in _keys(label):
+            position = bisect.bisect_left(self.keys, key)
+            while position < len(self.keys) and self.keys[position] == key:
+                if self.refs[position] == ref:
+                    del self.keys[position], self.refs[position]
+                    break
+                position += 1
+
+    def _use(self, ref, label, delta):
+        count = self.uses.get(ref, 0) + delta
+        if count <= 0:
+            self.uses.pop(ref, None)
+            self._delete(ref)
+        else:
+            self.uses[ref] = count
+            if ref not in self.labels:
+                self._insert(ref, label)
+
+    def remove_course(self, course_id):
+        course = self.courses.pop(course_id, None)
+        if course is None:
+            return
+        _, category, instructor_id = course
+        self._delete((COURSE, course_id))
+        if category:
+            self._use((CATEGORY, category), category, -1)
+        if instructor_id is not None:
+            self._use((INSTRUCTOR, instructor_id), None, -1)
+
+    def put_course(self, course_id, title, category, instructor_id, username): # Ekler veya günceller
+        self.remove_course(course_id)
+        self.courses[course_id] = (title, category, instructor_id)
+        self._insert((COURSE, course_id), title or '')
+        if category:
+            self._use((CATEGORY, category), category, 1)
+        if instructor_id is not None:
+            self._use((INSTRUCTOR, instructor_id), username or '', 1)
+
+    def rename_instructor(self, instructor_id, username):
+        ref = (INSTRUCTOR, instructor_id)
+        if ref in self.labels:
+            self._delete(ref)
+            self._insert(ref, username or '')
+
+    def load(self, rows): # Toplu oluşturma: anahtarlar bir kez sıralanır
+        entries = []
+        for course_id, title, category, instructor_id, username in rows:
+            self.courses[course_id] = (title, category, instructor_id)
+            self.labels[(COURSE, course_id)] = title or ''
+            for ref, label in (((CATEGORY, category), category), ((INSTRUCTOR, instructor_id), username or '')):
+                if ref[1] is not None and label is not None:
+                    self.uses[ref] = self.uses.get(ref, 0) + 1
+                    self.labels.setdefault(ref, label)
+        for ref, label in self.labels.items():
+            entries.extend((position, key, ref) for position, key in enumerate(_keys(label)))
+        if len(entries) > MAX_KEYS:
+            # Sınır aşılınca önce uzun metinlerin sondaki kelimelerinden başlayan anahtarlar düşer; her öğe tam metniyle bulunabilir kalır
+            entries.sort(key=lambda entry: entry[0])
+            self.dropped = len(entries) - MAX_KEYS
+            entries = entries[:MAX_KEYS]
+        entries.sort(key=lambda entry: entry[1])
+        self.keys = [key for _, key, _ in entries]
+        self.refs = [ref for _, _, ref in entries]
+        self.built_at = time.monotonic()
+        return self
+
+    def search(self, prefix, limit=10): # Öneki taşıyan ilk `limit` farklı öğe, anahtar sırasıyla
+        prefix = ' '.join(words(prefix))
+        if not prefix:
+            return []
+        results, seen = [], set()
+        position = bisect.bisect_left(self.keys, prefix)
+        while position < len(self.keys) and len(results) < limit and self.keys[position].startswith(prefix):
+            ref = self.refs[position]
+            if ref not in seen:
+                seen.add(ref)
+                results.append({'type': ref[0], 'id': ref[1] if ref[0] != CATEGORY else None, 'text': self.labels[ref]})
+            position += 1
+        return results
+
+def _rows(): # (id, başlık, kategori, eğitmen id'si, eğitmen adı)
+    return db.session.execute(
+        db.select(Course.id, Course.title, Course.category, Course.instructor_id, User.username)
+        .outerjoin(User, User.id == Course.instructor_id)
+    )
+
+class Suggester: # Süreç başına index; yazma işlemleri commit sonrası uygulanır
+    def __init__(self):
+        self.index = PrefixIndex()
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._pending = None # build() sürerken gelen değişiklikler
+
+    def build(self): # Okuma sürerken commit edilen değişiklikler yeni index'e de uygulanır
+        with self._lock:
+            self._pending = []
+        index = PrefixIndex().load(_rows())
+        if index.dropped:
+            current_app.logger.warning(f'Suggest index hit MAX_KEYS={MAX_KEYS}: {index.dropped} keys dropped')
+        with self._lock:
+            for changes in self._pending:
+                self._apply(index, changes)
+            self.index, self._pending = index, None
+
+    def reset(self):
+        with self._lock:
+            self.index = PrefixIndex().load([])
+
+    def search(self, prefix, limit=10):
+        with self._lock:
+            return self.index.search(prefix, limit)
+
+    def refresh_if_stale(self, app): # Diğer süreçlerin yazdıklarını almak için arka planda yeniden oluşturur
+        with self._lock:
+            stale = self.index.built_at is None or time.monotonic() - self.index.built_at > REFRESH_SECONDS
+            if not stale or self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            with app.app_context():
+                try:
+                    self.build()
+                except Exception as e:
+                    app.logger.error(f'Suggest index refresh failed: {str(e)}')
+                finally:
+                    db.session.remove()
+                    self._refreshing = False
+        threading.Thread(target=run, name='suggest-refresh', daemon=True).start()
+
+    def apply(self, changes): # after_flush'ta toplanan değişiklikler
+        with self._lock:
+            self._apply(self.index, changes)
+            if self._pending is not None:
+                self._pending.append(changes)
+
+    @staticmethod
+    def _apply(index, changes):
+        for kind, values in changes:
+            if kind == 'put':
+                index.put_course(*values)
+            elif kind == 'remove':
+                index.remove_course(*values)
+            else:
+                index.rename_instructor(*values)
+
+suggester = Suggester()
+
+def _changed(obj, *attributes):
+    state = inspect(obj)
+    return any(state.attrs[attribute].history.has_changes() for attribute in attributes)
+
+@event.listens_for(db.session, 'after_flush')
+def _collect(session, flush_context): # Değişen kursların güncel değerleri; commit olursa uygulanır
+    changes = session.info.setdefault('suggest_changes', [])
+    courses = [obj for obj in session.new if isinstance(obj, Course)] + [
+        obj for obj in session.dirty if isinstance(obj, Course) and _changed(obj, 'title', 'category', 'instructor_id')
+    ]
+    instructor_ids = {course.instructor_id for course in courses}
+    usernames = dict(session.connection().execute(
+        db.select(User.id, User.username).where(User.id.in_(instructor_ids))
+    ).all()) if instructor_ids else {}
+    for course in courses:
+        changes.append(('put', (course.id, course.title, course.category, course.instructor_id, usernames.get(course.instructor_id))))
+    for obj in session.deleted:
+        if isinstance(obj, Course):
+            changes.append(('remove', (obj.id,)))
+    for obj in session.dirty:
+        if isinstance(obj, User) and _changed(obj, 'username'):
+            changes.append(('rename', (obj.id, obj.username)))
+
+@event.listens_for(db.session, 'after_commit')
+def _apply(session):
+    changes = session.info.pop('suggest_changes', None)
+    if changes:
+        suggester.apply(changes)
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard(session):
+    session.info.pop('suggest_changes', None)
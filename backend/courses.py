@@ -1,5 +1,5 @@
 from flask import Blueprint, jsonify, request, current_app, url_for, render_template, send_from_directory, make_response #flask modülünü import ediyoruz
-from models import db, Course, Lesson, User, Enrollment, Review, Progress, Quiz, QuizQuestion, QuizOption, QuizAttempt, QuizAnswer, Assignment, AssignmentSubmission, Notification, LessonDocument #models modülünü import ediyoruz
+from models import db, Course, Lesson, User, Enrollment, Review, Progress, Quiz, QuizQuestion, QuizOption, QuizAttempt, QuizAnswer, QuizSubmission, Assignment, AssignmentSubmission, Notification, LessonDocument, CourseRank #models modülünü import ediyoruz
 from flask_jwt_extended import jwt_required, get_jwt_identity #flask_jwt_extended modülünü import ediyoruz
 from werkzeug.utils import secure_filename #werkzeug modülünü import ediyoruz
 import os #os modülünü import ediyoruz
@@ -12,7 +12,23 @@ import uuid #uuid modülünü import ediyoruz
 import bleach #bleach modülünü import ediyoruz
 from sqlalchemy import or_, and_, func, desc #sqlalchemy modülünü import ediyoruz#sqlalchemy modülünü import ediyoruz
 import logging
+from sqlalchemy.orm import selectinload #değerlendirme yazarlarını toplu yüklemek için
 from utils import upload_image_local, upload_video_local, upload_document_local
+import instructor_stats #eğitmen istatistik özetlerini güncel tutmak için
+import notification_outbox #bildirim olaylarını outbox'a yazmak için (dağıtımı notifications-worker yapar)
+import unread_counts #toplu güncellemelerde okunmamış sayaçlarını düzeltmek için
+import notification_list #bildirim listelerinin imleçli sayfalanması için
+from cursors import encode_cursor, parse_cursor #(created_at, id) imleçli sayfalama için
+import course_search #kurs aramasında tam metin index'i için
+import course_facets #arama sonuçlarının facet sayıları için
+import course_suggest #arama kutusu önerileri için
+import course_page #kurs sayfasının tek istekte yüklenmesi için
+import course_recommend #ortak kayıt komşuları için
+import quiz_grading #quiz cevaplarını derlenmiş cevap anahtarıyla puanlamak için
+import quiz_ingest #sınav anındaki teslimleri kuyruğa yazmak için (puanlamayı quiz-worker yapar)
+import quiz_analytics #eğitmen için soru analizi (zorluk, ayırt edicilik, çeldiriciler)
+import quiz_regrade #cevap anahtarı düzeltilince denemeleri toplu yeniden puanlamak için
+from response_cache import cached, course_tag, instructor_tag, user_tag, CATEGORIES, INSTRUCTORS #katalog yanıtlarının önbelleği için
 
 # İstanbul/Türkiye saat dilimini tanımla (UTC+3)
 TURKEY_TZ = timezone(timedelta(hours=3)) #Türkiye saat dilimini tanımlıyoruz.
@@ -187,20 +203,15 @@ def update_course(course_id): #update_course fonksiyonunu tanımlıyoruz
         if changes: #changes'in boş olup olmadığını kontrol ediyoruz
             course.updated_at = datetime.now(TURKEY_TZ) #course.updated_at'yi alıyoruz
             
-            # Kursa kayıtlı öğrencilere bildirim gönder
-            enrolled_students = Enrollment.query.filter_by(course_id=course_id).all() #Enrollment.query.filter_by(course_id=course_id).all()'yi alıyoruz
-            
-            for enrollment in enrolled_students: #enrolled_students'in boş olup olmadığını kontrol ediyoruz
-                notification = Notification(
-                    user_id=enrollment.student_id, #enrollment.student_id'yi alıyoruz
-                    course_id=course_id, #course_id'yi alıyoruz
-                    type='course_update', #type'yi alıyoruz
-                    title=f'Kurs Güncellendi: {course.title}', #Kurs Güncellendi: {course.title} durumunda title'e ekle
-                    message=f'{course.title} kursunda yapılan değişiklikler:\n' + '\n'.join(f'• {change}' for change in changes),
-                    is_read=False,
-                    created_at=datetime.now(TURKEY_TZ)
-                )
-                db.session.add(notification) #notification'ı veritabanına ekle
+            # Bildirim olayı outbox'a yazılır; öğrencilere dağıtımı notifications-worker yapar
+            notifications_sent = course.enrollment_count
+            notification_outbox.enqueue(
+                course_id,
+                'course_update',
+                f'Kurs Güncellendi: {course.title}', #Kurs Güncellendi: {course.title} durumunda title'e ekle
+                f'{course.title} kursunda yapılan değişiklikler:\n' + '\n'.join(f'• {change}' for change in changes),
+                created_at=datetime.now(TURKEY_TZ)
+            )
         
         try:
             db.session.commit() #commit işlemi yap
@@ -208,7 +219,7 @@ def update_course(course_id): #update_course fonksiyonunu tanımlıyoruz
                 'message': 'Kurs başarıyla güncellendi', #Kurs başarıyla güncellendi durumunda boş bir liste döndürüyoruz
                 'course': course.to_dict(), #course.to_dict()'yi alıyoruz
                 'changes': changes, #changes'i alıyoruz
-                'notifications_sent': len(enrolled_students) if changes else 0 #notifications_sent'i alıyoruz
+                'notifications_sent': notifications_sent if changes else 0 #notifications_sent'i alıyoruz
             })
         except Exception as e: #hata durumunda
             db.session.rollback() #rollback işlemi yap
@@ -229,6 +240,8 @@ def delete_course(course_id):
         return jsonify({'error': 'You can only delete your own courses'}), 403
     
     db.session.delete(course) # Kursu veritabanından siliyoruz.
+    db.session.flush()
+    instructor_stats.refresh_instructors([course.instructor_id]) # Eğitmen istatistiklerini silinen kurs olmadan yeniden hesapla
     db.session.commit() # Değişiklikleri kaydediyoruz.
     
     return jsonify({'message': 'Course deleted successfully'})
@@ -258,19 +271,19 @@ def add_lesson(course_id): #add_lesson fonksiyonunu tanımlıyoruz
         course_id=course_id
     )
     
+    old_lesson_count = course.lesson_count #ders eklenmeden önceki ders sayısı
     db.session.add(lesson) #lesson'ı veritabanına ekle
-    
-    # Kursa kayıtlı tüm öğrencilere bildirim gönder
-    enrollments = Enrollment.query.filter_by(course_id=course_id).all() #Enrollment.query.filter_by(course_id=course_id).all()'yi alıyoruz
-    for enrollment in enrollments:
-        notification = Notification(
-            user_id=enrollment.student_id,
-            course_id=course_id,
-            title=f"Yeni Ders: {lesson.title}",
-            message=f"{course.title} kursuna yeni bir ders eklendi: {lesson.title}",
-            type="new_lesson"
-        )
-        db.session.add(notification) #notification'ı veritabanına ekle
+    instructor_stats.record_lesson_change(course, old_lesson_count) #eğitmen istatistiklerini güncelle
+    db.session.flush() #lesson.id'nin oluşması için
+    
+    # Kursa kayıtlı tüm öğrencilere bildirim (outbox üzerinden)
+    notification_outbox.enqueue(
+        course_id,
+        'new_lesson',
+        f"Yeni Ders: {lesson.title}",
+        f"{course.title} kursuna yeni bir ders eklendi: {lesson.title}",
+        reference_id=lesson.id
+    )
     
     db.session.commit() #commit işlemi yap
     
@@ -284,6 +297,7 @@ def add_lesson(course_id): #add_lesson fonksiyonunu tanımlıyoruz
     }), 201
 
 @courses.route('/<int:course_id>/lessons', methods=['GET']) #courses.route('/<int:course_id>/lessons', methods=['GET']) fonksiyonunu tanımlıyoruz
+@cached(lambda args: {course_tag(args['course_id'])}) #ders, belge, quiz ve ödev yazmalarında geçersiz kılınır
 def get_course_lessons(course_id): #get_course_lessons fonksiyonunu tanımlıyoruz
     """Bir kursa ait tüm dersleri getirir."""
     try:
@@ -313,7 +327,7 @@ def search_courses(): #search_courses fonksiyonunu tanımlıyoruz
         min_price = request.args.get('min_price', type=float) #min_price'yi alıyoruz
         max_price = request.args.get('max_price', type=float) #max_price'yi alıyoruz
         instructor_id = request.args.get('instructor_id', type=int) #instructor_id'yi alıyoruz
-        sort_by = request.args.get('sort_by', 'created_at')  # created_at, title, price, popularity
+        sort_by = request.args.get('sort_by', 'relevance' if query else 'created_at')  # relevance, created_at, title, price, popularity, trending
         order = request.args.get('order', 'desc')  # asc, desc
         page = request.args.get('page', 1, type=int) #page'yi alıyoruz
         per_page = request.args.get('per_page', 10, type=int) #per_page'yi alıyoruz
@@ -324,18 +338,14 @@ def search_courses(): #search_courses fonksiyonunu tanımlıyoruz
         if per_page < 1 or per_page > 50:
             return jsonify({'message': 'Sayfa boyutu 1-50 arasında olmalıdır'}), 400
 
+        include_facets = request.args.get('facets', 'false').lower() == 'true' #facet sayıları istenmiş mi
+        fuzzy = request.args.get('fuzzy', 'auto')  # auto: tam metin sonuç vermezse trigram benzerliğine geç; true, false
+        if fuzzy not in ('auto', 'true', 'false'):
+            return jsonify({'message': 'fuzzy auto, true veya false olmalıdır'}), 400
+
         # Temel sorguyu oluştur
         query_obj = Course.query.join(User, Course.instructor_id == User.id)
 
-        # Arama filtrelerini uygula
-        if query:
-            search_filter = or_(
-                Course.title.ilike(f'%{query}%'),
-                Course.description.ilike(f'%{query}%'),
-                User.username.ilike(f'%{query}%')
-            )
-            query_obj = query_obj.filter(search_filter)
-
         if category: #category'nin boş olup olmadığını kontrol ediyoruz
             query_obj = query_obj.filter(Course.category == category) #Course.category == category durumunda query_obj'e ekle
 
@@ -351,18 +361,39 @@ def search_courses(): #search_courses fonksiyonunu tanımlıyoruz
         if instructor_id: #instructor_id'in boş olup olmadığını kontrol ediyoruz
             query_obj = query_obj.filter(Course.instructor_id == instructor_id) #Course.instructor_id == instructor_id durumunda query_obj'e ekle
 
+        # Arama filtresi: tam metin index'i (PostgreSQL tsvector/GIN, SQLite FTS5), yazım hatalarında trigram index'i
+        # (PostgreSQL pg_trgm, SQLite course_trigrams); ikisi de Türkçe katlanmış metin üzerinde, bkz. course_search.py
+        match_type = None
+        search = None
+        if query:
+            match_type = 'fuzzy' if fuzzy == 'true' else 'exact'
+            search = course_search.fuzzy(query) if fuzzy == 'true' else course_search.match(query)
+            if search is not None and fuzzy == 'auto' and not query_obj.join(search, search.c.course_id == Course.id).limit(1).count():
+                match_type, search = 'fuzzy', course_search.fuzzy(query)
+            if search is not None:
+                query_obj = query_obj.join(search, search.c.course_id == Course.id)
+            else: # Aranabilir kelime yok (ör. sadece noktalama)
+                query_obj = query_obj.filter(db.false())
+
         # Sıralama
-        if sort_by == 'title': #sort_by'in title olup olmadığını kontrol ediyoruz
+        if sort_by == 'relevance' and search is not None: #arama puanına göre, eşitlikte yeni kurs önce
+            query_obj = query_obj.order_by(search.c.score.desc() if order == 'desc' else search.c.score.asc(), Course.id.desc())
+        elif sort_by == 'title': #sort_by'in title olup olmadığını kontrol ediyoruz
             query_obj = query_obj.order_by(Course.title.desc() if order == 'desc' else Course.title.asc()) #Course.title.desc() if order == 'desc' else Course.title.asc() durumunda query_obj'e ekle
         elif sort_by == 'price': #sort_by'in price olup olmadığını kontrol ediyoruz
             query_obj = query_obj.order_by(Course.price.desc() if order == 'desc' else Course.price.asc())
         elif sort_by == 'popularity': #sort_by'in popularity olup olmadığını kontrol ediyoruz
-            # Popülerlik için kayıt sayısına göre sıralama
-            query_obj = query_obj.outerjoin(Enrollment).group_by(Course.id, User.id) #Enrollment.outerjoin(Course.id, User.id) durumunda query_obj'e ekle
+            # Popülerlik için saklanan kayıt sayacına göre sıralama
             if order == 'desc': #order'in desc olup olmadığını kontrol ediyoruz
-                query_obj = query_obj.order_by(db.func.count(Enrollment.id).desc()) #db.func.count(Enrollment.id).desc() durumunda query_obj'e ekle
+                query_obj = query_obj.order_by(Course.enrollment_count.desc()) #Course.enrollment_count.desc() durumunda query_obj'e ekle
             else: #order'in desc olması durumunda
-                query_obj = query_obj.order_by(db.func.count(Enrollment.id).asc()) #db.func.count(Enrollment.id).asc() durumunda query_obj'e ekle
+                query_obj = query_obj.order_by(Course.enrollment_count.asc()) #Course.enrollment_count.asc() durumunda query_obj'e ekle
+        elif sort_by == 'trending': #önceden hesaplanmış trend puanı (course_rank.py), ix_course_rank_score index'i sırasıyla
+            query_obj = query_obj.join(CourseRank, CourseRank.course_id == Course.id)
+            if order == 'desc':
+                query_obj = query_obj.order_by(CourseRank.score.desc(), CourseRank.course_id.desc())
+            else:
+                query_obj = query_obj.order_by(CourseRank.score.asc(), CourseRank.course_id.asc())
         else:  # default: created_at
             query_obj = query_obj.order_by(Course.created_at.desc() if order == 'desc' else Course.created_at.asc())
 
@@ -390,29 +421,47 @@ def search_courses(): #search_courses fonksiyonunu tanımlıyoruz
                     'id': course.instructor.id, #course.instructor.id'yi alıyoruz
                     'username': course.instructor.username #course.instructor.username'yi alıyoruz
                 },
-                'enrollment_count': len(course.enrollments) #course.enrollments'in uzunluğunu alıyoruz
+                'enrollment_count': course.enrollment_count #saklanan kayıt sayacını alıyoruz
             }
             results.append(course_dict) #course_dict'i results'e ekle
 
-        return jsonify({
+        response = {
             'courses': results, #results'i alıyoruz
             'total': total, #total'i alıyoruz
             'page': page, #page'yi alıyoruz
             'per_page': per_page, #per_page'yi alıyoruz
-            'total_pages': (total + per_page - 1) // per_page #(total + per_page - 1) // per_page'yi alıyoruz
-        })
+            'total_pages': (total + per_page - 1) // per_page, #(total + per_page - 1) // per_page'yi alıyoruz
+            'match': match_type #exact, fuzzy veya arama metni yoksa None
+        }
+        if include_facets: #arama metnine göre facet sayıları; kategori, seviye, fiyat ve eğitmen filtrelerinden bağımsızdır
+            response['facets'] = course_facets.EMPTY if query and search is None else course_facets.get(course_facets.cache_key(query, match_type), search)
+        return jsonify(response)
 
     except Exception as e: #hata durumunda
         current_app.logger.error(f"Error in search_courses: {str(e)}") #hata durumunda logluyoruz
         return jsonify({'message': 'Kurslar aranırken bir hata oluştu', 'error': str(e)}), 500 #Kurslar aranırken bir hata oluştu: {str(e)} durumunda boş bir liste döndürüyoruz
 
+@courses.route('/suggest', methods=['GET']) #yazarken arama önerileri
+@jwt_required()
+def suggest_courses():
+    """Önekle başlayan kurs başlıkları, kategoriler ve eğitmen adları (bellekteki önek index'inden)"""
+    prefix = request.args.get('prefix', '').strip()
+    limit = request.args.get('limit', 10, type=int)
+    if limit < 1 or limit > 20:
+        return jsonify({'message': 'limit 1-20 arasında olmalıdır'}), 400
+
+    course_suggest.suggester.refresh_if_stale(current_app._get_current_object())
+    return jsonify({'prefix': prefix, 'suggestions': course_suggest.suggester.search(prefix, limit)}), 200
+
 @courses.route('/categories', methods=['GET'])
+@cached(lambda args: {CATEGORIES}) #kurs eklenince, silinince veya kategorisi değişince geçersiz kılınır
 def get_categories(): #get_categories fonksiyonunu tanımlıyoruz
     # Tüm kategorileri getir
     categories = db.session.query(Course.category).distinct().all() #Course.category.distinct().all()'yi alıyoruz
     return jsonify([category[0] for category in categories]) #category[0] for category in categories'yi alıyoruz
 
 @courses.route('/instructors', methods=['GET']) #courses.route('/instructors', methods=['GET']) fonksiyonunu tanımlıyoruz
+@cached(lambda args: {INSTRUCTORS}) #eğitmen hesabı değişince geçersiz kılınır
 def get_instructors(): #get_instructors fonksiyonunu tanımlıyoruz
     # Tüm eğitmenleri getir
     instructors = User.query.filter_by(role='instructor').all() #User.query.filter_by(role='instructor').all()'yi alıyoruz
@@ -423,19 +472,38 @@ def get_instructors(): #get_instructors fonksiyonunu tanımlıyoruz
     } for instructor in instructors]) #instructor[0] for instructor in instructors'yi alıyoruz
 
 @courses.route('/<int:course_id>/reviews', methods=['GET']) #courses.route('/<int:course_id>/reviews', methods=['GET']) fonksiyonunu tanımlıyoruz
+@cached(lambda args: {course_tag(args['course_id'])}, lambda args, data: {user_tag(review['user_id']) for review in data['reviews']})
 def get_course_reviews(course_id): #get_course_reviews fonksiyonunu tanımlıyoruz
-    """Kurs değerlendirmelerini getir"""
+    """Kurs değerlendirmelerini (created_at, id) imleciyle sayfalar; ortalama ve puan dağılımı kurs sayaçlarından okunur"""
+    limit = request.args.get('limit', 20, type=int)
+    if limit < 1 or limit > 100:
+        return jsonify({'message': 'limit 1-100 arasında olmalıdır'}), 400
+    try:
+        cursor = parse_cursor(request.args.get('cursor')) # Önceki sayfanın next_cursor değeri
+    except ValueError:
+        return jsonify({'message': 'Geçersiz imleç'}), 400
+
     course = Course.query.get_or_404(course_id) #course.id'yi alıyoruz
-    reviews = Review.query.filter_by(course_id=course_id).order_by(Review.created_at.desc()).all() #Review.query.filter_by(course_id=course_id).order_by(Review.created_at.desc()).all()'yi alıyoruz
-    
-    # Ortalama puanı hesapla
-    avg_rating = db.session.query(db.func.avg(Review.rating)).filter_by(course_id=course_id).scalar() or 0 #db.session.query(db.func.avg(Review.rating)).filter_by(course_id=course_id).scalar() or 0'yi alıyoruz
-    
+
+    # Yazarlar sayfadaki tüm değerlendirmeler için tek IN sorgusuyla yüklenir
+    stmt = db.select(Review).options(selectinload(Review.user)).where(Review.course_id == course_id)
+    if cursor is not None:
+        stmt = stmt.where(db.tuple_(Review.created_at, Review.id) < cursor)
+    reviews = db.session.scalars(stmt.order_by(Review.created_at.desc(), Review.id.desc()).limit(limit + 1)).all()
+
+    next_cursor = None
+    if len(reviews) > limit:
+        reviews = reviews[:limit]
+        next_cursor = encode_cursor(reviews[-1].created_at, reviews[-1].id)
+
     return jsonify({
         'course_id': course_id, #course_id'yi alıyoruz
-        'average_rating': float(avg_rating), #float(avg_rating)'yi alıyoruz
-        'total_reviews': len(reviews), #len(reviews)'yi alıyoruz
-        'reviews': [review.to_dict() for review in reviews] #review.to_dict() for review in reviews'yi alıyoruz
+        'average_rating': course.rating_sum / course.review_count if course.review_count else 0.0, #ortalama sayaçlardan hesaplanır
+        'total_reviews': course.review_count, #toplam değerlendirme sayısı sayaçtan okunur
+        'rating_histogram': course.rating_histogram(), #puan -> değerlendirme sayısı
+        'reviews': [review.to_dict() for review in reviews], #review.to_dict() for review in reviews'yi alıyoruz
+        'next_cursor': next_cursor,
+        'limit': limit
     })
 
 @courses.route('/<int:course_id>/reviews', methods=['POST']) #courses.route('/<int:course_id>/reviews', methods=['POST']) fonksiyonunu tanımlıyoruz#courses.route('/<int:course_id>/reviews', methods=['POST']) fonksiyonunu tanımlıyoruz
@@ -660,20 +728,16 @@ def create_quiz(course_id, lesson_id):
                     db.session.add(option)
         
         try:
-            # Kursa kayıtlı öğrencilere bildirim gönder
-            enrollments = Enrollment.query.filter_by(course_id=course_id).all()
-            for enrollment in enrollments:
-                notification = Notification(
-                    user_id=enrollment.student_id,
-                    course_id=course_id,
-                    type='new_quiz',
-                    title=f'Yeni Quiz: {quiz.title}',
-                    message=f'{course.title} kursuna yeni bir quiz eklendi: {quiz.title}',
-                    is_read=False,
-                    created_at=datetime.now(TURKEY_TZ),
-                    reference_id=quiz.id
-                )
-                db.session.add(notification)
+            # Kursa kayıtlı öğrencilere bildirim (outbox üzerinden)
+            db.session.flush() # quiz.id'nin oluşması için
+            notification_outbox.enqueue(
+                course_id,
+                'new_quiz',
+                f'Yeni Quiz: {quiz.title}',
+                f'{course.title} kursuna yeni bir quiz eklendi: {quiz.title}',
+                reference_id=quiz.id,
+                created_at=datetime.now(TURKEY_TZ)
+            )
             
             db.session.commit()
             return jsonify({
@@ -716,8 +780,37 @@ def submit_quiz(course_id, lesson_id, quiz_id):
             return jsonify({'message': 'Quiz bu derse ait değil'}), 400
         
         data = request.get_json()
-        if not data or not data.get('answers'):
+        if not isinstance(data, dict) or not data.get('answers'):
             return jsonify({'message': 'Cevaplar gerekli'}), 400
+        if not isinstance(data['answers'], list):
+            return jsonify({'message': 'Cevaplar liste olmalı'}), 400
+        
+        # Cevaplar derlenmiş cevap anahtarıyla bellekte puanlanır (soru başına sorgu atılmaz)
+        key = quiz_grading.answer_keys.get(quiz)
+        queued = current_app.config.get('QUIZ_SUBMISSION_MODE') == 'queue'
+        try:
+            if queued:
+                quiz_grading.validate(key, data['answers']) # Puanlama worker'da; burada sadece soru id'leri denetlenir
+            else:
+                answer_rows, total_points, correct_count = quiz_grading.grade(key, data['answers'])
+        except quiz_grading.UnknownQuestion as e:
+            return jsonify({'message': f'Soru bu quize ait değil: {e}'}), 400
+        
+        if queued:
+            # Teslim kuyruğa yazılır; puan, cevaplar ve bildirimler quiz-worker tarafından toplu yazılır
+            submitted_at = datetime.now(TURKEY_TZ)
+            attempt_id = quiz_ingest.enqueue(quiz, int(current_user_id), course_id, data['answers'], submitted_at).id
+            db.session.commit() # Yanıt için deneme yeniden okunmaz
+            return jsonify({
+                'message': 'Quiz teslim alındı, puanlanıyor',
+                'attempt': {
+                    'id': attempt_id,
+                    'status': 'queued',
+                    'started_at': submitted_at.isoformat()
+                },
+                'status_url': url_for('courses.get_quiz_attempt', course_id=course_id, lesson_id=lesson_id,
+                                      quiz_id=quiz_id, attempt_id=attempt_id)
+            }), 202
         
         # Quiz denemesi oluştur
         attempt = QuizAttempt(
@@ -727,38 +820,15 @@ def submit_quiz(course_id, lesson_id, quiz_id):
         )
         db.session.add(attempt)
         
-        # Cevapları kaydet ve puanla
-        total_points = 0
-        max_points = 0
-        
-        for answer_data in data['answers']:
-            question = QuizQuestion.query.get_or_404(answer_data['question_id'])
-            max_points += question.points
-            
-            answer = QuizAnswer(
-                attempt=attempt,
-                question_id=question.id,
-                selected_option_id=answer_data.get('selected_option_id'),
-                answer_text=answer_data.get('text', '')
-            )
-            
-            # Çoktan seçmeli soru kontrolü
-            if question.question_type == 'multiple_choice' and answer.selected_option_id:
-                selected_option = QuizOption.query.get(answer.selected_option_id)
-                if selected_option and selected_option.is_correct:
-                    answer.is_correct = True
-                    answer.points_earned = question.points
-                    total_points += question.points
-            
-            db.session.add(answer)
-        
-        # Quiz denemesini tamamla
+        # Quiz denemesini tamamla; özet (puan, yüzde, doğru sayısı) sonuç sayfası için denemeye yazılır
         attempt.completed_at = datetime.now(TURKEY_TZ)
-        attempt.score = (total_points / max_points * 100) if max_points > 0 else 0
+        quiz_grading.summarize(attempt, key, total_points, correct_count)
+        attempt.responses = quiz_grading.pack_responses(answer_rows) # Quiz analizi için
+        db.session.flush() # attempt.id'nin oluşması için
+        quiz_grading.insert_answers(attempt.id, answer_rows) # Tüm cevaplar tek toplu INSERT ile
         
-        # Kurs ve quiz bilgilerini al
+        # Kurs bilgisini al
         course = Course.query.get_or_404(course_id)
-        lesson = Lesson.query.get_or_404(lesson_id)
         
         # Öğrenci bilgilerini al
         student = User.query.get(current_user_id)
@@ -783,6 +853,7 @@ def submit_quiz(course_id, lesson_id, quiz_id):
                 'attempt': {
                     'id': attempt.id,
                     'score': attempt.score,
+                    'correct_count': correct_count,
                     'started_at': attempt.started_at.isoformat(),
                     'completed_at': attempt.completed_at.isoformat()
                 }
@@ -794,6 +865,74 @@ def submit_quiz(course_id, lesson_id, quiz_id):
     except Exception as e:
         return jsonify({'message': f'Bir hata oluştu: {str(e)}'}), 500
 
+@courses.route('/<int:course_id>/lessons/<int:lesson_id>/quiz/<int:quiz_id>/attempts/<int:attempt_id>', methods=['GET'])
+@jwt_required()
+def get_quiz_attempt(course_id, lesson_id, quiz_id, attempt_id):
+    """Deneme durumu: kuyruktaki teslimler için istemci bu adresi yoklar"""
+    current_user_id = int(get_jwt_identity())
+    found = quiz_ingest.status(attempt_id)
+    if found is None or found[0].quiz_id != quiz_id or found[0].user_id != current_user_id:
+        return jsonify({'message': 'Deneme bulunamadı'}), 404
+    
+    attempt, status, error = found
+    result = {
+        'id': attempt.id,
+        'status': status,
+        'score': attempt.score,
+        'total_score': attempt.total_score,
+        'max_score': attempt.max_score,
+        'correct_count': attempt.correct_count,
+        'started_at': attempt.started_at.isoformat() if attempt.started_at else None,
+        'completed_at': attempt.completed_at.isoformat() if attempt.completed_at else None
+    }
+    if error:
+        result['error'] = error
+    return jsonify({'attempt': result})
+
+@courses.route('/<int:course_id>/lessons/<int:lesson_id>/quiz/<int:quiz_id>/analytics', methods=['GET'])
+@jwt_required()
+def get_quiz_analytics(course_id, lesson_id, quiz_id):
+    """Quizin soru analizi: zorluk (p), ayırt edicilik, seçenek seçilme oranları ve puan dağılımı"""
+    current_user_id = int(get_jwt_identity())
+    course = Course.query.get_or_404(course_id)
+    if course.instructor_id != current_user_id:
+        return jsonify({'message': 'Bu quizin analizini görüntüleme yetkiniz yok'}), 403
+    
+    lesson = Lesson.query.get_or_404(lesson_id)
+    if lesson.course_id != course_id:
+        return jsonify({'message': 'Ders bu kursa ait değil'}), 400
+    
+    quiz = Quiz.query.get_or_404(quiz_id)
+    if quiz.lesson_id != lesson_id:
+        return jsonify({'message': 'Quiz bu derse ait değil'}), 400
+    
+    # Bir sonraki tamamlanan denemeye (veya cevap anahtarı değişikliğine) kadar önbellekten
+    return jsonify(quiz_analytics.analytics.get(quiz))
+
+@courses.route('/<int:course_id>/lessons/<int:lesson_id>/quiz/<int:quiz_id>/regrade', methods=['POST'])
+@jwt_required()
+def regrade_quiz(course_id, lesson_id, quiz_id):
+    """Quizin tamamlanmış denemelerini güncel cevap anahtarıyla yeniden puanla"""
+    current_user_id = int(get_jwt_identity())
+    course = Course.query.get_or_404(course_id)
+    if course.instructor_id != current_user_id:
+        return jsonify({'message': 'Bu quizi yeniden puanlama yetkiniz yok'}), 403
+    
+    lesson = Lesson.query.get_or_404(lesson_id)
+    if lesson.course_id != course_id:
+        return jsonify({'message': 'Ders bu kursa ait değil'}), 400
+    
+    quiz = Quiz.query.get_or_404(quiz_id)
+    if quiz.lesson_id != lesson_id:
+        return jsonify({'message': 'Quiz bu derse ait değil'}), 400
+    
+    # Cevaplar ve deneme özetleri parça parça toplu UPDATE ile düzeltilir
+    report = quiz_regrade.regrade(quiz_id)
+    return jsonify({
+        'message': f"{report['changed']} denemenin puanı güncellendi",
+        **report
+    })
+
 @courses.route('/<int:course_id>/lessons/<int:lesson_id>/assignment', methods=['POST'])
 @jwt_required()
 def create_assignment(course_id, lesson_id):
@@ -820,21 +959,17 @@ def create_assignment(course_id, lesson_id):
     )
     
     db.session.add(assignment)
-    
-    # Kursa kayıtlı öğrencilere bildirim gönder
-    enrollments = Enrollment.query.filter_by(course_id=course_id).all()
-    for enrollment in enrollments:
-        notification = Notification(
-            user_id=enrollment.student_id,
-            course_id=course_id,
-            type='new_assignment',
-            title=f'Yeni Ödev: {assignment.title}',
-            message=f'{course.title} kursuna yeni bir ödev eklendi: {assignment.title}. Son teslim tarihi: {assignment.due_date.strftime("%d.%m.%Y %H:%M")}',
-            is_read=False,
-            created_at=datetime.now(TURKEY_TZ),
-            reference_id=assignment.id
-        )
-        db.session.add(notification)
+    db.session.flush() # assignment.id'nin oluşması için
+    
+    # Kursa kayıtlı öğrencilere bildirim (outbox üzerinden)
+    notification_outbox.enqueue(
+        course_id,
+        'new_assignment',
+        f'Yeni Ödev: {assignment.title}',
+        f'{course.title} kursuna yeni bir ödev eklendi: {assignment.title}. Son teslim tarihi: {assignment.due_date.strftime("%d.%m.%Y %H:%M")}',
+        reference_id=assignment.id,
+        created_at=datetime.now(TURKEY_TZ)
+    )
     
     db.session.commit()
     
@@ -974,18 +1109,17 @@ def grade_assignment_submission(course_id, lesson_id, assignment_id, submission_
         submission.feedback = data.get('feedback', '')
         submission.graded_at = datetime.now(TURKEY_TZ)
         
-        # Öğrenciye bildirim gönder
-        notification = Notification(
+        # Öğrenciye bildirim (outbox üzerinden, bildirim ayarı kontrol edilerek)
+        notification_outbox.enqueue(
+            course_id,
+            'assignment_graded',
+            f'Ödev Değerlendirildi: {assignment.title}',
+            f'{course.title} kursundaki {assignment.title} ödevinden {submission.grade:.1f} puan aldınız.' + 
+                (f'\n\nGeri Bildirim:\n{submission.feedback}' if submission.feedback else ''),
+            reference_id=assignment.id,
             user_id=submission.user_id,
-            course_id=course_id,
-            type='assignment_graded',
-            title=f'Ödev Değerlendirildi: {assignment.title}',
-            message=f'{course.title} kursundaki {assignment.title} ödevinden {submission.grade:.1f} puan aldınız.' + 
-                    (f'\n\nGeri Bildirim:\n{submission.feedback}' if submission.feedback else ''),
-            is_read=False,
             created_at=datetime.now(TURKEY_TZ)
         )
-        db.session.add(notification)
         
         try:
             db.session.commit()
@@ -1036,6 +1170,7 @@ def enroll_course(course_id):
     
     try:
         db.session.add(enrollment)
+        instructor_stats.record_enrollment(enrollment)
         db.session.commit()
         return jsonify({
             'message': 'Kursa başarıyla kaydoldunuz',
@@ -1067,7 +1202,7 @@ def get_quiz_results(course_id, lesson_id, quiz_id):
     if not enrollment:
         return jsonify({'error': 'Bu kursa kayıtlı değilsiniz'}), 403
     
-    # Öğrencinin quiz denemelerini bul
+    # Öğrencinin quiz denemelerini bul; özet puanlar puanlamada denemeye yazılmıştır
     attempts = QuizAttempt.query.filter_by(
         quiz_id=quiz_id,
         user_id=current_user_id
@@ -1076,44 +1211,46 @@ def get_quiz_results(course_id, lesson_id, quiz_id):
     if not attempts:
         return jsonify({'message': 'Bu quiz için henüz bir denemeniz bulunmuyor'}), 404
     
-    results = []
-    for attempt in attempts:
-        answers = []
-        total_points = 0
-        total_questions = len(quiz.questions)
-        
-        for answer in attempt.answers:
-            question = QuizQuestion.query.get(answer.question_id)
-            correct_answer = None
-            
-            if question.question_type == 'multiple_choice':
-                correct_option = QuizOption.query.filter_by(
-                    question_id=question.id,
-                    is_correct=True
-                ).first()
-                correct_answer = correct_option.option_text if correct_option else None
-            
-            answers.append({
-                'question_text': question.question_text,
-                'your_answer': answer.answer_text,
-                'correct_answer': correct_answer,
-                'points_earned': answer.points_earned,
-                'is_correct': answer.is_correct
-            })
-            
-            if answer.is_correct:
-                total_points += answer.points_earned
-        
-        results.append({
-            'attempt_id': attempt.id,
-            'started_at': attempt.started_at.isoformat(),
-            'completed_at': attempt.completed_at.isoformat() if attempt.completed_at else None,
-            'total_score': total_points,
-            'max_possible_score': sum(q.points for q in quiz.questions),
-            'percentage': (total_points / sum(q.points for q in quiz.questions)) * 100 if quiz.questions else 0,
-            'answers': answers
+    # Tüm denemelerin cevapları soru metinleriyle tek sorguda, doğru seçenekler quiz başına tek sorguda
+    answers_by_attempt = {attempt.id: [] for attempt in attempts}
+    answer_rows = db.session.execute(
+        db.select(QuizAnswer.attempt_id, QuizAnswer.question_id, QuizAnswer.selected_option_id, QuizAnswer.answer_text,
+                  QuizAnswer.points_earned, QuizAnswer.is_correct, QuizQuestion.question_text, QuizQuestion.question_type)
+        .join(QuizQuestion, QuizQuestion.id == QuizAnswer.question_id)
+        .where(QuizAnswer.attempt_id.in_(list(answers_by_attempt)))
+        .order_by(QuizAnswer.attempt_id, QuizAnswer.id)
+    )
+    correct_options = {}
+    for question_id, option_text in db.session.execute(
+        db.select(QuizOption.question_id, QuizOption.option_text)
+        .join(QuizQuestion, QuizQuestion.id == QuizOption.question_id)
+        .where(QuizQuestion.quiz_id == quiz_id, QuizOption.is_correct == True)
+        .order_by(QuizOption.id.desc())
+    ):
+        correct_options[question_id] = option_text # Birden çok doğru seçenekte ilki kalır
+    
+    for answer in answer_rows:
+        answers_by_attempt[answer.attempt_id].append({
+            'question_id': answer.question_id,
+            'question_text': answer.question_text,
+            'your_answer': answer.answer_text,
+            'selected_option_id': answer.selected_option_id,
+            'correct_answer': correct_options.get(answer.question_id) if answer.question_type == 'multiple_choice' else None,
+            'points_earned': answer.points_earned,
+            'is_correct': answer.is_correct
         })
     
+    results = [{
+        'attempt_id': attempt.id,
+        'started_at': attempt.started_at.isoformat(),
+        'completed_at': attempt.completed_at.isoformat() if attempt.completed_at else None,
+        'total_score': attempt.total_score,
+        'max_possible_score': attempt.max_score,
+        'percentage': attempt.score,
+        'correct_count': attempt.correct_count,
+        'answers': answers_by_attempt[attempt.id]
+    } for attempt in attempts]
+    
     return jsonify({
         'quiz_title': quiz.title,
         'quiz_description': quiz.description,
@@ -1176,32 +1313,34 @@ def get_unread_notifications():
         current_user_id = get_jwt_identity()
         
         # Sayfalandırma parametrelerini al ve doğrula
-        page = request.args.get('page', 1, type=int)
+        page = request.args.get('page', 1, type=int) # Eski istemciler için; yeni istemciler cursor kullanır
         per_page = request.args.get('per_page', 10, type=int)
         
         if page < 1:
             return jsonify({'message': 'Sayfa numarası 1 veya daha büyük olmalıdır'}), 400
         if per_page < 1:
             return jsonify({'message': 'Sayfa boyutu 1 veya daha büyük olmalıdır'}), 400
+        per_page = min(per_page, 100)
+        
+        try:
+            cursor = parse_cursor(request.args.get('cursor')) # Önceki sayfanın next_cursor değeri
+        except ValueError:
+            return jsonify({'message': 'Geçersiz cursor'}), 400
         
         # Filtreleme parametrelerini al
         course_id = request.args.get('course_id', type=int)
         notification_type = request.args.get('type')
         since = request.args.get('since')
         
-        # Base query oluştur
-        base_query = db.select(Notification).filter_by(
-            user_id=current_user_id,
-            is_read=False
-        )
+        criteria = [Notification.user_id == int(current_user_id), Notification.is_read == False]
         
         # Kurs filtresi
         if course_id:
-            base_query = base_query.filter_by(course_id=course_id)
+            criteria.append(Notification.course_id == course_id)
             
         # Tip filtresi
         if notification_type:
-            base_query = base_query.filter_by(type=notification_type)
+            criteria.append(Notification.type == notification_type)
             
         # Tarih filtresi
         if since:
@@ -1217,39 +1356,36 @@ def get_unread_notifications():
             
             # Tarih aralığı kontrolü - tam gün karşılaştırması için
             since_date = since_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            base_query = base_query.filter(Notification.created_at >= since_date)
-        
-        # Toplam kayıt sayısını al
-        count_query = db.select(db.func.count()).select_from(Notification)
-        for criterion in base_query.whereclause.clauses:
-            count_query = count_query.where(criterion)
-        total_count = db.session.scalar(count_query)
-        
-        # Sayfalandırılmış ve sıralanmış sonuçları al
-        notifications = db.session.scalars(
-            base_query.order_by(Notification.created_at.desc())
-            .offset((page - 1) * per_page)
-            .limit(per_page)
-        ).all()
+            criteria.append(Notification.created_at >= since_date)
+        
+        # (created_at, id) imleciyle sayfalanır; kurs başlıkları aynı sorguda yüklenir
+        notifications, next_cursor, total_count = notification_list.fetch(
+            *criteria,
+            limit=per_page,
+            cursor=cursor,
+            include_total=notification_list.include_total(request.args),
+            offset=0 if cursor else (page - 1) * per_page
+        )
         
         # Bildirimleri temizle ve dönüştür
-        notification_list = []
+        notification_items = []
         for notification in notifications:
             notification_dict = notification.to_dict()
             notification_dict['message'] = sanitize_html(notification_dict['message'])
-            notification_list.append(notification_dict)
+            notification_items.append(notification_dict)
         
-        # Toplam sayfa sayısını hesapla
-        total_pages = (total_count + per_page - 1) // per_page
-        
-        return jsonify({
-            'notifications': notification_list,
-            'count': len(notification_list),
-            'total_count': total_count,
-            'current_page': page,
-            'total_pages': total_pages,
-            'per_page': per_page
-        })
+        response = {
+            'notifications': notification_items,
+            'count': len(notification_items),
+            'per_page': per_page,
+            'next_cursor': next_cursor # Sonraki sayfa için imleç, yoksa None
+        }
+        if total_count is not None: # include_total=false ise sayım yapılmaz
+            response['total_count'] = total_count
+            response['total_pages'] = (total_count + per_page - 1) // per_page
+        if not cursor:
+            response['current_page'] = page
+        return jsonify(response)
         
     except Exception as e:
         return jsonify({'message': f'Bir hata oluştu: {str(e)}'}), 500
@@ -1276,6 +1412,7 @@ def mark_selected_notifications_read():
             )
             .values(is_read=True, read_at=now)
         )
+        unread_counts.add(current_user_id, -result.rowcount)
         
         db.session.commit()
         
@@ -1344,6 +1481,7 @@ def mark_all_notifications_read():
             )
             .values(is_read=True, read_at=now)
         )
+        unread_counts.add(current_user_id, -result.rowcount)
         
         db.session.commit()
         
@@ -1379,18 +1517,19 @@ def grade_quiz_attempt(course_id, lesson_id, quiz_id, attempt_id):
         # Puanı güncelle
         quiz_attempt.score = float(data['score'])
         quiz_attempt.completed_at = datetime.now(TURKEY_TZ)
-        
-        # Öğrenciye bildirim gönder
-        notification = Notification(
+        if quiz_attempt.max_score:
+            quiz_attempt.total_score = quiz_attempt.max_score * quiz_attempt.score / 100 # Özet yeni yüzdeyle uyumlu kalır
+        
+        # Öğrenciye bildirim (outbox üzerinden, bildirim ayarı kontrol edilerek)
+        notification_outbox.enqueue(
+            course_id,
+            'quiz_graded',
+            f'Quiz Değerlendirildi: {quiz_attempt.quiz.title}',
+            f'{course.title} kursundaki {quiz_attempt.quiz.title} quiz\'inden {quiz_attempt.score:.1f}% aldınız.',
+            reference_id=quiz_attempt.quiz_id,
             user_id=quiz_attempt.user_id,
-            course_id=course_id,
-            type='quiz_graded',
-            title=f'Quiz Değerlendirildi: {quiz_attempt.quiz.title}',
-            message=f'{course.title} kursundaki {quiz_attempt.quiz.title} quiz\'inden {quiz_attempt.score:.1f}% aldınız.',
-            is_read=False,
             created_at=datetime.now(TURKEY_TZ)
         )
-        db.session.add(notification)
         
         try:
             db.session.commit()
@@ -1757,6 +1896,8 @@ def bulk_update_notifications():
             )
             .values(**update_data)
         )
+        if 'is_read' in update_data:
+            unread_counts.refresh(current_user_id) # Okundu/okunmadı her iki yöne değişebilir
         
         db.session.commit()
         
@@ -1770,38 +1911,68 @@ def bulk_update_notifications():
         current_app.logger.error(f"Error updating notifications: {str(e)}")
         return jsonify({'message': 'Bildirimler güncellenirken bir hata oluştu'}), 500
 
+# GET /courses/ için seçilebilen alanlar: alan adı -> kolon (instructor_name eğitmen tablosundan join ile gelir)
+COURSE_LIST_FIELDS = {
+    'id': Course.id,
+    'title': Course.title,
+    'description': Course.description,
+    'instructor_id': Course.instructor_id,
+    'instructor_name': User.username,
+    'created_at': Course.created_at,
+    'updated_at': Course.updated_at,
+    'image_url': Course.image_url,
+    'price': Course.price,
+    'category': Course.category,
+    'level': Course.level,
+    'enrollment_count': Course.enrollment_count,
+    'lesson_count': Course.lesson_count,
+    'review_count': Course.review_count,
+    # ortalama sayaçlardan hesaplanır (değerlendirme tablosu okunmaz)
+    'average_rating': db.case((Course.review_count > 0, db.cast(Course.rating_sum, db.Float) / Course.review_count), else_=0.0),
+}
+DEFAULT_COURSE_LIST_FIELDS = ['id', 'title', 'description', 'instructor_id', 'instructor_name', 'created_at', 'image_url', 'price', 'category', 'level']
+
 @courses.route('/', methods=['GET'])
 @jwt_required()
 def get_courses():
+    """Kursları en yeniden eskiye (created_at, id) imleciyle sayfalar; fields= ile sadece istenen alanlar döner"""
+    limit = request.args.get('limit', 20, type=int)
+    if limit < 1 or limit > 100:
+        return jsonify({'message': 'limit 1-100 arasında olmalıdır'}), 400
     try:
-        current_app.logger.info('Getting all courses')
-        
-        # Veritabanı sorgusunu try-except bloğu içine al
-        courses = db.session.execute(
-            db.select(Course).order_by(Course.created_at.desc())
-        ).scalars().all()
-        
-        current_app.logger.info(f'Found {len(courses)} courses')
-        
-        # Her bir kurs için detaylı bilgi logla
-        course_list = []
-        for course in courses:
-            course_data = {
-                'id': course.id,
-                'title': course.title,
-                'description': course.description,
-                'instructor_id': course.instructor_id,
-                'instructor_name': course.instructor.username,
-                'created_at': course.created_at.isoformat() if course.created_at else None,
-                'image_url': course.image_url if hasattr(course, 'image_url') else None,
-                'price': course.price,
-                'category': course.category,
-                'level': course.level
-            }
-            current_app.logger.info(f'Course details: {course_data}')
-            course_list.append(course_data)
+        cursor = parse_cursor(request.args.get('cursor'))
+    except ValueError:
+        return jsonify({'message': 'Geçersiz imleç'}), 400
+    fields = [name.strip() for name in request.args.get('fields', '').split(',') if name.strip()] or DEFAULT_COURSE_LIST_FIELDS
+    unknown = [name for name in fields if name not in COURSE_LIST_FIELDS]
+    if unknown:
+        return jsonify({'message': f"Bilinmeyen alan: {', '.join(unknown)}", 'fields': list(COURSE_LIST_FIELDS)}), 400
+    instructor_id = request.args.get('instructor_id', type=int)
+
+    try:
+        # Sadece istenen kolonlar ve imleç için created_at/id; eğitmen adı aynı sorgudaki join'den
+        stmt = db.select(*[COURSE_LIST_FIELDS[name].label(name) for name in fields], Course.created_at.label('_created_at'), Course.id.label('_id'))
+        if 'instructor_name' in fields:
+            stmt = stmt.join(User, User.id == Course.instructor_id)
+        if instructor_id:
+            stmt = stmt.where(Course.instructor_id == instructor_id)
+        if cursor is not None:
+            stmt = stmt.where(db.tuple_(Course.created_at, Course.id) < cursor)
+        rows = db.session.execute(stmt.order_by(Course.created_at.desc(), Course.id.desc()).limit(limit + 1)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]._created_at, rows[-1]._id)
 
-        return jsonify(course_list), 200
+        course_list = []
+        for row in rows:
+            item = {name: getattr(row, name) for name in fields}
+            for name in ('created_at', 'updated_at'):
+                if item.get(name) is not None:
+                    item[name] = item[name].isoformat()
+            course_list.append(item)
+        return jsonify({'courses': course_list, 'next_cursor': next_cursor, 'limit': limit}), 200
 
     except Exception as e:
         db.session.rollback()
@@ -1810,6 +1981,7 @@ def get_courses():
 
 @courses.route('/<int:course_id>', methods=['GET'])
 @jwt_required()
+@cached(lambda args: {course_tag(args['course_id'])}, lambda args, data: {instructor_tag(data['instructor_id'])}, private=True)
 def get_course(course_id):
     try:
         course = Course.query.get_or_404(course_id)
@@ -1833,6 +2005,32 @@ def get_course(course_id):
         current_app.logger.error(f"Error fetching course {course_id}: {str(e)}")
         return jsonify({'error': 'Failed to fetch course details'}), 500 
 
+@courses.route('/<int:course_id>/related', methods=['GET'])
+@jwt_required()
+def get_related_courses(course_id):
+    """Bu kursa kayıt olan öğrencilerin kayıt olduğu diğer kurslar (course_neighbors tablosundan)"""
+    limit = request.args.get('limit', 10, type=int)
+    if limit < 1 or limit > course_recommend.TOP_K:
+        return jsonify({'message': f'limit 1-{course_recommend.TOP_K} arasında olmalıdır'}), 400
+    try:
+        return jsonify({'course_id': course_id, 'related': course_recommend.related(course_id, limit)}), 200
+    except Exception as e:
+        current_app.logger.error(f"Error fetching related courses for {course_id}: {str(e)}")
+        return jsonify({'error': 'İlgili kurslar yüklenirken bir hata oluştu'}), 500
+
+@courses.route('/<int:course_id>/page', methods=['GET'])
+@jwt_required()
+def get_course_page(course_id):
+    """Kurs sayfası için kurs, eğitmen, ders listesi, değerlendirme özeti, kayıt ve ilerleme bilgisini tek yanıtta döndürür"""
+    try:
+        page = course_page.build(course_id, int(get_jwt_identity()))
+        if page is None:
+            return jsonify({'error': 'Kurs bulunamadı'}), 404
+        return jsonify(page), 200
+    except Exception as e:
+        current_app.logger.error(f"Error fetching course page {course_id}: {str(e)}")
+        return jsonify({'error': 'Kurs sayfası yüklenirken bir hata oluştu'}), 500
+
 @courses.route('/<int:course_id>/lessons/<int:lesson_id>', methods=['DELETE'])
 @jwt_required()
 def delete_lesson(course_id, lesson_id):
@@ -1885,7 +2083,9 @@ def delete_lesson(course_id, lesson_id):
             db.session.delete(assignment)
         
         # Dersi sil
+        old_lesson_count = course.lesson_count
         db.session.delete(lesson)
+        instructor_stats.record_lesson_change(course, old_lesson_count)
         db.session.commit()
         
         return jsonify({
@@ -1978,19 +2178,15 @@ def update_lesson(course_id, lesson_id):
         if changes:
             lesson.updated_at = datetime.now(TURKEY_TZ)
             
-            # Kursa kayıtlı öğrencilere bildirim gönder
-            enrollments = Enrollment.query.filter_by(course_id=course_id).all()
-            for enrollment in enrollments:
-                notification = Notification(
-                    user_id=enrollment.student_id,
-                    course_id=course_id,
-                    type='lesson_update',
-                    title=f'Ders Güncellendi: {lesson.title}',
-                    message=f'{course.title} kursundaki {lesson.title} dersi güncellendi.',
-                    is_read=False,
-                    created_at=datetime.now(TURKEY_TZ)
-                )
-                db.session.add(notification)
+            # Kursa kayıtlı öğrencilere bildirim (outbox üzerinden)
+            notification_outbox.enqueue(
+                course_id,
+                'lesson_update',
+                f'Ders Güncellendi: {lesson.title}',
+                f'{course.title} kursundaki {lesson.title} dersi güncellendi.',
+                reference_id=lesson.id,
+                created_at=datetime.now(TURKEY_TZ)
+            )
                 
         db.session.commit()
         
@@ -2049,7 +2245,8 @@ def delete_quiz(course_id, lesson_id, quiz_id):
         if quiz.lesson_id != lesson_id:
             return jsonify({'message': 'Quiz bu derse ait değil'}), 400
         
-        # Önce tüm quiz denemelerini ve cevapları sil
+        # Önce kuyruktaki teslimleri, tüm quiz denemelerini ve cevapları sil
+        db.session.execute(db.delete(QuizSubmission).where(QuizSubmission.quiz_id == quiz_id))
         attempts = QuizAttempt.query.filter_by(quiz_id=quiz_id).all()
         for attempt in attempts:
             # Denemeye ait cevapları sil
@@ -2146,31 +2343,54 @@ def update_quiz(course_id, lesson_id, quiz_id):
         quiz.time_limit = data.get('time_limit')
         quiz.passing_score = data.get('passing_score', 60)
         
-        # Mevcut soruları ve seçenekleri sil
-        for question in quiz.questions:
-            for option in question.options:
-                db.session.delete(option)
-            db.session.delete(question)
-        
-        # Yeni soruları ekle
+        # Sorular ve seçenekler id ile eşleştirilip yerinde güncellenir; böylece verilmiş cevaplar soruya bağlı kalır
+        # ve anahtar düzeltmesinden sonra /regrade eski denemeleri yeniden puanlayabilir. id'siz (veya bu quize ait
+        # olmayan id'li) sorular ve seçenekler yeni satır olarak eklenir
+        existing = {q.id: q for q in quiz.questions}
+        kept_questions = set()
+        removed_options = []
         for q_data in data['questions']:
-            question = QuizQuestion(
-                quiz=quiz,
-                question_text=q_data['question_text'],
-                question_type=q_data.get('question_type', 'multiple_choice'),
-                points=q_data.get('points', 10)
-            )
-            db.session.add(question)
-            
-            # Çoktan seçmeli soru seçeneklerini ekle
-            if question.question_type == 'multiple_choice' and 'options' in q_data:
-                for opt_data in q_data['options']:
-                    option = QuizOption(
-                        question=question,
-                        option_text=opt_data['text'],
-                        is_correct=opt_data.get('is_correct', False)
-                    )
+            question = existing.get(q_data.get('id'))
+            if question is None or question.id in kept_questions:
+                question = QuizQuestion(quiz=quiz)
+                db.session.add(question)
+            else:
+                kept_questions.add(question.id)
+            question.question_text = q_data['question_text']
+            question.question_type = q_data.get('question_type', 'multiple_choice')
+            question.points = q_data.get('points', 10)
+
+            # Çoktan seçmeli soru seçeneklerini güncelle
+            options = {o.id: o for o in question.options} if question.id else {}
+            kept_options = set()
+            opt_list = q_data.get('options', []) if question.question_type == 'multiple_choice' else []
+            for opt_data in opt_list:
+                option = options.get(opt_data.get('id'))
+                if option is None or option.id in kept_options:
+                    option = QuizOption(question=question)
                     db.session.add(option)
+                else:
+                    kept_options.add(option.id)
+                option.option_text = opt_data['text']
+                option.is_correct = opt_data.get('is_correct', False)
+            removed_options.extend(o for o_id, o in options.items() if o_id not in kept_options)
+
+        # Yükte olmayan sorulara verilmiş cevaplar soruyla birlikte silinir; çıkarılan seçeneği seçen cevaplar seçimsiz kalır
+        removed_questions = [q for q_id, q in existing.items() if q_id not in kept_questions]
+        if removed_questions:
+            db.session.execute(db.delete(QuizAnswer).where(QuizAnswer.question_id.in_([q.id for q in removed_questions])))
+        for question in removed_questions:
+            removed_options.extend(question.options)
+        if removed_options:
+            db.session.execute(
+                db.update(QuizAnswer)
+                .where(QuizAnswer.selected_option_id.in_([o.id for o in removed_options]))
+                .values(selected_option_id=None)
+            )
+        for option in removed_options:
+            db.session.delete(option)
+        for question in removed_questions:
+            db.session.delete(question)
         
         try:
             db.session.commit()
@@ -2461,21 +2681,17 @@ def course_assignments(course_id):
                 )
                 
                 db.session.add(assignment)
+                db.session.flush() # assignment.id'nin oluşması için
                 
-                # Kursa kayıtlı öğrencilere bildirim gönder
-                enrollments = Enrollment.query.filter_by(course_id=course_id).all()
-                for enrollment in enrollments:
-                    notification = Notification(
-                        user_id=enrollment.student_id,
-                        course_id=course_id,
-                        type='new_assignment',
-                        title=f'Yeni Ödev: {assignment.title}',
-                        message=f'{course.title} kursuna yeni bir ödev eklendi: {assignment.title}. Son teslim tarihi: {assignment.due_date.strftime("%d.%m.%Y %H:%M")}',
-                        is_read=False,
-                        created_at=datetime.now(TURKEY_TZ),
-                        reference_id=assignment.id
-                    )
-                    db.session.add(notification)
+                # Kursa kayıtlı öğrencilere bildirim (outbox üzerinden)
+                notification_outbox.enqueue(
+                    course_id,
+                    'new_assignment',
+                    f'Yeni Ödev: {assignment.title}',
+                    f'{course.title} kursuna yeni bir ödev eklendi: {assignment.title}. Son teslim tarihi: {assignment.due_date.strftime("%d.%m.%Y %H:%M")}',
+                    reference_id=assignment.id,
+                    created_at=datetime.now(TURKEY_TZ)
+                )
                 
                 db.session.commit()
                 
@@ -0,0 +1,13 @@
+from datetime import datetime # İmleç çözümlemesi için kullanılır.
+
+# (created_at, id) anahtarıyla sayfalanan listelerin ortak imleç biçimi: "<created_at ISO>,<id>"
+
+def encode_cursor(created_at, row_id): # Sayfanın son satırından imleç üretir
+    return f'{created_at.isoformat()},{row_id}'
+
+def decode_cursor(value): # Geçersiz imleçte ValueError fırlatır
+    created_at, row_id = value.rsplit(',', 1)
+    return datetime.fromisoformat(created_at), int(row_id)
+
+def parse_cursor(value): # Boş değer None, geçersiz imleç ValueError
+    return decode_cursor(value) if value else None
@@ -0,0 +1,263 @@
+from datetime import datetime, UTC # Örnek sorgu parametreleri için kullanılır.
+from models import db, Course, Lesson, Enrollment, Progress, Notification, Assignment, AssignmentSubmission, QuizAttempt, InstructorStudent, ActivityEvent, UnreadCount, CourseRank, User, Review, CourseNeighbor, QuizSubmission, QuizAnswer, QuizQuestion # models.py dosyasındaki modelleri import ediyoruz.
+import course_search # Tam metin arama sorgusu için
+import quiz_ingest # Quiz teslim kuyruğu sorguları için
+import quiz_regrade # Toplu yeniden puanlama güncellemeleri için
+
+# Uygulamanın sıcak sorguları: ad -> Select üreten fonksiyon
+HOT_QUERIES = {}
+
+def hot_query(name): # Sorguyu denetim listesine kaydeder
+    def decorator(builder):
+        HOT_QUERIES[name] = builder
+        return builder
+    return decorator
+
+@hot_query('enrollment_by_student_course')
+def _enrollment_by_student_course():
+    return db.select(Enrollment).where(Enrollment.student_id == 1, Enrollment.course_id == 1)
+
+@hot_query('enrollments_by_course')
+def _enrollments_by_course():
+    return db.select(Enrollment.student_id).where(Enrollment.course_id == 1)
+
+@hot_query('progress_by_enrollment_lesson')
+def _progress_by_enrollment_lesson():
+    return db.select(Progress).where(Progress.enrollment_id == 1, Progress.lesson_id == 1)
+
+@hot_query('unread_notifications')
+def _unread_notifications():
+    return (
+        db.select(Notification)
+        .where(Notification.user_id == 1, Notification.is_read == False)
+        .order_by(Notification.created_at.desc())
+        .limit(10)
+    )
+
+@hot_query('unread_notification_count')
+def _unread_notification_count():
+    return db.select(db.func.count()).select_from(Notification).where(
+        Notification.user_id == 1, Notification.is_read == False
+    )
+
+@hot_query('course_search')
+def _course_search():
+    search = course_search.match('python')
+    return (
+        db.select(Course.id)
+        .join(search, search.c.course_id == Course.id)
+        .where(Course.category == 'programming')
+        .order_by(search.c.score.desc())
+        .limit(10)
+    )
+
+@hot_query('course_fuzzy_search')
+def _course_fuzzy_search():
+    search = course_search.fuzzy('pyhton')
+    return (
+        db.select(Course.id)
+        .join(search, search.c.course_id == Course.id)
+        .order_by(search.c.score.desc())
+        .limit(10)
+    )
+
+@hot_query('course_trending')
+def _course_trending():
+    return (
+        db.select(Course.id)
+        .join(CourseRank, CourseRank.course_id == Course.id)
+        .order_by(CourseRank.score.desc(), CourseRank.course_id.desc())
+        .limit(10)
+    )
+
+@hot_query('course_list')
+def _course_list():
+    return (
+        db.select(Course.id, Course.title, User.username)
+        .join(User, User.id == Course.instructor_id)
+        .where(db.tuple_(Course.created_at, Course.id) < (datetime.now(UTC), 100))
+        .order_by(Course.created_at.desc(), Course.id.desc())
+        .limit(21)
+    )
+
+@hot_query('review_page')
+def _review_page():
+    return (
+        db.select(Review)
+        .where(Review.course_id == 1, db.tuple_(Review.created_at, Review.id) < (datetime.now(UTC), 100))
+        .order_by(Review.created_at.desc(), Review.id.desc())
+        .limit(21)
+    )
+
+@hot_query('course_related')
+def _course_related():
+    return (
+        db.select(Course.id, Course.title, CourseNeighbor.score)
+        .join(Course, Course.id == CourseNeighbor.neighbor_id)
+        .where(CourseNeighbor.course_id == 1)
+        .order_by(CourseNeighbor.rank)
+        .limit(10)
+    )
+
+@hot_query('student_recommendations')
+def _student_recommendations():
+    enrolled = db.select(Enrollment.course_id).where(Enrollment.student_id == 1)
+    score = db.func.sum(CourseNeighbor.score).label('score')
+    return (
+        db.select(Course.id, Course.title, score)
+        .join(Course, Course.id == CourseNeighbor.neighbor_id)
+        .where(CourseNeighbor.course_id.in_(enrolled), CourseNeighbor.neighbor_id.not_in(enrolled))
+        .group_by(Course.id, Course.title)
+        .order_by(score.desc(), Course.id)
+        .limit(10)
+    )
+
+@hot_query('notification_page')
+def _notification_page():
+    return (
+        db.select(Notification)
+        .where(Notification.user_id == 1, db.tuple_(Notification.created_at, Notification.id) < (datetime.now(UTC), 100))
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
+        .limit(21)
+    )
+
+@hot_query('unread_count')
+def _unread_count():
+    return db.select(UnreadCount.count).where(UnreadCount.user_id == 1)
+
+@hot_query('submission_by_assignment_user')
+def _submission_by_assignment_user():
+    return db.select(AssignmentSubmission).where(
+        AssignmentSubmission.assignment_id == 1, AssignmentSubmission.user_id == 1
+    )
+
+@hot_query('lessons_by_course')
+def _lessons_by_course():
+    return db.select(Lesson).where(Lesson.course_id == 1).order_by(Lesson.order.asc())
+
+@hot_query('quiz_attempts_by_user')
+def _quiz_attempts_by_user():
+    return (
+        db.select(QuizAttempt)
+        .where(QuizAttempt.quiz_id == 1, QuizAttempt.user_id == 1)
+        .order_by(QuizAttempt.started_at.desc())
+    )
+
+@hot_query('quiz_result_answers')
+def _quiz_result_answers():
+    return (
+        db.select(QuizAnswer.attempt_id, QuizAnswer.answer_text, QuizQuestion.question_text)
+        .join(QuizQuestion, QuizQuestion.id == QuizAnswer.question_id)
+        .where(QuizAnswer.attempt_id.in_([1, 2, 3]))
+        .order_by(QuizAnswer.attempt_id, QuizAnswer.id)
+    )
+
+@hot_query('quiz_analytics_stamp')
+def _quiz_analytics_stamp():
+    return (
+        db.select(db.func.count(QuizAttempt.completed_at), db.func.max(QuizAttempt.completed_at))
+        .where(QuizAttempt.quiz_id == 1)
+    )
+
+@hot_query('quiz_analytics_responses')
+def _quiz_analytics_responses():
+    return db.select(QuizAttempt.responses).where(QuizAttempt.quiz_id == 1, QuizAttempt.completed_at.isnot(None))
+
+@hot_query('quiz_regrade_answers')
+def _quiz_regrade_answers():
+    return quiz_regrade.answers_update(1, 1, 2000)
+
+@hot_query('quiz_regrade_attempts')
+def _quiz_regrade_attempts():
+    return quiz_regrade.attempts_update(1, 1, 2000, 100)
+
+@hot_query('quiz_submission_claim')
+def _quiz_submission_claim():
+    return (
+        db.select(QuizSubmission.id)
+        .where(quiz_ingest._claimable(datetime.now(UTC)))
+        .order_by(QuizSubmission.id)
+        .limit(200)
+    )
+
+@hot_query('quiz_attempt_status')
+def _quiz_attempt_status():
+    return (
+        db.select(QuizAttempt, QuizSubmission.status, QuizSubmission.last_error)
+        .outerjoin(QuizSubmission, QuizSubmission.attempt_id == QuizAttempt.id)
+        .where(QuizAttempt.id == 1)
+    )
+
+@hot_query('upcoming_assignments')
+def _upcoming_assignments():
+    now = datetime.now(UTC)
+    return db.select(Assignment).where(Assignment.lesson_id == 1, Assignment.due_date > now)
+
+@hot_query('courses_by_instructor')
+def _courses_by_instructor():
+    return db.select(Course.id).where(Course.instructor_id == 1)
+
+@hot_query('active_instructor_students')
+def _active_instructor_students():
+    return db.select(db.func.count()).select_from(InstructorStudent).where(
+        InstructorStudent.instructor_id == 1, InstructorStudent.last_active_at >= datetime.now(UTC)
+    )
+
+@hot_query('activity_feed')
+def _activity_feed():
+    return (
+        db.select(ActivityEvent)
+        .where(ActivityEvent.user_id == 1, db.tuple_(ActivityEvent.created_at, ActivityEvent.id) < (datetime.now(UTC), 100))
+        .order_by(ActivityEvent.created_at.desc(), ActivityEvent.id.desc())
+        .limit(21)
+    )
+
+def explain(connection, stmt): # Sorgunun planını satır listesi olarak döndürür
+    dialect = connection.dialect
+    compiled = stmt.compile(dialect=dialect, compile_kwargs={'render_postcompile': True})
+    params = compiled.params
+    if dialect.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+
+    if dialect.name == 'sqlite':
+        rows = connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + compiled.string, params).fetchall()
+        return [row[-1] for row in rows] # (id, parent, notused, detail)
+
+    rows = connection.exec_driver_sql('EXPLAIN ' + compiled.string, params).fetchall()
+    return [row[0] for row in rows]
+
+def full_scans(plan, dialect_name): # Plan içindeki tam tablo taramalarını bulur
+    if dialect_name == 'sqlite':
+        # "SCAN tablo" index kullanmadan tüm tabloyu okur; "SEARCH ... USING INDEX" sorun değildir
+        # Alt sorgu sonuçları (MATERIALIZE/CO-ROUTINE) tablo değildir; kendi planları ayrıca denetlenir
+        derived = {line.split(' ', 1)[1] for line in plan if line.startswith(('MATERIALIZE ', 'CO-ROUTINE '))}
+        return [
+            line for line in plan
+            if line.startswith('SCAN ') and 'USING' not in line and 'CONSTANT ROW' not in line
+            and 'VIRTUAL TABLE INDEX' not in line # FTS5 eşleşmesi kendi index'ini kullanır
+            and line[len('SCAN '):] not in derived
+        ]
+    return [line.strip() for line in plan if 'Seq Scan' in line]
+
+def run_audit(names=None): # Kayıtlı sorguların planlarını çıkarır ve tam taramaları işaretler
+    results = []
+    with db.engine.connect() as connection:
+        if connection.dialect.name == 'postgresql':
+            # Küçük tablolarda planlayıcı index'i atlayabilir; index yolu varsa onu seçmeye zorla
+            connection.exec_driver_sql('SET enable_seqscan = off')
+
+        for name, builder in HOT_QUERIES.items():
+            if names and name not in names:
+                continue
+            plan = explain(connection, builder())
+            scans = full_scans(plan, connection.dialect.name)
+            results.append({
+                'name': name,
+                'plan': plan,
+                'full_scans': scans,
+                'ok': not scans
+            })
+
+        if connection.dialect.name == 'postgresql':
+            connection.exec_driver_sql('RESET enable_seqscan')
+    return results
@@ -3,6 +3,8 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_cors import CORS # Flask-CORS'u import ediyoruz.
 from models import db, Course, Enrollment, Progress, Lesson, User, Assignment, AssignmentSubmission
 from datetime import datetime, UTC, timedelta # datetime modülünü import ediyoruz.
+import progress_stats # Kayıt ilerlemelerini toplu hesaplayan modül
+import instructor_stats # Eğitmen istatistik özetlerini güncel tutan modül
 
 enrollments = Blueprint('enrollments', __name__) # Enrollments blueprint'ini oluşturuyoruz.
 CORS(enrollments, resources={ # CORS'u ayarlıyoruz.
@@ -23,6 +25,34 @@ def is_instructor(user_id): # Kullanıcının eğitmen olup olmadığını kontr
     user = User.query.get(user_id) # Kullanıcıyı buluyoruz.
     return user and user.role == 'instructor'
 
+def _list_params(): # Listeleme uç noktaları için sıralama ve sayfalama parametrelerini okur
+    sort = request.args.get('sort', 'enrolled_at')
+    order = request.args.get('order', 'desc')
+    page = request.args.get('page', type=int)
+    per_page = request.args.get('per_page', 20, type=int)
+    
+    if sort not in progress_stats.SORT_FIELDS:
+        return None, (jsonify({'error': f"sort must be one of: {', '.join(progress_stats.SORT_FIELDS)}"}), 400)
+    if order not in ('asc', 'desc'):
+        return None, (jsonify({'error': 'order must be asc or desc'}), 400)
+    if page is not None and page < 1:
+        return None, (jsonify({'error': 'page must be 1 or greater'}), 400)
+    if per_page < 1 or per_page > 100:
+        return None, (jsonify({'error': 'per_page must be between 1 and 100'}), 400)
+    
+    return {'sort': sort, 'order': order, 'page': page, 'per_page': per_page}, None
+
+def _list_response(key, items, total, params): # page verilmediyse eski düz liste biçimini korur
+    if params['page'] is None:
+        return jsonify(items)
+    return jsonify({
+        key: items,
+        'total': total,
+        'page': params['page'],
+        'per_page': params['per_page'],
+        'total_pages': (total + params['per_page'] - 1) // params['per_page']
+    })
+
 @enrollments.route('/courses/<int:course_id>/enroll', methods=['POST']) # Kursa kayıt ol
 @jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
 def enroll_course(course_id): # Kursa kayıt ol
@@ -59,6 +89,7 @@ def enroll_course(course_id): # Kursa kayıt ol
         )
         db.session.add(progress)
     
+    instructor_stats.record_enrollment(enrollment) # Eğitmen istatistiklerini güncelle
     db.session.commit() # Değişiklikleri kaydediyoruz.
     
     return jsonify({
@@ -86,7 +117,7 @@ def get_my_courses(): # Öğrencinin kayıtlı olduğu kursları al
             'instructor': enrollment.course.instructor.username,
             'progress': {
                 'completed_lessons': len([p for p in enrollment.progress if p.completed]),
-                'total_lessons': len(enrollment.course.lessons)
+                'total_lessons': enrollment.course.lesson_count
             }
         }
     } for enrollment in enrollments])
@@ -104,17 +135,18 @@ def get_course_progress(course_id): # Kursun ilerleme durumunu al
     
     # Dersleri ve ilerleme durumunu al
     lessons = Lesson.query.filter_by(course_id=course_id).order_by(Lesson.order).all()
-    progress_records = {p.lesson_id: p for p in enrollment.progress}
+    progress_records = {p.lesson_id: p for p in Progress.query.filter_by(enrollment_id=enrollment.id)}
+    completed = [lesson for lesson in lessons if lesson.id in progress_records and progress_records[lesson.id].completed]
     
     return jsonify({
         'course_title': enrollment.course.title,
-        'total_progress': len([p for p in enrollment.progress if p.completed]) / len(lessons) * 100,
+        'total_progress': len(completed) / len(lessons) * 100 if lessons else 0,
         'lessons': [{
             'id': lesson.id,
             'title': lesson.title,
             'order': lesson.order,
-            'completed': progress_records.get(lesson.id, {}).completed or False,
-            'completed_at': progress_records.get(lesson.id, {}).completed_at
+            'completed': lesson in completed,
+            'completed_at': progress_records[lesson.id].completed_at if lesson.id in progress_records else None
         } for lesson in lessons]
     })
 
@@ -146,8 +178,10 @@ def complete_lesson(lesson_id): # Dersi tamamla
         db.session.add(progress)
     
     # Dersi tamamla
+    was_completed = bool(progress.completed)
     progress.completed = True
     progress.completed_at = datetime.now(UTC)
+    instructor_stats.record_lesson_completed(enrollment, lesson, was_completed) # Eğitmen istatistiklerini güncelle
     db.session.commit()
     
     return jsonify({
@@ -168,45 +202,26 @@ def get_enrolled_courses(): # Öğrencinin kayıtlı olduğu kursları al
     if not is_student(user_id):
         return jsonify({'error': 'Only students can view enrolled courses'}), 403
     
-    # Kullanıcının kayıtlı olduğu kursları al
-    enrollments = Enrollment.query.filter_by(student_id=user_id).all()
-    
-    # Kayıt yoksa boş liste döndür (404 yerine 200 durum koduyla)
-    if not enrollments:
-        return jsonify([]), 200
-    
-    # Kayıtlar varsa kurs bilgilerini döndür
-    courses = []
-    for enrollment in enrollments:
-        course = Course.query.get(enrollment.course_id)
-        if course:
-            # Kursa ait derslerin sayısını ve tamamlananları bul
-            lesson_count = Lesson.query.filter_by(course_id=course.id).count()
-            completed_count = Progress.query.join(Lesson).filter(
-                Progress.enrollment_id == enrollment.id,
-                Progress.completed == True,
-                Lesson.course_id == course.id
-            ).count()
-            
-            # İlerleme yüzdesini hesapla
-            progress_percentage = 0
-            if lesson_count > 0:
-                progress_percentage = int((completed_count / lesson_count) * 100)
-            
-            instructor = User.query.get(course.instructor_id)
-            
-            courses.append({
-                'id': course.id,
-                'title': course.title,
-                'description': course.description,
-                'image_url': course.image_url,
-                'instructor_name': instructor.username if instructor else 'Unknown',
-                'progress': progress_percentage,
-                'enrolled_at': enrollment.enrolled_at.isoformat(),
-                'last_activity_at': None  # Bu alan eklenebilir
-            })
-    
-    return jsonify(courses)
+    params, error = _list_params()
+    if error:
+        return error
+    
+    # Kayıtları, kurs ve ilerleme bilgisiyle birlikte tek sorguda al
+    stmt = progress_stats.enrollment_progress(Enrollment.student_id == user_id, sort=params['sort'], order=params['order'])
+    rows, total = progress_stats.fetch(stmt, params['page'], params['per_page'])
+    
+    courses = [{
+        'id': row.Course.id,
+        'title': row.Course.title,
+        'description': row.Course.description,
+        'image_url': row.Course.image_url,
+        'instructor_name': row.instructor_name or 'Unknown',
+        'progress': row.progress,
+        'enrolled_at': row.Enrollment.enrolled_at.isoformat(),
+        'last_activity_at': row.last_activity_at.isoformat() if row.last_activity_at else None
+    } for row in rows]
+    
+    return _list_response('courses', courses, total, params)
 
 @enrollments.route('/history', methods=['GET']) # Öğrencinin tüm kayıt geçmişini döndürür
 @jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
@@ -218,57 +233,29 @@ def get_enrollment_history(): # Öğrencinin tüm kayıt geçmişini döndürür
     if not is_student(user_id):
         return jsonify({'error': 'Only students can view enrollment history'}), 403
     
-    # Kullanıcının kayıtlı olduğu kursları al
-    enrollments = Enrollment.query.filter_by(student_id=user_id).all()
+    params, error = _list_params()
+    if error:
+        return error
     
-    # Kayıt yoksa boş liste döndür
-    if not enrollments:
-        return jsonify([]), 200
+    stmt = progress_stats.enrollment_progress(Enrollment.student_id == user_id, sort=params['sort'], order=params['order'])
+    rows, total = progress_stats.fetch(stmt, params['page'], params['per_page'])
     
-    # Kayıt geçmişini hazırla
     history = []
-    for enrollment in enrollments:
-        course = Course.query.get(enrollment.course_id)
-        if course:
-            instructor = User.query.get(course.instructor_id)
-            
-            # Tüm dersleri ve tamamlanan dersleri say
-            lesson_count = Lesson.query.filter_by(course_id=course.id).count()
-            completed_count = Progress.query.join(Lesson).filter(
-                Progress.enrollment_id == enrollment.id,
-                Progress.completed == True,
-                Lesson.course_id == course.id
-            ).count()
-            
-            # Kursun durumunu belirle
-            status = 'active'
-            completed_at = None
-            
-            # Eğer tüm dersler tamamlanmışsa, kurs tamamlanmış demektir
-            if lesson_count > 0 and completed_count == lesson_count:
-                status = 'completed'
-                # Son tamamlanan dersin tarihini bul
-                last_progress = Progress.query.join(Lesson).filter(
-                    Progress.enrollment_id == enrollment.id,
-                    Progress.completed == True,
-                    Lesson.course_id == course.id
-                ).order_by(Progress.completed_at.desc()).first()
-                
-                if last_progress and last_progress.completed_at:
-                    completed_at = last_progress.completed_at.isoformat()
-            
-            history.append({
-                'id': enrollment.id,
-                'course_id': course.id,
-                'course_title': course.title,
-                'instructor_name': instructor.username if instructor else 'Unknown',
-                'enrolled_at': enrollment.enrolled_at.isoformat(),
-                'status': status,
-                'completed_at': completed_at,
-                'certificate_id': None  # Sertifika özelliği henüz eklenmedi
-            })
-    
-    return jsonify(history)
+    for row in rows:
+        # Eğer tüm dersler tamamlanmışsa, kurs tamamlanmış demektir
+        completed = progress_stats.is_completed(row)
+        history.append({
+            'id': row.Enrollment.id,
+            'course_id': row.Course.id,
+            'course_title': row.Course.title,
+            'instructor_name': row.instructor_name or 'Unknown',
+            'enrolled_at': row.Enrollment.enrolled_at.isoformat(),
+            'status': 'completed' if completed else 'active',
+            'completed_at': row.completed_at.isoformat() if completed and row.completed_at else None,
+            'certificate_id': None  # Sertifika özelliği henüz eklenmedi
+        })
+    
+    return _list_response('history', history, total, params)
 
 @enrollments.route('/instructor/students', methods=['GET']) # Eğitmenin öğrencilerini döndürür
 @jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
@@ -280,69 +267,37 @@ def get_instructor_students(): # Eğitmenin öğrencilerini döndürür
     if not is_instructor(user_id):
         return jsonify({'error': 'Only instructors can view their students'}), 403
     
-    # Eğitmenin kurslarını al
-    instructor_courses = Course.query.filter_by(instructor_id=user_id).all()
-    if not instructor_courses:
-        return jsonify([]), 200
-    
-    course_ids = [course.id for course in instructor_courses]
-    
-    # Bu kurslara kayıtlı öğrencileri al
-    students_data = []
-    enrollments = Enrollment.query.filter(Enrollment.course_id.in_(course_ids)).all()
-    
-    for enrollment in enrollments:
-        student = User.query.get(enrollment.student_id)
-        course = Course.query.get(enrollment.course_id)
-        
-        if not student or not course:
-            continue
-        
-        # Öğrencinin kurs ilerlemesini hesapla
-        lesson_count = Lesson.query.filter_by(course_id=course.id).count()
-        completed_count = Progress.query.join(Lesson).filter(
-            Progress.enrollment_id == enrollment.id,
-            Progress.completed == True,
-            Lesson.course_id == course.id
-        ).count()
-        
-        progress_percentage = 0
-        if lesson_count > 0:
-            progress_percentage = int((completed_count / lesson_count) * 100)
-        
-        completed = lesson_count > 0 and completed_count == lesson_count
-        
-        # Son aktivite tarihini bul
-        last_activity = Progress.query.join(Lesson).filter(
-            Progress.enrollment_id == enrollment.id,
-            Lesson.course_id == course.id
-        ).order_by(Progress.completed_at.desc()).first()
-        
-        last_activity_at = None
-        if last_activity and last_activity.completed_at:
-            last_activity_at = last_activity.completed_at.isoformat()
-        else:
-            last_activity_at = enrollment.enrolled_at.isoformat()
-        
-        students_data.append({
-            'id': enrollment.id,
-            'student': {
-                'id': student.id,
-                'name': student.username,  # veya full_name alan varsa
-                'email': student.email,
-                'avatar': student.profile_image if hasattr(student, 'profile_image') else None
-            },
-            'course': {
-                'id': course.id,
-                'title': course.title
-            },
-            'enrolled_at': enrollment.enrolled_at.isoformat(),
-            'progress': progress_percentage,
-            'last_activity_at': last_activity_at,
-            'completed': completed
-        })
+    params, error = _list_params()
+    if error:
+        return error
     
-    return jsonify(students_data)
+    # Eğitmenin kurslarına yapılan kayıtları tek sorguda al
+    stmt = progress_stats.enrollment_progress(
+        Enrollment.course_id.in_(db.select(Course.id).where(Course.instructor_id == user_id)),
+        sort=params['sort'],
+        order=params['order']
+    )
+    rows, total = progress_stats.fetch(stmt, params['page'], params['per_page'])
+    
+    students_data = [{
+        'id': row.Enrollment.id,
+        'student': {
+            'id': row.student.id,
+            'name': row.student.username,  # veya full_name alan varsa
+            'email': row.student.email,
+            'avatar': row.student.profile_image if hasattr(row.student, 'profile_image') else None
+        },
+        'course': {
+            'id': row.Course.id,
+            'title': row.Course.title
+        },
+        'enrolled_at': row.Enrollment.enrolled_at.isoformat(),
+        'progress': row.progress,
+        'last_activity_at': row.last_activity_at.isoformat() if row.last_activity_at else None,
+        'completed': progress_stats.is_completed(row)
+    } for row in rows]
+    
+    return _list_response('students', students_data, total, params)
 
 @enrollments.route('/instructor/student-stats', methods=['GET']) # Eğitmenin öğrenci istatistiklerini döndürür
 @jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
@@ -354,89 +309,8 @@ def get_instructor_student_stats(): # Eğitmenin öğrenci istatistiklerini dön
     if not is_instructor(user_id):
         return jsonify({'error': 'Only instructors can view student statistics'}), 403
     
-    # Eğitmenin kurslarını al
-    instructor_courses = Course.query.filter_by(instructor_id=user_id).all()
-    if not instructor_courses:
-        return jsonify({
-            'total_students': 0,
-            'active_students': 0,
-            'completions_this_month': 0,
-            'average_course_completion': 0
-        }), 200
-    
-    course_ids = [course.id for course in instructor_courses]
-    
-    # Bu kurslara kayıtlı öğrencileri al
-    enrollments = Enrollment.query.filter(Enrollment.course_id.in_(course_ids)).all()
-    
-    total_students = len(set(enrollment.student_id for enrollment in enrollments))
-    
-    # Son 2 hafta içinde aktif olan öğrencileri hesapla
-    two_weeks_ago = datetime.utcnow() - timedelta(days=14)
-    active_student_ids = set()
-    
-    for enrollment in enrollments:
-        # Son aktivite
-        last_activity = Progress.query.join(Lesson).filter(
-            Progress.enrollment_id == enrollment.id,
-            Lesson.course_id.in_(course_ids),
-            Progress.completed_at >= two_weeks_ago
-        ).order_by(Progress.completed_at.desc()).first()
-        
-        if last_activity:
-            active_student_ids.add(enrollment.student_id)
-    
-    active_students = len(active_student_ids)
-    
-    # Bu ay tamamlanan kurs sayısı
-    this_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    completions_this_month = 0
-    
-    # Kurs tamamlama oranları
-    completion_rates = []
-    
-    for course_id in course_ids:
-        lessons = Lesson.query.filter_by(course_id=course_id).all()
-        lesson_count = len(lessons)
-        
-        if lesson_count == 0:
-            continue
-        
-        course_enrollments = Enrollment.query.filter_by(course_id=course_id).all()
-        
-        for enrollment in course_enrollments:
-            completed_count = Progress.query.join(Lesson).filter(
-                Progress.enrollment_id == enrollment.id,
-                Progress.completed == True,
-                Lesson.course_id == course_id
-            ).count()
-            
-            # Kurs tamamlama oranı
-            completion_rate = (completed_count / lesson_count) * 100
-            completion_rates.append(completion_rate)
-            
-            # Bu ay tamamlanan kursları kontrol et
-            if completed_count == lesson_count:
-                last_completed = Progress.query.join(Lesson).filter(
-                    Progress.enrollment_id == enrollment.id,
-                    Progress.completed == True,
-                    Lesson.course_id == course_id
-                ).order_by(Progress.completed_at.desc()).first()
-                
-                if last_completed and last_completed.completed_at and last_completed.completed_at >= this_month_start:
-                    completions_this_month += 1
-    
-    # Ortalama tamamlama oranı
-    average_completion = 0
-    if completion_rates:
-        average_completion = int(sum(completion_rates) / len(completion_rates))
-    
-    return jsonify({
-        'total_students': total_students,
-        'active_students': active_students,
-        'completions_this_month': completions_this_month,
-        'average_course_completion': average_completion
-    })
+    # Önceden hesaplanmış istatistik satırını oku (bkz. instructor_stats.py)
+    return jsonify(instructor_stats.summary(int(user_id)))
 
 @enrollments.route('/instructor/students/<int:student_id>/progress', methods=['GET']) # Belirli bir öğrencinin tüm kurslarındaki ilerleme detaylarını döndürür
 @jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
@@ -454,77 +328,32 @@ def get_student_progress(student_id): # Belirli bir öğrencinin tüm kursların
         return jsonify({'error': 'User is not a student'}), 400
     
     # Eğitmenin kurslarını al
-    instructor_courses = Course.query.filter_by(instructor_id=user_id).all()
-    if not instructor_courses:
+    course_ids = db.session.scalars(db.select(Course.id).where(Course.instructor_id == user_id)).all()
+    if not course_ids:
         return jsonify({'error': 'No courses found for instructor'}), 404
     
-    course_ids = [course.id for course in instructor_courses]
-    
-    # Öğrencinin bu kurslara kayıtlarını bul
-    enrollments = Enrollment.query.filter(
+    # Öğrencinin bu kurslara kayıtlarını ilerleme bilgisiyle birlikte al
+    stmt = progress_stats.enrollment_progress(
         Enrollment.student_id == student_id,
         Enrollment.course_id.in_(course_ids)
-    ).all()
+    )
+    rows, _ = progress_stats.fetch(stmt)
     
-    if not enrollments:
+    if not rows:
         return jsonify({'error': 'Student is not enrolled in any of your courses'}), 404
     
-    # Öğrenci bilgilerini ve kurs ilerlemelerini hazırla
-    courses_progress = []
-    for enrollment in enrollments:
-        course = Course.query.get(enrollment.course_id)
-        
-        # Kurs derslerini ve ödevlerini al
-        lessons = Lesson.query.filter_by(course_id=course.id).all()
-        assignments = Assignment.query.join(Lesson).filter(Lesson.course_id == course.id).all()
-        
-        # Tamamlanan dersleri say
-        completed_lessons = Progress.query.join(Lesson).filter(
-            Progress.enrollment_id == enrollment.id,
-            Progress.completed == True,
-            Lesson.course_id == course.id
-        ).count()
-        
-        # Tamamlanan ödevleri ve ortalama notu hesapla
-        completed_assignments = 0
-        total_grade = 0
-        graded_count = 0
-        
-        for assignment in assignments:
-            submission = AssignmentSubmission.query.filter_by(
-                assignment_id=assignment.id,
-                user_id=student_id
-            ).first()
-            
-            if submission and submission.submitted_at:
-                completed_assignments += 1
-                if submission.grade is not None:
-                    total_grade += submission.grade
-                    graded_count += 1
-        
-        # Son aktivite tarihini bul
-        last_activity = Progress.query.join(Lesson).filter(
-            Progress.enrollment_id == enrollment.id,
-            Lesson.course_id == course.id
-        ).order_by(Progress.completed_at.desc()).first()
-        
-        last_activity_at = None
-        if last_activity and last_activity.completed_at:
-            last_activity_at = last_activity.completed_at.isoformat()
-        else:
-            last_activity_at = enrollment.enrolled_at.isoformat()
-        
-        courses_progress.append({
-            'id': course.id,
-            'title': course.title,
-            'progress': int((completed_lessons / len(lessons) * 100) if lessons else 0),
-            'completed_lessons': completed_lessons,
-            'total_lessons': len(lessons),
-            'last_activity': last_activity_at,
-            'completed_assignments': completed_assignments,
-            'total_assignments': len(assignments),
-            'average_grade': round(total_grade / graded_count if graded_count > 0 else 0, 2)
-        })
+    # Ödev sayıları ve notlar kurs başına gruplanmış tek sorgularla hesaplanır
+    assignments = progress_stats.assignment_stats(student_id, [row.Course.id for row in rows])
+    
+    courses_progress = [{
+        'id': row.Course.id,
+        'title': row.Course.title,
+        'progress': row.progress,
+        'completed_lessons': row.completed_lessons,
+        'total_lessons': row.Course.lesson_count,
+        'last_activity': row.last_activity_at.isoformat() if row.last_activity_at else None,
+        **assignments[row.Course.id]
+    } for row in rows]
     
     return jsonify({
         'id': student.id,
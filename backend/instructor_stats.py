@@ -0,0 +1,306 @@
+from datetime import datetime, timedelta # Aktiflik penceresi ve ay anahtarı için kullanılır.
+from sqlalchemy import event # Silinen kursların istatistik satırını kaldırmak için kullanılır.
+from models import db, User, Course, Enrollment, Progress, Lesson, CourseStats, InstructorStats, InstructorStudent # models.py dosyasındaki modelleri import ediyoruz.
+import progress_stats # Kayıt başına ilerleme özeti için kullanılır.
+
+ACTIVE_DAYS = 14 # Son kaç gün içinde ders tamamlayan öğrenci aktif sayılır
+
+def _now():
+    return datetime.utcnow()
+
+def _month(moment=None): # Aylık tamamlama sayacının anahtarı ('YYYY-MM')
+    return (moment or _now()).strftime('%Y-%m')
+
+def _month_start():
+    return _now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+def _update(model, *criteria, **values): # Oturumdaki nesnelerle eşitlemeden doğrudan UPDATE çalıştırır
+    return db.session.execute(
+        db.update(model).where(*criteria).values(**values).execution_options(synchronize_session=False)
+    )
+
+def _increment(model, *criteria, **amounts): # Atomik 'kolon = kolon + n' güncellemesi
+    return _update(model, *criteria, **{
+        column: getattr(model, column) + amount for column, amount in amounts.items()
+    })
+
+def _bump_month(model, *criteria, amount=1, reset_to=None): # Aylık tamamlama sayacını artırır, ay değiştiyse sıfırdan başlar
+    month = _month()
+    return _update(
+        model, *criteria,
+        completions_in_month=db.case(
+            (model.completions_month == month, model.completions_in_month + amount),
+            else_=amount if reset_to is None else reset_to
+        ),
+        completions_month=month
+    )
+
+@event.listens_for(db.session, 'before_flush')
+def _drop_course_rows(session, flush_context, instances): # Kurs silinmeden önce (yabancı anahtar için)
+    course_ids = [obj.id for obj in session.deleted if isinstance(obj, Course)]
+    if course_ids:
+        session.connection().execute(db.delete(CourseStats).where(CourseStats.course_id.in_(course_ids)))
+
+def _rows_exist(course): # Kurs ve eğitmen satırları yoksa artırım yerine tam hesaplama gerekir
+    return (
+        db.session.get(CourseStats, course.id) is not None
+        and db.session.get(InstructorStats, course.instructor_id) is not None
+    )
+
+def _course_rows(*criteria): # Verilen kurslar için CourseStats satırlarını gruplanmış tek sorguyla hesaplar
+    summary = progress_stats.progress_summary(Enrollment.course_id.in_(db.select(Course.id).where(*criteria)))
+    completed_lessons = db.func.coalesce(summary.c.completed_lessons, 0)
+    month_start = _month_start()
+    finished_this_month = db.case(
+        (db.and_(
+            Course.lesson_count > 0,
+            completed_lessons >= Course.lesson_count,
+            summary.c.completed_at >= month_start
+        ), 1),
+        else_=0
+    )
+
+    rows = db.session.execute(
+        db.select(
+            Course.id,
+            Course.instructor_id,
+            Course.lesson_count,
+            db.func.count(Enrollment.id),
+            db.func.coalesce(db.func.sum(summary.c.completed_lessons), 0),
+            db.func.coalesce(db.func.sum(finished_this_month), 0)
+        )
+        .outerjoin(Enrollment, Enrollment.course_id == Course.id)
+        .outerjoin(summary, summary.c.enrollment_id == Enrollment.id)
+        .where(*criteria)
+        .group_by(Course.id)
+    ).all()
+
+    month = _month()
+    return [{
+        'course_id': course_id,
+        'instructor_id': instructor_id,
+        'lesson_count': lesson_count,
+        'student_count': student_count,
+        'completed_lessons': completed,
+        'completions_month': month,
+        'completions_in_month': finished
+    } for course_id, instructor_id, lesson_count, student_count, completed, finished in rows]
+
+def _contribution(row, lesson_count): # Bir kursun eğitmen satırına katkısı: (kayıt, yüzde toplamı, bu ay tamamlanan)
+    if not lesson_count:
+        return 0, 0.0, 0
+    finished = row['completions_in_month'] if row['completions_month'] == _month() else 0
+    return row['student_count'], row['completed_lessons'] * 100.0 / lesson_count, finished
+
+def refresh_instructors(instructor_ids): # Eğitmenlerin tüm satırlarını mevcut verilerden yeniden hesaplar
+    """Verilen eğitmenlerin kurs, öğrenci ve eğitmen istatistik satırlarını baştan oluşturur"""
+    instructor_ids = list(instructor_ids)
+    if not instructor_ids:
+        return 0
+
+    course_rows = _course_rows(Course.instructor_id.in_(instructor_ids))
+
+    # Eğitmen-öğrenci çiftleri ve son aktiviteler tek INSERT ... SELECT ile
+    summary = progress_stats.progress_summary(
+        Enrollment.course_id.in_(db.select(Course.id).where(Course.instructor_id.in_(instructor_ids)))
+    )
+    pairs = (
+        db.select(
+            Course.instructor_id,
+            Enrollment.student_id,
+            db.func.count(Enrollment.id),
+            db.func.max(summary.c.last_activity_at)
+        )
+        .join(Course, Course.id == Enrollment.course_id)
+        .outerjoin(summary, summary.c.enrollment_id == Enrollment.id)
+        .where(Course.instructor_id.in_(instructor_ids))
+        .group_by(Course.instructor_id, Enrollment.student_id)
+    )
+
+    db.session.execute(db.delete(CourseStats).where(CourseStats.instructor_id.in_(instructor_ids)))
+    db.session.execute(db.delete(InstructorStudent).where(InstructorStudent.instructor_id.in_(instructor_ids)))
+    db.session.execute(db.delete(InstructorStats).where(InstructorStats.instructor_id.in_(instructor_ids)))
+
+    if course_rows:
+        db.session.execute(db.insert(CourseStats), [
+            {key: value for key, value in row.items() if key != 'lesson_count'} for row in course_rows
+        ])
+    db.session.execute(
+        db.insert(InstructorStudent).from_select(
+            ['instructor_id', 'student_id', 'enrollment_count', 'last_active_at'], pairs
+        )
+    )
+
+    student_counts = dict(db.session.execute(
+        db.select(InstructorStudent.instructor_id, db.func.count())
+        .where(InstructorStudent.instructor_id.in_(instructor_ids))
+        .group_by(InstructorStudent.instructor_id)
+    ).all())
+
+    totals = {instructor_id: [0, 0.0, 0] for instructor_id in instructor_ids}
+    for row in course_rows:
+        rated, rate_sum, finished = _contribution(row, row['lesson_count'])
+        totals[row['instructor_id']][0] += rated
+        totals[row['instructor_id']][1] += rate_sum
+        totals[row['instructor_id']][2] += finished
+
+    month = _month()
+    db.session.execute(db.insert(InstructorStats), [{
+        'instructor_id': instructor_id,
+        'total_students': student_counts.get(instructor_id, 0),
+        'rated_enrollments': rated,
+        'completion_rate_sum': rate_sum,
+        'completions_month': month,
+        'completions_in_month': finished
+    } for instructor_id, (rated, rate_sum, finished) in totals.items()])
+    return len(course_rows)
+
+def record_enrollment(enrollment): # Yeni kayıt: kurs öğrenci sayısı, eğitmen öğrenci çifti
+    """Yeni bir kaydı kurs ve eğitmen istatistiklerine işler"""
+    db.session.flush()
+    course = db.session.get(Course, enrollment.course_id)
+    if not _rows_exist(course):
+        refresh_instructors([course.instructor_id])
+        return
+
+    _increment(CourseStats, CourseStats.course_id == course.id, student_count=1)
+    if course.lesson_count > 0:
+        # Yeni kaydın tamamlanma oranı 0; sadece ortalamanın paydası artar
+        _increment(InstructorStats, InstructorStats.instructor_id == course.instructor_id, rated_enrollments=1)
+
+    pair = (
+        InstructorStudent.instructor_id == course.instructor_id,
+        InstructorStudent.student_id == enrollment.student_id
+    )
+    if _increment(InstructorStudent, *pair, enrollment_count=1).rowcount == 0:
+        db.session.add(InstructorStudent(
+            instructor_id=course.instructor_id,
+            student_id=enrollment.student_id,
+            enrollment_count=1
+        ))
+        _increment(InstructorStats, InstructorStats.instructor_id == course.instructor_id, total_students=1)
+
+def record_lesson_completed(enrollment, lesson, was_completed=False): # Ders tamamlandı: aktiflik, oran ve aylık tamamlama
+    """Tamamlanan bir dersi kurs ve eğitmen istatistiklerine işler"""
+    db.session.flush()
+    course = db.session.get(Course, lesson.course_id)
+    if not _rows_exist(course):
+        refresh_instructors([course.instructor_id])
+        return
+
+    _update(
+        InstructorStudent,
+        InstructorStudent.instructor_id == course.instructor_id,
+        InstructorStudent.student_id == enrollment.student_id,
+        last_active_at=_now()
+    )
+    if was_completed or not course.lesson_count:
+        return
+
+    _increment(CourseStats, CourseStats.course_id == course.id, completed_lessons=1)
+    _increment(
+        InstructorStats, InstructorStats.instructor_id == course.instructor_id,
+        completion_rate_sum=100.0 / course.lesson_count
+    )
+
+    completed = db.session.scalar(
+        db.select(db.func.count(Progress.id))
+        .join(Lesson, Lesson.id == Progress.lesson_id)
+        .where(Progress.enrollment_id == enrollment.id, Progress.completed == True, Lesson.course_id == course.id)
+    )
+    if completed == course.lesson_count: # Bu dersle kurs tamamlandı
+        _bump_month(CourseStats, CourseStats.course_id == course.id)
+        _bump_month(InstructorStats, InstructorStats.instructor_id == course.instructor_id)
+
+def record_lesson_change(course, old_lesson_count): # Ders eklendi/silindi: kurs satırını yeniden hesapla, farkı eğitmene yansıt
+    """Ders sayısı değişen kursun satırını yeniler ve eğitmen satırını farkla günceller"""
+    db.session.flush()
+    old = db.session.get(CourseStats, course.id, populate_existing=True)
+    if old is None or db.session.get(InstructorStats, course.instructor_id) is None:
+        refresh_instructors([course.instructor_id])
+        return
+
+    old_row = {
+        'student_count': old.student_count,
+        'completed_lessons': old.completed_lessons,
+        'completions_month': old.completions_month,
+        'completions_in_month': old.completions_in_month
+    }
+    new_row = _course_rows(Course.id == course.id)[0]
+    _update(CourseStats, CourseStats.course_id == course.id, **{
+        key: value for key, value in new_row.items() if key not in ('course_id', 'instructor_id', 'lesson_count')
+    })
+    db.session.expire(old)
+
+    old_rated, old_rate_sum, old_finished = _contribution(old_row, old_lesson_count)
+    new_rated, new_rate_sum, new_finished = _contribution(new_row, new_row['lesson_count'])
+    instructor = (InstructorStats.instructor_id == course.instructor_id,)
+    _increment(
+        InstructorStats, *instructor,
+        rated_enrollments=new_rated - old_rated,
+        completion_rate_sum=new_rate_sum - old_rate_sum
+    )
+    # Eğitmen satırının ayı eskiyse bu ay tamamlanan kurs yalnızca bu kurstan gelebilir
+    _bump_month(InstructorStats, *instructor, amount=new_finished - old_finished, reset_to=new_finished)
+
+def rebuild(chunk_size=200): # Tüm eğitmenlerin istatistiklerini parça parça yeniden oluşturur
+    """Her eğitmen grubu ayrı işlemde yeniden hesaplanır; işlenen eğitmen ve kurs sayısını döndürür"""
+    instructors = 0
+    courses = 0
+    last_id = 0
+    while True:
+        ids = db.session.scalars(
+            db.select(User.id)
+            .where(User.role == 'instructor', User.id > last_id)
+            .order_by(User.id)
+            .limit(chunk_size)
+        ).all()
+        if not ids:
+            break
+        courses += refresh_instructors(ids)
+        db.session.commit()
+        instructors += len(ids)
+        last_id = ids[-1]
+    return {'instructors': instructors, 'courses': courses}
+
+def summary(instructor_id): # Eğitmen panosu için tek satırdan istatistikleri okur
+    """get_instructor_student_stats yanıtını döndürür"""
+    stats = db.session.get(InstructorStats, instructor_id, populate_existing=True)
+    if stats is None:
+        # İlk istekte (veya rebuild çalıştırılmadıysa) satırı oluştur
+        refresh_instructors([instructor_id])
+        db.session.commit()
+        stats = db.session.get(InstructorStats, instructor_id)
+
+    active_students = db.session.scalar(
+        db.select(db.func.count())
+        .select_from(InstructorStudent)
+        .where(
+            InstructorStudent.instructor_id == instructor_id,
+            InstructorStudent.last_active_at >= _now() - timedelta(days=ACTIVE_DAYS)
+        )
+    )
+
+    # Kurs ve değerlendirme toplamları kursların sayaçlarından tek sorguyla (instructor_id index'i)
+    courses, reviews, rating_sum = db.session.execute(
+        db.select(
+            db.func.count(Course.id),
+            db.func.coalesce(db.func.sum(Course.review_count), 0),
+            db.func.coalesce(db.func.sum(Course.rating_sum), 0)
+        )
+        .where(Course.instructor_id == instructor_id)
+    ).one()
+
+    average_completion = 0
+    if stats.rated_enrollments > 0:
+        average_completion = int(round(stats.completion_rate_sum / stats.rated_enrollments, 6))
+
+    return {
+        'total_students': stats.total_students,
+        'active_students': active_students,
+        'completions_this_month': stats.completions_in_month if stats.completions_month == _month() else 0,
+        'average_course_completion': average_completion,
+        'total_courses': courses,
+        'total_reviews': reviews,
+        'average_rating': round(rating_sum / reviews, 2) if reviews else 0.0
+    }
@@ -0,0 +1,121 @@
+"""hot path indexes and unique constraints
+
+Revision ID: a3f1c9d2e7b4
+Revises:
+Create Date: 2026-10-17 09:12:41.315207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f1c9d2e7b4'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (tablo, index adı, kolonlar)
+INDEXES = [
+    ('courses', 'ix_courses_instructor_id', ['instructor_id']),
+    ('lesson', 'ix_lesson_course_order', ['course_id', 'order']),
+    ('lesson_document', 'ix_lesson_document_lesson_id', ['lesson_id']),
+    ('enrollment', 'ix_enrollment_course_id', ['course_id']),
+    ('review', 'ix_review_course_id', ['course_id']),
+    ('quiz', 'ix_quiz_lesson_id', ['lesson_id']),
+    ('quiz_question', 'ix_quiz_question_quiz_id', ['quiz_id']),
+    ('quiz_option', 'ix_quiz_option_question_id', ['question_id']),
+    ('quiz_attempt', 'ix_quiz_attempt_quiz_user_started', ['quiz_id', 'user_id', 'started_at']),
+    ('quiz_answer', 'ix_quiz_answer_attempt_id', ['attempt_id']),
+    ('assignment', 'ix_assignment_lesson_due', ['lesson_id', 'due_date']),
+    ('assignment_submission', 'ix_submission_assignment_user', ['assignment_id', 'user_id']),
+    ('notifications', 'ix_notifications_user_read_created', ['user_id', 'is_read', 'created_at']),
+    ('notification_settings', 'ix_notification_settings_user_id', ['user_id']),
+]
+
+# (tablo, constraint adı, kolonlar)
+UNIQUE_CONSTRAINTS = [
+    ('enrollment', 'uq_enrollment_student_course', ['student_id', 'course_id']),
+    ('progress', 'uq_progress_enrollment_lesson', ['enrollment_id', 'lesson_id']),
+]
+
+
+def _existing_indexes(inspector, table):
+    return {ix['name'] for ix in inspector.get_indexes(table)}
+
+
+def _existing_uniques(inspector, table):
+    return {uq['name'] for uq in inspector.get_unique_constraints(table)}
+
+
+def _deduplicate():
+    # Aynı öğrenci/kurs için açılmış fazla kayıtların ilerleme satırlarını en eski kayda taşı (tamamlanan dersler kaybolmasın)
+    op.execute("""
+        UPDATE progress SET enrollment_id = (
+            SELECT MIN(s.id) FROM enrollment s JOIN enrollment e
+                ON e.student_id = s.student_id AND e.course_id = s.course_id
+            WHERE e.id = progress.enrollment_id
+        )
+        WHERE enrollment_id IN (
+            SELECT e.id FROM enrollment e WHERE e.id NOT IN (
+                SELECT MIN(id) FROM enrollment GROUP BY student_id, course_id
+            )
+        )
+    """)
+
+    # Tekrarlanan ilerleme satırlarından en eskisini tut, tamamlanma bilgisini ona taşı
+    op.execute("""
+        UPDATE progress SET
+            completed = (
+                SELECT MAX(CASE WHEN d.completed THEN 1 ELSE 0 END) = 1 FROM progress d
+                WHERE d.enrollment_id = progress.enrollment_id AND d.lesson_id = progress.lesson_id
+            ),
+            completed_at = (
+                SELECT MAX(d.completed_at) FROM progress d
+                WHERE d.enrollment_id = progress.enrollment_id AND d.lesson_id = progress.lesson_id
+            )
+        WHERE id IN (
+            SELECT MIN(id) FROM progress GROUP BY enrollment_id, lesson_id HAVING COUNT(*) > 1
+        )
+    """)
+    op.execute("""
+        DELETE FROM progress WHERE id NOT IN (
+            SELECT MIN(id) FROM progress GROUP BY enrollment_id, lesson_id
+        )
+    """)
+
+    # Fazla kayıtların artık ilerleme satırı yok, silinebilirler
+    op.execute("""
+        DELETE FROM enrollment WHERE id NOT IN (
+            SELECT MIN(id) FROM enrollment GROUP BY student_id, course_id
+        )
+    """)
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    # db.create_all() yeni kurulumlarda index'leri zaten oluşturur; sadece eksikleri ekle
+    for table, name, columns in INDEXES:
+        if table in tables and name not in _existing_indexes(inspector, table):
+            op.create_index(name, table, columns, unique=False)
+
+    if {'enrollment', 'progress'} <= tables:
+        _deduplicate()
+
+    for table, name, columns in UNIQUE_CONSTRAINTS:
+        if table in tables and name not in _existing_uniques(inspector, table):
+            # SQLite ALTER TABLE ADD CONSTRAINT desteklemez, batch modu tabloyu yeniden kurar
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.create_unique_constraint(name, columns)
+
+
+def downgrade():
+    for table, name, columns in reversed(UNIQUE_CONSTRAINTS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(name, type_='unique')
+
+    for table, name, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
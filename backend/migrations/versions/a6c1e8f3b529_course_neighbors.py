@@ -0,0 +1,37 @@
+"""precomputed co-enrollment neighbours per course
+
+Revision ID: a6c1e8f3b529
+Revises: f4b8d2a6c915
+Create Date: 2026-10-17 21:12:46.730915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c1e8f3b529'
+down_revision = 'f4b8d2a6c915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'course_neighbors' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    # Satırlar 'flask recommend-courses' ile hesaplanır
+    op.create_table(
+        'course_neighbors',
+        sa.Column('course_id', sa.Integer(), sa.ForeignKey('courses.id'), primary_key=True),
+        sa.Column('rank', sa.Integer(), primary_key=True),
+        sa.Column('neighbor_id', sa.Integer(), sa.ForeignKey('courses.id'), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_course_neighbors_neighbor', 'course_neighbors', ['neighbor_id'])
+
+
+def downgrade():
+    op.drop_index('ix_course_neighbors_neighbor', table_name='course_neighbors')
+    op.drop_table('course_neighbors')
@@ -0,0 +1,26 @@
+"""index for keyset pagination of notifications
+
+Revision ID: a8d4e1b7c390
+Revises: f3a7c2e91b54
+Create Date: 2026-10-17 14:48:09.561230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d4e1b7c390'
+down_revision = 'f3a7c2e91b54'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    indexes = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('notifications')}
+    if 'ix_notifications_user_created' not in indexes:
+        op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
@@ -0,0 +1,51 @@
+"""full-text search index for courses
+
+Revision ID: b2c6f8a41d75
+Revises: a8d4e1b7c390
+Create Date: 2026-10-17 15:32:40.118452
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2c6f8a41d75'
+down_revision = 'a8d4e1b7c390'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Üretilmiş kolon mevcut satırlar için de hesaplanır
+        op.execute(
+            "ALTER TABLE courses ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')) STORED"
+        )
+        op.execute("CREATE INDEX IF NOT EXISTS ix_courses_search_vector ON courses USING gin (search_vector)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_users_username_search ON users USING gin (to_tsvector('simple', username))")
+        return
+
+    if 'courses_fts' in sa.inspect(bind).get_table_names():
+        return
+    op.execute(
+        "CREATE VIRTUAL TABLE courses_fts USING fts5("
+        "title, description, instructor, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        "INSERT INTO courses_fts (rowid, title, description, instructor) "
+        "SELECT courses.id, courses.title, coalesce(courses.description, ''), coalesce(users.username, '') "
+        "FROM courses LEFT JOIN users ON users.id = courses.instructor_id"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_users_username_search")
+        op.execute("DROP INDEX IF EXISTS ix_courses_search_vector")
+        op.execute("ALTER TABLE courses DROP COLUMN IF EXISTS search_vector")
+        return
+    op.execute("DROP TABLE IF EXISTS courses_fts")
@@ -0,0 +1,26 @@
+"""answer key version on quizzes for the grading cache
+
+Revision ID: b3e7f1c95a48
+Revises: a6c1e8f3b529
+Create Date: 2026-10-17 21:48:22.305617
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e7f1c95a48'
+down_revision = 'a6c1e8f3b529'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'answer_key_version' not in {c['name'] for c in sa.inspect(op.get_bind()).get_columns('quiz')}:
+        op.add_column('quiz', sa.Column('answer_key_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('quiz') as batch_op:
+        batch_op.drop_column('answer_key_version')
@@ -0,0 +1,47 @@
+"""stored counters on courses and lessons
+
+Revision ID: b7d2e4f81a06
+Revises: a3f1c9d2e7b4
+Create Date: 2026-10-17 10:04:18.552931
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2e4f81a06'
+down_revision = 'a3f1c9d2e7b4'
+branch_labels = None
+depends_on = None
+
+
+# (tablo, kolon, ilk değeri hesaplayan ifade)
+COUNTERS = [
+    ('courses', 'lesson_count', 'SELECT COUNT(*) FROM lesson WHERE lesson.course_id = courses.id'),
+    ('courses', 'enrollment_count', 'SELECT COUNT(*) FROM enrollment WHERE enrollment.course_id = courses.id'),
+    ('courses', 'review_count', 'SELECT COUNT(*) FROM review WHERE review.course_id = courses.id'),
+    ('courses', 'rating_sum', 'SELECT COALESCE(SUM(rating), 0) FROM review WHERE review.course_id = courses.id'),
+    ('lesson', 'document_count', 'SELECT COUNT(*) FROM lesson_document WHERE lesson_document.lesson_id = lesson.id'),
+    ('lesson', 'quiz_count', 'SELECT COUNT(*) FROM quiz WHERE quiz.lesson_id = lesson.id'),
+    ('lesson', 'assignment_count', 'SELECT COUNT(*) FROM assignment WHERE assignment.lesson_id = lesson.id'),
+]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    for table, column, backfill in COUNTERS:
+        if table not in tables:
+            continue
+        if column not in {c['name'] for c in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column(column, sa.Integer(), nullable=False, server_default='0'))
+        # Mevcut satırlar için sayaçları bir kez hesapla; sonrasında counters.py güncel tutar
+        op.execute(f'UPDATE {table} SET {column} = ({backfill})')
+
+
+def downgrade():
+    for table, column, backfill in reversed(COUNTERS):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column(column)
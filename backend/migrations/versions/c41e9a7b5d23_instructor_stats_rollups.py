@@ -0,0 +1,64 @@
+"""instructor statistics rollup tables
+
+Revision ID: c41e9a7b5d23
+Revises: b7d2e4f81a06
+Create Date: 2026-10-17 11:20:06.184470
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e9a7b5d23'
+down_revision = 'b7d2e4f81a06'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # Tablolar boş oluşturulur; 'flask rebuild-instructor-stats' (veya ilk istek) doldurur
+    if 'course_stats' not in tables:
+        op.create_table(
+            'course_stats',
+            sa.Column('course_id', sa.Integer(), sa.ForeignKey('courses.id'), primary_key=True),
+            sa.Column('instructor_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+            sa.Column('student_count', sa.Integer(), nullable=False),
+            sa.Column('completed_lessons', sa.Integer(), nullable=False),
+            sa.Column('completions_month', sa.String(length=7), nullable=True),
+            sa.Column('completions_in_month', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+        )
+        op.create_index('ix_course_stats_instructor_id', 'course_stats', ['instructor_id'], unique=False)
+
+    if 'instructor_stats' not in tables:
+        op.create_table(
+            'instructor_stats',
+            sa.Column('instructor_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+            sa.Column('total_students', sa.Integer(), nullable=False),
+            sa.Column('rated_enrollments', sa.Integer(), nullable=False),
+            sa.Column('completion_rate_sum', sa.Float(), nullable=False),
+            sa.Column('completions_month', sa.String(length=7), nullable=True),
+            sa.Column('completions_in_month', sa.Integer(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+        )
+
+    if 'instructor_students' not in tables:
+        op.create_table(
+            'instructor_students',
+            sa.Column('instructor_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+            sa.Column('student_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+            sa.Column('enrollment_count', sa.Integer(), nullable=False),
+            sa.Column('last_active_at', sa.DateTime(), nullable=True),
+        )
+        op.create_index('ix_instructor_students_active', 'instructor_students', ['instructor_id', 'last_active_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_instructor_students_active', table_name='instructor_students')
+    op.drop_table('instructor_students')
+    op.drop_table('instructor_stats')
+    op.drop_index('ix_course_stats_instructor_id', table_name='course_stats')
+    op.drop_table('course_stats')
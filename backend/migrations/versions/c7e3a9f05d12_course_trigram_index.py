@@ -0,0 +1,132 @@
+"""Turkish-normalized trigram search index for courses
+
+Revision ID: c7e3a9f05d12
+Revises: b2c6f8a41d75
+Create Date: 2026-10-17 17:08:21.530914
+
+"""
+import re
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e3a9f05d12'
+down_revision = 'b2c6f8a41d75'
+branch_labels = None
+depends_on = None
+
+# search_text.sql_normalize ile aynı ifade (migration uygulama modüllerine bağımlı olmasın diye kopyalandı)
+FOLD_FROM = 'IİıŞşĞğÜüÖöÇçÂâÎîÛûÊêÉéÈèÁáÀàÓóÍíÚú'
+FOLD_TO = 'iiissgguuooccaaiiuueeeeeeaaaaooiiuu'
+FOLD = str.maketrans(FOLD_FROM, FOLD_TO)
+WORD = re.compile(r'\w+', re.UNICODE)
+TITLE, INSTRUCTOR, DESCRIPTION = 0, 1, 2 # course_search ile aynı alan kodları
+READ_CHUNK = 1000 # Tek seferde yeniden indexlenen kurs sayısı
+
+
+def _fold(text): # search_text.normalize ile aynı
+    return (text or '').translate(FOLD).lower()
+
+
+def _trigrams(text): # search_text.trigrams ile aynı
+    grams = set()
+    for word in WORD.findall(_fold(text)):
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _backfill(bind): # Mevcut kursların trigramlarını yazar, courses_fts'i katlanmış metinle yeniden yazar
+    last_id = 0
+    while True:
+        rows = bind.execute(sa.text(
+            "SELECT courses.id, courses.title, courses.description, users.username "
+            "FROM courses LEFT JOIN users ON users.id = courses.instructor_id "
+            "WHERE courses.id > :last_id ORDER BY courses.id LIMIT :limit"
+        ), {'last_id': last_id, 'limit': READ_CHUNK}).all()
+        if not rows:
+            break
+        ids = sa.bindparam('ids', expanding=True)
+        course_ids = {'ids': [row[0] for row in rows]}
+        bind.execute(sa.text('DELETE FROM courses_fts WHERE rowid IN :ids').bindparams(ids), course_ids)
+        bind.execute(sa.text('DELETE FROM course_trigrams WHERE course_id IN :ids').bindparams(ids), course_ids)
+        bind.execute(
+            sa.text('INSERT INTO courses_fts (rowid, title, description, instructor) VALUES (:id, :title, :description, :instructor)'),
+            [{'id': course_id, 'title': _fold(title), 'description': _fold(description), 'instructor': _fold(username)}
+             for course_id, title, description, username in rows]
+        )
+        postings = [
+            {'trigram': gram, 'course_id': course_id, 'field': field}
+            for course_id, title, description, username in rows
+            for field, value in ((TITLE, title), (INSTRUCTOR, username), (DESCRIPTION, description))
+            for gram in _trigrams(value)
+        ]
+        if postings:
+            bind.execute(sa.text('INSERT INTO course_trigrams (trigram, course_id, field) VALUES (:trigram, :course_id, :field)'), postings)
+        last_id = rows[-1][0]
+
+
+def _normalize(column):
+    return f"lower(translate(coalesce({column}, ''), '{FOLD_FROM}', '{FOLD_TO}'))"
+
+
+def _search_vector(title, description):
+    return (
+        "ALTER TABLE courses ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        f"setweight(to_tsvector('simple', {title}), 'A') || "
+        f"setweight(to_tsvector('simple', {description}), 'B')) STORED"
+    )
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # tsvector kolonu ve eğitmen index'i katlanmış metinle yeniden üretilir (index'ler kolonla birlikte düşer)
+        op.execute("ALTER TABLE courses DROP COLUMN IF EXISTS search_vector")
+        op.execute(_search_vector(_normalize('title'), _normalize('description')))
+        op.execute("CREATE INDEX ix_courses_search_vector ON courses USING gin (search_vector)")
+        op.execute("DROP INDEX IF EXISTS ix_users_username_search")
+        op.execute(f"CREATE INDEX ix_users_username_search ON users USING gin (to_tsvector('simple', {_normalize('username')}))")
+
+        op.execute(
+            "ALTER TABLE courses ADD COLUMN IF NOT EXISTS search_text text GENERATED ALWAYS AS ("
+            f"{_normalize('title')} || ' ' || {_normalize('description')}) STORED"
+        )
+        op.execute("CREATE INDEX IF NOT EXISTS ix_courses_search_text_trgm ON courses USING gin (search_text gin_trgm_ops)")
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (({_normalize('username')}) gin_trgm_ops)")
+        return
+
+    # SQLite: trigram listesi mevcut kurslardan doldurulur ve courses_fts katlanmış metinle yeniden yazılır
+    # (tablo uygulama açılışındaki create_all ile önceden oluşmuş olabilir; doldurma yine de yapılır)
+    if 'course_trigrams' not in sa.inspect(bind).get_table_names():
+        op.execute(
+            "CREATE TABLE course_trigrams ("
+            "trigram TEXT NOT NULL, course_id INTEGER NOT NULL, field INTEGER NOT NULL, "
+            "PRIMARY KEY (trigram, course_id, field)) WITHOUT ROWID"
+        )
+        op.execute("CREATE INDEX ix_course_trigrams_course ON course_trigrams (course_id)")
+    _backfill(bind)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_users_username_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_courses_search_text_trgm")
+        op.execute("ALTER TABLE courses DROP COLUMN IF EXISTS search_text")
+        op.execute("ALTER TABLE courses DROP COLUMN IF EXISTS search_vector")
+        op.execute(_search_vector("coalesce(title, '')", "coalesce(description, '')"))
+        op.execute("CREATE INDEX ix_courses_search_vector ON courses USING gin (search_vector)")
+        op.execute("DROP INDEX IF EXISTS ix_users_username_search")
+        op.execute("CREATE INDEX ix_users_username_search ON users USING gin (to_tsvector('simple', username))")
+        return
+    op.execute("DROP TABLE IF EXISTS course_trigrams")
+    # courses_fts önceki revizyondaki gibi katlanmamış metne döner
+    if 'courses_fts' in sa.inspect(op.get_bind()).get_table_names():
+        op.execute("DELETE FROM courses_fts")
+        op.execute(
+            "INSERT INTO courses_fts (rowid, title, description, instructor) "
+            "SELECT courses.id, courses.title, coalesce(courses.description, ''), coalesce(users.username, '') "
+            "FROM courses LEFT JOIN users ON users.id = courses.instructor_id"
+        )
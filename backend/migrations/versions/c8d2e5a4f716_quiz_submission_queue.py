@@ -0,0 +1,44 @@
+"""quiz submission queue for asynchronous grading
+
+Revision ID: c8d2e5a4f716
+Revises: b3e7f1c95a48
+Create Date: 2026-10-17 22:31:06.114572
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d2e5a4f716'
+down_revision = 'b3e7f1c95a48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'quiz_submission_queue' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        'quiz_submission_queue',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('attempt_id', sa.Integer(), sa.ForeignKey('quiz_attempt.id'), nullable=False, unique=True),
+        sa.Column('quiz_id', sa.Integer(), sa.ForeignKey('quiz.id'), nullable=False),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('course_id', sa.Integer(), sa.ForeignKey('courses.id'), nullable=False),
+        sa.Column('answers', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('locked_until', sa.DateTime(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+    )
+    op.create_index('ix_quiz_submission_queue_status_id', 'quiz_submission_queue', ['status', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_quiz_submission_queue_status_id', table_name='quiz_submission_queue')
+    op.drop_table('quiz_submission_queue')
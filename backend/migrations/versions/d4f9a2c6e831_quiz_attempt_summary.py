@@ -0,0 +1,43 @@
+"""per-attempt score summary on quiz attempts
+
+Revision ID: d4f9a2c6e831
+Revises: c8d2e5a4f716
+Create Date: 2026-10-17 23:12:47.530918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f9a2c6e831'
+down_revision = 'c8d2e5a4f716'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = {c['name'] for c in sa.inspect(op.get_bind()).get_columns('quiz_attempt')}
+    if 'total_score' not in columns:
+        op.add_column('quiz_attempt', sa.Column('total_score', sa.Float(), nullable=True))
+    if 'max_score' not in columns:
+        op.add_column('quiz_attempt', sa.Column('max_score', sa.Float(), nullable=True))
+    if 'correct_count' not in columns:
+        op.add_column('quiz_attempt', sa.Column('correct_count', sa.Integer(), nullable=True))
+
+    # Tamamlanmış denemeler için cevaplardan bir kez hesapla; sonrasında puanlama yazar.
+    # Toplam puan quizin bugünkü sorularından alınır (eski denemelerde soru değişmişse yaklaşık)
+    op.execute(
+        'UPDATE quiz_attempt SET '
+        'total_score = (SELECT COALESCE(SUM(points_earned), 0) FROM quiz_answer WHERE quiz_answer.attempt_id = quiz_attempt.id), '
+        'correct_count = (SELECT COUNT(*) FROM quiz_answer WHERE quiz_answer.attempt_id = quiz_attempt.id AND quiz_answer.is_correct), '
+        'max_score = (SELECT COALESCE(SUM(points), 0) FROM quiz_question WHERE quiz_question.quiz_id = quiz_attempt.quiz_id) '
+        'WHERE completed_at IS NOT NULL AND total_score IS NULL'
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('quiz_attempt') as batch_op:
+        batch_op.drop_column('correct_count')
+        batch_op.drop_column('max_score')
+        batch_op.drop_column('total_score')
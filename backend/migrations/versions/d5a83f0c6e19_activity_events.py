@@ -0,0 +1,42 @@
+"""append-only student activity events
+
+Revision ID: d5a83f0c6e19
+Revises: c41e9a7b5d23
+Create Date: 2026-10-17 12:02:47.903115
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a83f0c6e19'
+down_revision = 'c41e9a7b5d23'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'activity_events' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    # Mevcut veriler için 'flask backfill-activity' çalıştırılmalı
+    op.create_table(
+        'activity_events',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('type', sa.String(length=30), nullable=False),
+        sa.Column('source_id', sa.Integer(), nullable=False),
+        sa.Column('course_id', sa.Integer(), nullable=True),
+        sa.Column('course_title', sa.String(length=200), nullable=True),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.UniqueConstraint('type', 'source_id', name='uq_activity_events_source'),
+    )
+    op.create_index('ix_activity_events_user_created', 'activity_events', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_activity_events_user_created', table_name='activity_events')
+    op.drop_table('activity_events')
@@ -0,0 +1,40 @@
+"""precomputed trending score for catalog ranking
+
+Revision ID: d9f4b2a17e63
+Revises: c7e3a9f05d12
+Create Date: 2026-10-17 18:42:13.906527
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9f4b2a17e63'
+down_revision = 'c7e3a9f05d12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'course_rank' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        'course_rank',
+        sa.Column('course_id', sa.Integer(), sa.ForeignKey('courses.id'), primary_key=True),
+        sa.Column('score', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('recent_enrollments', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('rating', sa.Float(), nullable=True),
+        sa.Column('completion_rate', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('computed_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_course_rank_score', 'course_rank', ['score', 'course_id'])
+
+    # Her kurs sıfır puanla başlar; gerçek puanlar 'flask rank-courses' ile hesaplanır
+    op.execute("INSERT INTO course_rank (course_id, score) SELECT id, 0 FROM courses")
+
+
+def downgrade():
+    op.drop_index('ix_course_rank_score', table_name='course_rank')
+    op.drop_table('course_rank')
@@ -0,0 +1,26 @@
+"""index for keyset pagination of the course list
+
+Revision ID: e1a5c8d3f270
+Revises: d9f4b2a17e63
+Create Date: 2026-10-17 19:55:41.204318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1a5c8d3f270'
+down_revision = 'd9f4b2a17e63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    indexes = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('courses')}
+    if 'ix_courses_created_at' not in indexes:
+        op.create_index('ix_courses_created_at', 'courses', ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_courses_created_at', table_name='courses')
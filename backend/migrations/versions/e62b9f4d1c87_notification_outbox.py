@@ -0,0 +1,47 @@
+"""notification outbox for background fan-out
+
+Revision ID: e62b9f4d1c87
+Revises: d5a83f0c6e19
+Create Date: 2026-10-17 13:10:22.418306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e62b9f4d1c87'
+down_revision = 'd5a83f0c6e19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'notification_outbox' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        'notification_outbox',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('course_id', sa.Integer(), sa.ForeignKey('courses.id'), nullable=False),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('reference_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
+        sa.Column('cursor', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('delivered', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('locked_until', sa.DateTime(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+    )
+    op.create_index('ix_notification_outbox_status_id', 'notification_outbox', ['status', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_notification_outbox_status_id', table_name='notification_outbox')
+    op.drop_table('notification_outbox')
@@ -0,0 +1,60 @@
+"""packed responses on quiz attempts for item analysis
+
+Revision ID: e7b3c1f8d492
+Revises: d4f9a2c6e831
+Create Date: 2026-10-18 00:04:51.270336
+
+"""
+from itertools import groupby
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3c1f8d492'
+down_revision = 'd4f9a2c6e831'
+branch_labels = None
+depends_on = None
+
+RESPONSE_DTYPE = np.dtype([('question_id', '<i4'), ('option_id', '<i4')]) # quiz_grading.RESPONSE_DTYPE ile aynı
+ATTEMPT_CHUNK = 1000 # Tek seferde paketlenen deneme sayısı
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if 'responses' not in {c['name'] for c in inspector.get_columns('quiz_attempt')}:
+        op.add_column('quiz_attempt', sa.Column('responses', sa.LargeBinary(), nullable=True))
+    if 'ix_quiz_attempt_quiz_completed' not in {index['name'] for index in inspector.get_indexes('quiz_attempt')}:
+        op.create_index('ix_quiz_attempt_quiz_completed', 'quiz_attempt', ['quiz_id', 'completed_at'], unique=False)
+
+    # Tamamlanmış denemelerin seçimleri cevaplardan bir kez paketlenir; sonrasında puanlama yazar.
+    # quiz_answer tamamı belleğe alınmaz: denemeler id sırasıyla parça parça okunur ve her parça hemen yazılır.
+    attempts = sa.table('quiz_attempt', sa.column('id'), sa.column('responses', sa.LargeBinary()))
+    statement = attempts.update().where(attempts.c.id == sa.bindparam('attempt_id')).values(responses=sa.bindparam('packed'))
+    last_id = 0
+    while True:
+        attempt_ids = bind.execute(sa.text(
+            'SELECT id FROM quiz_attempt WHERE id > :last_id AND completed_at IS NOT NULL AND responses IS NULL '
+            'ORDER BY id LIMIT :limit'
+        ), {'last_id': last_id, 'limit': ATTEMPT_CHUNK}).scalars().all()
+        if not attempt_ids:
+            break
+        rows = bind.execute(sa.text(
+            'SELECT attempt_id, question_id, selected_option_id FROM quiz_answer '
+            'WHERE attempt_id IN :attempt_ids ORDER BY attempt_id, id'
+        ).bindparams(sa.bindparam('attempt_ids', expanding=True)), {'attempt_ids': attempt_ids}).all()
+        updates = [
+            {'attempt_id': attempt_id, 'packed': np.array([(row[1], row[2] or 0) for row in group], dtype=RESPONSE_DTYPE).tobytes()}
+            for attempt_id, group in groupby(rows, key=lambda row: row[0])
+        ]
+        if updates:
+            bind.execute(statement, updates)
+        last_id = attempt_ids[-1]
+
+
+def downgrade():
+    op.drop_index('ix_quiz_attempt_quiz_completed', table_name='quiz_attempt')
+    with op.batch_alter_table('quiz_attempt') as batch_op:
+        batch_op.drop_column('responses')
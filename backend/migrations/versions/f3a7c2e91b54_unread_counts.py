@@ -0,0 +1,42 @@
+"""per-user unread notification counters
+
+Revision ID: f3a7c2e91b54
+Revises: e62b9f4d1c87
+Create Date: 2026-10-17 14:05:51.203774
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a7c2e91b54'
+down_revision = 'e62b9f4d1c87'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if 'unread_counts' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        'unread_counts',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # Mevcut kullanıcılar için başlangıç değerleri; sonradan oluşan farkları 'flask reconcile-unread-counts' düzeltir
+    op.execute(
+        """
+        INSERT INTO unread_counts (user_id, count)
+        SELECT users.id, COUNT(notifications.id)
+        FROM users
+        LEFT JOIN notifications ON notifications.user_id = users.id AND notifications.is_read = false
+        GROUP BY users.id
+        """
+    )
+
+
+def downgrade():
+    op.drop_table('unread_counts')
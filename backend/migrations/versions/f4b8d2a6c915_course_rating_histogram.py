@@ -0,0 +1,42 @@
+"""stored rating histogram on courses and keyset index for reviews
+
+Revision ID: f4b8d2a6c915
+Revises: e1a5c8d3f270
+Create Date: 2026-10-17 20:31:07.118245
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4b8d2a6c915'
+down_revision = 'e1a5c8d3f270'
+branch_labels = None
+depends_on = None
+
+
+RATINGS = range(1, 6)
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    columns = {c['name'] for c in inspector.get_columns('courses')}
+
+    for rating in RATINGS:
+        column = f'rating_{rating}_count'
+        if column not in columns:
+            op.add_column('courses', sa.Column(column, sa.Integer(), nullable=False, server_default='0'))
+        # Mevcut değerlendirmelerden bir kez hesapla; sonrasında counters.py güncel tutar
+        op.execute(f'UPDATE courses SET {column} = (SELECT COUNT(*) FROM review WHERE review.course_id = courses.id AND review.rating = {rating})')
+
+    indexes = {index['name'] for index in inspector.get_indexes('review')}
+    if 'ix_review_course_created' not in indexes:
+        op.create_index('ix_review_course_created', 'review', ['course_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_review_course_created', table_name='review')
+    with op.batch_alter_table('courses') as batch_op:
+        for rating in reversed(RATINGS):
+            batch_op.drop_column(f'rating_{rating}_count')
@@ -67,11 +67,14 @@ class User(db.Model):
 
 class Course(db.Model):
     __tablename__ = 'courses'
+    __table_args__ = (
+        db.Index('ix_courses_created_at', 'created_at', 'id'),  # Katalog listesi (created_at, id) anahtarıyla sayfalanır
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
-    instructor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    instructor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     price = db.Column(db.Float, nullable=False, default=0.0)
@@ -79,11 +82,26 @@ class Course(db.Model):
     level = db.Column(db.String(20))  # 'Başlangıç', 'Orta', 'İleri'
     image_url = db.Column(db.String(500), nullable=True)  # Kurs resmi için URL
     
+    # Sayaçlar (counters.py içindeki oturum olaylarıyla güncel tutulur)
+    lesson_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    enrollment_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Puanların toplamı, ortalama = rating_sum / review_count
+    # Puan dağılımı: her puan (1-5) için değerlendirme sayısı
+    rating_1_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_2_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_3_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_4_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_5_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    
     # İlişkiler
     lessons = db.relationship('Lesson', back_populates='course', lazy=True, cascade='all, delete-orphan')
     enrollments = db.relationship('Enrollment', backref='course', lazy=True, cascade='all, delete-orphan')
     reviews = db.relationship('Review', backref='course', lazy=True, cascade='all, delete-orphan')
 
+    def rating_histogram(self): # Puan -> değerlendirme sayısı (sayaçlardan, tarama yapmadan)
+        return {str(rating): getattr(self, f'rating_{rating}_count') for rating in range(1, 6)}
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -96,12 +114,16 @@ class Course(db.Model):
             'category': self.category,
             'level': self.level,
             'image_url': self.image_url,
-            'lesson_count': len(self.lessons),
-            'enrollment_count': len(self.enrollments),
-            'review_count': len(self.reviews)
+            'lesson_count': self.lesson_count,
+            'enrollment_count': self.enrollment_count,
+            'review_count': self.review_count
         }
 
 class Lesson(db.Model):
+    __table_args__ = (
+        db.Index('ix_lesson_course_order', 'course_id', 'order'),  # Kurs ders listesi sıralı okunur
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
@@ -114,6 +136,11 @@ class Lesson(db.Model):
     file_url = db.Column(db.String(500), nullable=True) # Dosya URL
     file_type = db.Column(db.String(50), nullable=True)  # pdf, ppt, doc vb.
     
+    # Sayaçlar (counters.py içindeki oturum olaylarıyla güncel tutulur)
+    document_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    quiz_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    assignment_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    
     # İlişkiler
     progress_records = db.relationship('Progress', backref='lesson', lazy=True)
     quizzes = db.relationship('Quiz', backref='lesson', lazy=True)
@@ -122,12 +149,6 @@ class Lesson(db.Model):
     course = db.relationship('Course', back_populates='lessons', lazy=True)
 
     def to_dict(self):
-        # İlişkilerin None olup olmadığını kontrol et
-        doc_count = len(self.documents) if self.documents is not None else 0
-        # Dersin sahip olduğu quizlerin sayısını hesapla
-        quiz_count = len(self.quizzes) if self.quizzes is not None else 0 
-        assign_count = len(self.assignments) if self.assignments is not None else 0
-        
         return {
             'id': self.id,
             'title': self.title,
@@ -135,14 +156,14 @@ class Lesson(db.Model):
             'order': self.order,
             'video_url': self.video_url,
             'created_at': self.created_at.isoformat(),
-            'document_count': doc_count,
-            'quiz_count': quiz_count,          # Düzeltilmiş quiz sayımı
-            'assignment_count': assign_count
+            'document_count': self.document_count,
+            'quiz_count': self.quiz_count,
+            'assignment_count': self.assignment_count
         }
 
 class LessonDocument(db.Model): # Ders belgesi
     id = db.Column(db.Integer, primary_key=True)
-    lesson_id = db.Column(db.Integer, db.ForeignKey('lesson.id'), nullable=False)
+    lesson_id = db.Column(db.Integer, db.ForeignKey('lesson.id'), nullable=False, index=True)
     file_url = db.Column(db.String(500), nullable=False)
     file_name = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(UTC))
@@ -156,6 +177,11 @@ class LessonDocument(db.Model): # Ders belgesi
         }
 
 class Enrollment(db.Model): # Kayıt
+    __table_args__ = (
+        db.UniqueConstraint('student_id', 'course_id', name='uq_enrollment_student_course'),  # Bir öğrenci bir kursa bir kez kayıt olur
+        db.Index('ix_enrollment_course_id', 'course_id'),  # Kursa kayıtlı öğrenciler (bildirim, eğitmen ekranları)
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
@@ -170,6 +196,10 @@ class Enrollment(db.Model): # Kayıt
         }
 
 class Progress(db.Model): # İlerleme
+    __table_args__ = (
+        db.UniqueConstraint('enrollment_id', 'lesson_id', name='uq_progress_enrollment_lesson'),  # Kayıt başına ders başına tek ilerleme satırı
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     enrollment_id = db.Column(db.Integer, db.ForeignKey('enrollment.id'), nullable=False)
     lesson_id = db.Column(db.Integer, db.ForeignKey('lesson.id'), nullable=False)
@@ -182,6 +212,10 @@ class Progress(db.Model): # İlerleme
     enrollment = db.relationship('Enrollment', backref='progress_records', lazy=True)
 
 class Review(db.Model): # İnceleme
+    __table_args__ = (
+        db.Index('ix_review_course_created', 'course_id', 'created_at', 'id'),  # Kurs değerlendirmeleri (created_at, id) anahtarıyla sayfalanır
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     rating = db.Column(db.Integer, nullable=False)  # 1-5 arası puan
     comment = db.Column(db.Text, nullable=False)
@@ -189,7 +223,7 @@ class Review(db.Model): # İnceleme
     updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # İlişkiler
-    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False, index=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     instructor_reply = db.Column(db.Text, nullable=True)
     instructor_reply_date = db.Column(db.DateTime, nullable=True)
@@ -215,10 +249,11 @@ class Quiz(db.Model): # Quiz
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
-    lesson_id = db.Column(db.Integer, db.ForeignKey('lesson.id'), nullable=False)
+    lesson_id = db.Column(db.Integer, db.ForeignKey('lesson.id'), nullable=False, index=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(UTC))
     time_limit = db.Column(db.Integer, nullable=True)  # Dakika cinsinden süre limiti
     passing_score = db.Column(db.Float, nullable=False, default=60.0)  # Geçme notu
+    answer_key_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Soru/seçenek değiştikçe artar (bkz. quiz_grading.py)
     
     # İlişkiler
     questions = db.relationship('QuizQuestion', backref='quiz', lazy=True)
@@ -238,7 +273,7 @@ class Quiz(db.Model): # Quiz
 
 class QuizQuestion(db.Model): # Quiz sorusu
     id = db.Column(db.Integer, primary_key=True)
-    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), nullable=False)
+    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), nullable=False, index=True)
     question_text = db.Column(db.Text, nullable=False)
     question_type = db.Column(db.String(20), nullable=False)  # multiple_choice, true_false, short_answer
     points = db.Column(db.Integer, nullable=False, default=1)
@@ -259,7 +294,7 @@ class QuizQuestion(db.Model): # Quiz sorusu
 
 class QuizOption(db.Model): # Quiz seçeneği
     id = db.Column(db.Integer, primary_key=True)
-    question_id = db.Column(db.Integer, db.ForeignKey('quiz_question.id'), nullable=False)
+    question_id = db.Column(db.Integer, db.ForeignKey('quiz_question.id'), nullable=False, index=True)
     option_text = db.Column(db.String(200), nullable=False)
     is_correct = db.Column(db.Boolean, nullable=False, default=False)
     
@@ -272,12 +307,22 @@ class QuizOption(db.Model): # Quiz seçeneği
         }
 
 class QuizAttempt(db.Model): # Quiz deneme
+    __table_args__ = (
+        db.Index('ix_quiz_attempt_quiz_user_started', 'quiz_id', 'user_id', 'started_at'),  # Öğrencinin quiz denemeleri, en yeniden eskiye
+        db.Index('ix_quiz_attempt_quiz_completed', 'quiz_id', 'completed_at'),  # Quiz analizi önbelleğinin tazelik kontrolü
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    score = db.Column(db.Float, nullable=True)
+    score = db.Column(db.Float, nullable=True)  # Yüzde (0-100)
     started_at = db.Column(db.DateTime, default=lambda: datetime.now(UTC))
     completed_at = db.Column(db.DateTime, nullable=True)
+    # Puanlamada yazılan özet; sonuç sayfası cevapları toplamadan okur
+    total_score = db.Column(db.Float, nullable=True)  # Kazanılan puan
+    max_score = db.Column(db.Float, nullable=True)  # Quizin puanlama anındaki toplam puanı
+    correct_count = db.Column(db.Integer, nullable=True)
+    responses = db.Column(db.LargeBinary, nullable=True)  # Seçilen seçenekler, paketli (question_id, option_id) int32 çiftleri (bkz. quiz_grading.pack_responses)
     
     # İlişkiler
     answers = db.relationship('QuizAnswer', backref='attempt', lazy=True)
@@ -289,13 +334,16 @@ class QuizAttempt(db.Model): # Quiz deneme
             'quiz_id': self.quiz_id,
             'user_id': self.user_id,
             'score': self.score,
+            'total_score': self.total_score,
+            'max_score': self.max_score,
+            'correct_count': self.correct_count,
             'started_at': self.started_at.isoformat(),
             'completed_at': self.completed_at.isoformat() if self.completed_at else None
         }
 
 class QuizAnswer(db.Model): # Quiz cevabı
     id = db.Column(db.Integer, primary_key=True)
-    attempt_id = db.Column(db.Integer, db.ForeignKey('quiz_attempt.id'), nullable=False)
+    attempt_id = db.Column(db.Integer, db.ForeignKey('quiz_attempt.id'), nullable=False, index=True)
     question_id = db.Column(db.Integer, db.ForeignKey('quiz_question.id'), nullable=False)
     selected_option_id = db.Column(db.Integer, db.ForeignKey('quiz_option.id'), nullable=True)  # Çoktan seçmeli sorular için
     answer_text = db.Column(db.Text, nullable=False)
@@ -317,6 +365,10 @@ class QuizAnswer(db.Model): # Quiz cevabı
         }
 
 class Assignment(db.Model): # Ödev
+    __table_args__ = (
+        db.Index('ix_assignment_lesson_due', 'lesson_id', 'due_date'),  # Derse ait ödevler ve yaklaşan teslim tarihleri
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=False)
@@ -353,6 +405,10 @@ class Assignment(db.Model): # Ödev
         }
 
 class AssignmentSubmission(db.Model): # Ödev gönderimi  
+    __table_args__ = (
+        db.Index('ix_submission_assignment_user', 'assignment_id', 'user_id'),  # Öğrencinin bir ödeve gönderimi
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     assignment_id = db.Column(db.Integer, db.ForeignKey('assignment.id'), nullable=False)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -381,6 +437,10 @@ class AssignmentSubmission(db.Model): # Ödev gönderimi
 
 class Notification(db.Model): # Bildirim
     __tablename__ = 'notifications'
+    __table_args__ = (
+        db.Index('ix_notifications_user_read_created', 'user_id', 'is_read', 'created_at'),  # Okunmamış bildirimler ve sayaç
+        db.Index('ix_notifications_user_created', 'user_id', 'created_at', 'id'),  # Tüm bildirimlerin imleçli sayfalanması
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -416,7 +476,7 @@ class NotificationSetting(db.Model): # Bildirim ayarları
     __tablename__ = 'notification_settings'
     
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.String(255), nullable=False)
     category = db.Column(db.String(50), nullable=False)  # 'course', 'system', 'marketing'
@@ -436,4 +496,139 @@ class NotificationSetting(db.Model): # Bildirim ayarları
             'enabled': self.enabled,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
-        } 
\ No newline at end of file
+        } 
+
+class CourseStats(db.Model): # Kurs bazında öğrenci istatistikleri (instructor_stats.py ile güncel tutulur)
+    __tablename__ = 'course_stats'
+
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), primary_key=True)
+    instructor_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    student_count = db.Column(db.Integer, nullable=False, default=0)  # Kayıt sayısı
+    completed_lessons = db.Column(db.Integer, nullable=False, default=0)  # Tüm kayıtlarda tamamlanan ders toplamı
+    completions_month = db.Column(db.String(7), nullable=True)  # 'YYYY-MM', completions_in_month hangi aya ait
+    completions_in_month = db.Column(db.Integer, nullable=False, default=0)  # O ay tamamlanan kurs sayısı
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+
+class InstructorStats(db.Model): # Eğitmen bazında öğrenci istatistikleri
+    __tablename__ = 'instructor_stats'
+
+    instructor_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    total_students = db.Column(db.Integer, nullable=False, default=0)  # Farklı öğrenci sayısı
+    rated_enrollments = db.Column(db.Integer, nullable=False, default=0)  # Dersi olan kurslardaki kayıt sayısı
+    completion_rate_sum = db.Column(db.Float, nullable=False, default=0.0)  # Bu kayıtların tamamlanma yüzdeleri toplamı
+    completions_month = db.Column(db.String(7), nullable=True)
+    completions_in_month = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+
+class InstructorStudent(db.Model): # Eğitmen-öğrenci çifti ve öğrencinin son aktivitesi
+    __tablename__ = 'instructor_students'
+    __table_args__ = (
+        db.Index('ix_instructor_students_active', 'instructor_id', 'last_active_at'),  # Son 14 günde aktif öğrenci sayısı
+    )
+
+    instructor_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    enrollment_count = db.Column(db.Integer, nullable=False, default=0)  # Öğrencinin bu eğitmendeki kayıt sayısı
+    last_active_at = db.Column(db.DateTime, nullable=True)  # Son tamamlanan ders zamanı
+
+class ActivityEvent(db.Model): # Öğrenci aktivite akışı (activity_log.py ile yazılır, sadece ekleme yapılır)
+    __tablename__ = 'activity_events'
+    __table_args__ = (
+        db.Index('ix_activity_events_user_created', 'user_id', 'created_at', 'id'),  # Kullanıcının akışı, en yeniden eskiye
+        db.UniqueConstraint('type', 'source_id', name='uq_activity_events_source'),  # Aynı kaynak satırı için tek olay
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    type = db.Column(db.String(30), nullable=False)  # 'enrollment', 'completion', 'submission', 'quiz_attempt'
+    source_id = db.Column(db.Integer, nullable=False)  # Olayı doğuran satırın id'si (enrollment, progress, submission, quiz_attempt)
+    course_id = db.Column(db.Integer, nullable=True)  # Kurs silinse de akış korunur, bu yüzden yabancı anahtar yok
+    course_title = db.Column(db.String(200), nullable=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': f'{self.type}_{self.source_id}',
+            'type': self.type,
+            'title': self.title,
+            'description': self.description,
+            'course_id': self.course_id,
+            'course_title': self.course_title,
+            'date': self.created_at.isoformat()
+        }
+
+class NotificationOutbox(db.Model): # Gönderilmeyi bekleyen bildirim olayları (notification_outbox.py işler)
+    __tablename__ = 'notification_outbox'
+    __table_args__ = (
+        db.Index('ix_notification_outbox_status_id', 'status', 'id'),  # İşçinin bekleyen olayları sırayla alması
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)  # Tek alıcılı olaylar için; boşsa kursa kayıtlı öğrenciler
+    type = db.Column(db.String(50), nullable=False)
+    title = db.Column(db.String(200), nullable=False)
+    message = db.Column(db.Text, nullable=False)
+    reference_id = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(UTC))  # Bildirimlerin created_at değeri
+    status = db.Column(db.String(20), nullable=False, default='pending')  # 'pending', 'processing', 'done', 'failed'
+    cursor = db.Column(db.Integer, nullable=False, default=0)  # Son bildirim yazılan öğrenci id'si (yarıda kalan olay buradan devam eder)
+    delivered = db.Column(db.Integer, nullable=False, default=0)  # Yazılan bildirim sayısı
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    locked_by = db.Column(db.String(100), nullable=True)  # Olayı alan işçi
+    locked_until = db.Column(db.DateTime, nullable=True)  # Kira süresi; dolarsa başka işçi devralabilir
+    processed_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+
+class UnreadCount(db.Model): # Kullanıcı başına okunmamış bildirim sayacı (unread_counts.py günceller)
+    __tablename__ = 'unread_counts'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+class CourseRank(db.Model): # Katalog sıralaması için önceden hesaplanmış "trend" puanı (course_rank.py hesaplar)
+    __tablename__ = 'course_rank'
+    __table_args__ = (
+        db.Index('ix_course_rank_score', 'score', 'course_id'),  # sort_by=trending: index sırasıyla okunur
+    )
+
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), primary_key=True)
+    score = db.Column(db.Float, nullable=False, default=0.0)
+    recent_enrollments = db.Column(db.Float, nullable=False, default=0.0)  # Zamanla azalan ağırlıklı kayıt sayısı
+    rating = db.Column(db.Float, nullable=True)  # Önsel ortalamayla yumuşatılmış puan ortalaması
+    completion_rate = db.Column(db.Float, nullable=False, default=0.0)  # Tamamlanan ders / (öğrenci x ders)
+    computed_at = db.Column(db.DateTime, nullable=True)
+
+class CourseNeighbor(db.Model): # "Bu kursa kayıt olanlar şunlara da kayıt oldu": kurs başına en benzer K kurs (course_recommend.py hesaplar)
+    __tablename__ = 'course_neighbors'
+    __table_args__ = (
+        db.Index('ix_course_neighbors_neighbor', 'neighbor_id'),  # Silinen kursun başka kurslardaki satırları için
+    )
+
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True)  # 1 = en benzer; birincil anahtar sırasıyla okunur
+    neighbor_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
+    score = db.Column(db.Float, nullable=False)  # Ağırlıklı kosinüs benzerliği (ortak kayıt sayısıyla küçültülmüş)
+    computed_at = db.Column(db.DateTime, nullable=True)
+
+class QuizSubmission(db.Model): # Puanlanmayı bekleyen quiz teslimleri (quiz_ingest.py işler)
+    __tablename__ = 'quiz_submission_queue'
+    __table_args__ = (
+        db.Index('ix_quiz_submission_queue_status_id', 'status', 'id'),  # İşçinin bekleyen teslimleri sırayla alması
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    attempt_id = db.Column(db.Integer, db.ForeignKey('quiz_attempt.id'), nullable=False, unique=True)  # Teslimde oluşturulan (henüz puansız) deneme
+    quiz_id = db.Column(db.Integer, db.ForeignKey('quiz.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
+    answers = db.Column(db.Text, nullable=False)  # İstekteki cevaplar (JSON)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(UTC))  # Teslim zamanı; denemenin completed_at değeri olur
+    status = db.Column(db.String(20), nullable=False, default='pending')  # 'pending', 'processing', 'done', 'failed'
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    locked_by = db.Column(db.String(100), nullable=True)  # Teslimi alan işçi
+    locked_until = db.Column(db.DateTime, nullable=True)  # Kira süresi; dolarsa başka işçi devralabilir
+    processed_at = db.Column(db.DateTime, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
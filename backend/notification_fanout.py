@@ -0,0 +1,78 @@
+from datetime import datetime, UTC # Bildirim zamanı için kullanılır.
+from models import db, User, Enrollment, Notification, NotificationSetting # models.py dosyasındaki modelleri import ediyoruz.
+import unread_counts # Alıcıların okunmamış sayaçları için
+
+COUNTER_CHUNK = 1000 # Tek UPDATE'te artırılan en fazla okunmamış sayacı
+
+# Bildirim türü -> NotificationSetting kategorisi
+COURSE_TYPES = {
+    'course_update', 'new_lesson', 'lesson_update', 'new_assignment', 'new_quiz',
+    'quiz_graded', 'assignment_graded', 'assignment_due'
+}
+
+def category_for(notification_type): # Bildirim türünün hangi ayar kategorisine bağlı olduğunu döndürür
+    return 'course' if notification_type in COURSE_TYPES else 'system'
+
+def _enabled_settings(category): # Kullanıcı başına kategori ayarı: en az biri açıksa 1, hepsi kapalıysa 0
+    return (
+        db.select(
+            NotificationSetting.user_id.label('user_id'),
+            db.func.max(db.case((NotificationSetting.enabled == True, 1), else_=0)).label('enabled')
+        )
+        .where(NotificationSetting.category == category)
+        .group_by(NotificationSetting.user_id)
+        .subquery('category_settings')
+    )
+
+def recipients(course_id, notification_type, after=None, through=None): # Bildirimi alacak öğrencileri seçen sorgu (ayarı olmayanlar varsayılan olarak alır)
+    settings = _enabled_settings(category_for(notification_type))
+    stmt = (
+        db.select(Enrollment.student_id)
+        .outerjoin(settings, settings.c.user_id == Enrollment.student_id)
+        .where(
+            Enrollment.course_id == course_id,
+            db.or_(settings.c.enabled.is_(None), settings.c.enabled == 1)
+        )
+    )
+    # (after, through] aralığı: işçinin alıcıları parça parça işlemesi için
+    if after is not None:
+        stmt = stmt.where(Enrollment.student_id > after)
+    if through is not None:
+        stmt = stmt.where(Enrollment.student_id <= through)
+    return stmt
+
+def user_recipient(user_id, notification_type): # Tek kullanıcı, bu kategoriyi kapatmadıysa
+    settings = _enabled_settings(category_for(notification_type))
+    return (
+        db.select(User.id.label('student_id'))
+        .outerjoin(settings, settings.c.user_id == User.id)
+        .where(User.id == user_id, db.or_(settings.c.enabled.is_(None), settings.c.enabled == 1))
+    )
+
+def fan_out(course_id, notification_type, title, message, reference_id=None, created_at=None, after=None, through=None, user_id=None): # Kursa kayıtlı öğrencilere tek INSERT ... SELECT ile bildirim yazar
+    """Bildirimi kayıtlı ve bu kategoriyi kapatmamış tüm öğrencilere (user_id verilirse sadece ona) ekler; eklenen satır sayısını döndürür"""
+    if user_id is not None:
+        student_ids = user_recipient(user_id, notification_type).subquery('recipients')
+    else:
+        student_ids = recipients(course_id, notification_type, after, through).subquery('recipients')
+    select = db.select(
+        student_ids.c.student_id,
+        db.literal(course_id),
+        db.literal(notification_type),
+        db.literal(title),
+        db.literal(message),
+        db.literal(False),
+        db.literal(created_at or datetime.now(UTC), db.DateTime),
+        db.literal(reference_id, db.Integer)
+    )
+    # RETURNING ile sayaçlar tam olarak eklenen alıcılar için artırılır; alıcı sorgusunu yeniden çalıştırmak
+    # araya giren kayıt veya ayar değişikliğini de sayardı
+    user_ids = db.session.execute(
+        db.insert(Notification).from_select(
+            ['user_id', 'course_id', 'type', 'title', 'message', 'is_read', 'created_at', 'reference_id'],
+            select
+        ).returning(Notification.user_id)
+    ).scalars().all()
+    for start in range(0, len(user_ids), COUNTER_CHUNK):
+        unread_counts.add_for(user_ids[start:start + COUNTER_CHUNK])
+    return len(user_ids)
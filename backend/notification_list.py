@@ -0,0 +1,31 @@
+from sqlalchemy.orm import joinedload # Kurs başlığını bildirimlerle aynı sorguda yüklemek için kullanılır.
+from models import db, Course, Notification # models.py dosyasındaki modelleri import ediyoruz.
+from cursors import encode_cursor # Sayfalama imleci biçimi
+
+def fetch(*criteria, limit=20, cursor=None, include_total=True, offset=0): # Bildirimleri (created_at, id) anahtarıyla sayfalar
+    """Filtrelenen bildirimleri en yeniden eskiye döndürür; (bildirimler, sonraki imleç, toplam) üçlüsü.
+    include_total=False ise toplam sayılmaz (None döner); offset sadece eski sayfa numarası istemcileri içindir"""
+    stmt = (
+        db.select(Notification)
+        .options(joinedload(Notification.course).load_only(Course.title)) # to_dict satır başına kurs sorgusu atmasın
+        .where(*criteria)
+    )
+    if cursor is not None:
+        stmt = stmt.where(db.tuple_(Notification.created_at, Notification.id) < cursor)
+
+    notifications = db.session.scalars(
+        stmt.order_by(Notification.created_at.desc(), Notification.id.desc()).offset(offset).limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(notifications) > limit:
+        notifications = notifications[:limit]
+        next_cursor = encode_cursor(notifications[-1].created_at, notifications[-1].id)
+
+    total = None
+    if include_total:
+        total = db.session.scalar(db.select(db.func.count(Notification.id)).where(*criteria))
+    return notifications, next_cursor, total
+
+def include_total(args): # ?include_total=false toplam sayımını atlar
+    return args.get('include_total', 'true').lower() not in ('false', '0', 'no')
@@ -0,0 +1,166 @@
+import os # İşçi kimliği için süreç numarası
+import socket # İşçi kimliği için makine adı
+import time # Süre ölçümü için kullanılır.
+from datetime import datetime, timedelta # Kira süreleri için kullanılır.
+from flask import current_app # Loglama için kullanılır.
+from models import db, Enrollment, NotificationOutbox # models.py dosyasındaki modelleri import ediyoruz.
+from notification_fanout import fan_out, recipients # Alıcıları seçen ve bildirim yazan sorgular
+
+MAX_ATTEMPTS = 5 # Bu kadar hatadan sonra olay 'failed' olarak bırakılır
+
+def enqueue(course_id, notification_type, title, message, reference_id=None, user_id=None, created_at=None): # Bildirim olayını isteğin işlemine ekler
+    """Olay, değişiklikle aynı işlemde outbox'a yazılır; alıcılara dağıtımı işçi yapar"""
+    event = NotificationOutbox(
+        course_id=course_id,
+        user_id=user_id,
+        type=notification_type,
+        title=title,
+        message=message,
+        reference_id=reference_id,
+        created_at=created_at
+    )
+    db.session.add(event)
+    return event
+
+def default_worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+def _now():
+    return datetime.utcnow()
+
+def _claimable(now): # Bekleyen veya kirası dolmuş olaylar
+    return db.or_(
+        NotificationOutbox.status == 'pending',
+        db.and_(NotificationOutbox.status == 'processing', NotificationOutbox.locked_until < now)
+    )
+
+def claim(worker_id, limit=10, lease_seconds=60): # Olayları bu işçi adına kiralar
+    """Postgres'te FOR UPDATE SKIP LOCKED, SQLite'ta locked_by/locked_until kira kolonlarıyla olay alır"""
+    now = _now()
+    candidates = (
+        db.select(NotificationOutbox.id)
+        .where(_claimable(now))
+        .order_by(NotificationOutbox.id)
+        .limit(limit)
+    )
+    if db.session.get_bind().dialect.name == 'postgresql':
+        # Başka işçinin kilitlediği satırları beklemeden atla
+        candidates = candidates.with_for_update(skip_locked=True)
+
+    ids = db.session.scalars(candidates).all()
+    if not ids:
+        db.session.rollback()
+        return []
+
+    # Koşul UPDATE içinde tekrar kontrol edilir; SQLite'ta aynı satırı iki işçi alamaz
+    db.session.execute(
+        db.update(NotificationOutbox)
+        .where(NotificationOutbox.id.in_(ids), _claimable(now))
+        .values(
+            status='processing',
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=lease_seconds),
+            attempts=NotificationOutbox.attempts + 1
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+    return db.session.scalars(
+        db.select(NotificationOutbox)
+        .where(
+            NotificationOutbox.id.in_(ids),
+            NotificationOutbox.locked_by == worker_id,
+            NotificationOutbox.status == 'processing'
+        )
+        .order_by(NotificationOutbox.id)
+    ).all()
+
+def _advance(event_id, worker_id, lease_seconds, **values): # Kira hâlâ bizdeyse olay satırını günceller
+    result = db.session.execute(
+        db.update(NotificationOutbox)
+        .where(NotificationOutbox.id == event_id, NotificationOutbox.locked_by == worker_id)
+        .values({'locked_until': _now() + timedelta(seconds=lease_seconds), **values})
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+def process(event, worker_id, batch_size=1000, lease_seconds=60): # Olayı alıcılara parça parça dağıtır
+    """Her parça (bildirimler + outbox imleci) tek işlemde kaydedilir; yazılan bildirim sayısını döndürür"""
+    fields = {
+        'course_id': event.course_id,
+        'notification_type': event.type,
+        'title': event.title,
+        'message': event.message,
+        'reference_id': event.reference_id,
+        'created_at': event.created_at
+    }
+    event_id, user_id, cursor, delivered = event.id, event.user_id, event.cursor, 0
+
+    if user_id is not None:
+        delivered = fan_out(**fields, user_id=user_id)
+    else:
+        while True:
+            batch = db.session.scalars(
+                recipients(event.course_id, event.type, after=cursor)
+                .order_by(Enrollment.student_id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+            inserted = fan_out(**fields, after=cursor, through=batch[-1])
+            cursor = batch[-1]
+            if not _advance(event_id, worker_id, lease_seconds, cursor=cursor,
+                            delivered=NotificationOutbox.delivered + inserted):
+                db.session.rollback() # Kira başka işçiye geçti; bu parçayı yazma
+                return delivered
+            db.session.commit()
+            delivered += inserted
+
+    # Tek alıcılı olayda bildirim ve 'done' durumu aynı işlemde yazılır
+    done = {'delivered': delivered} if user_id is not None else {}
+    if _advance(event_id, worker_id, lease_seconds, status='done', locked_by=None, locked_until=None,
+                processed_at=_now(), **done):
+        db.session.commit()
+    else:
+        db.session.rollback()
+    return delivered
+
+def _fail(event_id, worker_id, attempts, error, retry_seconds=30): # Hata: bir süre sonra yeniden denenmek üzere bırak veya vazgeç
+    db.session.rollback()
+    db.session.execute(
+        db.update(NotificationOutbox)
+        .where(NotificationOutbox.id == event_id, NotificationOutbox.locked_by == worker_id)
+        .values(
+            # Kirası dolmuş 'processing' satırı tekrar alınabilir; bekleme süresi deneme sayısıyla artar
+            status='failed' if attempts >= MAX_ATTEMPTS else 'processing',
+            locked_by=None,
+            locked_until=_now() + timedelta(seconds=retry_seconds * attempts),
+            last_error=str(error)
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+def drain(worker_id=None, claim_size=10, batch_size=1000, lease_seconds=60): # Bekleyen olay kalmayana kadar outbox'u boşaltır
+    """İşlenen olay, yazılan bildirim, başarısız olay sayısını ve geçen süreyi döndürür"""
+    worker_id = worker_id or default_worker_id()
+    stats = {'events': 0, 'notifications': 0, 'failed': 0, 'seconds': 0.0}
+    started = time.perf_counter()
+
+    while True:
+        events = claim(worker_id, limit=claim_size, lease_seconds=lease_seconds)
+        if not events:
+            break
+        for event in events:
+            event_id, attempts = event.id, event.attempts
+            try:
+                stats['notifications'] += process(event, worker_id, batch_size, lease_seconds)
+                stats['events'] += 1
+            except Exception as e:
+                current_app.logger.error(f'Outbox event {event_id} failed: {str(e)}')
+                _fail(event_id, worker_id, attempts, e)
+                stats['failed'] += 1
+
+    stats['seconds'] = time.perf_counter() - started
+    return stats
@@ -0,0 +1,191 @@
+import json # Olay verilerini serileştirmek için kullanılır.
+import queue # Bağlantı başına olay kuyruğu için kullanılır.
+import threading # Toplayıcı iş parçacığı ve kilitler için kullanılır.
+import time # Yoklama aralığı için kullanılır.
+from sqlalchemy.orm import joinedload # Kurs başlığını bildirimlerle aynı sorguda yüklemek için kullanılır.
+from models import db, Course, Notification # models.py dosyasındaki modelleri import ediyoruz.
+import unread_counts # Okunmamış sayaçları için
+
+HEARTBEAT_SECONDS = 15 # Boş bağlantılarda proxy'lerin bağlantıyı kapatmaması için yorum satırı aralığı
+POLL_SECONDS = 1.0 # Toplayıcının veritabanını kontrol etme aralığı (süreç başına tek sorgu)
+RETRY_MS = 3000 # İstemcinin yeniden bağlanma beklemesi
+REPLAY_LIMIT = 100 # Last-Event-ID ile en fazla kaç bildirim yeniden gönderilir; fazlası kaçırıldıysa 'resync' gönderilir
+QUEUE_SIZE = 200 # Yavaş istemci için biriken olay sınırı
+LATE_SECONDS = 120 # Atlanan id'nin geç commit edilmesi bu kadar beklenir (uzun işlemler id'yi erken alıp geç görünür kılar)
+MAX_GAPS = 1000 # İzlenen en fazla boşluk; sıra atlaması gibi büyük boşluklar izlenmez
+
+def format_event(event, data, event_id=None): # SSE metin biçimi
+    lines = [f'id: {event_id}'] if event_id is not None else []
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+def notification_event(notification):
+    return notification.id, format_event('notification', notification.to_dict(), notification.id)
+
+def resync_event(latest_id): # İstemci bildirim listesini yeniden çekmeli; id son bildirim olduğundan Last-Event-ID oradan sürer
+    return latest_id, format_event('resync', {'last_id': latest_id}, latest_id)
+
+def count_event(count): # id taşımaz; istemcinin son bildirim id'si değişmez
+    return None, format_event('unread_count', {'count': count})
+
+class LocalBroker: # Süreç içi yayın/abonelik; paylaşımlı bir veri yolu (ör. Redis pub/sub) aynı arayüzle takılabilir
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {} # user_id -> kuyruklar
+
+    def subscribe(self, user_id):
+        subscription = queue.Queue(maxsize=QUEUE_SIZE)
+        subscription.overflowed = False
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, user_id, subscription):
+        with self._lock:
+            subscriptions = self._subscribers.get(user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[user_id]
+
+    def users(self): # Bağlı kullanıcılar
+        with self._lock:
+            return list(self._subscribers)
+
+    def publish(self, user_id, event):
+        with self._lock:
+            subscriptions = list(self._subscribers.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.put_nowait(event)
+            except queue.Full:
+                # Akış kapatılır; istemci Last-Event-ID ile yeniden bağlanıp eksikleri veritabanından alır
+                subscription.overflowed = True
+
+class Hub: # Süreç başına toplayıcı: bağlı tüm kullanıcılar için her aralıkta tek bildirim ve tek sayaç sorgusu
+    def __init__(self, broker):
+        self.broker = broker
+        self.last_id = None # Görülen en büyük bildirim id'si; bağlı kullanıcı yokken None
+        self.gaps = {} # last_id altında henüz görünmeyen id -> fark edildiği an (time.monotonic)
+        self.counts = {} # user_id -> son gönderilen okunmamış sayısı
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self, app): # İlk bağlantıda arka plan iş parçacığını başlatır
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, args=(app,), name='notification-hub', daemon=True)
+                self._thread.start()
+
+    def _run(self, app):
+        while True:
+            time.sleep(POLL_SECONDS)
+            with app.app_context():
+                try:
+                    self.tick()
+                except Exception as e:
+                    app.logger.error(f'Notification hub tick failed: {str(e)}')
+                finally:
+                    db.session.remove() # Bağlantı beklerken havuza geri verilir
+
+    def tick(self): # Yeni bildirimleri ve değişen sayaçları bağlı kullanıcılara dağıtır
+        users = self.broker.users()
+        if not users:
+            self.last_id, self.gaps, self.counts = None, {}, {}
+            return
+
+        if self.last_id is None:
+            # Öncekiler bağlantı açılırken Last-Event-ID ile gönderilir
+            self.last_id = db.session.scalar(db.select(db.func.max(Notification.id))) or 0
+        else:
+            self._publish_new(users)
+
+        counts = unread_counts.get_many(users)
+        for user_id in users:
+            count = counts.get(user_id)
+            if count is not None and self.counts.get(user_id) != count:
+                self.broker.publish(user_id, count_event(count))
+        self.counts = {user_id: counts[user_id] for user_id in users if user_id in counts}
+
+    def _publish_new(self, users): # Son id'den sonrakileri ve geç görünen boşlukları yayınlar
+        """id'ler INSERT'te verilir ama COMMIT'te görünür: uzun bir işlem N'yi, kısa bir işlem N+1'i commit ettikten sonra
+        görünür kılabilir. Bu yüzden last_id altında kalan boşluklar LATE_SECONDS boyunca her turda yeniden aranır"""
+        now = time.monotonic()
+        self.gaps = {gap: seen for gap, seen in self.gaps.items() if now - seen < LATE_SECONDS} # Geri alınan işlemlerin id'leri
+        visible = db.session.execute(
+            db.select(Notification.id, Notification.user_id)
+            .where(db.or_(Notification.id > self.last_id, Notification.id.in_(list(self.gaps))))
+            .order_by(Notification.id)
+        ).all()
+        if not visible:
+            return
+
+        found = {row.id for row in visible}
+        max_id = max(self.last_id, visible[-1].id)
+        missing = set(range(self.last_id + 1, max_id + 1)) - found if max_id - self.last_id <= MAX_GAPS else set()
+        for gap in found & set(self.gaps):
+            del self.gaps[gap]
+        for gap in missing:
+            self.gaps.setdefault(gap, now)
+        self.last_id = max_id
+
+        connected = set(users)
+        ids = [row.id for row in visible if row.user_id in connected]
+        if ids:
+            notifications = db.session.scalars(
+                db.select(Notification)
+                .options(joinedload(Notification.course).load_only(Course.title))
+                .where(Notification.id.in_(ids))
+                .order_by(Notification.id)
+            ).all()
+            for notification in notifications:
+                self.broker.publish(notification.user_id, notification_event(notification))
+
+broker = LocalBroker()
+hub = Hub(broker)
+
+def replay(user_id, last_event_id): # Bağlantı koptuktan sonra kaçırılan bildirimlerin olayları
+    """REPLAY_LIMIT'ten fazlası kaçırıldıysa ilk sayfayı gönderip canlıya geçmek kalanları kaybettirirdi;
+    bunun yerine tek bir 'resync' olayı döner"""
+    notifications = db.session.scalars(
+        db.select(Notification)
+        .options(joinedload(Notification.course).load_only(Course.title))
+        .where(Notification.user_id == user_id, Notification.id > last_event_id)
+        .order_by(Notification.id)
+        .limit(REPLAY_LIMIT + 1)
+    ).all()
+    if len(notifications) <= REPLAY_LIMIT:
+        return [notification_event(n) for n in notifications]
+    latest_id = db.session.scalar(db.select(db.func.max(Notification.id)).where(Notification.user_id == user_id))
+    return [resync_event(latest_id)]
+
+def stream(app, user_id, last_event_id=None): # Kullanıcının SSE akışını üreten generator
+    """Önce güncel sayaç ve (Last-Event-ID varsa) kaçırılan bildirimler, sonra toplayıcının olayları ve heartbeat"""
+    hub.start(app)
+    subscription = broker.subscribe(user_id)
+    count = unread_counts.get(user_id)
+    hub.counts.setdefault(user_id, count)
+    initial = replay(user_id, last_event_id) if last_event_id is not None else []
+    initial.append(count_event(count))
+    db.session.remove() # Bekleyen bağlantı veritabanı bağlantısı tutmaz
+
+    def generate():
+        sent = {event_id for event_id, _ in initial if event_id is not None}
+        try:
+            yield f'retry: {RETRY_MS}\n\n'
+            for _, chunk in initial:
+                yield chunk
+            while not subscription.overflowed:
+                try:
+                    event_id, chunk = subscription.get(timeout=HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ': heartbeat\n\n'
+                    continue
+                if event_id in sent:
+                    continue # Yeniden gönderimle zaten iletildi (geç commit edilen daha küçük id'ler yine iletilir)
+                yield chunk
+        finally:
+            broker.unsubscribe(user_id, subscription)
+
+    return generate()
@@ -1,7 +1,12 @@
-from flask import Blueprint, jsonify, request, current_app # Flask'ın Blueprint, jsonify, request ve current_app fonksiyonlarını import ediyoruz.
+from flask import Blueprint, Response, jsonify, request, current_app # Flask'ın Blueprint, jsonify, request ve current_app fonksiyonlarını import ediyoruz.
 from flask_jwt_extended import jwt_required, get_jwt_identity # Flask-JWT-Extended'ın jwt_required ve get_jwt_identity fonksiyonlarını import ediyoruz.
 from datetime import datetime, UTC # datetime modülünü import ediyoruz.
 from models import db, Notification, User, NotificationSetting # models.py dosyasındaki db, Notification, User ve NotificationSetting modellerini import ediyoruz.
+from notification_fanout import category_for # Bildirim türünün ayar kategorisi
+import unread_counts # Okunmamış bildirim sayaçları
+import notification_list # Bildirim listelerinin imleçli sayfalanması
+from cursors import parse_cursor # Sayfalama imleci çözümlemesi
+import notification_stream # Canlı bildirim akışı (SSE)
 import logging # logging modülünü import ediyoruz.
 import traceback # traceback modülünü import ediyoruz.
 
@@ -15,10 +20,31 @@ def get_notifications(): # Tüm bildirimleri getir
     try:
         current_user_id = get_jwt_identity() # JWT token'ının içindeki bilgileri almak için kullanılır.
         
-        # Kullanıcının tüm bildirimlerini al
-        notifications = Notification.query.filter_by(user_id=current_user_id).order_by(Notification.created_at.desc()).all()
+        # Sayfalama parametrelerini al
+        limit = request.args.get('limit', 20, type=int) # Sayfa başına bildirim sayısı
+        if limit < 1 or limit > 100:
+            return jsonify({"error": "limit 1 ile 100 arasında olmalıdır."}), 400
         
-        return jsonify([notification.to_dict() for notification in notifications]), 200
+        try:
+            cursor = parse_cursor(request.args.get('cursor')) # Önceki sayfanın next_cursor değeri
+        except ValueError:
+            return jsonify({"error": "Geçersiz cursor."}), 400
+        
+        # (user_id, created_at, id) index'iyle sayfalanır; derin sayfalar ilk sayfa kadar ucuzdur
+        notifications, next_cursor, total = notification_list.fetch(
+            Notification.user_id == int(current_user_id),
+            limit=limit,
+            cursor=cursor,
+            include_total=notification_list.include_total(request.args)
+        )
+        
+        response = {
+            "notifications": [notification.to_dict() for notification in notifications],
+            "next_cursor": next_cursor # Sonraki sayfa için imleç, yoksa None
+        }
+        if total is not None:
+            response["total"] = total
+        return jsonify(response), 200
     except Exception as e:
         current_app.logger.error(f"Error in get_notifications: {str(e)}")
         current_app.logger.error(traceback.format_exc())
@@ -31,14 +57,34 @@ def get_unread_count(): # Okunmamış bildirim sayısını getir
     try:
         current_user_id = get_jwt_identity() # JWT token'ının içindeki bilgileri almak için kullanılır.
         
-        # Kullanıcının okunmamış bildirimlerini say
-        unread_count = Notification.query.filter_by(user_id=current_user_id, is_read=False).count()
+        # Sayaç tablosundan birincil anahtarla okunur (bkz. unread_counts.py)
+        unread_count = unread_counts.get(current_user_id)
         
         return jsonify({"count": unread_count}), 200
     except Exception as e:
         current_app.logger.error(f"Error in get_unread_count: {str(e)}")
         return jsonify({"error": "İstek işlenirken bir hata oluştu."}), 500
 
+# Canlı bildirim akışı (Server-Sent Events)
+@notifications_bp.route('/notifications/stream', methods=['GET']) # Yeni bildirimleri ve sayaç değişikliklerini gönder
+@jwt_required(locations=['headers', 'query_string']) # EventSource başlık gönderemez; token ?jwt=... ile de alınır
+def stream_notifications(): # Yoklama yerine açık kalan bağlantı
+    current_user_id = int(get_jwt_identity()) # JWT token'ının içindeki bilgileri almak için kullanılır.
+    
+    # Yeniden bağlanan tarayıcı son aldığı olayın id'sini gönderir
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    if last_event_id is not None:
+        try:
+            last_event_id = int(last_event_id)
+        except ValueError:
+            return jsonify({"error": "Geçersiz Last-Event-ID."}), 400
+    
+    events = notification_stream.stream(current_app._get_current_object(), current_user_id, last_event_id)
+    return Response(events, mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no' # nginx arabelleğe almasın
+    })
+
 # Bildirimi okundu olarak işaretle
 @notifications_bp.route('/notifications/<int:notification_id>/read', methods=['PUT']) # Bildirimi okundu olarak işaretle
 @jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
@@ -217,12 +263,7 @@ def update_notification_settings(): # Bildirim ayarlarını güncelle
 def create_notification(user_id, course_id, notification_type, title, message, reference_id=None): # Yeni bildirim oluştur (iç işlemlerde kullanılabilir)
     try:
         # Kullanıcının bu tür bildirimlerle ilgili ayarlarını kontrol et
-        if notification_type == 'course_update':
-            category = 'course'
-        elif notification_type in ['new_assignment', 'new_quiz', 'quiz_graded', 'assignment_graded', 'assignment_due']:
-            category = 'course'
-        else:
-            category = 'system'
+        category = category_for(notification_type)
         
         # Kullanıcının bu kategorideki bildirim ayarını kontrol et
         settings = NotificationSetting.query.filter_by(
@@ -0,0 +1,110 @@
+from sqlalchemy.orm import aliased # Aynı tabloyu (users) farklı rollerle iki kez bağlamak için kullanılır.
+from models import db, Course, Enrollment, Progress, Lesson, User, Assignment, AssignmentSubmission # models.py dosyasındaki modelleri import ediyoruz.
+
+# Kayıt listelerinde izin verilen sıralama alanları
+SORT_FIELDS = ('enrolled_at', 'progress', 'last_activity')
+
+Student = aliased(User, name='student')
+Instructor = aliased(User, name='instructor')
+
+def progress_summary(*criteria): # Kayıt başına tamamlanan ders sayısı, tamamlanma ve son aktivite zamanı
+    """Verilen kayıt filtreleri için kayıt başına tek satırlık ilerleme özeti alt sorgusu"""
+    completed = db.case((Progress.completed == True, 1), else_=0)
+    return (
+        db.select(
+            Progress.enrollment_id.label('enrollment_id'),
+            db.func.sum(completed).label('completed_lessons'),
+            db.func.max(db.case((Progress.completed == True, Progress.completed_at))).label('completed_at'),
+            db.func.max(Progress.completed_at).label('last_activity_at')
+        )
+        .join(Enrollment, Enrollment.id == Progress.enrollment_id)
+        .join(Lesson, Lesson.id == Progress.lesson_id)
+        .where(Lesson.course_id == Enrollment.course_id, *criteria) # Sadece kaydın kendi kursundaki dersler sayılır
+        .group_by(Progress.enrollment_id)
+        .subquery('progress_summary')
+    )
+
+def enrollment_progress(*criteria, sort='enrolled_at', order='desc'): # Kayıtları kurs, öğrenci, eğitmen ve ilerleme bilgisiyle tek sorguda döndürür
+    """Filtrelenen kayıtlar için ilerleme bilgisini içeren sıralı sorguyu oluşturur"""
+    summary = progress_summary(*criteria)
+    completed_lessons = db.func.coalesce(summary.c.completed_lessons, 0)
+    # Toplam ders sayısı Course.lesson_count sayacından okunur (bkz. counters.py)
+    progress = db.case((Course.lesson_count > 0, completed_lessons * 100 // Course.lesson_count), else_=0)
+    last_activity_at = db.func.coalesce(summary.c.last_activity_at, Enrollment.enrolled_at)
+
+    sort_columns = {
+        'enrolled_at': Enrollment.enrolled_at,
+        'progress': progress,
+        'last_activity': last_activity_at
+    }
+    sort_column = sort_columns[sort]
+    sort_column = sort_column.asc() if order == 'asc' else sort_column.desc()
+    tiebreaker = Enrollment.id.asc() if order == 'asc' else Enrollment.id.desc()
+
+    return (
+        db.select(
+            Enrollment,
+            Course,
+            Student,
+            Instructor.username.label('instructor_name'),
+            completed_lessons.label('completed_lessons'),
+            progress.label('progress'),
+            summary.c.completed_at,
+            last_activity_at.label('last_activity_at')
+        )
+        .join(Course, Course.id == Enrollment.course_id)
+        .join(Student, Student.id == Enrollment.student_id)
+        .outerjoin(Instructor, Instructor.id == Course.instructor_id)
+        .outerjoin(summary, summary.c.enrollment_id == Enrollment.id)
+        .where(*criteria)
+        .order_by(sort_column, tiebreaker)
+    )
+
+def fetch(stmt, page=None, per_page=20): # Sorguyu çalıştırır; sayfa verilirse LIMIT/OFFSET ve toplam sayı ile
+    """Satırları ve (sayfalama varsa) toplam satır sayısını döndürür"""
+    if page is None:
+        return db.session.execute(stmt).all(), None
+
+    total = db.session.scalar(
+        db.select(db.func.count()).select_from(stmt.order_by(None).subquery())
+    )
+    rows = db.session.execute(stmt.limit(per_page).offset((page - 1) * per_page)).all()
+    return rows, total
+
+def is_completed(row): # Kursun tüm dersleri tamamlandı mı
+    return row.Course.lesson_count > 0 and row.completed_lessons >= row.Course.lesson_count
+
+def assignment_stats(student_id, course_ids): # Kurs başına ödev sayısı ve öğrencinin teslim/not özetini döndürür
+    """Kurs id'si -> {'total_assignments', 'completed_assignments', 'average_grade'} sözlüğü"""
+    stats = {course_id: {'total_assignments': 0, 'completed_assignments': 0, 'average_grade': 0} for course_id in course_ids}
+    if not course_ids:
+        return stats
+
+    totals = db.session.execute(
+        db.select(Lesson.course_id, db.func.count(Assignment.id))
+        .join(Assignment, Assignment.lesson_id == Lesson.id)
+        .where(Lesson.course_id.in_(course_ids))
+        .group_by(Lesson.course_id)
+    ).all()
+    for course_id, total in totals:
+        stats[course_id]['total_assignments'] = total
+
+    submissions = db.session.execute(
+        db.select(
+            Lesson.course_id,
+            db.func.count(db.distinct(AssignmentSubmission.assignment_id)),
+            db.func.avg(AssignmentSubmission.grade)
+        )
+        .join(Assignment, Assignment.id == AssignmentSubmission.assignment_id)
+        .join(Lesson, Lesson.id == Assignment.lesson_id)
+        .where(
+            AssignmentSubmission.user_id == student_id,
+            AssignmentSubmission.submitted_at.isnot(None),
+            Lesson.course_id.in_(course_ids)
+        )
+        .group_by(Lesson.course_id)
+    ).all()
+    for course_id, completed, average in submissions:
+        stats[course_id]['completed_assignments'] = completed
+        stats[course_id]['average_grade'] = round(average or 0, 2)
+    return stats
@@ -0,0 +1,177 @@
+import threading # Analiz önbelleğinin kilidi için kullanılır.
+from datetime import datetime # Hesaplama zamanı için kullanılır.
+import numpy as np # Deneme x soru matrisi üzerindeki hesaplar için kullanılır.
+from models import db, QuizQuestion, QuizOption, QuizAttempt # models.py dosyasındaki modelleri import ediyoruz.
+from quiz_grading import RESPONSE_DTYPE # quiz_attempt.responses kayıt biçimi
+
+SCORE_BINS = 10 # Puan dağılımı 0-100 arasında bu kadar eşit aralığa bölünür
+HARD_P = 0.3 # Doğru cevaplanma oranı bunun altındaki soru 'hard'
+EASY_P = 0.9 # Doğru cevaplanma oranı bunun üstündeki soru 'easy'
+LOW_DISCRIMINATION = 0.2 # Nokta-çift serili korelasyonu bunun altındaki soru 'low_discrimination'
+MAX_ENTRIES = 500 # Süreçte tutulan en fazla quiz analizi
+
+def _items(quiz_id): # Sorular ve seçenekleri tek sorguda, id sırasıyla
+    return db.session.execute(
+        db.select(QuizQuestion.id, QuizQuestion.question_text, QuizQuestion.question_type, QuizQuestion.points,
+                  QuizOption.id, QuizOption.option_text, QuizOption.is_correct)
+        .outerjoin(QuizOption, QuizOption.question_id == QuizQuestion.id)
+        .where(QuizQuestion.quiz_id == quiz_id)
+        .order_by(QuizQuestion.id, QuizOption.id)
+    ).all()
+
+def _responses(quiz_id): # Tamamlanmış denemelerin paketli seçimleri tek sorguda
+    return db.session.scalars(
+        db.select(QuizAttempt.responses).where(QuizAttempt.quiz_id == quiz_id, QuizAttempt.completed_at.isnot(None))
+    ).all()
+
+def response_matrix(blobs, question_ids): # Deneme x soru seçim matrisi (seçilen seçenek id'si, seçilmediyse 0)
+    """question_ids sıralı olmalıdır; artık quizde olmayan sorulara verilen cevaplar atlanır"""
+    blobs = [blob or b'' for blob in blobs]
+    selected = np.zeros((len(blobs), len(question_ids)), dtype=np.int64)
+    if not len(question_ids):
+        return selected
+    lengths = np.fromiter((len(blob) // RESPONSE_DTYPE.itemsize for blob in blobs), dtype=np.int64, count=len(blobs))
+    records = np.frombuffer(b''.join(blobs), dtype=RESPONSE_DTYPE)
+    rows = np.repeat(np.arange(len(blobs)), lengths)
+    columns = np.searchsorted(question_ids, records['question_id'])
+    clipped = np.minimum(columns, len(question_ids) - 1)
+    known = question_ids[clipped] == records['question_id']
+    selected[rows[known], clipped[known]] = records['option_id'][known]
+    return selected
+
+def analyze(selected, points, gradable, option_ids, option_columns, option_correct): # Madde analizi; tüm sorular aynı anda
+    """selected: deneme x soru seçim matrisi; option_* dizileri seçenek id'sine göre sıralıdır.
+    (doğru matrisi, soru başına p, ayırt edicilik, seçenek seçilme sayıları, cevap sayıları, yüzde puanlar) döndürür"""
+    attempts, questions = selected.shape
+    if len(option_ids):
+        index = np.minimum(np.searchsorted(option_ids, selected), len(option_ids) - 1)
+        # Seçim, o sorunun bir seçeneği olmalı (başka sorunun seçeneği veya silinmiş seçenek sayılmaz)
+        valid = (option_ids[index] == selected) & (option_columns[index] == np.arange(questions))
+        correct = valid & option_correct[index] & gradable
+        option_counts = np.bincount(index[valid], minlength=len(option_ids))
+    else:
+        valid = correct = np.zeros(selected.shape, dtype=bool)
+        option_counts = np.zeros(0, dtype=np.int64)
+
+    earned = correct * points
+    total = earned.sum(axis=1)
+    max_points = points[gradable].sum()
+    percentages = total / max_points * 100 if max_points > 0 else np.zeros(attempts)
+
+    x = correct.astype(np.float64)
+    p_values = x.mean(axis=0) if attempts else np.full(questions, np.nan)
+    # Nokta-çift serili korelasyon: soru puanı ile sorunun kendisi hariç toplam puan arasında
+    rest = total[:, None] - earned
+    if attempts:
+        covariance = (x * rest).mean(axis=0) - p_values * rest.mean(axis=0)
+        spread = x.std(axis=0) * rest.std(axis=0)
+    else:
+        covariance = spread = np.zeros(questions)
+    discrimination = np.divide(covariance, spread, out=np.full(questions, np.nan), where=spread > 0)
+    return correct, p_values, discrimination, option_counts, valid.sum(axis=0), percentages
+
+def _number(value, digits=4):
+    return None if value is None or np.isnan(value) else round(float(value), digits)
+
+def _flags(p_value, discrimination, options):
+    flags = []
+    if p_value is not None and p_value < HARD_P:
+        flags.append('hard')
+    if p_value is not None and p_value > EASY_P:
+        flags.append('easy')
+    if discrimination is not None and discrimination < LOW_DISCRIMINATION:
+        flags.append('low_discrimination')
+    correct_rate = sum(option['rate'] for option in options if option['is_correct'])
+    if any(not option['is_correct'] and option['rate'] > correct_rate for option in options):
+        flags.append('misleading_distractor') # Bir çeldirici doğru cevaptan daha çok seçilmiş
+    return flags
+
+def compute(quiz): # Quizin tüm tamamlanmış denemeleri üzerinden analiz
+    items = _items(quiz.id)
+    question_rows = list({row[0]: row[:4] for row in items}.values())
+    option_rows = [row for row in items if row[4] is not None]
+    question_ids = np.array([row[0] for row in question_rows], dtype=np.int64)
+    points = np.array([row[3] or 0 for row in question_rows], dtype=np.float64)
+    gradable = np.array([row[2] == 'multiple_choice' for row in question_rows], dtype=bool)
+    option_ids = np.array([row[4] for row in option_rows], dtype=np.int64)
+    order = np.argsort(option_ids)
+    option_ids = option_ids[order]
+    option_columns = np.searchsorted(question_ids, np.array([row[0] for row in option_rows], dtype=np.int64))[order]
+    option_correct = np.array([bool(row[6]) for row in option_rows], dtype=bool)[order]
+
+    selected = response_matrix(_responses(quiz.id), question_ids)
+    _, p_values, discrimination, option_counts, answered, percentages = analyze(
+        selected, points, gradable, option_ids, option_columns, option_correct
+    )
+    attempts = len(selected)
+
+    position = {option_id: i for i, option_id in enumerate(option_ids.tolist())}
+    questions = []
+    for column, (question_id, text, question_type, question_points) in enumerate(question_rows):
+        options = [{
+            'id': row[4],
+            'text': row[5],
+            'is_correct': bool(row[6]),
+            'rate': _number(option_counts[position[row[4]]] / attempts) if attempts else None
+        } for row in option_rows if row[0] == question_id]
+        p_value = _number(p_values[column]) if gradable[column] else None
+        item_discrimination = _number(discrimination[column]) if gradable[column] else None
+        questions.append({
+            'id': question_id,
+            'text': text,
+            'question_type': question_type,
+            'points': question_points,
+            'p_value': p_value,
+            'discrimination': item_discrimination,
+            'unanswered_rate': _number(1 - answered[column] / attempts) if attempts else None,
+            'options': options,
+            'flags': _flags(p_value, item_discrimination, options) if attempts and gradable[column] else []
+        })
+
+    counts, edges = np.histogram(percentages, bins=SCORE_BINS, range=(0, 100))
+    return {
+        'quiz_id': quiz.id,
+        'attempts': attempts,
+        'computed_at': datetime.utcnow().isoformat(),
+        'questions': questions,
+        'score_distribution': {
+            'bins': [{'min': float(edges[i]), 'max': float(edges[i + 1]), 'count': int(counts[i])} for i in range(SCORE_BINS)],
+            'mean': _number(percentages.mean(), 2) if attempts else None,
+            'median': _number(np.median(percentages), 2) if attempts else None,
+            'std': _number(percentages.std(), 2) if attempts else None,
+            'p25': _number(np.percentile(percentages, 25), 2) if attempts else None,
+            'p75': _number(np.percentile(percentages, 75), 2) if attempts else None
+        }
+    }
+
+def _stamp(quiz): # Yeni tamamlanan deneme veya anahtar değişikliği analizi eskitir; (quiz_id, completed_at) index'inden okunur
+    count, last = db.session.execute(
+        db.select(db.func.count(QuizAttempt.completed_at), db.func.max(QuizAttempt.completed_at))
+        .where(QuizAttempt.quiz_id == quiz.id)
+    ).one()
+    return quiz.answer_key_version, count, last
+
+class AnalyticsCache: # quiz id'si -> (damga, analiz); damga her istekte tek sorguyla doğrulanır
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, quiz):
+        stamp = _stamp(quiz)
+        with self._lock:
+            entry = self._entries.get(quiz.id)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        result = compute(quiz)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[quiz.id] = (stamp, result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+analytics = AnalyticsCache()
@@ -0,0 +1,142 @@
+import threading # Cevap anahtarı önbelleğinin kilidi için kullanılır.
+from collections import namedtuple # Derlenmiş anahtar kayıtları için kullanılır.
+import numpy as np # Seçilen seçeneklerin paketlenmesi için kullanılır.
+from sqlalchemy import event # Soru ve seçenek değişikliklerinde anahtar sürümünü artırmak için kullanılır.
+from models import db, Quiz, QuizQuestion, QuizOption, QuizAnswer # models.py dosyasındaki modelleri import ediyoruz.
+
+MAX_KEYS = 5000 # Süreçte tutulan en fazla quiz anahtarı
+
+RESPONSE_DTYPE = np.dtype([('question_id', '<i4'), ('option_id', '<i4')]) # quiz_attempt.responses kayıt biçimi; seçilmeyen seçenek 0
+
+Question = namedtuple('Question', 'points question_type correct options') # correct: doğru seçenek id'leri, options: tüm seçenek id'leri
+AnswerKey = namedtuple('AnswerKey', 'quiz_id version questions max_points') # questions: soru id'si -> Question
+
+def compile_key(quiz_id, version): # Soruların puan, tür ve seçeneklerini tek sorguda okur
+    questions = {}
+    rows = db.session.execute(
+        db.select(QuizQuestion.id, QuizQuestion.points, QuizQuestion.question_type, QuizOption.id, QuizOption.is_correct)
+        .outerjoin(QuizOption, QuizOption.question_id == QuizQuestion.id)
+        .where(QuizQuestion.quiz_id == quiz_id)
+    )
+    for question_id, points, question_type, option_id, is_correct in rows:
+        question = questions.setdefault(question_id, Question(points or 0, question_type, set(), set()))
+        if option_id is not None:
+            question.options.add(option_id)
+            if is_correct:
+                question.correct.add(option_id)
+    questions = {
+        question_id: q._replace(correct=frozenset(q.correct), options=frozenset(q.options))
+        for question_id, q in questions.items()
+    }
+    return AnswerKey(quiz_id, version, questions, sum(q.points for q in questions.values()))
+
+class AnswerKeyCache: # quiz id'si -> derlenmiş anahtar; quiz.answer_key_version ile doğrulanır
+    def __init__(self, max_keys=MAX_KEYS):
+        self.max_keys = max_keys
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def get(self, quiz): # Sürüm değiştiyse (bu veya başka bir süreçte) anahtar yeniden derlenir
+        with self._lock:
+            key = self._keys.get(quiz.id)
+        if key is not None and key.version == quiz.answer_key_version:
+            return key
+        key = compile_key(quiz.id, quiz.answer_key_version)
+        with self._lock:
+            if len(self._keys) >= self.max_keys:
+                self._keys.clear()
+            self._keys[quiz.id] = key
+        return key
+
+    def discard(self, quiz_ids):
+        with self._lock:
+            for quiz_id in quiz_ids:
+                self._keys.pop(quiz_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._keys.clear()
+
+answer_keys = AnswerKeyCache()
+
+class UnknownQuestion(ValueError): # Cevaplanan soru bu quize ait değil
+    pass
+
+def _parse(key, answer): # Cevabın (soru id'si, soru, seçilen seçenek) üçlüsü; soru bu quize ait değilse UnknownQuestion
+    try:
+        question_id = int(answer['question_id'])
+        selected = int(answer['selected_option_id']) if answer.get('selected_option_id') is not None else None
+    except (KeyError, TypeError, ValueError):
+        raise UnknownQuestion(answer.get('question_id') if isinstance(answer, dict) else answer)
+    question = key.questions.get(question_id)
+    if question is None:
+        raise UnknownQuestion(question_id)
+    if selected not in question.options:
+        selected = None # Sorunun seçeneği olmayan (silinmiş veya uydurma) seçim boş sayılır; yabancı anahtar hatası vermez
+    return question_id, question, selected
+
+def validate(key, answers): # Sadece soru id'lerini anahtara göre denetler; kuyruk modunda cevap satırları worker'da üretilir
+    for answer in answers:
+        _parse(key, answer)
+
+def grade(key, answers): # Bellekte puanlama: (cevap satırları, kazanılan puan, doğru sayısı)
+    """answers: [{'question_id', 'selected_option_id', 'text'}]; satırlar attempt_id dışında QuizAnswer kolonlarıdır"""
+    rows, earned, correct_count = [], 0, 0
+    for answer in answers:
+        question_id, question, selected = _parse(key, answer)
+        is_correct = question.question_type == 'multiple_choice' and selected is not None and selected in question.correct
+        points = question.points if is_correct else 0
+        earned += points
+        correct_count += is_correct
+        rows.append({
+            'question_id': question_id,
+            'selected_option_id': selected,
+            'answer_text': answer.get('text', ''),
+            'is_correct': is_correct,
+            'points_earned': points
+        })
+    return rows, earned, correct_count
+
+def summarize(attempt, key, earned, correct_count): # Denemenin özetini yazar; puan quizin tüm soruları üzerinden yüzdedir
+    attempt.total_score = earned
+    attempt.max_score = key.max_points
+    attempt.correct_count = correct_count
+    attempt.score = (earned / key.max_points * 100) if key.max_points > 0 else 0
+
+def pack_responses(rows): # Cevap satırlarındaki seçimler; quiz analizi bunları tek kolondan okur (bkz. quiz_analytics.py)
+    return np.array([(row['question_id'], row['selected_option_id'] or 0) for row in rows], dtype=RESPONSE_DTYPE).tobytes()
+
+def insert_answers(attempt_id, rows): # Denemenin tüm cevapları tek executemany ile yazılır
+    if rows:
+        db.session.execute(db.insert(QuizAnswer), [{**row, 'attempt_id': attempt_id} for row in rows])
+
+def _quiz_id(session, obj): # Soru veya seçeneğin ait olduğu quiz (yeni nesnelerde ilişki üzerinden)
+    if isinstance(obj, QuizOption):
+        question = obj.question
+        if question is None and obj.question_id is not None:
+            question = session.get(QuizQuestion, obj.question_id)
+        return _quiz_id(session, question) if question is not None else None
+    if isinstance(obj, QuizQuestion):
+        return obj.quiz_id if obj.quiz_id is not None else (obj.quiz.id if obj.quiz is not None else None)
+    return None
+
+@event.listens_for(db.session, 'before_flush')
+def _bump_versions(session, flush_context, instances): # Anahtarı değişen quizlerin sürümü artırılır; diğer süreçler de yeniden derler
+    quiz_ids = {_quiz_id(session, obj) for obj in (*session.new, *session.dirty, *session.deleted) if isinstance(obj, (QuizQuestion, QuizOption))}
+    quiz_ids.discard(None)
+    if quiz_ids:
+        table = Quiz.__table__
+        session.connection().execute(
+            table.update().where(table.c.id.in_(quiz_ids)).values(answer_key_version=table.c.answer_key_version + 1)
+        )
+        session.info.setdefault('answer_key_changes', set()).update(quiz_ids)
+
+@event.listens_for(db.session, 'after_commit')
+def _discard_keys(session):
+    quiz_ids = session.info.pop('answer_key_changes', None)
+    if quiz_ids:
+        answer_keys.discard(quiz_ids)
+
+@event.listens_for(db.session, 'after_rollback')
+def _keep_keys(session):
+    session.info.pop('answer_key_changes', None)
@@ -0,0 +1,258 @@
+import json # Cevapların kuyrukta saklanması için kullanılır.
+import time # Süre ölçümü için kullanılır.
+from collections import Counter, defaultdict # Quiz başına denemeleri ve alıcı başına bildirimleri gruplamak için kullanılır.
+from concurrent.futures import ThreadPoolExecutor # İşçi havuzu için kullanılır.
+from datetime import datetime, timedelta # Kira süreleri için kullanılır.
+from flask import current_app # Loglama için kullanılır.
+from models import db, Course, Lesson, Quiz, QuizAttempt, QuizAnswer, QuizSubmission, Notification, NotificationSetting # models.py dosyasındaki modelleri import ediyoruz.
+from notification_fanout import category_for # Öğrencinin bildirim ayarı kategorisi
+from notification_outbox import default_worker_id # İşçi kimliği
+import quiz_grading # Derlenmiş cevap anahtarıyla puanlama
+import unread_counts # Toplu yazılan bildirimlerin okunmamış sayaçları için
+
+MAX_ATTEMPTS = 5 # Bu kadar hatadan sonra teslim 'failed' olarak bırakılır
+GRADING_ERROR = 'Teslim puanlanırken bir hata oluştu' # Öğrenciye gösterilen hata; ayrıntı yalnızca loglanır
+
+# Kuyruk durumu -> istemciye gösterilen deneme durumu
+STATUSES = {'pending': 'queued', 'processing': 'processing', 'failed': 'failed'}
+
+def enqueue(quiz, user_id, course_id, answers, submitted_at): # Teslimi kuyruğa yazar; puansız denemeyi döndürür
+    """Deneme completed_at boş olarak oluşturulur ve id'si hemen döner; puan, cevap satırları ve bildirimler işçide yazılır"""
+    attempt = QuizAttempt(quiz_id=quiz.id, user_id=user_id, started_at=submitted_at)
+    db.session.add(attempt)
+    db.session.flush() # attempt.id'nin oluşması için
+    db.session.add(QuizSubmission(
+        attempt_id=attempt.id,
+        quiz_id=quiz.id,
+        user_id=user_id,
+        course_id=course_id,
+        answers=json.dumps(answers),
+        created_at=submitted_at
+    ))
+    return attempt
+
+def status(attempt_id): # (deneme, durum, hata); deneme yoksa None
+    row = db.session.execute(
+        db.select(QuizAttempt, QuizSubmission.status, QuizSubmission.last_error)
+        .outerjoin(QuizSubmission, QuizSubmission.attempt_id == QuizAttempt.id)
+        .where(QuizAttempt.id == attempt_id)
+    ).first()
+    if row is None:
+        return None
+    attempt, queued, error = row
+    if queued in STATUSES:
+        return attempt, STATUSES[queued], error
+    return attempt, 'graded' if attempt.completed_at else 'in_progress', None
+
+def _now():
+    return datetime.utcnow()
+
+def _claimable(now): # Bekleyen veya kirası dolmuş teslimler
+    return db.or_(
+        QuizSubmission.status == 'pending',
+        db.and_(QuizSubmission.status == 'processing', QuizSubmission.locked_until < now)
+    )
+
+def claim(worker_id, limit=200, lease_seconds=60): # Teslimleri bu işçi adına kiralar (bkz. notification_outbox.claim)
+    now = _now()
+    candidates = (
+        db.select(QuizSubmission.id)
+        .where(_claimable(now))
+        .order_by(QuizSubmission.id)
+        .limit(limit)
+    )
+    if db.session.get_bind().dialect.name == 'postgresql':
+        # Başka işçinin kilitlediği satırları beklemeden atla
+        candidates = candidates.with_for_update(skip_locked=True)
+
+    ids = db.session.scalars(candidates).all()
+    if not ids:
+        db.session.rollback()
+        return []
+
+    # Koşul UPDATE içinde tekrar kontrol edilir; SQLite'ta aynı satırı iki işçi alamaz
+    db.session.execute(
+        db.update(QuizSubmission)
+        .where(QuizSubmission.id.in_(ids), _claimable(now))
+        .values(
+            status='processing',
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=lease_seconds),
+            attempts=QuizSubmission.attempts + 1
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+    return db.session.scalars(
+        db.select(QuizSubmission)
+        .where(
+            QuizSubmission.id.in_(ids),
+            QuizSubmission.locked_by == worker_id,
+            QuizSubmission.status == 'processing'
+        )
+        .order_by(QuizSubmission.id)
+    ).all()
+
+def _muted(user_ids): # 'quiz_graded' kategorisindeki tüm ayarlarını kapatmış öğrenciler
+    enabled = db.func.max(db.case((NotificationSetting.enabled == True, 1), else_=0))
+    return set(db.session.scalars(
+        db.select(NotificationSetting.user_id)
+        .where(NotificationSetting.user_id.in_(user_ids), NotificationSetting.category == category_for('quiz_graded'))
+        .group_by(NotificationSetting.user_id)
+        .having(enabled == 0)
+    ))
+
+def process(submissions, worker_id): # Kiralanan teslimleri tek işlemde puanlar; puanlanan teslim sayısını döndürür
+    """Sorgu sayısı teslim sayısından bağımsızdır: quizler ve denemeler birer sorguda yüklenir, puanlar tek executemany
+    UPDATE, cevaplar ve bildirimler birer INSERT ile yazılır. Eğitmene quiz başına tek bildirim, öğrenciye puan bildirimi gider"""
+    quizzes = {
+        row.Quiz.id: row for row in db.session.execute(
+            db.select(Quiz, Course.id.label('course_id'), Course.title.label('course_title'), Course.instructor_id)
+            .join(Lesson, Lesson.id == Quiz.lesson_id)
+            .join(Course, Course.id == Lesson.course_id)
+            .where(Quiz.id.in_({submission.quiz_id for submission in submissions}))
+        )
+    }
+    attempts = {
+        attempt.id: attempt for attempt in db.session.scalars(
+            db.select(QuizAttempt).where(QuizAttempt.id.in_([submission.attempt_id for submission in submissions]))
+        )
+    }
+
+    answer_rows, graded, rejected = [], defaultdict(list), {}
+    for submission in submissions:
+        quiz, attempt = quizzes.get(submission.quiz_id), attempts.get(submission.attempt_id)
+        if quiz is None or attempt is None:
+            rejected[submission.id] = 'Quiz veya deneme bulunamadı'
+            continue
+        key = quiz_grading.answer_keys.get(quiz.Quiz)
+        try:
+            rows, total_points, correct_count = quiz_grading.grade(key, json.loads(submission.answers))
+        except quiz_grading.UnknownQuestion as e:
+            # Teslimden sonra soru silinmiş; yeniden denemek sonucu değiştirmez
+            rejected[submission.id] = f'Soru bu quize ait değil: {e}'
+            continue
+        # Tamamlanma zamanı puanlama değil teslim zamanıdır
+        quiz_grading.summarize(attempt, key, total_points, correct_count)
+        attempt.responses = quiz_grading.pack_responses(rows) # Quiz analizi için
+        attempt.completed_at = submission.created_at
+        answer_rows.extend({**row, 'attempt_id': attempt.id} for row in rows)
+        graded[submission.quiz_id].append(attempt)
+
+    if answer_rows:
+        db.session.execute(db.insert(QuizAnswer), answer_rows)
+
+    muted = _muted({attempt.user_id for done in graded.values() for attempt in done})
+    notifications = []
+    for quiz_id, done in graded.items():
+        quiz = quizzes[quiz_id]
+        average = sum(attempt.score for attempt in done) / len(done)
+        notifications.append({
+            'user_id': quiz.instructor_id,
+            'course_id': quiz.course_id,
+            'type': 'quiz_submitted',
+            'title': f'Yeni Quiz Teslimleri: {quiz.Quiz.title}',
+            'message': f'"{quiz.course_title}" kursundaki "{quiz.Quiz.title}" quiz\'ini {len(done)} öğrenci tamamladı. Ortalama puan: %{average:.1f}',
+            'reference_id': quiz_id
+        })
+        notifications.extend({
+            'user_id': attempt.user_id,
+            'course_id': quiz.course_id,
+            'type': 'quiz_graded',
+            'title': f'Quiz Değerlendirildi: {quiz.Quiz.title}',
+            'message': f'{quiz.course_title} kursundaki {quiz.Quiz.title} quiz\'inden {attempt.score:.1f}% aldınız.',
+            'reference_id': quiz_id
+        } for attempt in done if attempt.user_id not in muted)
+    if notifications:
+        # Bildirimler tek executemany ile yazılır; sayaçlar alıcı başına değil, bildirim sayısı başına tek UPDATE ile artar
+        db.session.execute(db.insert(Notification), notifications)
+        received = Counter(notification['user_id'] for notification in notifications)
+        by_amount = defaultdict(list)
+        for user_id, amount in received.items():
+            by_amount[amount].append(user_id)
+        for amount, user_ids in by_amount.items():
+            unread_counts.add_for(user_ids, amount)
+
+    ids = [submission.id for submission in submissions]
+    values = {'status': 'done', 'locked_by': None, 'locked_until': None, 'processed_at': _now()}
+    if rejected:
+        values['status'] = db.case((QuizSubmission.id.in_(list(rejected)), 'failed'), else_='done')
+        values['last_error'] = db.case(*((QuizSubmission.id == submission_id, error) for submission_id, error in rejected.items()))
+    result = db.session.execute(
+        db.update(QuizSubmission)
+        .where(QuizSubmission.id.in_(ids), QuizSubmission.locked_by == worker_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(ids):
+        db.session.rollback() # Kira (bir kısmı) başka işçiye geçti; bu partiyi yazma, o işçi yeniden puanlar
+        return 0
+    db.session.commit()
+    return len(ids) - len(rejected)
+
+def _fail(submissions, worker_id, retry_seconds=30): # Puanlanamayan teslimler: bir süre sonra yeniden denenmek üzere bırak veya vazgeç
+    db.session.rollback()
+    for submission_id, attempts in submissions:
+        db.session.execute(
+            db.update(QuizSubmission)
+            .where(QuizSubmission.id == submission_id, QuizSubmission.locked_by == worker_id)
+            .values(
+                status='failed' if attempts >= MAX_ATTEMPTS else 'processing',
+                locked_by=None,
+                locked_until=_now() + timedelta(seconds=retry_seconds * attempts),
+                last_error=GRADING_ERROR
+            )
+            .execution_options(synchronize_session=False)
+        )
+    db.session.commit()
+
+def _isolate(submissions, claimed, worker_id): # Hata veren partiyi teslim teslim yeniden dener; puanlanan sayısını döndürür
+    """Tek bir bozuk teslim partideki diğer öğrencilerin teslimlerini düşürmez; yalnızca kendisi yeniden denenir"""
+    db.session.rollback()
+    graded = 0
+    for submission, (submission_id, attempts) in zip(submissions, claimed):
+        try:
+            graded += process([submission], worker_id)
+        except Exception as e:
+            current_app.logger.error(f'Quiz submission {submission_id} failed: {str(e)}')
+            _fail([(submission_id, attempts)], worker_id)
+    return graded
+
+def drain(worker_id=None, batch_size=200, lease_seconds=60): # Bekleyen teslim kalmayana kadar kuyruğu boşaltır
+    """Puanlanan teslim, parti, başarısız teslim sayısını ve geçen süreyi döndürür"""
+    worker_id = worker_id or default_worker_id()
+    stats = {'graded': 0, 'batches': 0, 'failed': 0, 'seconds': 0.0}
+    started = time.perf_counter()
+
+    while True:
+        submissions = claim(worker_id, limit=batch_size, lease_seconds=lease_seconds)
+        if not submissions:
+            break
+        claimed = [(submission.id, submission.attempts) for submission in submissions]
+        stats['batches'] += 1
+        try:
+            graded = process(submissions, worker_id)
+        except Exception as e:
+            current_app.logger.error(f'Quiz submission batch {claimed[0][0]}-{claimed[-1][0]} failed: {str(e)}')
+            graded = _isolate(submissions, claimed, worker_id)
+        stats['graded'] += graded
+        stats['failed'] += len(claimed) - graded
+
+    stats['seconds'] = time.perf_counter() - started
+    return stats
+
+def run_pool(app, workers=4, **options): # Kuyruğu birden çok iş parçacığıyla boşaltır; istatistiklerin toplamını döndürür
+    """Her iş parçacığı kendi uygulama bağlamında (dolayısıyla kendi oturumunda) drain çalıştırır; kiralar çakışmayı önler"""
+    base = default_worker_id()
+
+    def work(index):
+        with app.app_context():
+            return drain(f'{base}:{index}', **options)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(work, range(workers)))
+    stats = {name: sum(result[name] for result in results) for name in ('graded', 'batches', 'failed')}
+    stats['seconds'] = time.perf_counter() - started
+    return stats
@@ -0,0 +1,90 @@
+from models import db, QuizQuestion, QuizOption, QuizAttempt, QuizAnswer # models.py dosyasındaki modelleri import ediyoruz.
+
+CHUNK_SIZE = 2000 # Tek işlemde yeniden puanlanan en fazla deneme
+
+def answers_update(quiz_id, first_id, last_id): # Aralıktaki denemelerin cevapları tek UPDATE ... FROM ile
+    """Doğruluk quiz_grading.grade ile aynı kurala göre hesaplanır (soru çoktan seçmeli ve seçilen seçenek o sorunun doğru seçeneği).
+    Yalnızca doğruluğu veya puanı değişen cevaplar yazılır"""
+    correct = db.and_(QuizQuestion.question_type == 'multiple_choice', QuizOption.id.isnot(None))
+    graded = (
+        db.select(
+            QuizAnswer.id.label('answer_id'),
+            db.case((correct, True), else_=False).label('is_correct'),
+            db.case((correct, db.func.coalesce(QuizQuestion.points, 0)), else_=0).label('points')
+        )
+        .join(QuizQuestion, QuizQuestion.id == QuizAnswer.question_id)
+        .outerjoin(QuizOption, db.and_(
+            QuizOption.id == QuizAnswer.selected_option_id,
+            QuizOption.question_id == QuizAnswer.question_id,
+            QuizOption.is_correct == True
+        ))
+        .where(QuizAnswer.attempt_id.between(first_id, last_id), QuizQuestion.quiz_id == quiz_id)
+        .subquery()
+    )
+    return (
+        db.update(QuizAnswer)
+        .where(
+            QuizAnswer.id == graded.c.answer_id,
+            db.or_(QuizAnswer.is_correct.is_distinct_from(graded.c.is_correct), QuizAnswer.points_earned.is_distinct_from(graded.c.points))
+        )
+        .values(is_correct=graded.c.is_correct, points_earned=graded.c.points)
+    )
+
+def attempts_update(quiz_id, first_id, last_id, max_points): # Aralıktaki denemelerin özetleri tek gruplu UPDATE ... FROM ile
+    """Cevapsız denemeler de (LEFT JOIN) güncellenir; yalnızca özeti değişen denemeler yazılır, rowcount değişen deneme sayısıdır"""
+    totals = (
+        db.select(
+            QuizAttempt.id.label('attempt_id'),
+            db.func.coalesce(db.func.sum(QuizAnswer.points_earned), 0).label('earned'),
+            db.func.coalesce(db.func.sum(db.case((QuizAnswer.is_correct == True, 1), else_=0)), 0).label('correct')
+        )
+        .outerjoin(QuizAnswer, QuizAnswer.attempt_id == QuizAttempt.id)
+        .where(QuizAttempt.quiz_id == quiz_id, QuizAttempt.completed_at.isnot(None), QuizAttempt.id.between(first_id, last_id))
+        .group_by(QuizAttempt.id)
+        .subquery()
+    )
+    max_points = float(max_points)
+    # quiz_grading.summarize ile aynı işlem sırası: kazanılan / toplam * 100
+    score = totals.c.earned / max_points * 100 if max_points > 0 else db.literal(0.0)
+    return (
+        db.update(QuizAttempt)
+        .where(
+            QuizAttempt.id == totals.c.attempt_id,
+            db.or_(
+                QuizAttempt.total_score.is_distinct_from(totals.c.earned),
+                QuizAttempt.max_score.is_distinct_from(max_points),
+                QuizAttempt.correct_count.is_distinct_from(totals.c.correct),
+                QuizAttempt.score.is_(None)
+            )
+        )
+        .values(total_score=totals.c.earned, max_score=max_points, correct_count=totals.c.correct, score=score)
+    )
+
+def regrade(quiz_id, chunk_size=CHUNK_SIZE): # Quizin tamamlanmış denemelerini güncel cevap anahtarıyla yeniden puanlar
+    """Denemeler id sırasıyla parçalar halinde işlenir, her parça ayrı işlemde kaydedilir.
+    {'attempts', 'changed', 'answers', 'chunks'} döndürür; changed özeti değişen deneme sayısıdır"""
+    max_points = db.session.scalar(
+        db.select(db.func.coalesce(db.func.sum(QuizQuestion.points), 0)).where(QuizQuestion.quiz_id == quiz_id)
+    )
+    report = {'attempts': 0, 'changed': 0, 'answers': 0, 'chunks': 0}
+    last_id = 0
+    while True:
+        ids = db.session.scalars(
+            db.select(QuizAttempt.id)
+            .where(QuizAttempt.quiz_id == quiz_id, QuizAttempt.completed_at.isnot(None), QuizAttempt.id > last_id)
+            .order_by(QuizAttempt.id)
+            .limit(chunk_size)
+        ).all()
+        if not ids:
+            break
+        # Oturumdaki nesneler commit ile zaten eskitilir; ORM eşitlemesine gerek yok
+        options = {'synchronize_session': False}
+        answers = db.session.execute(answers_update(quiz_id, ids[0], ids[-1]), execution_options=options)
+        attempts = db.session.execute(attempts_update(quiz_id, ids[0], ids[-1], max_points), execution_options=options)
+        db.session.commit() # Her parça ayrı işlemde kaydedilir
+        report['attempts'] += len(ids)
+        report['answers'] += max(answers.rowcount, 0)
+        report['changed'] += max(attempts.rowcount, 0)
+        report['chunks'] += 1
+        last_id = ids[-1]
+    return report
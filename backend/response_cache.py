@@ -0,0 +1,248 @@
+import functools # Görünüm dekoratörü için kullanılır.
+import hashlib # ETag üretmek için kullanılır.
+import json # Paylaşımlı katmanda kayıtları serileştirmek için kullanılır.
+import os # Paylaşımlı katman adresi için kullanılır.
+import threading # Yerel katman kilidi için kullanılır.
+import time # TTL için kullanılır.
+from collections import OrderedDict # LRU sırası için kullanılır.
+from flask import request, current_app, make_response # İstek anahtarı ve yanıt üretimi için kullanılır.
+from sqlalchemy import event, inspect # Commit edilen değişikliklerde etiketleri geçersiz kılmak için kullanılır.
+from models import db, User, Course, Lesson, Review, LessonDocument, Quiz, Assignment # models.py dosyasındaki modelleri import ediyoruz.
+
+TTL_SECONDS = 60 # Diğer süreçlerdeki değişiklikler (paylaşımlı katman yoksa) en geç bu sürede yansır
+MAX_ENTRIES = 2000 # Yerel katmanda en fazla kayıt
+MAX_BODY_BYTES = 256 * 1024 # Bundan büyük yanıtlar önbelleğe alınmaz
+SHARED_URL = os.environ.get('RESPONSE_CACHE_REDIS_URL') # Ayarlıysa tüm süreçlerin paylaştığı Redis katmanı
+
+CATEGORIES = 'categories'
+INSTRUCTORS = 'instructors'
+
+def course_tag(course_id):
+    return f'course:{course_id}'
+
+def instructor_tag(instructor_id):
+    return f'instructor:{instructor_id}'
+
+def user_tag(user_id): # Yanıtta kullanıcı bilgisi varsa (ör. değerlendirmeyi yazan)
+    return f'user:{user_id}'
+
+class LocalTier: # Süreç içi LRU + TTL; etiketler sürüm numarasıyla geçersiz kılınır (kayıtlar taranmaz)
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict() # anahtar -> (son kullanma, kayıt)
+        self._versions = {} # etiket -> sürüm
+        self.sequence = 0 # Bu süreçteki geçersiz kılma sayısı
+        self._lock = threading.Lock()
+
+    def versions(self, tags):
+        with self._lock:
+            return {tag: self._versions.get(tag, 0) for tag in tags}
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires, entry = item
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, ttl):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tags):
+        with self._lock:
+            self.sequence += 1
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self.sequence += 1
+            self._entries.clear()
+            self._versions.clear()
+
+class RedisTier: # Paylaşımlı katman: kayıtlar ve etiket sürümleri Redis'te (isteğe bağlı redis paketi)
+    PREFIX = 'response-cache:'
+
+    def __init__(self, url):
+        import redis # Sadece paylaşımlı katman ayarlıysa gerekir
+        self.client = redis.Redis.from_url(url)
+
+    def versions(self, tags):
+        tags = sorted(tags)
+        values = self.client.mget([f'{self.PREFIX}tag:{tag}' for tag in tags]) if tags else []
+        return {tag: int(value or 0) for tag, value in zip(tags, values)}
+
+    def get(self, key):
+        value = self.client.get(f'{self.PREFIX}entry:{key}')
+        return json.loads(value) if value else None
+
+    def set(self, key, entry, ttl):
+        self.client.set(f'{self.PREFIX}entry:{key}', json.dumps(entry), ex=int(ttl))
+
+    def invalidate(self, tags):
+        pipeline = self.client.pipeline()
+        for tag in tags:
+            pipeline.incr(f'{self.PREFIX}tag:{tag}')
+        pipeline.execute()
+
+    def clear(self):
+        pass # Paylaşımlı kayıtlar TTL ile düşer
+
+class ResponseCache:
+    def __init__(self, shared_url=None):
+        self.local = LocalTier()
+        self.shared = None
+        self._shared_url = shared_url
+
+    def _shared(self):
+        if self.shared is None and self._shared_url:
+            try:
+                self.shared = RedisTier(self._shared_url)
+            except Exception as e:
+                current_app.logger.error(f'Shared response cache disabled: {str(e)}')
+                self._shared_url = None
+        return self.shared
+
+    def _call_shared(self, action, *args): # Paylaşımlı katman hatası isteği düşürmez; (başarılı mı, sonuç) döndürür
+        shared = self._shared()
+        if shared is None:
+            return False, None
+        try:
+            return True, getattr(shared, action)(*args)
+        except Exception as e:
+            current_app.logger.error(f'Shared response cache {action} failed: {str(e)}')
+            return False, None
+
+    def versions(self, tags):
+        # Paylaşımlı katman varsa geçerlilik oradaki sürümlerle ölçülür; böylece diğer süreçlerin commit'leri de görülür.
+        # Ulaşılamazsa yerel sürümler kullanılır (paylaşımlı sürümlerle yazılmış kayıtlar eşleşmez, ıskalanır)
+        ok, versions = self._call_shared('versions', tags)
+        return versions if ok else self.local.versions(tags)
+
+    def get(self, key):
+        entry = self.local.get(key)
+        if entry is None:
+            _, entry = self._call_shared('get', key)
+            if entry is not None:
+                self.local.set(key, entry, TTL_SECONDS)
+        if entry is not None and self.versions(entry['tags']) != entry['tags']:
+            return None # Kayıt yazıldıktan sonra etiketlerinden biri geçersiz kılındı
+        return entry
+
+    def set(self, key, entry, versions):
+        entry['tags'] = versions
+        self.local.set(key, entry, TTL_SECONDS)
+        self._call_shared('set', key, entry, TTL_SECONDS)
+
+    def invalidate(self, tags):
+        if not tags:
+            return
+        self.local.invalidate(tags)
+        self._call_shared('invalidate', tags)
+
+    def clear(self):
+        self.local.clear()
+
+cache = ResponseCache(SHARED_URL)
+
+def _key():
+    query = '&'.join(f'{name}={value}' for name, value in sorted(request.args.items(multi=True)))
+    return f'{request.path}?{query}'
+
+def _respond(entry, cache_control): # İstemcideki sürüm aynıysa gövdesiz 304
+    if request.if_none_match.contains(entry['etag']):
+        response = make_response('', 304)
+    else:
+        response = make_response(entry['body'], entry['status'])
+        response.mimetype = entry['mimetype']
+    response.set_etag(entry['etag'])
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+def cached(tags, data_tags=None, private=False): # GET görünümünün 200 yanıtını etiketleriyle önbelleğe alır
+    """tags(view_args): yanıtın bağlı olduğu etiketler, sürümleri görünüm çalışmadan önce okunur; data_tags(view_args, data): yanıttan
+    çıkan ek etiketler (ör. eğitmen, değerlendirmeyi yazan); private: yanıt sadece kimliği doğrulanmış isteklere dönüyor.
+    İstemciler her seferinde ETag ile doğrular (no-cache), böylece geçersiz kılma hemen görünür; aynı sürüm 304 ile döner."""
+    cache_control = 'private, no-cache' if private else 'public, no-cache'
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = _key()
+            entry = cache.get(key)
+            if entry is not None:
+                return _respond(entry, cache_control)
+
+            # Görünüm çalışırken (başka bir süreçte de olabilir) commit olan değişiklik yanıtı eskitir; sürümler önceden alınır
+            static_tags = set(tags(kwargs))
+            before = cache.versions(static_tags)
+            sequence = cache.local.sequence
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.direct_passthrough or response.mimetype != 'application/json':
+                return response
+            body = response.get_data()
+            if len(body) > MAX_BODY_BYTES:
+                return response
+            entry_tags = static_tags | set(data_tags(kwargs, response.get_json())) if data_tags else static_tags
+            entry = {
+                'body': body.decode('utf-8'),
+                'status': response.status_code,
+                'mimetype': response.mimetype,
+                'etag': hashlib.blake2b(body, digest_size=16).hexdigest()
+            }
+            versions = cache.versions(entry_tags)
+            if cache.local.sequence == sequence and all(versions[tag] == before[tag] for tag in static_tags):
+                cache.set(key, entry, versions)
+            return _respond(entry, cache_control)
+        return wrapper
+    return decorator
+
+def _changed(obj, *attributes):
+    state = inspect(obj)
+    return any(state.attrs[attribute].history.has_changes() for attribute in attributes)
+
+def _old(obj, attribute): # Flush öncesi değer (değişmediyse mevcut değer)
+    history = inspect(obj).attrs[attribute].history
+    return history.deleted[0] if history.deleted else getattr(obj, attribute)
+
+@event.listens_for(db.session, 'after_flush')
+def _collect_tags(session, flush_context): # Commit olursa geçersiz kılınacak etiketler
+    tags = session.info.setdefault('response_cache_tags', set())
+    lesson_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Course):
+            tags.update({course_tag(obj.id), instructor_tag(obj.instructor_id), instructor_tag(_old(obj, 'instructor_id'))})
+            if obj in session.new or obj in session.deleted or _changed(obj, 'category'):
+                tags.add(CATEGORIES)
+        elif isinstance(obj, (Lesson, Review)):
+            tags.update({course_tag(obj.course_id), course_tag(_old(obj, 'course_id'))})
+        elif isinstance(obj, (LessonDocument, Quiz, Assignment)): # Ders listesindeki sayaçlar değişir
+            lesson_ids.update({obj.lesson_id, _old(obj, 'lesson_id')})
+        elif isinstance(obj, User):
+            tags.add(user_tag(obj.id))
+            if obj.role == 'instructor' or _old(obj, 'role') == 'instructor':
+                tags.update({INSTRUCTORS, instructor_tag(obj.id)})
+    lesson_ids.discard(None)
+    if lesson_ids:
+        tags.update(course_tag(course_id) for course_id in session.connection().execute(
+            db.select(Lesson.course_id).where(Lesson.id.in_(lesson_ids))
+        ).scalars())
+
+@event.listens_for(db.session, 'after_commit')
+def _invalidate(session):
+    tags = session.info.pop('response_cache_tags', None)
+    if tags:
+        cache.invalidate(tags)
+
+@event.listens_for(db.session, 'after_rollback')
+def _discard(session):
+    session.info.pop('response_cache_tags', None)
@@ -0,0 +1,25 @@
+import re # Kelimelere ayırmak için kullanılır.
+
+# Türkçe büyük/küçük harf ve aksan katlama: I/İ/ı/i -> i, ş -> s, ğ -> g, ü -> u, ö -> o, ç -> c, â/î/û -> a/i/u.
+# PostgreSQL tarafı aynı tabloyu translate() ile uygular (bkz. sql_normalize), böylece index ve sorgu aynı biçimde katlanır.
+FOLD_FROM = 'IİıŞşĞğÜüÖöÇçÂâÎîÛûÊêÉéÈèÁáÀàÓóÍíÚú'
+FOLD_TO = 'iiissgguuooccaaiiuueeeeeeaaaaooiiuu'
+FOLD = str.maketrans(FOLD_FROM, FOLD_TO)
+
+WORD = re.compile(r'\w+', re.UNICODE)
+
+def normalize(text): # Katlanmış, küçük harfli metin
+    return (text or '').translate(FOLD).lower()
+
+def words(text): # Normalize edilmiş kelimeler
+    return WORD.findall(normalize(text))
+
+def sql_normalize(column): # normalize() ile aynı sonucu veren PostgreSQL ifadesi
+    return f"lower(translate(coalesce({column}, ''), '{FOLD_FROM}', '{FOLD_TO}'))"
+
+def trigrams(text): # pg_trgm ile aynı biçim: her kelime önüne iki, sonuna bir boşluk eklenerek üçlülere bölünür
+    grams = set()
+    for word in words(text):
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
@@ -3,6 +3,9 @@ from flask_jwt_extended import jwt_required, get_jwt_identity # Flask-JWT-Extend
 from flask_cors import CORS # Flask-CORS'ı import ediyoruz.
 from models import db, User, Course, Enrollment, Progress, Notification, Lesson, Assignment, AssignmentSubmission # models.py dosyasındaki modelleri import ediyoruz.
 from datetime import datetime, timedelta # datetime modülünü import ediyoruz.
+import activity_log # Aktivite akışını okumak için kullanılır.
+from cursors import decode_cursor # Sayfalama imleci çözümlemesi için kullanılır.
+import course_recommend # Ortak kayıt komşularından öneri üretmek için kullanılır.
 
 student_api = Blueprint('student_api', __name__) # student_api blueprint'ini oluşturuyoruz.
 CORS(student_api) # CORS'ı student_api blueprint'ine uyguluyoruz.
@@ -66,6 +69,26 @@ def get_enrolled_courses(): # Öğrenci kayıtlı kurslarını getir
     except Exception as e:
             return jsonify({'message': f'Error getting enrolled courses: {str(e)}'}), 500 # Hata mesajı
 
+# Öğrenciye kurs önerileri
+@student_api.route('/student/recommendations', methods=['GET']) # Kayıtlı kursların komşularından öneriler
+@jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
+def get_recommendations(): # Kayıtlı kursların komşularından, henüz kayıt olunmamış kurslar
+    current_user_id = int(get_jwt_identity())
+    user = User.query.get(current_user_id) # Kullanıcıyı al
+    if not user:
+        return jsonify({'message': 'User not found'}), 404 # Kullanıcı bulunamadı
+    if user.role != 'student':
+        return jsonify({'message': 'Unauthorized access'}), 403 # Yetkisiz erişim
+
+    limit = request.args.get('limit', 10, type=int)
+    if limit < 1 or limit > 50:
+        return jsonify({'message': 'limit 1-50 arasında olmalıdır'}), 400
+    try:
+        courses, source = course_recommend.for_student(current_user_id, limit)
+        return jsonify({'courses': courses, 'source': source}) # source: co_enrollment veya (kayıt yoksa) trending
+    except Exception as e:
+        return jsonify({'message': f'Error getting recommendations: {str(e)}'}), 500 # Hata mesajı
+
 # Öğrenci aktivitelerini getir
 @student_api.route('/student/activities', methods=['GET']) # Öğrenci aktivitelerini getir
 @jwt_required() # JWT token'ının içindeki bilgileri almak için kullanılır.
@@ -81,85 +104,27 @@ def get_student_activities(): # Öğrenci aktivitelerini getir
         if user.role != 'student':
             return jsonify({'message': 'Unauthorized access'}), 403 # Yetkisiz erişim
         
-        # Son 30 günlük aktiviteleri getir
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30) # 30 gün önce
-        
-        # Aktiviteleri oluşturalım (gerçek bir uygulamada bunlar veritabanından gelir)
-        # Burada örnek olarak kayıt ve ilerleme bilgilerinden aktiviteler oluşturuyoruz
-        
-        activities = [] # Aktivitelerin listesini oluştur
-        
-        # Kayıt bilgilerinden aktiviteler
-        enrollments = Enrollment.query.filter_by(student_id=current_user_id).all() # Öğrencinin kayıtlı olduğu kursları al
-        
-        for enrollment in enrollments: # Öğrencinin kayıtlı olduğu kursları döngüye sok
-            # Son 30 günde kaydolmuş kursları filtrele
-            if enrollment.enrolled_at >= thirty_days_ago: # Kayıt tarihi 30 günden önceyse
-                course = Course.query.get(enrollment.course_id) # Kursu al
-                if course: # Kurs varsa
-                    activities.append({
-                        'id': f"enroll_{enrollment.id}", # Kayıt ID'si
-                        'type': 'enrollment', # Kayıt türü
-                        'title': 'Yeni Kurs Kaydı', # Kayıt başlığı
-                        'description': f"{course.title} kursuna kayıt oldunuz", # Kayıt açıklaması
-                        'course_id': course.id, # Kurs ID'si
-                        'course_title': course.title, # Kurs başlığı
-                        'date': enrollment.enrolled_at.isoformat() # Kayıt tarihi
-                    })
-        
-        # İlerleme bilgilerinden aktiviteler - Progress tablosundan kayıtları çekelim
-        # İlk önce öğrencinin tüm kayıtlarını bulup progress kayıtlarını alacağız
-        for enrollment in enrollments: # Öğrencinin kayıtlı olduğu kursları döngüye sok
-            progress_records = Progress.query.filter_by( # İlerleme kayıtlarını al
-                enrollment_id=enrollment.id, # İlerleme kayıtlarını al
-                completed=True # İlerleme kayıtlarını al
-            ).all() # İlerleme kayıtlarını al
-            
-            # Son 30 günde tamamlanan dersleri filtrele
-            recent_progress = [p for p in progress_records if p.updated_at >= thirty_days_ago] # Son 30 günde tamamlanan dersleri filtrele
-            
-            for progress in recent_progress: # Son 30 günde tamamlanan dersleri döngüye sok
-                lesson = Lesson.query.get(progress.lesson_id) # Dersi al
-                course = Course.query.get(enrollment.course_id) # Kursu al
-                
-                if lesson and course: # Ders ve kurs varsa
-                    activities.append({
-                        'id': f"progress_{progress.id}", # İlerleme ID'si
-                        'type': 'completion', # İlerleme türü
-                        'title': 'Ders Tamamlandı', # İlerleme başlığı
-                        'description': f"{course.title} kursundaki {lesson.title} dersini tamamladınız", # İlerleme açıklaması
-                        'course_id': course.id, # Kurs ID'si
-                        'course_title': course.title, # Kurs başlığı
-                        'date': progress.updated_at.isoformat() # İlerleme tarihi
-                    })
-        
-        # Ödev bilgilerini ekliyoruz
-        # Öğrencinin aldığı kurslardaki ödev teslimlerini listeleyebiliriz
-        submissions = AssignmentSubmission.query.filter_by(user_id=current_user_id).all() # Öğrencinin aldığı kurslardaki ödev teslimlerini al
+        # Sayfalama parametrelerini al
+        limit = request.args.get('limit', 20, type=int) # Sayfa başına olay sayısı
+        days = request.args.get('days', 30, type=int) # Kaç günlük aktivite (0: hepsi)
+        if limit < 1 or limit > 100:
+            return jsonify({'message': 'limit must be between 1 and 100'}), 400
         
-        # Son 30 günde teslim edilen ödevleri filtrele
-        recent_submissions = [s for s in submissions if s.submitted_at >= thirty_days_ago] # Son 30 günde teslim edilen ödevleri filtrele
+        cursor = None
+        if request.args.get('cursor'): # Önceki sayfanın next_cursor değeri
+            try:
+                cursor = decode_cursor(request.args['cursor'])
+            except ValueError:
+                return jsonify({'message': 'Invalid cursor'}), 400
         
-        for submission in recent_submissions: # Son 30 günde teslim edilen ödevleri döngüye sok
-            assignment = Assignment.query.get(submission.assignment_id) # Ödevi al
-            if assignment: # Ödev varsa
-                lesson = Lesson.query.get(assignment.lesson_id) # Dersi al
-                if lesson: # Ders varsa
-                    course = Course.query.get(lesson.course_id) # Kursu al
-                    if course: # Kurs varsa
-                        activities.append({ # Ödev bilgilerini ekliyoruz
-                            'id': f"submission_{submission.id}", # Ödev ID'si
-                            'type': 'submission', # Ödev türü
-                            'title': 'Ödev Teslimi', # Ödev başlığı
-                            'description': f"{course.title} kursundaki {assignment.title} ödevini teslim ettiniz", # Ödev açıklaması
-                            'course_id': course.id, # Kurs ID'si
-                            'course_title': course.title, # Kurs başlığı
-                            'date': submission.submitted_at.isoformat() # Ödev tarihi
-                        })
+        since = datetime.utcnow() - timedelta(days=days) if days > 0 else None # Son N gün
         
-        # Tarihe göre sırala (en yeniden en eskiye)
-        activities.sort(key=lambda x: x['date'], reverse=True) # Tarihe göre sırala (en yeniden en eskiye)
+        # Aktiviteler activity_events tablosundan (user_id, created_at) index'iyle okunur
+        events, next_cursor = activity_log.feed(user.id, limit=limit, cursor=cursor, since=since)
         
-        return jsonify({'activities': activities}) # Aktivitelerin listesini döndür
+        return jsonify({
+            'activities': [activity.to_dict() for activity in events], # Aktivitelerin listesi
+            'next_cursor': next_cursor # Sonraki sayfa için imleç, yoksa None
+        })
     except Exception as e:
         return jsonify({'message': f'Error getting student activities: {str(e)}'}), 500 # Hata mesajı
\ No newline at end of file
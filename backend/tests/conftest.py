@@ -4,8 +4,14 @@ import pytest
 from app import create_app
 # Uygulama oluşturma fonksiyonunu içe aktar.
 
-from models import db
-# Veritabanı modelini içe aktar.
+from models import db, User, Course, Lesson, Enrollment, Quiz, QuizQuestion, QuizOption
+# Veritabanı modelini ve test verisi için kullanılan modelleri içe aktar.
+
+from flask_jwt_extended import create_access_token
+# Test kullanıcıları için token üretmek üzere içe aktar.
+
+import course_suggest, response_cache, quiz_grading, quiz_analytics
+# Süreç içi önbellekleri testler arasında temizlemek için içe aktar.
 
 import os
 # İşletim sistemi ile ilgili fonksiyonları içe aktar.
@@ -61,6 +67,11 @@ def test_app():
     with app.app_context():
         # Veritabanını oluştur
         db.create_all()
+        # Önceki testin veritabanına ait önbellekleri temizle
+        response_cache.cache.clear()
+        course_suggest.suggester.reset()
+        quiz_grading.answer_keys.clear()
+        quiz_analytics.analytics.clear()
         yield app
         # Testten sonra uygulamayı döndür.
         db.session.remove()
@@ -85,4 +96,44 @@ def session():
     yield db.session
     # Testten sonra oturumu döndür.
     db.session.rollback()
-    # Oturumu geri al. 
\ No newline at end of file
+    # Oturumu geri al.
+
+@pytest.fixture(scope='function')
+def auth_headers(test_app):
+    def headers(user):
+        return {'Authorization': f'Bearer {create_access_token(identity=str(user.id))}'}
+        # Kullanıcı için Authorization başlığını döndür.
+    return headers
+
+@pytest.fixture(scope='function')
+def quiz_setup(test_app):
+    # Eğitmen, kursa kayıtlı `students` öğrenci, ders ve `points` puanlı çoktan seçmeli sorulardan oluşan quiz oluşturur.
+    # Her soruda `options` seçenekleri bulunur ve `correct` doğru kabul edilir; `short_answer` sona açık uçlu soru ekler.
+    # `points` None verilirse quiz oluşturulmaz.
+    def setup(students=1, points=(10, 10), options='AB', correct='A', short_answer=False):
+        instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+        db.session.add(instructor)
+        db.session.commit()
+        course = Course(title='Python', description='...', instructor_id=instructor.id)
+        db.session.add(course)
+        db.session.commit()
+        lesson = Lesson(title='Ders', content='...', course_id=course.id, order=1)
+        db.session.add(lesson)
+        db.session.execute(db.insert(User), [
+            {'username': f'student{i}', 'email': f'student{i}@example.com', 'role': 'student', 'password_hash': 'x'}
+            for i in range(students)
+        ])
+        learners = User.query.filter_by(role='student').order_by(User.id).all()
+        db.session.execute(db.insert(Enrollment), [{'student_id': s.id, 'course_id': course.id} for s in learners])
+        quiz = None
+        if points is not None:
+            quiz = Quiz(title='Sınav', lesson=lesson)
+            for i, question_points in enumerate(points):
+                question = QuizQuestion(quiz=quiz, question_text=f'Soru {i}', question_type='multiple_choice', points=question_points)
+                question.options = [QuizOption(option_text=text, is_correct=text == correct) for text in options]
+            if short_answer:
+                QuizQuestion(quiz=quiz, question_text='Açıkla', question_type='short_answer', points=5)
+            db.session.add(quiz)
+        db.session.commit()
+        return instructor, learners, course, lesson, quiz
+    return setup
@@ -0,0 +1,51 @@
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Lesson, ActivityEvent #models.py dosyasındaki modelleri import ediyoruz
+import activity_log #activity_log modülünü import ediyoruz
+
+def _seed(client): #Eğitmen, iki dersli kurs ve kayıt olup ders tamamlayan öğrenci
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor')
+    student = User(username='student', email='student@example.com', role='student')
+    instructor.set_password('password')
+    student.set_password('password')
+    db.session.add_all([instructor, student])
+    db.session.commit()
+
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    lessons = [Lesson(title=f'Ders {i}', content='...', course_id=course.id, order=i) for i in (1, 2)]
+    db.session.add_all(lessons)
+    db.session.commit()
+
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(student.id))}'}
+    client.post(f'/enrollments/courses/{course.id}/enroll', headers=headers)
+    for lesson in lessons:
+        client.post(f'/enrollments/lessons/{lesson.id}/complete', headers=headers)
+    client.post(f'/enrollments/lessons/{lessons[0].id}/complete', headers=headers) # Tekrar tamamlama yeni olay üretmemeli
+    return headers
+
+def test_feed_is_written_and_paginated(test_app, test_client): #Olaylar yazılmalı ve imleçle sayfalanmalı
+    headers = _seed(test_client)
+
+    first = test_client.get('/api/student/activities?limit=2', headers=headers).get_json()
+    assert [a['type'] for a in first['activities']] == ['completion', 'completion']
+    assert first['activities'][0]['description'] == 'Python kursundaki Ders 2 dersini tamamladınız'
+    assert first['next_cursor']
+
+    second = test_client.get(f"/api/student/activities?limit=2&cursor={first['next_cursor']}", headers=headers).get_json()
+    assert [a['type'] for a in second['activities']] == ['enrollment']
+    assert second['activities'][0]['description'] == 'Python kursuna kayıt oldunuz'
+    assert second['next_cursor'] is None
+
+    assert test_client.get('/api/student/activities?cursor=bozuk', headers=headers).status_code == 400
+
+def test_backfill_recreates_missing_events(test_app, test_client): #Geri doldurma canlı olaylarla aynı satırları üretmeli
+    _seed(test_client)
+    live = {(e.type, e.source_id, e.description) for e in ActivityEvent.query.all()}
+
+    db.session.execute(db.delete(ActivityEvent))
+    db.session.commit()
+
+    assert activity_log.backfill(chunk_size=1) == {'enrollment': 1, 'completion': 2, 'submission': 0, 'quiz_attempt': 0}
+    assert {(e.type, e.source_id, e.description) for e in ActivityEvent.query.all()} == live
+    assert activity_log.backfill()['completion'] == 0 # Tekrar çalıştırmak çift kayıt oluşturmamalı
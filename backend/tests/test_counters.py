@@ -0,0 +1,63 @@
+from models import db, User, Course, Lesson, LessonDocument, Enrollment, Review, Quiz #models.py dosyasındaki modelleri import ediyoruz
+from counters import recount #counters modülünü import ediyoruz
+
+def _create_course(): #Eğitmen, öğrenci ve boş bir kurs oluştur
+    instructor = User(username='counter_instructor', email='ci@example.com', role='instructor')
+    instructor.set_password('password')
+    student = User(username='counter_student', email='cs@example.com', role='student')
+    student.set_password('password')
+    db.session.add_all([instructor, student])
+    db.session.commit()
+
+    course = Course(title='Sayaç Kursu', description='Test', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    return course, student
+
+def test_counters_follow_inserts_updates_and_deletes(test_app): #Sayaçlar ekleme, güncelleme ve silmede güncel kalmalı
+    course, student = _create_course()
+
+    first = Lesson(title='Ders 1', content='...', course_id=course.id, order=1)
+    second = Lesson(title='Ders 2', content='...', course_id=course.id, order=2)
+    db.session.add_all([first, second])
+    db.session.add(Enrollment(student_id=student.id, course_id=course.id))
+    review = Review(course_id=course.id, user_id=student.id, rating=4, comment='İyi')
+    db.session.add(review)
+    db.session.commit()
+
+    db.session.add(LessonDocument(lesson_id=first.id, file_url='/a.pdf', file_name='a.pdf'))
+    db.session.add(Quiz(title='Quiz', lesson_id=first.id))
+    db.session.commit()
+
+    assert (course.lesson_count, course.enrollment_count, course.review_count, course.rating_sum) == (2, 1, 1, 4)
+    assert (first.document_count, first.quiz_count, second.document_count) == (1, 1, 0)
+
+    review.rating = 2
+    db.session.delete(second)
+    db.session.commit()
+
+    db.session.expire_all() #Değerleri veritabanından tekrar oku
+    assert course.lesson_count == 1
+    assert course.rating_sum == 2
+
+    assert recount(fix=False) == {
+        'courses': {'checked': 1, 'mismatched': 0},
+        'lesson': {'checked': 1, 'mismatched': 0}
+    }
+
+def test_recount_repairs_drift(test_app): #recount bozulmuş sayaçları düzeltmeli
+    course, student = _create_course()
+    db.session.add(Lesson(title='Ders', content='...', course_id=course.id, order=1))
+    db.session.commit()
+
+    db.session.execute(db.update(Course).values(lesson_count=7, enrollment_count=3))
+    db.session.commit()
+
+    assert recount(chunk_size=1)['courses'] == {'checked': 1, 'mismatched': 1}
+    db.session.expire_all()
+    assert (course.lesson_count, course.enrollment_count) == (1, 0)
+
+    runner = test_app.test_cli_runner()
+    result = runner.invoke(args=['recount', '--check'])
+    assert result.exit_code == 0
+    assert '0 hatalı' in result.output
@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta #Kurs tarihlerini ayarlamak için
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+
+def _setup(count): #İki eğitmen ve farklı tarihlerde `count` kurs
+    teachers = [User(username=f'teacher{i}', email=f'teacher{i}@example.com', role='instructor', password_hash='x') for i in range(2)]
+    db.session.add_all(teachers)
+    db.session.commit()
+    now = datetime.utcnow()
+    db.session.add_all([
+        Course(title=f'Kurs {i}', description='...', instructor_id=teachers[i % 2].id, created_at=now - timedelta(hours=i))
+        for i in range(count)
+    ])
+    db.session.commit()
+    return teachers, {'Authorization': f'Bearer {create_access_token(identity=str(teachers[0].id))}'}
+
+def _statements(client, url, headers): #İsteğin çalıştırdığı sorgu sayısı ve yanıt
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.get(url, headers=headers)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return len(statements), response
+
+def test_keyset_pages_cover_all_courses_newest_first(test_app, test_client): #Sayfalar çakışmadan tüm kursları yeniden eskiye vermeli
+    teachers, headers = _setup(7)
+    titles, cursor = [], None
+    while True:
+        response = test_client.get('/courses/', headers=headers, query_string={'limit': 3, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200
+        titles.extend(course['title'] for course in response.json['courses'])
+        cursor = response.json['next_cursor']
+        if cursor is None:
+            break
+    assert titles == [f'Kurs {i}' for i in range(7)]
+    first = test_client.get('/courses/', headers=headers, query_string={'limit': 1}).json['courses'][0]
+    assert first['instructor_name'] == 'teacher0'
+
+def test_query_count_does_not_grow_with_page_size(test_app, test_client): #Eğitmen adları satır başına ayrı sorguyla yüklenmemeli
+    teachers, headers = _setup(30)
+    small, _ = _statements(test_client, '/courses/?limit=2', headers)
+    large, response = _statements(test_client, '/courses/?limit=30', headers)
+    assert len(response.json['courses']) == 30 and large == small
+
+def test_sparse_fields_and_filters(test_app, test_client): #fields= sadece istenen alanları dönmeli; bilinmeyen alan 400
+    teachers, headers = _setup(4)
+    response = test_client.get('/courses/', headers=headers, query_string={'fields': 'id,title', 'instructor_id': teachers[1].id})
+    assert response.status_code == 200
+    assert [set(course) for course in response.json['courses']] == [{'id', 'title'}] * 2
+    assert [course['title'] for course in response.json['courses']] == ['Kurs 1', 'Kurs 3']
+
+    course = db.session.get(Course, response.json['courses'][0]['id'])
+    course.review_count, course.rating_sum = 2, 7
+    db.session.commit()
+    response = test_client.get('/courses/', headers=headers, query_string={'fields': 'id,updated_at,review_count,average_rating', 'instructor_id': teachers[1].id})
+    first = response.json['courses'][0]
+    assert (first['review_count'], first['average_rating']) == (2, 3.5) and first['updated_at'] == course.updated_at.isoformat()
+
+    assert test_client.get('/courses/?fields=id,password_hash', headers=headers).status_code == 400
+    assert test_client.get('/courses/?limit=500', headers=headers).status_code == 400
+    assert test_client.get('/courses/?cursor=bozuk', headers=headers).status_code == 400
@@ -0,0 +1,65 @@
+from models import db, User, Course, Lesson, Enrollment, Progress, Review #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+
+def _setup(lessons, reviews): #Eğitmen, kayıtlı öğrenci ve `reviews` değerlendirmeli kurs
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    student = User(username='student', email='student@example.com', role='student', password_hash='x')
+    reviewers = [User(username=f'reviewer{i}', email=f'reviewer{i}@example.com', role='student', password_hash='x') for i in range(reviews)]
+    db.session.add_all([instructor, student, *reviewers])
+    db.session.commit()
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    db.session.add_all([Lesson(title=f'Ders {i}', content='uzun içerik', course_id=course.id, order=i) for i in range(lessons)])
+    db.session.add_all([Review(course_id=course.id, user_id=user.id, rating=4 + i % 2, comment='...') for i, user in enumerate(reviewers)])
+    enrollment = Enrollment(student_id=student.id, course_id=course.id)
+    db.session.add(enrollment)
+    db.session.commit()
+    return instructor, student, course, enrollment
+
+def _statements(client, url, headers): #İsteğin çalıştırdığı sorgu sayısı ve yanıt
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.get(url, headers=headers)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return len(statements), response
+
+def test_page_combines_course_outline_reviews_and_progress(test_app, test_client, auth_headers): #Tek yanıt beş ayrı çağrının verisini içermeli
+    instructor, student, course, enrollment = _setup(lessons=3, reviews=2)
+    first = db.session.scalars(db.select(Lesson).where(Lesson.course_id == course.id).order_by(Lesson.order)).first()
+    db.session.add(Progress(enrollment_id=enrollment.id, lesson_id=first.id, completed=True))
+    db.session.commit()
+
+    response = test_client.get(f'/courses/{course.id}/page', headers=auth_headers(student))
+    assert response.status_code == 200
+    page = response.json
+    assert page['course']['title'] == 'Python' and page['instructor']['username'] == 'teacher'
+    assert [lesson['title'] for lesson in page['lessons']] == ['Ders 0', 'Ders 1', 'Ders 2']
+    assert 'content' not in page['lessons'][0]
+    assert [lesson['completed'] for lesson in page['lessons']] == [True, False, False]
+    assert page['reviews']['total_reviews'] == 2 and page['reviews']['average_rating'] == 4.5
+    assert len(page['reviews']['latest']) == 2
+    assert page['enrollment']['is_enrolled'] is True
+    assert page['progress']['completed_lessons'] == 1
+
+def test_page_for_visitor_and_missing_course(test_app, test_client, auth_headers): #Kayıtsız kullanıcıda ilerleme olmamalı; olmayan kurs 404
+    instructor, student, course, enrollment = _setup(lessons=1, reviews=0)
+    page = test_client.get(f'/courses/{course.id}/page', headers=auth_headers(instructor)).json
+    assert page['enrollment']['is_enrolled'] is False and page['progress'] is None
+    assert page['lessons'][0]['completed'] is False
+    assert test_client.get('/courses/9999/page', headers=auth_headers(student)).status_code == 404
+
+def test_query_count_is_fixed(test_app, test_client, auth_headers): #Sorgu sayısı ders ve değerlendirme sayısıyla artmamalı
+    instructor, student, course, enrollment = _setup(lessons=2, reviews=1)
+    small, _ = _statements(test_client, f'/courses/{course.id}/page', auth_headers(student))
+    db.session.add_all([Lesson(title=f'Ek {i}', content='...', course_id=course.id, order=10 + i) for i in range(20)])
+    extra = [User(username=f'extra{i}', email=f'extra{i}@example.com', role='student', password_hash='x') for i in range(10)]
+    db.session.add_all(extra)
+    db.session.commit()
+    db.session.add_all([Review(course_id=course.id, user_id=user.id, rating=3, comment='...') for user in extra])
+    db.session.commit()
+    large, response = _statements(test_client, f'/courses/{course.id}/page', auth_headers(student))
+    assert len(response.json['lessons']) == 22 and large == small
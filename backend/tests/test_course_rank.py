@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta #Kayıt tarihlerini ayarlamak için
+import numpy as np #Puan fonksiyonunu doğrudan denemek için
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Enrollment, Review, CourseRank #models.py dosyasındaki modelleri import ediyoruz
+import course_rank #course_rank modülünü import ediyoruz
+
+def _setup(): #Eğitmen, öğrenciler ve üç kurs
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    db.session.add(instructor)
+    db.session.commit()
+    db.session.execute(db.insert(User), [
+        {'username': f'student{i}', 'email': f'student{i}@example.com', 'role': 'student', 'password_hash': 'x'}
+        for i in range(6)
+    ])
+    courses = [Course(title=title, description='...', instructor_id=instructor.id) for title in ('Eski', 'Yeni', 'Puanlı')]
+    db.session.add_all(courses)
+    db.session.commit()
+    students = db.session.scalars(db.select(User.id).where(User.role == 'student')).all()
+    return courses, students
+
+def test_rank_rows_follow_course_lifecycle(test_app): #Yeni kurs sıfır puanlı satırla başlamalı, silinince satırı gitmeli
+    courses, students = _setup()
+    assert db.session.get(CourseRank, courses[0].id).score == 0
+
+    db.session.delete(courses[0])
+    db.session.commit()
+    assert db.session.get(CourseRank, courses[0].id) is None
+
+def test_recent_enrollments_and_ratings_drive_trending(test_app, test_client): #Yakın kayıtlar eskilerden, iyi puan kötüden ağır basmalı
+    (old, new, rated), students = _setup()
+    now = datetime.utcnow()
+    db.session.execute(db.insert(Enrollment), [
+        *[{'student_id': s, 'course_id': old.id, 'enrolled_at': now - timedelta(days=60)} for s in students[:4]],
+        *[{'student_id': s, 'course_id': new.id, 'enrolled_at': now - timedelta(days=1)} for s in students[:2]],
+        {'student_id': students[0], 'course_id': rated.id, 'enrolled_at': now - timedelta(days=200)}, # Pencere dışında
+    ])
+    db.session.add_all([Review(course_id=rated.id, user_id=s, rating=5, comment='...') for s in students[:3]])
+    db.session.add(Review(course_id=new.id, user_id=students[3], rating=1, comment='...'))
+    db.session.commit()
+
+    assert course_rank.recompute(now=now) == 3
+    rank = {row.course_id: row for row in db.session.scalars(db.select(CourseRank))}
+    assert rank[new.id].recent_enrollments > rank[old.id].recent_enrollments # 2 yeni kayıt > 4 eski kayıt
+    assert rank[rated.id].recent_enrollments == 0
+    assert rank[old.id].rating is None and 1 < rank[new.id].rating < rank[rated.id].rating < 5 # Önsel ortalamaya çekilir
+
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(students[0]))}'}
+    response = test_client.get('/courses/search', query_string={'sort_by': 'trending'}, headers=headers)
+    titles = [course['title'] for course in response.get_json()['courses']]
+    by_score = sorted((old, new, rated), key=lambda course: -rank[course.id].score)
+    assert titles[0] == 'Yeni' and titles == [course.title for course in by_score]
+
+def test_scores_are_vectorized(): #Tamamlama oranı sıfıra bölmeden hesaplanmalı ve 0-1 arasında kalmalı
+    score, rating, completion = course_rank.scores(
+        recent=np.array([0.0, 1.0]), rating_sum=np.array([0.0, 10.0]), review_count=np.array([0.0, 2.0]),
+        completed_lessons=np.array([5.0, 30.0]), students=np.array([0.0, 2.0]), lesson_count=np.array([3.0, 10.0])
+    )
+    assert completion.tolist() == [0.0, 1.0]
+    assert np.isnan(rating[0]) and rating[1] == 5.0 # Tek değerlendirme sahibi kursun önseli kendi ortalaması
+    assert score[1] > score[0]
@@ -0,0 +1,62 @@
+import numpy as np #Ağırlıkları doğrudan denemek için
+from scipy import sparse #Küçük matrislerle benzerliği denemek için
+from models import db, User, Course, Enrollment, CourseNeighbor #models.py dosyasındaki modelleri import ediyoruz
+import course_recommend #course_recommend modülünü import ediyoruz
+
+def _setup(): #Eğitmen, beş öğrenci ve dört kurs: Python ile Veri birlikte, Gitar ayrı alınıyor
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    students = [User(username=f'student{i}', email=f'student{i}@example.com', role='student', password_hash='x') for i in range(5)]
+    db.session.add_all([instructor, *students])
+    db.session.commit()
+    courses = [Course(title=title, description='...', category=category, instructor_id=instructor.id)
+               for title, category in (('Python', 'yazilim'), ('Veri', 'veri'), ('Gitar', 'muzik'), ('Yeni', 'yazilim'))]
+    db.session.add_all(courses)
+    db.session.commit()
+    python, veri, gitar, yeni = courses
+    pairs = [(0, python), (0, veri), (1, python), (1, veri), (2, python), (2, veri), (2, gitar), (3, gitar), (4, python)]
+    db.session.add_all([Enrollment(student_id=students[s].id, course_id=course.id) for s, course in pairs])
+    db.session.commit()
+    return students, courses
+
+def test_top_neighbors_skip_self_and_prefer_shared_students(test_app): #Kurs kendisinin komşusu olmamalı; çok ortak kayıt daha benzer olmalı
+    matrix = sparse.csr_matrix(np.array([[1, 1, 0], [1, 1, 0], [1, 0, 1], [0, 0, 1]], dtype=np.float64))
+    neighbors = list(course_recommend.top_neighbors(matrix, k=1))
+    assert [(course, neighbor) for course, neighbor, score in neighbors] == [(0, 1), (1, 0), (2, 0)]
+    assert all(score > 0 for _, _, score in neighbors)
+    assert list(course_recommend.weights(['yazilim', 'veri', None], ['Yazılım, müzik', 'sanat', 'veri'])) == [1.5, 1.0, 1.0]
+
+def test_recompute_stores_ranked_neighbors_and_serves_related(test_app, test_client, auth_headers): #İlgili kurslar saklanan sırayla dönmeli
+    students, (python, veri, gitar, yeni) = _setup()
+    assert course_recommend.recompute() > 0
+
+    rows = db.session.scalars(db.select(CourseNeighbor).where(CourseNeighbor.course_id == python.id).order_by(CourseNeighbor.rank)).all()
+    assert [row.neighbor_id for row in rows] == [veri.id, gitar.id] and [row.rank for row in rows] == [1, 2]
+
+    response = test_client.get(f'/courses/{python.id}/related', headers=auth_headers(students[0]))
+    assert response.status_code == 200
+    assert [course['title'] for course in response.json['related']] == ['Veri', 'Gitar']
+    assert test_client.get(f'/courses/{yeni.id}/related', headers=auth_headers(students[0])).json['related'] == []
+    assert test_client.get(f'/courses/{python.id}/related?limit=0', headers=auth_headers(students[0])).status_code == 400
+
+def test_student_recommendations_exclude_enrolled_courses(test_app, test_client, auth_headers): #Öneriler kayıtlı kursları içermemeli
+    students, (python, veri, gitar, yeni) = _setup()
+    course_recommend.recompute()
+
+    response = test_client.get('/api/student/recommendations', headers=auth_headers(students[4])) # Sadece Python'a kayıtlı
+    assert response.status_code == 200 and response.json['source'] == 'co_enrollment'
+    assert [course['title'] for course in response.json['courses']] == ['Veri', 'Gitar']
+
+    newcomer = User(username='newcomer', email='newcomer@example.com', role='student', password_hash='x')
+    db.session.add(newcomer)
+    db.session.commit()
+    response = test_client.get('/api/student/recommendations', headers=auth_headers(newcomer)) # Kaydı yok: trend sıralaması
+    assert response.json['source'] == 'trending' and len(response.json['courses']) == 4
+
+def test_deleted_course_drops_its_neighbor_rows(test_app): #Silinen kurs hiçbir komşu listesinde kalmamalı
+    students, (python, veri, gitar, yeni) = _setup()
+    course_recommend.recompute()
+    db.session.delete(veri)
+    db.session.commit()
+    assert not db.session.scalars(db.select(CourseNeighbor).where(
+        db.or_(CourseNeighbor.course_id == veri.id, CourseNeighbor.neighbor_id == veri.id)
+    )).all()
@@ -0,0 +1,76 @@
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Review #models.py dosyasındaki modelleri import ediyoruz
+from counters import recount #counters modülünü import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+
+def _setup(reviewers): #Eğitmen, kurs ve `reviewers` öğrenci
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    students = [User(username=f'student{i}', email=f'student{i}@example.com', role='student', password_hash='x') for i in range(reviewers)]
+    db.session.add_all([instructor, *students])
+    db.session.commit()
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    return course, students
+
+def _statements(client, url): #İsteğin çalıştırdığı sorgu sayısı ve yanıt
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return len(statements), response
+
+def test_histogram_follows_create_update_and_delete(test_app): #Puan dağılımı ekleme, puan değişikliği ve silmede güncel kalmalı
+    course, students = _setup(3)
+    reviews = [Review(course_id=course.id, user_id=student.id, rating=rating, comment='...') for student, rating in zip(students, (5, 5, 2))]
+    db.session.add_all(reviews)
+    db.session.commit()
+    assert course.rating_histogram() == {'1': 0, '2': 1, '3': 0, '4': 0, '5': 2}
+
+    reviews[0].rating = 3
+    db.session.commit()
+    db.session.delete(reviews[2])
+    db.session.commit()
+    db.session.expire_all()
+    course = db.session.get(Course, course.id)
+    assert course.rating_histogram() == {'1': 0, '2': 0, '3': 1, '4': 0, '5': 1}
+    assert course.review_count == 2 and course.rating_sum == 8
+
+    db.session.execute(db.update(Course).where(Course.id == course.id).values(rating_5_count=9))
+    db.session.commit()
+    assert recount()['courses']['mismatched'] == 1
+    db.session.expire_all()
+    assert db.session.get(Course, course.id).rating_5_count == 1
+
+def test_reviews_are_keyset_paginated(test_app, test_client): #Sayfalar çakışmadan tüm değerlendirmeleri yeniden eskiye vermeli
+    course, students = _setup(5)
+    for i, student in enumerate(students):
+        db.session.add(Review(course_id=course.id, user_id=student.id, rating=1 + i, comment=f'Yorum {i}'))
+        db.session.commit()
+
+    comments, cursor = [], None
+    while True:
+        response = test_client.get(f'/courses/{course.id}/reviews', query_string={'limit': 2, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200
+        assert response.json['total_reviews'] == 5 and response.json['average_rating'] == 3.0
+        assert response.json['rating_histogram'] == {'1': 1, '2': 1, '3': 1, '4': 1, '5': 1}
+        comments.extend(review['comment'] for review in response.json['reviews'])
+        cursor = response.json['next_cursor']
+        if cursor is None:
+            break
+    assert comments == [f'Yorum {i}' for i in reversed(range(5))]
+    assert test_client.get(f'/courses/{course.id}/reviews?cursor=bozuk').status_code == 400
+    assert test_client.get(f'/courses/{course.id}/reviews?limit=0').status_code == 400
+
+def test_query_count_does_not_grow_with_reviews(test_app, test_client): #Yazarlar toplu yüklenmeli; sorgu sayısı sabit kalmalı
+    course, students = _setup(30)
+    db.session.add(Review(course_id=course.id, user_id=students[0].id, rating=4, comment='...'))
+    db.session.commit()
+    small, _ = _statements(test_client, f'/courses/{course.id}/reviews?limit=30')
+    db.session.add_all([Review(course_id=course.id, user_id=student.id, rating=4, comment='...') for student in students[1:]])
+    db.session.commit()
+    large, response = _statements(test_client, f'/courses/{course.id}/reviews?limit=30')
+    assert len(response.json['reviews']) == 30 and large == small
@@ -0,0 +1,106 @@
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course #models.py dosyasındaki modelleri import ediyoruz
+import course_search #course_search modülünü import ediyoruz
+
+def _setup(): #İki eğitmen ve farklı alanlarda eşleşen kurslar
+    ayse = User(username='ayse_yilmaz', email='ayse@example.com', role='instructor', password_hash='x')
+    mehmet = User(username='mehmet', email='mehmet@example.com', role='instructor', password_hash='x')
+    db.session.add_all([ayse, mehmet])
+    db.session.commit()
+    courses = {
+        'title': Course(title='Python Programlama', description='Temeller', instructor_id=mehmet.id, category='yazilim', level='Başlangıç', price=0),
+        'description': Course(title='Veri Bilimi', description='Python ile veri analizi', instructor_id=mehmet.id, category='veri', level='Orta', price=100),
+        'instructor': Course(title='Gitar Dersleri', description='Akorlar', instructor_id=ayse.id, category='muzik', level='Başlangıç', price=50),
+    }
+    db.session.add_all(courses.values())
+    db.session.commit()
+    return ayse, courses
+
+def _search(test_client, **params):
+    headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+    response = test_client.get('/courses/search', query_string=params, headers=headers)
+    assert response.status_code == 200
+    return [course['title'] for course in response.get_json()['courses']]
+
+def test_search_is_ranked_and_filtered(test_app, test_client): #Başlık eşleşmesi önce gelmeli, filtreler uygulanmalı
+    ayse, courses = _setup()
+
+    assert _search(test_client, q='pyth') == ['Python Programlama', 'Veri Bilimi'] # Önek eşleşmesi, başlık ağırlığı
+    assert _search(test_client, q='python', category='veri') == ['Veri Bilimi']
+    assert _search(test_client, q='python', max_price=50) == ['Python Programlama']
+    assert _search(test_client, q='ayse') == ['Gitar Dersleri'] # Eğitmen adı
+    assert _search(test_client, q='python veri') == ['Veri Bilimi'] # Tüm kelimeler eşleşmeli
+    assert _search(test_client, q='"*') == []
+
+def test_index_follows_course_and_instructor_changes(test_app, test_client): #Güncelleme, silme ve ad değişikliği index'e yansımalı
+    ayse, courses = _setup()
+
+    courses['title'].title = 'Django Web'
+    db.session.commit()
+    assert _search(test_client, q='django') == ['Django Web']
+    assert _search(test_client, q='python') == ['Veri Bilimi']
+
+    db.session.delete(courses['description'])
+    db.session.commit()
+    assert _search(test_client, q='python') == []
+
+    ayse.username = 'ayse_kaya'
+    db.session.commit()
+    assert _search(test_client, q='kaya') == ['Gitar Dersleri']
+    assert _search(test_client, q='yilmaz') == []
+
+def test_rebuild_indexes_bulk_inserted_courses(test_app, test_client): #ORM dışı eklenen kurslar yeniden oluşturmayla aranabilmeli
+    ayse, courses = _setup()
+    db.session.execute(db.insert(Course), [{'title': 'Go Dili', 'description': '...', 'instructor_id': ayse.id}])
+    db.session.commit()
+    assert _search(test_client, q='go') == []
+
+    assert course_search.rebuild(chunk_size=2) == 4
+    assert _search(test_client, q='go') == ['Go Dili']
+
+def test_turkish_folding_and_typo_fallback(test_app, test_client): #Türkçe harfler katlanmalı, yazım hatasında trigram aramasına geçilmeli
+    ayse, courses = _setup()
+    db.session.add(Course(title='İSTANBUL Işık Tasarımı', description='Aydınlatma', instructor_id=ayse.id))
+    db.session.commit()
+
+    assert _search(test_client, q='istanbul') == ['İSTANBUL Işık Tasarımı']
+    assert _search(test_client, q='ISIK') == ['İSTANBUL Işık Tasarımı'] # I -> i, ı -> i
+    assert _search(test_client, q='tasarimi') == ['İSTANBUL Işık Tasarımı']
+
+    headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+    response = test_client.get('/courses/search', query_string={'q': 'pyhton'}, headers=headers)
+    body = response.get_json()
+    assert body['match'] == 'fuzzy'
+    assert [course['title'] for course in body['courses']] == ['Python Programlama', 'Veri Bilimi'] # Başlık ağırlığı önce
+    assert _search(test_client, q='pyhton', fuzzy='false') == []
+    assert _search(test_client, q='programlma', fuzzy='true') == ['Python Programlama']
+
+    courses['title'].title = 'Django Web'
+    db.session.commit()
+    assert _search(test_client, q='djnago', fuzzy='true') == ['Django Web']
+    assert _search(test_client, q='programlma', fuzzy='true') == []
+
+def test_search_text_normalization(): #Katlama ve trigramlar pg_trgm ile aynı biçimde olmalı
+    from search_text import normalize, trigrams
+    assert normalize('İSTANBUL Işık ŞÇĞÜÖ') == 'istanbul isik scguo'
+    assert trigrams('Ab') == {'  a', ' ab', 'ab '}
+
+def test_facets_follow_query_not_filters(test_app, test_client): #Facet'ler arama metnine göre sayılmalı, filtrelerden etkilenmemeli, değişiklikte yenilenmeli
+    ayse, courses = _setup()
+    headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+
+    def facets(**params):
+        response = test_client.get('/courses/search', query_string={'facets': 'true', **params}, headers=headers)
+        return response.get_json()['facets']
+
+    result = facets(q='python', category='veri')
+    assert result['category'] == [{'value': 'veri', 'count': 1}, {'value': 'yazilim', 'count': 1}]
+    assert {p['key']: p['count'] for p in result['price']} == {'free': 1, '0-100': 1}
+    assert result['instructor'] == [{'id': courses['title'].instructor_id, 'username': 'mehmet', 'count': 2}]
+    assert sum(level['count'] for level in facets()['level']) == 3
+
+    courses['description'].category = 'yazilim' # Önbellek kurs değişikliğinde boşaltılmalı
+    db.session.commit()
+    assert facets(q='PYTHON')['category'] == [{'value': 'yazilim', 'count': 2}]
+    assert facets(q='"*')['category'] == []
+    assert 'facets' not in test_client.get('/courses/search', query_string={'q': 'python'}, headers=headers).get_json()
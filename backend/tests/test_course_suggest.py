@@ -0,0 +1,80 @@
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course #models.py dosyasındaki modelleri import ediyoruz
+import course_suggest #MAX_KEYS sınırını küçültmek için
+from course_suggest import PrefixIndex, suggester #course_suggest modülünü import ediyoruz
+
+def _suggest(test_client, prefix, **params):
+    headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+    response = test_client.get('/courses/suggest', query_string={'prefix': prefix, **params}, headers=headers)
+    assert response.status_code == 200
+    return [(s['type'], s['text']) for s in response.get_json()['suggestions']]
+
+def test_prefix_index_matches_word_starts(): #Her kelimenin başından, Türkçe katlamayla eşleşmeli
+    index = PrefixIndex().load([
+        (1, 'Python Programlama', 'yazilim', 10, 'mehmet'),
+        (2, 'İleri Python', 'yazilim', 11, 'ayse'),
+        (3, 'Gitar', 'muzik', 11, 'ayse'),
+    ])
+    assert [s['text'] for s in index.search('pyth')] == ['İleri Python', 'Python Programlama'] # Kısa tamamlama önce
+    assert [s['text'] for s in index.search('ILERI')] == ['İleri Python']
+    assert index.search('prog')[0] == {'type': 'course', 'id': 1, 'text': 'Python Programlama'}
+    assert index.search('yaz') == [{'type': 'category', 'id': None, 'text': 'yazilim'}]
+    assert index.search('py', limit=1) == [{'type': 'course', 'id': 2, 'text': 'İleri Python'}]
+
+    index.remove_course(3) # Kategorinin son kursu silinince kategori de düşmeli
+    assert index.search('muz') == []
+    assert [s['text'] for s in index.search('ay')] == ['ayse']
+
+def test_suggest_follows_commits(test_app, test_client): #Commit edilen yazmalar index'e yansımalı, geri alınanlar yansımamalı
+    instructor = User(username='Öğretmen', email='t@example.com', role='instructor', password_hash='x')
+    db.session.add(instructor)
+    db.session.commit()
+    course = Course(title='Veri Bilimi', description='...', category='veri', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+
+    assert _suggest(test_client, 'bil') == [('course', 'Veri Bilimi')]
+    assert _suggest(test_client, 'ogret') == [('instructor', 'Öğretmen')]
+    assert _suggest(test_client, 'veri') == [('category', 'veri'), ('course', 'Veri Bilimi')]
+
+    course.title = 'Makine Öğrenmesi'
+    db.session.commit()
+    assert _suggest(test_client, 'bil') == []
+    assert _suggest(test_client, 'ogren') == [('course', 'Makine Öğrenmesi')]
+
+    db.session.add(Course(title='Geri Alınan', description='...', instructor_id=instructor.id))
+    db.session.flush()
+    db.session.rollback()
+    assert _suggest(test_client, 'geri') == []
+
+    db.session.delete(db.session.get(Course, course.id))
+    db.session.commit()
+    assert _suggest(test_client, 'ma') == []
+    assert _suggest(test_client, 'ogret') == []
+
+def test_suggest_rebuild_and_validation(test_app, test_client): #Toplu eklemeler yeniden oluşturmayla görünmeli
+    instructor = User(username='mehmet', email='m@example.com', role='instructor', password_hash='x')
+    db.session.add(instructor)
+    db.session.commit()
+    db.session.execute(db.insert(Course), [{'title': 'Go Dili', 'description': '...', 'instructor_id': instructor.id}])
+    db.session.commit()
+    assert _suggest(test_client, 'go') == []
+
+    suggester.build()
+    assert _suggest(test_client, 'go') == [('course', 'Go Dili')]
+    assert _suggest(test_client, '') == []
+
+    headers = {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+    assert test_client.get('/courses/suggest?prefix=go&limit=50', headers=headers).status_code == 400
+
+def test_key_cap_drops_trailing_words_first(monkeypatch): #Sınır aşılınca alfabetik sondaki öğeler değil uzun başlıkların son ekleri düşmeli
+    monkeypatch.setattr(course_suggest, 'MAX_KEYS', 6)
+    index = PrefixIndex().load([
+        (1, 'Astronomi Temelleri Uygulamalı Gözlem Kursu', None, None, None),
+        (2, 'Yoga', None, None, None),
+        (3, 'Zanaat', None, None, None),
+    ])
+    assert len(index.keys) == 6 and index.dropped == 1
+    assert [s['text'] for s in index.search('zan')] == ['Zanaat'] # Alfabetik sıranın sonundaki öğe de bulunur
+    assert [s['text'] for s in index.search('astro')] == ['Astronomi Temelleri Uygulamalı Gözlem Kursu']
+    assert index.search('kurs') == [] # Son kelimeden başlayan anahtar düştü
@@ -0,0 +1,36 @@
+from db_audit import HOT_QUERIES, run_audit, full_scans #db_audit modülünü import ediyoruz
+import db_audit #Komut testinde denetim sonucunu değiştirmek için
+
+def test_hot_queries_use_indexes(test_app): #Kayıtlı tüm sıcak sorgular index kullanmalı
+    results = run_audit()
+
+    assert len(results) == len(HOT_QUERIES)
+    for result in results:
+        assert result['ok'], f"{result['name']} tam tarama yapıyor: {result['full_scans']}"
+
+def test_full_scan_detection(): #SQLite plan satırlarından tam taramalar ayıklanmalı
+    plan = [
+        'SCAN notifications',
+        'SEARCH enrollment USING INDEX ix_enrollment_course_id (course_id=?)',
+        'SCAN lesson USING INDEX ix_lesson_course_order',
+        'SCAN CONSTANT ROW'
+    ]
+    assert full_scans(plan, 'sqlite') == ['SCAN notifications']
+    assert full_scans(['Seq Scan on notifications  (cost=0.00..1.01 rows=1)'], 'postgresql') == [
+        'Seq Scan on notifications  (cost=0.00..1.01 rows=1)'
+    ]
+
+def test_db_audit_command(test_app): #flask db-audit komutu başarıyla çıkmalı
+    runner = test_app.test_cli_runner()
+    result = runner.invoke(args=['db-audit'])
+
+    assert result.exit_code == 0
+    assert f'{len(HOT_QUERIES)} sorgu denetlendi, 0 tanesi tam tarama yapıyor.' in result.output
+
+def test_db_audit_command_fails_on_full_scan(test_app, monkeypatch): #Tam tarama varsa komut sıfırdan farklı kodla çıkmalı
+    scan = {'name': 'taranan', 'ok': False, 'plan': ['SCAN notifications'], 'full_scans': ['SCAN notifications']}
+    monkeypatch.setattr(db_audit, 'run_audit', lambda: [scan])
+    result = test_app.test_cli_runner().invoke(args=['db-audit'])
+
+    assert result.exit_code == 1
+    assert '[SCAN] taranan' in result.output and '1 sorgu denetlendi, 1 tanesi tam tarama yapıyor.' in result.output
@@ -0,0 +1,99 @@
+from models import db, User, Course, CourseStats #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #SQLite'ta yabancı anahtar denetimini açmak için
+import instructor_stats #instructor_stats modülünü import ediyoruz
+
+def _user(username, role): #Test kullanıcısı oluştur
+    user = User(username=username, email=f'{username}@example.com', role=role)
+    user.set_password('password')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+def _add_lesson(client, headers, course_id, order): #Ders ekleme uç noktasını çağır
+    response = client.post(f'/courses/{course_id}/lessons', headers=headers,
+                           json={'title': f'Ders {order}', 'content': '...', 'order': order})
+    assert response.status_code == 201
+    return response.get_json()['lesson']['id']
+
+def test_rollup_follows_enrollments_completions_and_lessons(test_app, test_client, auth_headers): #Artımlı güncellemeler tam hesaplamayla aynı sonucu vermeli
+    instructor = _user('teacher', 'instructor')
+    students = [_user(f'student{i}', 'student') for i in range(3)]
+    courses = [Course(title=f'Kurs {i}', description='...', instructor_id=instructor.id) for i in range(2)]
+    db.session.add_all(courses)
+    db.session.commit()
+    course_ids = [course.id for course in courses]
+
+    lessons = [_add_lesson(test_client, auth_headers(instructor), course_ids[0], order) for order in (1, 2)]
+    _add_lesson(test_client, auth_headers(instructor), course_ids[1], 1)
+
+    for student in students:
+        assert test_client.post(f'/enrollments/courses/{course_ids[0]}/enroll', headers=auth_headers(student)).status_code == 201
+    assert test_client.post(f'/courses/{course_ids[1]}/enroll', headers=auth_headers(students[0])).status_code == 201
+
+    for lesson_id in lessons:
+        test_client.post(f'/enrollments/lessons/{lesson_id}/complete', headers=auth_headers(students[0]))
+    test_client.post(f'/enrollments/lessons/{lessons[0]}/complete', headers=auth_headers(students[1]))
+    test_client.post(f'/enrollments/lessons/{lessons[0]}/complete', headers=auth_headers(students[1])) # Tekrar tamamlama sayılmamalı
+
+    response = test_client.get('/enrollments/instructor/student-stats', headers=auth_headers(instructor))
+    assert response.get_json() == {
+        'total_students': 3,
+        'active_students': 2,
+        'completions_this_month': 1,
+        'average_course_completion': 37, # (100 + 50 + 0 + 0) / 4
+        'total_courses': 2,
+        'total_reviews': 0,
+        'average_rating': 0.0
+    }
+
+    # Yeni ders tamamlanmış kursu tamamlanmamış yapar ve oranları düşürür
+    _add_lesson(test_client, auth_headers(instructor), course_ids[0], 3)
+    incremental = test_client.get('/enrollments/instructor/student-stats', headers=auth_headers(instructor)).get_json()
+    assert incremental['completions_this_month'] == 0
+    assert incremental['average_course_completion'] == 25 # (66.6 + 33.3 + 0 + 0) / 4
+
+    instructor_stats.rebuild()
+    rebuilt = test_client.get('/enrollments/instructor/student-stats', headers=auth_headers(instructor)).get_json()
+    assert rebuilt == incremental
+
+def test_course_and_review_totals(test_app, test_client, auth_headers): #Panodaki toplamlar tüm kurslardan (ilk sayfadan değil) gelmeli
+    instructor = _user('teacher', 'instructor')
+    other = _user('other', 'instructor')
+    db.session.add_all([Course(title=f'Kurs {i}', description='...', instructor_id=instructor.id, review_count=i, rating_sum=4 * i) for i in range(25)])
+    db.session.add(Course(title='Başka', description='...', instructor_id=other.id, review_count=3, rating_sum=3))
+    db.session.commit()
+
+    stats = test_client.get('/enrollments/instructor/student-stats', headers=auth_headers(instructor)).get_json()
+    assert (stats['total_courses'], stats['total_reviews'], stats['average_rating']) == (25, 300, 4.0)
+
+def test_rebuild_command(test_app): #flask rebuild-instructor-stats komutu eğitmenleri işlemeli
+    _user('teacher', 'instructor')
+    runner = test_app.test_cli_runner()
+    result = runner.invoke(args=['rebuild-instructor-stats', '--chunk-size', '1'])
+
+    assert result.exit_code == 0
+    assert '1 eğitmen' in result.output
+
+def test_deleting_enrolled_course_removes_its_stats(test_app, test_client, auth_headers): #Yabancı anahtarlar denetlenirken kayıtlı kurs silinebilmeli
+    instructor = _user('teacher', 'instructor')
+    student = _user('student', 'student')
+    course = Course(title='Kurs', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    course_id = course.id
+    assert test_client.post(f'/enrollments/courses/{course_id}/enroll', headers=auth_headers(student)).status_code == 201
+    assert db.session.get(CourseStats, course_id) is not None
+
+    headers = auth_headers(instructor)
+    foreign_keys = lambda connection, record: connection.execute('PRAGMA foreign_keys=ON')
+    event.listen(db.engine, 'connect', foreign_keys)
+    db.session.remove()
+    db.engine.dispose() # Yeni bağlantılar denetimi açık olarak kurulur
+    try:
+        response = test_client.delete(f'/courses/{course_id}', headers=headers)
+    finally:
+        db.session.remove()
+        event.remove(db.engine, 'connect', foreign_keys)
+        db.engine.dispose()
+    assert response.status_code == 200
+    assert db.session.get(CourseStats, course_id) is None
@@ -0,0 +1,79 @@
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Enrollment, Notification, NotificationSetting, UnreadCount #models.py dosyasındaki modelleri import ediyoruz
+from notification_fanout import fan_out, category_for #notification_fanout modülünü import ediyoruz
+from notification_outbox import drain #outbox işçisini import ediyoruz
+from sqlalchemy import event #Araya giren işlemi taklit etmek için
+import unread_counts #Okunmamış sayaçları için
+
+def _setting(user, category, enabled): #Kullanıcıya bildirim ayarı ekle
+    db.session.add(NotificationSetting(user_id=user.id, name=category, description='...', category=category, enabled=enabled))
+
+def _course_with_students(count): #Eğitmen ve verilen sayıda kayıtlı öğrencisi olan kurs
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    db.session.add(instructor)
+    db.session.commit()
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+
+    db.session.execute(db.insert(User), [
+        {'username': f'student{i}', 'email': f'student{i}@example.com', 'role': 'student', 'password_hash': 'x'}
+        for i in range(count)
+    ])
+    students = User.query.filter_by(role='student').order_by(User.id).all()
+    db.session.execute(db.insert(Enrollment), [{'student_id': s.id, 'course_id': course.id} for s in students])
+    db.session.commit()
+    return instructor, course, students
+
+def test_fan_out_honors_category_settings(test_app): #Kategoriyi tamamen kapatan öğrenci bildirim almamalı
+    instructor, course, students = _course_with_students(4)
+    _setting(students[0], 'course', False) # Kurs bildirimleri kapalı
+    _setting(students[1], 'course', False)
+    _setting(students[1], 'course', True) # En az bir ayar açık
+    _setting(students[2], 'system', False) # Sadece sistem bildirimleri kapalı
+    db.session.commit()
+
+    assert category_for('new_quiz') == 'course'
+    assert fan_out(course.id, 'new_quiz', 'Yeni Quiz', 'Quiz eklendi', reference_id=7) == 3
+
+    recipients = {n.user_id for n in Notification.query.filter_by(type='new_quiz', reference_id=7)}
+    assert recipients == {students[1].id, students[2].id, students[3].id}
+
+def test_add_lesson_notifies_enrolled_students(test_app, test_client): #Ders ekleme olayı işçi tarafından herkese dağıtılmalı
+    instructor, course, students = _course_with_students(2000)
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(instructor.id))}'}
+
+    response = test_client.post(f'/courses/{course.id}/lessons', headers=headers,
+                                json={'title': 'Giriş', 'content': '...', 'order': 1})
+    assert response.status_code == 201
+
+    lesson_id = response.get_json()['lesson']['id']
+    assert Notification.query.filter_by(type='new_lesson', reference_id=lesson_id).count() == 0 # İstek sadece outbox'a yazar
+
+    assert drain(batch_size=500)['notifications'] == 2000
+    assert Notification.query.filter_by(type='new_lesson', reference_id=lesson_id).count() == 2000
+
+def test_counters_follow_inserted_rows(test_app): #INSERT ile sayaç artırımı arasında kaydolan öğrencinin sayacı artmamalı
+    instructor, course, students = _course_with_students(2)
+    late = User(username='late', email='late@example.com', role='student', password_hash='x')
+    db.session.add(late)
+    db.session.commit()
+    course_id, late_id = course.id, late.id
+    for student in students: # Toplu eklenen öğrencilerin sayaç satırları ilk okumada oluşur
+        unread_counts.get(student.id)
+    db.session.commit()
+
+    done = []
+    def enroll_after_insert(conn, cursor, statement, *args): # Başka bir işlem INSERT'ten hemen sonra commit etmiş gibi
+        if statement.startswith('INSERT INTO notifications') and not done:
+            done.append(True)
+            conn.exec_driver_sql('INSERT INTO enrollment (student_id, course_id) VALUES (?, ?)', (late_id, course_id))
+    event.listen(db.engine, 'after_cursor_execute', enroll_after_insert)
+    try:
+        assert fan_out(course_id, 'new_quiz', 'Yeni Quiz', 'Quiz eklendi') == 2
+    finally:
+        event.remove(db.engine, 'after_cursor_execute', enroll_after_insert)
+    db.session.commit()
+
+    counts = dict(db.session.execute(db.select(UnreadCount.user_id, UnreadCount.count)).all())
+    assert [counts[s.id] for s in students] == [1, 1] and counts[late_id] == 0
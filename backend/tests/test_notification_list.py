@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta #Bildirim zamanlarını ayarlamak için
+from sqlalchemy import event #Çalışan SQL sorgularını yakalamak için
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Notification #models.py dosyasındaki modelleri import ediyoruz
+
+def _setup(count): #Öğrenci, iki kurs ve zaman sırası belli bildirimler
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    student = User(username='student', email='student@example.com', role='student', password_hash='x')
+    db.session.add_all([instructor, student])
+    db.session.commit()
+    courses = [Course(title=f'Kurs {i}', description='...', instructor_id=instructor.id) for i in range(2)]
+    db.session.add_all(courses)
+    db.session.commit()
+
+    start = datetime(2026, 1, 1)
+    db.session.add_all([
+        Notification(user_id=student.id, course_id=courses[i % 2].id, type='new_lesson', title=f'N{i}',
+                     message='...', is_read=(i % 3 == 0), created_at=start + timedelta(minutes=i // 2)) # Aynı zamanlı çiftler
+        for i in range(count)
+    ])
+    db.session.commit()
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(student.id))}'}
+    db.session.expunge_all() # Kurslar kimlik haritasından yüklenmesin
+    return headers
+
+def _collect(test_client, url, headers): #next_cursor bitene kadar tüm sayfaları gezer
+    titles, cursor, pages = [], None, 0
+    while True:
+        response = test_client.get(url + (f'&cursor={cursor}' if cursor else ''), headers=headers)
+        assert response.status_code == 200
+        data = response.get_json()
+        titles += [n['title'] for n in data['notifications']]
+        pages += 1
+        cursor = data['next_cursor']
+        if not cursor:
+            return titles, pages, data
+
+def test_all_notifications_are_paged_by_cursor(test_app, test_client): #Sayfalar çakışmadan ve eksiksiz gezilmeli
+    headers = _setup(25)
+    titles, pages, last = _collect(test_client, '/api/notifications?limit=10', headers)
+
+    assert pages == 3
+    assert len(titles) == len(set(titles)) == 25
+    assert titles[0] == 'N24' and titles[-1] == 'N0'
+    assert last['total'] == 25
+
+    response = test_client.get('/api/notifications?limit=5&include_total=false', headers=headers)
+    assert 'total' not in response.get_json()
+    assert test_client.get('/api/notifications?cursor=abc', headers=headers).status_code == 400
+
+def test_unread_list_uses_cursor_and_one_query_per_page(test_app, test_client): #Kurs başlıkları satır başına sorgulanmamalı
+    headers = _setup(30)
+    titles, pages, last = _collect(test_client, '/courses/notifications/unread?per_page=7&include_total=false', headers)
+    assert len(titles) == len(set(titles)) == 20 # 30 bildirimin 10'u okunmuş
+    assert 'total_count' not in last
+
+    statements = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        data = test_client.get('/courses/notifications/unread?per_page=20', headers=headers).get_json()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    assert {n['course_title'] for n in data['notifications']} == {'Kurs 0', 'Kurs 1'}
+    assert data['total_count'] == 20
+    assert len([s for s in statements if 'FROM notifications' in s]) == 2 # Sayfa + toplam
+    assert not [s for s in statements if s.lstrip().startswith('SELECT') and 'FROM courses' in s and 'notifications' not in s]
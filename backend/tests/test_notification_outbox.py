@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta #Kira sürelerini ayarlamak için
+from models import db, User, Course, Enrollment, Notification, NotificationSetting, NotificationOutbox #models.py dosyasındaki modelleri import ediyoruz
+from notification_outbox import enqueue, claim, process, drain #notification_outbox modülünü import ediyoruz
+
+def _course_with_students(count): #Eğitmen ve verilen sayıda kayıtlı öğrencisi olan kurs
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    db.session.add(instructor)
+    db.session.commit()
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+
+    db.session.execute(db.insert(User), [
+        {'username': f'student{i}', 'email': f'student{i}@example.com', 'role': 'student', 'password_hash': 'x'}
+        for i in range(count)
+    ])
+    students = User.query.filter_by(role='student').order_by(User.id).all()
+    db.session.execute(db.insert(Enrollment), [{'student_id': s.id, 'course_id': course.id} for s in students])
+    db.session.commit()
+    return course, students
+
+def test_worker_delivers_event_in_batches(test_app): #Olay parça parça işlenmeli, imleç ve sayaç güncellenmeli
+    course, students = _course_with_students(25)
+    enqueue(course.id, 'new_quiz', 'Yeni Quiz', 'Quiz eklendi', reference_id=3)
+    db.session.commit()
+
+    stats = drain(worker_id='w1', batch_size=10)
+    assert stats['events'] == 1 and stats['notifications'] == 25
+
+    event = db.session.scalar(db.select(NotificationOutbox))
+    assert event.status == 'done'
+    assert event.delivered == 25
+    assert event.cursor == students[-1].id
+    assert event.locked_by is None
+    assert Notification.query.filter_by(type='new_quiz', reference_id=3).count() == 25
+
+def test_claim_is_exclusive_until_lease_expires(test_app): #Kiralanan olayı başka işçi alamamalı; kira dolunca devralmalı
+    course, students = _course_with_students(3)
+    enqueue(course.id, 'course_update', 'Kurs Güncellendi', '...')
+    db.session.commit()
+
+    assert len(claim('w1', lease_seconds=60)) == 1
+    assert claim('w2') == []
+
+    event = db.session.scalar(db.select(NotificationOutbox))
+    event.locked_until = datetime.utcnow() - timedelta(seconds=1) # w1 çöktü
+    db.session.commit()
+
+    taken = claim('w2')
+    assert [e.id for e in taken] == [event.id]
+    assert taken[0].attempts == 2
+
+    # Kirası elinden alınan işçi olayı tamamlayamamalı
+    stale = db.session.get(NotificationOutbox, event.id)
+    process(stale, 'w1')
+    assert db.session.get(NotificationOutbox, event.id).status == 'processing'
+
+    assert process(taken[0], 'w2') == 3
+    assert db.session.get(NotificationOutbox, event.id).status == 'done'
+
+def test_single_recipient_event_honors_settings(test_app): #Not bildirimi sadece öğrenciye gitmeli, ayar kapalıysa hiç gitmemeli
+    course, students = _course_with_students(2)
+    db.session.add(NotificationSetting(user_id=students[1].id, name='course', description='...', category='course', enabled=False))
+    enqueue(course.id, 'assignment_graded', 'Ödev Değerlendirildi', '...', user_id=students[0].id)
+    enqueue(course.id, 'assignment_graded', 'Ödev Değerlendirildi', '...', user_id=students[1].id)
+    db.session.commit()
+
+    stats = drain()
+    assert stats['events'] == 2 and stats['notifications'] == 1
+    assert [n.user_id for n in Notification.query.filter_by(type='assignment_graded')] == [students[0].id]
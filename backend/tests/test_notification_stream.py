@@ -0,0 +1,114 @@
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Notification #models.py dosyasındaki modelleri import ediyoruz
+import notification_stream #notification_stream modülünü import ediyoruz
+
+def _setup(): #Öğrenci, kurs ve iki eski bildirim
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    student = User(username='student', email='student@example.com', role='student', password_hash='x')
+    db.session.add_all([instructor, student])
+    db.session.commit()
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    old = [Notification(user_id=student.id, course_id=course.id, type='new_lesson', title=f'Eski {i}', message='...') for i in range(2)]
+    db.session.add_all(old)
+    db.session.commit()
+    return student, course, old
+
+def _notify(student, course, title):
+    notification = Notification(user_id=student.id, course_id=course.id, type='new_quiz', title=title, message='...')
+    db.session.add(notification)
+    db.session.commit()
+    return notification
+
+def _drain(subscription): #Kuyruktaki olay metinleri
+    chunks = []
+    while not subscription.empty():
+        chunks.append(subscription.get_nowait()[1])
+    return chunks
+
+def test_hub_pushes_new_notifications_and_count_changes(test_app): #Toplayıcı sadece bağlı kullanıcılara yeni olayları göndermeli
+    student, course, old = _setup()
+    hub = notification_stream.Hub(notification_stream.LocalBroker())
+    subscription = hub.broker.subscribe(student.id)
+
+    hub.tick() # İlk tur başlangıç noktasını ve sayacı kaydeder
+    assert [c for c in _drain(subscription) if 'event: notification' in c] == []
+
+    created = _notify(student, course, 'Yeni Quiz')
+    hub.tick()
+    chunks = _drain(subscription)
+    assert chunks[0].startswith(f'id: {created.id}\nevent: notification\n') and 'Yeni Quiz' in chunks[0]
+    assert chunks[1] == 'event: unread_count\ndata: {"count": 3}\n\n'
+
+    hub.tick() # Değişiklik yoksa olay yok
+    assert _drain(subscription) == []
+
+    created.is_read = True
+    db.session.commit()
+    hub.tick()
+    assert _drain(subscription) == ['event: unread_count\ndata: {"count": 2}\n\n']
+
+    hub.broker.unsubscribe(student.id, subscription)
+    hub.tick()
+    assert hub.last_id is None and hub.broker.users() == []
+
+def test_hub_publishes_late_committed_ids(test_app): #Daha küçük id'yi geç commit eden işlemin bildirimi kaybolmamalı
+    student, course, old = _setup()
+    hub = notification_stream.Hub(notification_stream.LocalBroker())
+    subscription = hub.broker.subscribe(student.id)
+    hub.tick()
+    _drain(subscription)
+
+    # Uzun işlem old[1].id + 1'i aldı ama henüz commit etmedi; kısa işlem + 2'yi commit etti
+    late_id = old[1].id + 1
+    db.session.add(Notification(id=late_id + 1, user_id=student.id, course_id=course.id, type='new_quiz', title='Erken', message='...'))
+    db.session.commit()
+    hub.tick()
+    assert ['Erken' in c for c in _drain(subscription) if 'event: notification' in c] == [True]
+    assert hub.last_id == late_id + 1 and late_id in hub.gaps
+
+    db.session.add(Notification(id=late_id, user_id=student.id, course_id=course.id, type='new_quiz', title='Sonra', message='...'))
+    db.session.commit()
+    hub.tick()
+    chunks = [c for c in _drain(subscription) if 'event: notification' in c]
+    assert len(chunks) == 1 and chunks[0].startswith(f'id: {late_id}\n') and 'Sonra' in chunks[0]
+    assert hub.gaps == {}
+
+    # Geri alınan işlemin id'si bir süre sonra aranmaz
+    hub.gaps = {late_id + 5: 0.0}
+    hub.tick()
+    assert hub.gaps == {}
+
+def test_stream_endpoint_resumes_from_last_event_id(test_app, test_client): #Last-Event-ID sonrası bildirimler yeniden gönderilmeli
+    student, course, old = _setup()
+    token = create_access_token(identity=str(student.id))
+
+    response = test_client.get(f'/api/notifications/stream?jwt={token}', headers={'Last-Event-ID': str(old[0].id)}, buffered=False)
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+
+    chunks = (chunk.decode() for chunk in response.response)
+    assert next(chunks) == f'retry: {notification_stream.RETRY_MS}\n\n'
+    replayed = next(chunks)
+    assert replayed.startswith(f'id: {old[1].id}\n') and 'Eski 1' in replayed
+    assert next(chunks) == 'event: unread_count\ndata: {"count": 2}\n\n'
+    assert notification_stream.broker.users() == [student.id]
+
+    response.close() # İstemci bağlantıyı kapattı
+    assert notification_stream.broker.users() == []
+
+    bad = test_client.get('/api/notifications/stream', headers={
+        'Authorization': f'Bearer {token}', 'Last-Event-ID': 'abc'
+    })
+    assert bad.status_code == 400
+
+def test_too_many_missed_sends_resync(test_app, monkeypatch): #Sınırdan fazla kaçırılan bildirim sessizce atlanmamalı
+    student, course, old = _setup()
+    monkeypatch.setattr(notification_stream, 'REPLAY_LIMIT', 2)
+    assert [event_id for event_id, _ in notification_stream.replay(student.id, 0)] == [old[0].id, old[1].id]
+
+    latest = _notify(student, course, 'Yeni')
+    events = notification_stream.replay(student.id, 0)
+    assert events == [(latest.id, f'id: {latest.id}\nevent: resync\ndata: {{"last_id": {latest.id}}}\n\n')]
+    assert [event_id for event_id, _ in notification_stream.replay(student.id, old[0].id)] == [old[1].id, latest.id]
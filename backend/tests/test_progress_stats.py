@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta #Tamamlanma zamanları için kullanılır
+from models import db, User, Course, Lesson, Enrollment, Progress #models.py dosyasındaki modelleri import ediyoruz
+
+def _user(username, role): #Test kullanıcısı oluştur
+    user = User(username=username, email=f'{username}@example.com', role=role)
+    user.set_password('password')
+    db.session.add(user)
+    return user
+
+def _seed(): #Bir eğitmen, iki ders ve farklı ilerlemede iki öğrenci
+    instructor = _user('teacher', 'instructor')
+    fast = _user('fast', 'student')
+    slow = _user('slow', 'student')
+    db.session.commit()
+
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    lessons = [Lesson(title=f'Ders {i}', content='...', course_id=course.id, order=i) for i in (1, 2)]
+    db.session.add_all(lessons)
+    fast_enrollment = Enrollment(student_id=fast.id, course_id=course.id)
+    slow_enrollment = Enrollment(student_id=slow.id, course_id=course.id)
+    db.session.add_all([fast_enrollment, slow_enrollment])
+    db.session.commit()
+
+    finished = datetime(2026, 1, 10)
+    for i, lesson in enumerate(lessons):
+        db.session.add(Progress(enrollment_id=fast_enrollment.id, lesson_id=lesson.id,
+                                completed=True, completed_at=finished - timedelta(days=1 - i)))
+    db.session.add(Progress(enrollment_id=slow_enrollment.id, lesson_id=lessons[0].id,
+                            completed=True, completed_at=datetime(2026, 1, 5)))
+    db.session.commit()
+    return instructor, fast, slow, course
+
+def test_student_course_list_and_history(test_app, test_client, auth_headers): #Öğrenci listeleri ilerleme ve tamamlanma bilgisini içermeli
+    instructor, fast, slow, course = _seed()
+
+    courses = test_client.get('/enrollments/courses', headers=auth_headers(slow)).get_json()
+    assert [(c['id'], c['progress'], c['instructor_name']) for c in courses] == [(course.id, 50, 'teacher')]
+    assert courses[0]['last_activity_at'].startswith('2026-01-05')
+
+    history = test_client.get('/enrollments/history', headers=auth_headers(fast)).get_json()
+    assert history[0]['status'] == 'completed'
+    assert history[0]['completed_at'].startswith('2026-01-10')
+
+def test_instructor_students_sorted_and_paginated(test_app, test_client, auth_headers): #Sıralama ve sayfalama SQL'de yapılmalı
+    instructor, fast, slow, course = _seed()
+    headers = auth_headers(instructor)
+
+    students = test_client.get('/enrollments/instructor/students?sort=progress&order=asc', headers=headers).get_json()
+    assert [(s['student']['name'], s['progress'], s['completed']) for s in students] == [
+        ('slow', 50, False), ('fast', 100, True)
+    ]
+
+    page = test_client.get('/enrollments/instructor/students?sort=progress&page=1&per_page=1', headers=headers).get_json()
+    assert page['total'] == 2 and page['total_pages'] == 2
+    assert [s['student']['name'] for s in page['students']] == ['fast']
+
+    response = test_client.get('/enrollments/instructor/students?sort=name', headers=headers)
+    assert response.status_code == 400
+
+    progress = test_client.get(f'/enrollments/instructor/students/{slow.id}/progress', headers=headers).get_json()
+    assert progress['courses'][0]['completed_lessons'] == 1
+    assert progress['courses'][0]['total_lessons'] == 2
+    assert progress['courses'][0]['total_assignments'] == 0
@@ -0,0 +1,100 @@
+import numpy as np #Beklenen korelasyonları hesaplamak için
+from models import db, User, Course, QuizOption #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+from quiz_analytics import response_matrix #quiz_analytics modülünü import ediyoruz
+from quiz_grading import RESPONSE_DTYPE #Paketli seçim biçimi
+
+def _setup(quiz_setup, students): #Ortak quiz: iki çoktan seçmeli (A doğru) ve bir açık uçlu soru
+    return quiz_setup(students, points=(10, 30), options='ABC', short_answer=True)
+
+def _submit(client, headers, course, lesson, quiz, picks): #picks: soru başına seçilen seçenek sırası (None = boş)
+    questions = sorted(quiz.questions, key=lambda q: q.id)
+    answers = [{'question_id': q.id, 'selected_option_id': sorted(o.id for o in q.options)[pick] if pick is not None else None}
+               for q, pick in zip(questions, picks)]
+    answers.append({'question_id': questions[2].id, 'text': 'cevap'})
+    response = client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/submit', headers=headers, json={'answers': answers})
+    assert response.status_code == 200
+
+def _analytics(client, headers, course, lesson, quiz):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.get(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/analytics', headers=headers)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return response, len(statements)
+
+PICKS = [(0, 0), (0, 1), (1, 0), (2, None), (0, 0)] # Öğrenci başına iki çoktan seçmeli soruya verilen cevaplar
+
+def test_item_statistics(test_app, test_client, quiz_setup, auth_headers): #p, nokta-çift serili korelasyon, çeldirici oranları ve puan dağılımı
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, len(PICKS))
+    for student, picks in zip(students, PICKS):
+        _submit(test_client, auth_headers(student), course, lesson, quiz, picks)
+
+    response, _ = _analytics(test_client, auth_headers(instructor), course, lesson, quiz)
+    assert response.status_code == 200
+    data = response.json
+    assert data['attempts'] == 5
+    first, second, open_ended = data['questions']
+
+    correct = np.array([[p[0] == 0, p[1] == 0] for p in PICKS], dtype=float)
+    total = correct @ np.array([10, 30])
+    for column, question in enumerate((first, second)):
+        assert question['p_value'] == correct[:, column].mean()
+        rest = total - correct[:, column] * (10, 30)[column]
+        assert abs(question['discrimination'] - np.corrcoef(correct[:, column], rest)[0, 1]) < 1e-4
+
+    assert [o['rate'] for o in first['options']] == [0.6, 0.2, 0.2]
+    assert [o['rate'] for o in second['options']] == [0.6, 0.2, 0.0]
+    assert second['unanswered_rate'] == 0.2
+    assert open_ended['p_value'] is None and open_ended['flags'] == []
+
+    distribution = data['score_distribution']
+    percentages = total / 40 * 100
+    assert sum(b['count'] for b in distribution['bins']) == 5
+    assert distribution['bins'][-1]['count'] == 2 # %100 son aralıkta
+    assert distribution['mean'] == round(percentages.mean(), 2)
+
+def test_misleading_distractor_is_flagged(test_app, test_client, quiz_setup, auth_headers): #Çoğunluğun seçtiği yanlış seçenek işaretlenmeli
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, 4)
+    for student, pick in zip(students, (1, 1, 1, 0)):
+        _submit(test_client, auth_headers(student), course, lesson, quiz, (pick, 0))
+    first = _analytics(test_client, auth_headers(instructor), course, lesson, quiz)[0].json['questions'][0]
+    assert 'misleading_distractor' in first['flags'] and 'hard' in first['flags']
+
+def test_analytics_cached_until_next_attempt(test_app, test_client, quiz_setup, auth_headers): #Önbellekten tek tazelik sorgusuyla dönmeli; yeni deneme yeniden hesaplatmalı
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, 3)
+    _submit(test_client, auth_headers(students[0]), course, lesson, quiz, (0, 0))
+
+    first, cold = _analytics(test_client, auth_headers(instructor), course, lesson, quiz)
+    second, warm = _analytics(test_client, auth_headers(instructor), course, lesson, quiz)
+    assert warm < cold and second.json == first.json
+
+    _submit(test_client, auth_headers(students[1]), course, lesson, quiz, (1, 1))
+    third, _ = _analytics(test_client, auth_headers(instructor), course, lesson, quiz)
+    assert third.json['attempts'] == 2
+
+    # Anahtar değişikliği de yeniden hesaplatır: ikinci öğrencinin seçimi artık doğru
+    option = QuizOption.query.filter_by(question_id=third.json['questions'][0]['id']).order_by(QuizOption.id).all()
+    option[0].is_correct, option[1].is_correct = False, True
+    db.session.commit()
+    assert _analytics(test_client, auth_headers(instructor), course, lesson, quiz)[0].json['questions'][0]['p_value'] == 0.5
+
+def test_only_course_instructor_can_view(test_app, test_client, quiz_setup, auth_headers):
+    _, students, course, lesson, quiz = _setup(quiz_setup, 1)
+    assert _analytics(test_client, auth_headers(students[0]), course, lesson, quiz)[0].status_code == 403
+
+def test_response_matrix_skips_removed_questions(): #Silinmiş soruya verilen cevap matrise girmemeli
+    blobs = [np.array([(3, 7), (5, 9)], dtype=RESPONSE_DTYPE).tobytes(), None, np.array([(4, 8), (5, 0)], dtype=RESPONSE_DTYPE).tobytes()]
+    assert response_matrix(blobs, np.array([3, 5])).tolist() == [[7, 9], [0, 0], [0, 0]]
+
+def test_other_course_instructor_cannot_view(test_app, test_client, quiz_setup, auth_headers): #Başka kursun eğitmeni kendi kurs id'siyle bu quize erişememeli
+    _, _, _, lesson, quiz = _setup(quiz_setup, 1)
+    other = User(username='other', email='other@example.com', role='instructor', password_hash='x')
+    db.session.add(other)
+    db.session.commit()
+    own = Course(title='Başka', description='...', instructor_id=other.id)
+    db.session.add(own)
+    db.session.commit()
+    assert _analytics(test_client, auth_headers(other), own, lesson, quiz)[0].status_code == 400
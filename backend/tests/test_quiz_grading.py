@@ -0,0 +1,82 @@
+from models import db, Quiz, QuizQuestion, QuizOption, QuizAnswer, QuizAttempt #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+import quiz_grading #quiz_grading modülünü import ediyoruz
+
+def _questions(count, correct=0): #Her soruda iki seçenek; `correct` sıradaki seçenek doğru
+    return [{'question_text': f'Soru {i}', 'points': 10, 'options': [
+        {'text': 'A', 'is_correct': correct == 0}, {'text': 'B', 'is_correct': correct == 1}
+    ]} for i in range(count)]
+
+def _create_quiz(client, headers, course, lesson, count):
+    response = client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz', headers=headers,
+                           json={'title': 'Quiz', 'questions': _questions(count)})
+    assert response.status_code == 201
+    return response.json['quiz']['id']
+
+def _answers(quiz_id, pick=0): #Her soru için `pick` sıradaki seçeneği işaretler
+    questions = db.session.scalars(db.select(QuizQuestion).where(QuizQuestion.quiz_id == quiz_id).order_by(QuizQuestion.id)).all()
+    return [{'question_id': q.id, 'selected_option_id': sorted(o.id for o in q.options)[pick]} for q in questions]
+
+def _submit(client, headers, course, lesson, quiz_id, answers):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz_id}/submit',
+                               headers=headers, json={'answers': answers})
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return response, len(statements)
+
+def test_submission_queries_do_not_grow_with_questions(test_app, test_client, quiz_setup, auth_headers): #50 soruluk sınav 3 soruluk kadar sorgu atmalı
+    instructor, (student,), course, lesson, _ = quiz_setup(points=None)
+    small_quiz = _create_quiz(test_client, auth_headers(instructor), course, lesson, 3)
+    large_quiz = _create_quiz(test_client, auth_headers(instructor), course, lesson, 50)
+    quiz_grading.answer_keys.clear()
+
+    small, small_count = _submit(test_client, auth_headers(student), course, lesson, small_quiz, _answers(small_quiz))
+    large, large_count = _submit(test_client, auth_headers(student), course, lesson, large_quiz, _answers(large_quiz))
+    assert small.status_code == large.status_code == 200
+    assert large.json['attempt']['score'] == 100 and large.json['attempt']['correct_count'] == 50
+    assert large_count == small_count
+    assert db.session.scalar(db.select(db.func.count()).select_from(QuizAnswer)) == 53
+
+    _, cached_count = _submit(test_client, auth_headers(student), course, lesson, large_quiz, _answers(large_quiz, pick=1))
+    assert cached_count == large_count - 1 # Anahtar önbellekten okunur
+
+def test_answer_key_changes_invalidate_cached_key(test_app, test_client, quiz_setup, auth_headers): #update_quiz ve başka süreçteki değişiklik yeni anahtarla puanlanmalı
+    instructor, (student,), course, lesson, _ = quiz_setup(points=None)
+    quiz_id = _create_quiz(test_client, auth_headers(instructor), course, lesson, 2)
+    stale = quiz_grading.answer_keys.get(db.session.get(Quiz, quiz_id)) # Önbelleğe eski anahtar alınır
+    db.session.commit()
+
+    updated = test_client.put(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz_id}', headers=auth_headers(instructor),
+                              json={'title': 'Quiz', 'questions': _questions(2, correct=1)})
+    assert updated.status_code == 200
+    response, _ = _submit(test_client, auth_headers(student), course, lesson, quiz_id, _answers(quiz_id, pick=1))
+    assert response.json['attempt']['score'] == 100
+    assert quiz_grading.answer_keys.get(db.session.get(Quiz, quiz_id)).version > stale.version
+
+    # Başka bir süreç anahtarı değiştirmiş gibi: satırlar ve sürüm doğrudan güncellenir, bu süreçteki önbellek dokunulmaz
+    question_ids = db.session.scalars(db.select(QuizQuestion.id).where(QuizQuestion.quiz_id == quiz_id)).all()
+    db.session.execute(db.update(QuizOption).where(QuizOption.question_id.in_(question_ids)).values(is_correct=~QuizOption.is_correct))
+    db.session.execute(db.update(Quiz).where(Quiz.id == quiz_id).values(answer_key_version=Quiz.answer_key_version + 1))
+    db.session.commit()
+    response, _ = _submit(test_client, auth_headers(student), course, lesson, quiz_id, _answers(quiz_id, pick=1))
+    assert response.json['attempt']['score'] == 0
+
+def test_unknown_question_is_rejected(test_app, test_client, quiz_setup, auth_headers): #Başka quizin sorusu 400 dönmeli ve deneme yazılmamalı
+    instructor, (student,), course, lesson, _ = quiz_setup(points=None)
+    first = _create_quiz(test_client, auth_headers(instructor), course, lesson, 1)
+    second = _create_quiz(test_client, auth_headers(instructor), course, lesson, 1)
+    response, _ = _submit(test_client, auth_headers(student), course, lesson, first, _answers(second))
+    assert response.status_code == 400
+    assert db.session.scalar(db.select(db.func.count()).select_from(QuizAttempt)) == 0
+
+def test_malformed_answers_are_rejected(test_app, test_client, quiz_setup, auth_headers): #Liste olmayan cevaplar veya sözlük olmayan cevap 500 değil 400 dönmeli
+    instructor, (student,), course, lesson, _ = quiz_setup(points=None)
+    quiz_id = _create_quiz(test_client, auth_headers(instructor), course, lesson, 1)
+    for answers in ([1, 2], {'question_id': 1}, ['abc']):
+        response, _ = _submit(test_client, auth_headers(student), course, lesson, quiz_id, answers)
+        assert response.status_code == 400
+    assert db.session.scalar(db.select(db.func.count()).select_from(QuizAttempt)) == 0
@@ -0,0 +1,146 @@
+from models import db, QuizQuestion, QuizOption, QuizAttempt, QuizAnswer, QuizSubmission, Notification, NotificationSetting #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+from quiz_ingest import claim, process, drain #quiz_ingest modülünü import ediyoruz
+import unread_counts #Toplu yazılan bildirimlerin sayaçlarını kontrol etmek için
+import quiz_grading #İstek sırasında puanlama yapılmadığını denetlemek için
+
+def _answers(quiz, pick): #İlk `pick` soruya doğru, diğerlerine yanlış cevap
+    questions = sorted(quiz.questions, key=lambda q: q.id)
+    return [{'question_id': q.id, 'selected_option_id': sorted(o.id for o in q.options)[0 if i < pick else 1]}
+            for i, q in enumerate(questions)]
+
+def _submit(client, headers, course, lesson, quiz, pick=2):
+    return client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/submit',
+                       headers=headers, json={'answers': _answers(quiz, pick)})
+
+def test_queued_submission_is_graded_by_worker(test_app, test_client, quiz_setup, auth_headers): #202 ve deneme id'si; işçi sonrası yoklama puanı göstermeli
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    instructor, students, course, lesson, quiz = quiz_setup(3)
+
+    responses = [_submit(test_client, auth_headers(student), course, lesson, quiz, pick=i) for i, student in enumerate(students)]
+    assert [r.status_code for r in responses] == [202, 202, 202]
+    first = responses[2].json
+    assert first['attempt']['status'] == 'queued'
+    assert db.session.scalar(db.select(db.func.count()).select_from(QuizAnswer)) == 0
+
+    poll = test_client.get(first['status_url'], headers=auth_headers(students[2]))
+    assert poll.status_code == 200 and poll.json['attempt']['status'] == 'queued'
+    assert test_client.get(first['status_url'], headers=auth_headers(students[0])).status_code == 404 # Başkasının denemesi
+
+    stats = drain(worker_id='w1', batch_size=10)
+    assert stats == {**stats, 'graded': 3, 'batches': 1, 'failed': 0}
+
+    poll = test_client.get(first['status_url'], headers=auth_headers(students[2]))
+    assert poll.json['attempt']['status'] == 'graded'
+    assert poll.json['attempt']['score'] == 100 and poll.json['attempt']['correct_count'] == 2
+    assert sorted(a.score for a in QuizAttempt.query) == [0, 50, 100]
+    assert db.session.scalar(db.select(db.func.count()).select_from(QuizAnswer)) == 6
+
+    # Eğitmene parti başına tek bildirim, her öğrenciye puan bildirimi
+    instructor_notes = Notification.query.filter_by(user_id=instructor.id, type='quiz_submitted').all()
+    assert len(instructor_notes) == 1 and '3 öğrenci' in instructor_notes[0].message
+    assert Notification.query.filter_by(type='quiz_graded').count() == 3
+    assert unread_counts.get(instructor.id) == 1
+
+def test_batch_queries_do_not_grow_with_submissions(test_app, test_client, quiz_setup, auth_headers): #40 teslimlik parti 4 teslimlik kadar sorgu atmalı
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    _, students, course, lesson, quiz = quiz_setup(44)
+    db.session.add(NotificationSetting(user_id=students[0].id, name='Kurs', description='...', category='course', enabled=False))
+    db.session.commit()
+
+    def graded_with_count(batch):
+        for student in batch:
+            assert _submit(test_client, auth_headers(student), course, lesson, quiz).status_code == 202
+        submissions = claim('w1', limit=100)
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            assert process(submissions, 'w1') == len(batch)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+        return len(statements)
+
+    assert graded_with_count(students[:4]) == graded_with_count(students[4:])
+    assert Notification.query.filter_by(type='quiz_submitted').count() == 2
+    assert Notification.query.filter_by(type='quiz_graded').count() == 43 # Bildirimleri kapatan öğrenci hariç
+
+def test_submission_for_removed_question_fails(test_app, test_client, quiz_setup, auth_headers): #Teslimden sonra silinen soru teslimi 'failed' yapmalı
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    _, students, course, lesson, quiz = quiz_setup(2)
+    url = _submit(test_client, auth_headers(students[0]), course, lesson, quiz).json['status_url']
+    assert _submit(test_client, auth_headers(students[1]), course, lesson, quiz, pick=1).status_code == 202
+
+    question = QuizQuestion.query.filter_by(quiz_id=quiz.id).order_by(QuizQuestion.id.desc()).first()
+    QuizOption.query.filter_by(question_id=question.id).delete()
+    db.session.delete(question)
+    db.session.commit()
+    assert _submit(test_client, auth_headers(students[1]), course, lesson, quiz, pick=1).status_code == 202 # Kalan soruyla yeni teslim
+
+    stats = drain(worker_id='w1')
+    assert stats['graded'] == 1 and stats['failed'] == 2
+    poll = test_client.get(url, headers=auth_headers(students[0])).json['attempt']
+    assert poll['status'] == 'failed' and 'Soru bu quize ait değil' in poll['error']
+    assert [s.status for s in QuizSubmission.query.order_by(QuizSubmission.id)] == ['failed', 'failed', 'done']
+
+def test_worker_without_lease_does_not_write(test_app, test_client, quiz_setup, auth_headers): #Kirası elinden alınan işçi partiyi yazamamalı
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    _, students, course, lesson, quiz = quiz_setup(1)
+    _submit(test_client, auth_headers(students[0]), course, lesson, quiz)
+
+    submissions = claim('w1')
+    assert claim('w2') == []
+    db.session.execute(db.update(QuizSubmission).values(locked_by='w2')) # Kira w2'ye geçti
+    db.session.commit()
+
+    assert process(submissions, 'w1') == 0
+    assert db.session.scalar(db.select(QuizAttempt.completed_at)) is None
+    assert db.session.scalar(db.select(db.func.count()).select_from(QuizAnswer)) == 0
+
+def test_deleting_quiz_removes_queued_submissions(test_app, test_client, quiz_setup, auth_headers): #Silinen quizin bekleyen teslimleri de silinmeli
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    instructor, students, course, lesson, quiz = quiz_setup(1)
+    _submit(test_client, auth_headers(students[0]), course, lesson, quiz)
+
+    response = test_client.delete(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}', headers=auth_headers(instructor))
+    assert response.status_code == 200
+    assert db.session.scalar(db.select(db.func.count()).select_from(QuizSubmission)) == 0
+    assert drain(worker_id='w1')['graded'] == 0
+
+def test_unknown_option_is_cleared(test_app, test_client, quiz_setup, auth_headers): #Sorunun seçeneği olmayan seçim boş sayılmalı, teslim puanlanmalı
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    _, students, course, lesson, quiz = quiz_setup(1)
+    answers = _answers(quiz, 2)
+    answers[0]['selected_option_id'] = 999999
+    test_client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/submit', headers=auth_headers(students[0]), json={'answers': answers})
+
+    assert drain(worker_id='w1')['graded'] == 1
+    assert sorted(a.selected_option_id is None for a in QuizAnswer.query) == [False, True]
+    assert db.session.scalar(db.select(QuizAttempt.score)) == 50
+
+def test_broken_submission_does_not_fail_its_batch(test_app, test_client, quiz_setup, auth_headers): #Hata veren teslim tek başına denenmeli; diğerleri puanlanmalı
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    _, students, course, lesson, quiz = quiz_setup(3)
+    urls = [_submit(test_client, auth_headers(student), course, lesson, quiz).json['status_url'] for student in students]
+    broken = QuizSubmission.query.order_by(QuizSubmission.id).all()[1]
+    broken.answers = 'bozuk json'
+    db.session.commit()
+
+    stats = drain(worker_id='w1')
+    assert stats['graded'] == 2 and stats['failed'] == 1
+    assert [s.status for s in QuizSubmission.query.order_by(QuizSubmission.id)] == ['done', 'processing', 'done']
+    poll = test_client.get(urls[1], headers=auth_headers(students[1])).json['attempt']
+    assert poll['error'] == 'Teslim puanlanırken bir hata oluştu' # Ham istisna metni öğrenciye gösterilmez
+
+def test_queue_mode_only_validates_in_request(test_app, test_client, quiz_setup, auth_headers, monkeypatch): #Kuyruk modunda istek puanlamaz; yabancı soru yine 400
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    instructor, students, course, lesson, quiz = quiz_setup(1)
+    def grade(*args):
+        raise AssertionError('istek sırasında puanlanmamalı')
+    monkeypatch.setattr(quiz_grading, 'grade', grade)
+
+    assert _submit(test_client, auth_headers(students[0]), course, lesson, quiz).status_code == 202
+    response = test_client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/submit', headers=auth_headers(students[0]),
+                                json={'answers': [{'question_id': 999999, 'selected_option_id': None}]})
+    assert response.status_code == 400
+    assert QuizSubmission.query.count() == 1
@@ -0,0 +1,134 @@
+from models import db, User, Course, QuizQuestion, QuizOption, QuizAttempt, QuizAnswer #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+from quiz_regrade import regrade #quiz_regrade modülünü import ediyoruz
+
+def _setup(quiz_setup, students): #Ortak quiz: 10 ve 30 puanlı iki soru; anahtar yanlışlıkla B
+    return quiz_setup(students, points=(10, 30), correct='B')
+
+def _submit(client, headers, course, lesson, quiz, picks): #picks: soru başına seçilen seçenek sırası
+    questions = sorted(quiz.questions, key=lambda q: q.id)
+    answers = [{'question_id': q.id, 'selected_option_id': sorted(o.id for o in q.options)[pick]} for q, pick in zip(questions, picks)]
+    response = client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/submit', headers=headers, json={'answers': answers})
+    assert response.status_code == 200
+
+def _update(client, headers, course, lesson, quiz, questions): #Eğitmen düzenleme sayfasının gönderdiği biçim; questions: (soru, puan, doğru şık)
+    def options(question, correct):
+        existing = sorted(question.options, key=lambda o: o.id) if question else [None, None]
+        return [{'id': option.id if option else None, 'text': text, 'is_correct': correct == text} for option, text in zip(existing, 'AB')]
+    return client.put(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}', headers=headers, json={
+        'title': 'Sınav',
+        'questions': [{'id': question.id if question else None, 'question_text': question.question_text if question else 'Yeni',
+                       'points': points, 'options': options(question, correct)}
+                      for question, points, correct in questions]
+    })
+
+def _questions(quiz):
+    return QuizQuestion.query.filter_by(quiz_id=quiz.id).order_by(QuizQuestion.id).all()
+
+def _regrade(client, headers, course, lesson, quiz):
+    return client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/regrade', headers=headers)
+
+def _scores():
+    return [(a.score, a.total_score, a.max_score, a.correct_count) for a in QuizAttempt.query.order_by(QuizAttempt.id)]
+
+PICKS = [(0, 0), (0, 1), (1, 0), (1, 1)] # Öğrenci başına seçilen seçenekler (0 = A, 1 = B)
+
+def test_answer_key_fix_regrades_existing_attempts(test_app, test_client, quiz_setup, auth_headers): #Anahtar düzeltilince eski denemeler yeni anahtarla puanlanmalı
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, len(PICKS))
+    for student, picks in zip(students, PICKS):
+        _submit(test_client, auth_headers(student), course, lesson, quiz, picks)
+    assert [s[0] for s in _scores()] == [0, 75, 25, 100]
+    question_ids = sorted(q.id for q in quiz.questions)
+
+    # Birinci sorunun doğru cevabı A imiş; düzenleme cevapları olan soruları silmeden yerinde günceller
+    first_question, second_question = _questions(quiz)
+    assert _update(test_client, auth_headers(instructor), course, lesson, quiz, [(first_question, 10, 'A'), (second_question, 30, 'B')]).status_code == 200
+    assert sorted(q.id for q in QuizQuestion.query.filter_by(quiz_id=quiz.id)) == question_ids
+    assert [s[0] for s in _scores()] == [0, 75, 25, 100] # Yeniden puanlamaya kadar eski puanlar
+
+    response = _regrade(test_client, auth_headers(instructor), course, lesson, quiz)
+    assert response.status_code == 200
+    assert response.json == {**response.json, 'attempts': 4, 'changed': 4, 'answers': 4, 'chunks': 1}
+    assert _scores() == [(25, 10, 40, 1), (100, 40, 40, 2), (0, 0, 40, 0), (75, 30, 40, 1)]
+    first = QuizAnswer.query.filter_by(question_id=question_ids[0]).order_by(QuizAnswer.attempt_id).all()
+    assert [(a.is_correct, a.points_earned) for a in first] == [(True, 10), (True, 10), (False, 0), (False, 0)]
+
+    # Değişiklik yoksa hiçbir satır yazılmaz
+    assert _regrade(test_client, auth_headers(instructor), course, lesson, quiz).json['changed'] == 0
+
+def test_points_change_and_removed_question(test_app, test_client, quiz_setup, auth_headers): #Puan değişikliği ve soru çıkarma toplam puanı da güncellemeli
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, 2)
+    _submit(test_client, auth_headers(students[0]), course, lesson, quiz, (1, 0))
+    _submit(test_client, auth_headers(students[1]), course, lesson, quiz, (0, 1))
+
+    assert _update(test_client, auth_headers(instructor), course, lesson, quiz, [(_questions(quiz)[0], 20, 'B')]).status_code == 200
+    assert QuizQuestion.query.filter_by(quiz_id=quiz.id).count() == 1
+    assert QuizAnswer.query.count() == 2 # Çıkarılan sorunun cevapları silindi
+
+    report = regrade(quiz.id)
+    assert report['changed'] == 2
+    assert _scores() == [(100, 20, 20, 1), (0, 0, 20, 0)]
+
+def test_removing_middle_question_keeps_the_others(test_app, test_client, quiz_setup, auth_headers): #Ortadaki soru silinince diğer sorular ve cevapları yerinde kalmalı
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, 1)
+    third = QuizQuestion(quiz=quiz, question_text='Soru 2', question_type='multiple_choice', points=20)
+    third.options = [QuizOption(option_text='A', is_correct=True), QuizOption(option_text='B', is_correct=False)]
+    db.session.add(third)
+    db.session.commit()
+    _submit(test_client, auth_headers(students[0]), course, lesson, quiz, (1, 0, 0)) # 10 + 0 + 20
+    first, middle, last = _questions(quiz)
+
+    assert _update(test_client, auth_headers(instructor), course, lesson, quiz, [(first, 10, 'B'), (last, 20, 'A')]).status_code == 200
+    assert [(q.id, q.question_text, q.points) for q in _questions(quiz)] == [(first.id, 'Soru 0', 10), (last.id, 'Soru 2', 20)]
+    assert sorted(a.question_id for a in QuizAnswer.query) == [first.id, last.id] # Yalnızca silinen sorunun cevabı gitti
+
+    assert regrade(quiz.id)['changed'] == 1
+    assert _scores() == [(100, 30, 30, 2)]
+
+def test_new_question_and_option_are_added(test_app, test_client, quiz_setup, auth_headers): #id'siz soru yeni satır olarak eklenmeli
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, 1)
+    first, second = _questions(quiz)
+    assert _update(test_client, auth_headers(instructor), course, lesson, quiz, [(first, 10, 'B'), (None, 5, 'A'), (second, 30, 'B')]).status_code == 200
+    questions = _questions(quiz)
+    assert [q.id for q in questions[:2]] == [first.id, second.id] and len(questions) == 3
+    assert [(o.option_text, o.is_correct) for o in sorted(questions[2].options, key=lambda o: o.id)] == [('A', True), ('B', False)]
+
+def test_chunks_keep_statement_count_flat(test_app, test_client, quiz_setup, auth_headers): #Parça başına sabit sayıda sorgu; deneme sayısıyla büyümemeli
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, 6)
+    for student in students:
+        _submit(test_client, auth_headers(student), course, lesson, quiz, (0, 0))
+    _update(test_client, auth_headers(instructor), course, lesson, quiz, [(question, points, 'A') for question, points in zip(_questions(quiz), (10, 30))])
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        report = regrade(quiz.id, chunk_size=4)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    assert report == {'attempts': 6, 'changed': 6, 'answers': 12, 'chunks': 2}
+    assert len(statements) == 1 + 2 * 3 + 1 # Toplam puan, parça başına (id'ler, cevaplar, denemeler), son boş parça
+    assert {s[0] for s in _scores()} == {100}
+
+def test_queued_attempts_are_not_regraded(test_app, test_client, quiz_setup, auth_headers): #Henüz puanlanmamış kuyruk denemelerine dokunulmamalı
+    test_app.config['QUIZ_SUBMISSION_MODE'] = 'queue'
+    instructor, students, course, lesson, quiz = _setup(quiz_setup, 1)
+    questions = sorted(quiz.questions, key=lambda q: q.id)
+    test_client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/submit', headers=auth_headers(students[0]),
+                     json={'answers': [{'question_id': q.id, 'selected_option_id': q.options[0].id} for q in questions]})
+    assert regrade(quiz.id) == {'attempts': 0, 'changed': 0, 'answers': 0, 'chunks': 0}
+    assert _scores() == [(None, None, None, None)]
+
+def test_only_course_instructor_can_regrade(test_app, test_client, quiz_setup, auth_headers):
+    _, students, course, lesson, quiz = _setup(quiz_setup, 1)
+    assert _regrade(test_client, auth_headers(students[0]), course, lesson, quiz).status_code == 403
+
+def test_other_course_instructor_cannot_regrade(test_app, test_client, quiz_setup, auth_headers): #Başka kursun eğitmeni kendi kurs id'siyle bu quizi puanlayamamalı
+    _, _, _, lesson, quiz = _setup(quiz_setup, 1)
+    other = User(username='other', email='other@example.com', role='instructor', password_hash='x')
+    db.session.add(other)
+    db.session.commit()
+    own = Course(title='Başka', description='...', instructor_id=other.id)
+    db.session.add(own)
+    db.session.commit()
+    assert _regrade(test_client, auth_headers(other), own, lesson, quiz).status_code == 400
@@ -0,0 +1,54 @@
+from models import db, QuizAttempt #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+
+def _setup(quiz_setup): #Ortak quiz: 10 ve 20 puanlı iki soru ve açık uçlu soru; doğru seçenekler soruya göre adlandırılır
+    _, (student,), course, lesson, quiz = quiz_setup(points=(10, 20), short_answer=True)
+    for i, question in enumerate(sorted(quiz.questions, key=lambda q: q.id)[:2]):
+        next(o for o in question.options if o.is_correct).option_text = f'Doğru {i}'
+    db.session.commit()
+    return student, course, lesson, quiz
+
+def _submit(client, headers, course, lesson, quiz, correct):
+    questions = sorted(quiz.questions, key=lambda q: q.id)
+    answers = [{'question_id': q.id, 'selected_option_id': sorted(o.id for o in q.options)[0 if i < correct else 1]}
+               for i, q in enumerate(questions[:2])]
+    answers.append({'question_id': questions[2].id, 'text': 'cevap'})
+    response = client.post(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/submit', headers=headers, json={'answers': answers})
+    assert response.status_code == 200
+
+def _results(client, headers, course, lesson, quiz):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        response = client.get(f'/courses/{course.id}/lessons/{lesson.id}/quiz/{quiz.id}/results', headers=headers)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    assert response.status_code == 200
+    return response.json, len(statements)
+
+def test_attempt_summary_is_stored_at_grading(test_app, test_client, quiz_setup, auth_headers): #Puan, yüzde ve doğru sayısı denemeye yazılmalı
+    student, course, lesson, quiz = _setup(quiz_setup)
+    _submit(test_client, auth_headers(student), course, lesson, quiz, correct=1)
+
+    attempt = db.session.scalar(db.select(QuizAttempt))
+    assert (attempt.total_score, attempt.max_score, attempt.correct_count) == (10, 35, 1)
+    assert round(attempt.score, 2) == round(10 / 35 * 100, 2)
+
+    results, _ = _results(test_client, auth_headers(student), course, lesson, quiz)
+    result = results['results'][0]
+    assert (result['total_score'], result['max_possible_score'], result['correct_count']) == (10, 35, 1)
+    assert [a['correct_answer'] for a in result['answers']] == ['Doğru 0', 'Doğru 1', None]
+    assert [a['is_correct'] for a in result['answers']] == [True, False, False]
+
+def test_results_queries_do_not_grow_with_attempts(test_app, test_client, quiz_setup, auth_headers): #10 deneme 1 deneme kadar sorgu atmalı
+    student, course, lesson, quiz = _setup(quiz_setup)
+    _submit(test_client, auth_headers(student), course, lesson, quiz, correct=2)
+    _, single = _results(test_client, auth_headers(student), course, lesson, quiz)
+
+    for correct in range(9):
+        _submit(test_client, auth_headers(student), course, lesson, quiz, correct=correct % 3)
+    results, many = _results(test_client, auth_headers(student), course, lesson, quiz)
+    assert results['total_attempts'] == 10
+    assert all(len(r['answers']) == 3 for r in results['results'])
+    assert many == single
@@ -0,0 +1,136 @@
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Lesson, Review #models.py dosyasındaki modelleri import ediyoruz
+from sqlalchemy import event #Sorgu saymak için
+from response_cache import cache, course_tag #Paylaşımlı katmanı test katmanıyla değiştirmek için
+
+def _setup():
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    student = User(username='student', email='student@example.com', role='student', password_hash='x')
+    db.session.add_all([instructor, student])
+    db.session.commit()
+    course = Course(title='Python', description='...', category='yazilim', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    return instructor, student, course
+
+class _Queries: #Motor üzerinde çalışan sorgu sayısı
+    def __enter__(self):
+        self.count = 0
+        event.listen(db.engine, 'before_cursor_execute', self._count)
+        return self
+    def __exit__(self, *exc):
+        event.remove(db.engine, 'before_cursor_execute', self._count)
+    def _count(self, *args):
+        self.count += 1
+
+def test_hit_etag_and_304(test_app, test_client): #İkinci istek veritabanına gitmemeli, aynı ETag 304 dönmeli
+    instructor, student, course = _setup()
+    first = test_client.get(f'/courses/{course.id}/lessons')
+    assert first.status_code == 200 and first.headers['Cache-Control'] == 'public, no-cache'
+    etag = first.headers['ETag']
+
+    with _Queries() as queries:
+        again = test_client.get(f'/courses/{course.id}/lessons')
+    assert queries.count == 0 and again.get_data() == first.get_data()
+
+    not_modified = test_client.get(f'/courses/{course.id}/lessons', headers={'If-None-Match': etag})
+    assert not_modified.status_code == 304 and not_modified.get_data() == b''
+
+def test_commits_invalidate_tagged_entries(test_app, test_client): #Ders, değerlendirme ve kurs yazmaları ilgili yanıtları yenilemeli
+    instructor, student, course = _setup()
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(student.id))}'}
+    assert test_client.get(f'/courses/{course.id}/lessons').get_json() == []
+    assert test_client.get('/courses/categories').get_json() == ['yazilim']
+    detail = test_client.get(f'/courses/{course.id}', headers=headers)
+    assert detail.headers['Cache-Control'] == 'private, no-cache'
+
+    db.session.add(Lesson(title='Giriş', content='...', course_id=course.id, order=1))
+    db.session.commit()
+    assert [lesson['title'] for lesson in test_client.get(f'/courses/{course.id}/lessons').get_json()] == ['Giriş']
+
+    db.session.add(Review(course_id=course.id, user_id=student.id, rating=4, comment='...'))
+    db.session.commit()
+    assert test_client.get(f'/courses/{course.id}/reviews').get_json()['total_reviews'] == 1
+
+    course.category = 'veri'
+    db.session.commit()
+    assert test_client.get('/courses/categories').get_json() == ['veri']
+
+    instructor.username = 'hoca' # Kurs detayında eğitmen adı var
+    db.session.commit()
+    response = test_client.get(f'/courses/{course.id}', headers=headers)
+    assert response.get_json()['instructor_name'] == 'hoca'
+    assert test_client.get(f'/courses/{course.id}', headers={**headers, 'If-None-Match': detail.headers['ETag']}).status_code == 200
+
+    student.username = 'ogrenci' # Değerlendirmeyi yazanın adı değişti
+    db.session.commit()
+    assert test_client.get(f'/courses/{course.id}/reviews').get_json()['reviews'][0]['user']['username'] == 'ogrenci'
+
+def test_rollback_keeps_entries_and_auth_still_applies(test_app, test_client): #Geri alınan yazma önbelleği boşaltmamalı; JWT kontrolü önbellekten önce
+    instructor, student, course = _setup()
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(student.id))}'}
+    assert test_client.get(f'/courses/{course.id}', headers=headers).status_code == 200
+    assert test_client.get(f'/courses/{course.id}').status_code == 401
+
+    url = f'/courses/{course.id}'
+    course.title = 'Değişmeyecek'
+    db.session.flush()
+    db.session.rollback()
+    with _Queries() as queries:
+        assert test_client.get(url, headers=headers).get_json()['title'] == 'Python'
+    assert queries.count == 0
+
+class _SharedTier: #Redis yerine süreç içi paylaşımlı katman; down=True iken her çağrı bağlantı hatası verir
+    def __init__(self):
+        self.entries, self.tags, self.down = {}, {}, False
+    def _check(self):
+        if self.down:
+            raise ConnectionError('redis unreachable')
+    def versions(self, tags):
+        self._check()
+        return {tag: self.tags.get(tag, 0) for tag in tags}
+    def get(self, key):
+        self._check()
+        return self.entries.get(key)
+    def set(self, key, entry, ttl):
+        self._check()
+        self.entries[key] = entry
+    def invalidate(self, tags):
+        self._check()
+        for tag in tags:
+            self.tags[tag] = self.tags.get(tag, 0) + 1
+
+def test_unreachable_shared_tier_falls_back_to_local(test_app, test_client, monkeypatch): #Redis'e ulaşılamıyorsa yanıtlar 500 olmamalı
+    shared = _SharedTier()
+    monkeypatch.setattr(cache, 'shared', shared)
+    instructor, student, course = _setup()
+    assert test_client.get(f'/courses/{course.id}/lessons').status_code == 200
+
+    shared.down = True
+    cache.local.clear()
+    assert test_client.get(f'/courses/{course.id}/lessons').status_code == 200
+    with _Queries() as queries: # Yerel katmandan, yerel sürümlerle
+        assert test_client.get(f'/courses/{course.id}/lessons').status_code == 200
+    assert queries.count == 0
+
+    db.session.add(Lesson(title='Giriş', content='...', course_id=course.id, order=1))
+    db.session.commit() # Paylaşımlı geçersiz kılma başarısız olsa da commit ve yerel geçersiz kılma yapılır
+    assert [lesson['title'] for lesson in test_client.get(f'/courses/{course.id}/lessons').get_json()] == ['Giriş']
+
+def test_commit_in_other_worker_during_view_is_not_cached(test_app, test_client, monkeypatch): #Görünüm çalışırken başka süreçte geçersiz kılınan yanıt saklanmamalı
+    shared = _SharedTier()
+    monkeypatch.setattr(cache, 'shared', shared)
+    instructor, student, course = _setup()
+    url = f'/courses/{course.id}/lessons'
+    tag = course_tag(course.id)
+
+    def other_worker_commits(*args): # Görünümün sorgusu sırasında başka bir süreç kursu değiştirmiş gibi
+        shared.invalidate({tag})
+    event.listen(db.engine, 'before_cursor_execute', other_worker_commits, once=True)
+    assert test_client.get(url).status_code == 200
+    assert shared.entries == {} and cache.local.get(url + '?') is None
+
+    assert test_client.get(url).status_code == 200 # Sonraki istek saklanır
+    with _Queries() as queries:
+        test_client.get(url)
+    assert queries.count == 0
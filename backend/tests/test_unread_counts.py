@@ -0,0 +1,80 @@
+from sqlalchemy import event #Çalışan SQL sorgularını yakalamak için
+from flask_jwt_extended import create_access_token #Test kullanıcıları için token üretir
+from models import db, User, Course, Enrollment, Notification, UnreadCount #models.py dosyasındaki modelleri import ediyoruz
+from notification_fanout import fan_out #notification_fanout modülünü import ediyoruz
+import unread_counts #unread_counts modülünü import ediyoruz
+
+def _setup(): #Eğitmen, kurs ve kayıtlı öğrenci
+    instructor = User(username='teacher', email='teacher@example.com', role='instructor', password_hash='x')
+    student = User(username='student', email='student@example.com', role='student', password_hash='x')
+    db.session.add_all([instructor, student])
+    db.session.commit()
+    course = Course(title='Python', description='...', instructor_id=instructor.id)
+    db.session.add(course)
+    db.session.commit()
+    db.session.add(Enrollment(student_id=student.id, course_id=course.id))
+    db.session.commit()
+    return course, student
+
+def _notify(course, student, count): #ORM ile okunmamış bildirimler ekle
+    notifications = [
+        Notification(user_id=student.id, course_id=course.id, type='new_lesson', title=f'N{i}', message='...')
+        for i in range(count)
+    ]
+    db.session.add_all(notifications)
+    db.session.commit()
+    return notifications
+
+def _stored(user_id):
+    return db.session.scalar(db.select(UnreadCount.count).where(UnreadCount.user_id == user_id))
+
+def test_counter_follows_inserts_reads_and_deletes(test_app, test_client): #Sayaç her yazma yolunda güncellenmeli
+    course, student = _setup()
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(student.id))}'}
+    assert _stored(student.id) == 0 # Yeni kullanıcı sıfır sayaçla başlar
+
+    first, second, third = _notify(course, student, 3)
+    assert fan_out(course.id, 'new_quiz', 'Yeni Quiz', '...') == 1
+    assert _stored(student.id) == 4
+
+    assert test_client.put(f'/api/notifications/{first.id}/read', headers=headers).status_code == 200
+    assert test_client.delete(f'/api/notifications/{second.id}', headers=headers).status_code == 200
+    assert _stored(student.id) == 2
+
+    response = test_client.post('/courses/notifications/bulk-update', headers=headers,
+                                json={'notification_ids': [first.id], 'is_read': False})
+    assert response.status_code == 200
+    assert _stored(student.id) == 3
+
+    assert test_client.post('/courses/notifications/mark-all-read', headers=headers).status_code == 200
+    assert _stored(student.id) == 0
+
+def test_unread_count_endpoint_does_not_count(test_app, test_client): #Uç nokta COUNT sorgusu çalıştırmamalı
+    course, student = _setup()
+    _notify(course, student, 5)
+    headers = {'Authorization': f'Bearer {create_access_token(identity=str(student.id))}'}
+
+    statements = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', capture)
+    try:
+        response = test_client.get('/api/notifications/unread-count', headers=headers)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', capture)
+
+    assert response.get_json() == {'count': 5}
+    assert not [s for s in statements if 'count(' in s.lower() and 'notifications' in s]
+
+def test_reconcile_fixes_drift_and_missing_rows(test_app): #Kayan ve eksik sayaçlar düzeltilmeli
+    course, student = _setup()
+    _notify(course, student, 2)
+    db.session.execute(db.update(UnreadCount).where(UnreadCount.user_id == student.id).values(count=7))
+    db.session.execute(db.delete(UnreadCount).where(UnreadCount.user_id == course.instructor_id))
+    db.session.commit()
+
+    assert unread_counts.reconcile(fix=False) == {'checked': 2, 'mismatched': 1, 'missing': 1}
+    assert unread_counts.reconcile() == {'checked': 2, 'mismatched': 1, 'missing': 1}
+    assert unread_counts.reconcile() == {'checked': 2, 'mismatched': 0, 'missing': 0}
+    assert _stored(student.id) == 2
+    assert unread_counts.get(course.instructor_id) == 0
@@ -0,0 +1,144 @@
+from collections import defaultdict # Kullanıcı başına farkları biriktirmek için kullanılır.
+from sqlalchemy import event, inspect # SQLAlchemy oturum olayları ve nesne geçmişi için kullanılır.
+from sqlalchemy.exc import IntegrityError # Aynı anda oluşturulan sayaç satırları için kullanılır.
+from models import db, User, Notification, UnreadCount # models.py dosyasındaki modelleri import ediyoruz.
+
+def _committed(obj, attribute): # Flush öncesi veritabanındaki değer
+    history = inspect(obj).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, attribute)
+
+def _keep_old_value(target, value, oldvalue, initiator): # Sadece active_history için; değeri değiştirmez
+    pass
+
+# Süresi dolmuş bildirimde değer değişirse eski değer de yüklensin
+for attribute in (Notification.is_read, Notification.user_id):
+    event.listen(attribute, 'set', _keep_old_value, active_history=True)
+
+@event.listens_for(db.session, 'before_flush')
+def _collect_unread_deltas(session, flush_context, instances):
+    # Önceki başarısız flush'tan kalan farklar atılır
+    deltas = session.info['unread_deltas'] = defaultdict(int)
+    for obj in session.new:
+        if isinstance(obj, Notification) and not obj.is_read:
+            deltas[obj.user_id] += 1
+    for obj in session.deleted:
+        if isinstance(obj, Notification) and not _committed(obj, 'is_read'):
+            deltas[_committed(obj, 'user_id')] -= 1
+    for obj in session.dirty:
+        if not isinstance(obj, Notification):
+            continue
+        old_user, was_unread = _committed(obj, 'user_id'), not _committed(obj, 'is_read')
+        new_user, is_unread = obj.user_id, not obj.is_read
+        if (old_user, was_unread) != (new_user, is_unread):
+            deltas[old_user] -= was_unread
+            deltas[new_user] += is_unread
+
+@event.listens_for(db.session, 'after_flush')
+def _apply_unread_deltas(session, flush_context):
+    connection = session.connection()
+    # Yeni kullanıcılar sıfır sayaçla başlar; böylece okuma hep birincil anahtarla yapılır
+    new_users = [{'user_id': obj.id, 'count': 0} for obj in session.new if isinstance(obj, User)]
+    if new_users:
+        connection.execute(UnreadCount.__table__.insert(), new_users)
+
+    for user_id, amount in session.info.pop('unread_deltas', {}).items():
+        if user_id is not None and amount:
+            connection.execute(_add_statement(UnreadCount.user_id == user_id, amount))
+
+def _add_statement(criteria, amount):
+    # Satırı olmayan kullanıcı atlanır; ilk okumada sayılarak oluşturulur
+    return (
+        db.update(UnreadCount)
+        .where(criteria)
+        .values(count=UnreadCount.count + amount)
+        .execution_options(synchronize_session=False)
+    )
+
+def add(user_id, amount): # Toplu UPDATE/DELETE sonrası sayacı düzeltir
+    if amount:
+        db.session.execute(_add_statement(UnreadCount.user_id == int(user_id), amount))
+
+def add_for(user_ids, amount=1): # INSERT ... SELECT ile bildirim alan kullanıcıların sayaçları
+    """user_ids: kullanıcı id'leri veya onları döndüren SELECT"""
+    db.session.execute(_add_statement(UnreadCount.user_id.in_(user_ids), amount))
+
+def _actual(*criteria): # Okunmamış bildirimleri kullanıcıya göre sayar
+    return (
+        db.select(Notification.user_id, db.func.count())
+        .where(Notification.is_read == False, *criteria)
+        .group_by(Notification.user_id)
+    )
+
+def refresh(user_id): # Tek kullanıcının sayacını gerçek değere eşitler
+    user_id = int(user_id)
+    actual = dict(db.session.execute(_actual(Notification.user_id == user_id)).all()).get(user_id, 0)
+    db.session.execute(
+        db.update(UnreadCount)
+        .where(UnreadCount.user_id == user_id)
+        .values(count=actual)
+        .execution_options(synchronize_session=False)
+    )
+    return actual
+
+def get(user_id): # Okunmamış bildirim sayısı (birincil anahtar okuması)
+    """Sayaç satırı yoksa bir kez sayılıp oluşturulur"""
+    user_id = int(user_id)
+    stmt = db.select(UnreadCount.count).where(UnreadCount.user_id == user_id)
+    count = db.session.scalar(stmt)
+    if count is not None:
+        return max(count, 0)
+
+    actual = dict(db.session.execute(_actual(Notification.user_id == user_id)).all()).get(user_id, 0)
+    try:
+        db.session.execute(db.insert(UnreadCount).values(user_id=user_id, count=actual))
+        db.session.commit()
+    except IntegrityError: # Başka istek satırı önce oluşturdu
+        db.session.rollback()
+        return max(db.session.scalar(stmt) or 0, 0)
+    return actual
+
+def get_many(user_ids): # Birden çok kullanıcının sayaçları; satırı olmayanlar sonuçta yer almaz
+    return {
+        user_id: max(count, 0)
+        for user_id, count in db.session.execute(
+            db.select(UnreadCount.user_id, UnreadCount.count).where(UnreadCount.user_id.in_(user_ids))
+        ).all()
+    }
+
+def reconcile(chunk_size=1000, fix=True): # Sayaçları gerçek okunmamış sayılarıyla karşılaştırır
+    """Kullanıcılar id sırasıyla parça parça işlenir; eksik satırlar oluşturulur, hatalı olanlar düzeltilir"""
+    report = {'checked': 0, 'mismatched': 0, 'missing': 0}
+    last_id = 0
+    while True:
+        user_ids = db.session.scalars(
+            db.select(User.id).where(User.id > last_id).order_by(User.id).limit(chunk_size)
+        ).all()
+        if not user_ids:
+            break
+        last_id = user_ids[-1]
+
+        stored = dict(db.session.execute(
+            db.select(UnreadCount.user_id, UnreadCount.count).where(UnreadCount.user_id.in_(user_ids))
+        ).all())
+        actual = dict(db.session.execute(_actual(Notification.user_id.in_(user_ids))).all())
+
+        for user_id in user_ids:
+            report['checked'] += 1
+            count = actual.get(user_id, 0)
+            if user_id not in stored:
+                report['missing'] += 1
+                if fix:
+                    db.session.execute(db.insert(UnreadCount).values(user_id=user_id, count=count))
+            elif stored[user_id] != count:
+                report['mismatched'] += 1
+                if fix:
+                    db.session.execute(
+                        db.update(UnreadCount)
+                        .where(UnreadCount.user_id == user_id)
+                        .values(count=count)
+                        .execution_options(synchronize_session=False)
+                    )
+        db.session.commit() # Her parça ayrı işlemde kaydedilir
+    return report
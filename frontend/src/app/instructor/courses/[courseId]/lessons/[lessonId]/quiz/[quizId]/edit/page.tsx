@@ -14,9 +14,11 @@ interface QuizFormValues {  // QuizFormValues interface'i
   time_limit: number | null;
   passing_score: number;
   questions: {
+    id?: number;  // Mevcut sorunun id'si (yeni soruda yok)
     question_text: string;
     points: number;
     options: {
+      id?: number;  // Mevcut seçeneğin id'si (yeni seçenekte yok)
       option_text: string;
       is_correct: boolean;
     }[];
@@ -32,9 +34,11 @@ const quizSchema = z.object({  // Quiz şeması
   ),
   passing_score: z.number().min(0).max(100),  // Passing score alanı
   questions: z.array(z.object({
+    id: z.number().optional(),
     question_text: z.string().min(1, 'Soru metni gereklidir'),
     points: z.number().min(1, 'Puan 1 veya daha büyük olmalıdır'),
     options: z.array(z.object({
+      id: z.number().optional(),
       option_text: z.string().min(1, 'Seçenek metni gereklidir'),
       is_correct: z.boolean()
     })).min(2, 'En az 2 seçenek gereklidir')
@@ -96,9 +100,11 @@ export default function EditQuizPage() {  // EditQuizPage componenti
           time_limit: quizData.time_limit,  // Time limit alanının değeri
           passing_score: quizData.passing_score,  // Passing score alanının değeri
           questions: quizData.questions.map((question: QuizQuestion) => ({  // QuizQuestion tipini kullan
+            id: question.id,  // Güncellemede soru id ile eşleşir
             question_text: question.question_text,  // Question text alanının değeri
             points: question.points,  // Points alanının değeri
             options: question.options.map(option => ({  // Option tipini kullan
+              id: option.id,  // Güncellemede seçenek id ile eşleşir
               option_text: option.option_text,  // Option text alanının değeri
               is_correct: option.is_correct  // Is correct alanının değeri
             }))
@@ -146,6 +152,7 @@ export default function EditQuizPage() {  // EditQuizPage componenti
         questions: data.questions.map(question => ({  // Question tipini kullan
           ...question,  // Question tipini kullan
           options: question.options.map(option => ({  // Option tipini kullan
+            id: option.id,
             text: option.option_text,  // Option text alanının değeri
             is_correct: option.is_correct  // Is correct alanının değeri
           }))
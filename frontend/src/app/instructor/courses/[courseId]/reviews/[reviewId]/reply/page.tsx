@@ -40,8 +40,7 @@ export default function ReviewReplyPage() {  // ReviewReplyPage componenti
         }
         
         // Değerlendirme verilerini yükle
-        const reviewsResponse = await reviewsApi.getCourseReviews(Number(courseId));  // Reviews API'sini kullanarak course'a ait değerlendirme verilerini al
-        const reviewData = reviewsResponse.reviews.find(r => r.id === Number(reviewId));  // ReviewData state'ini set et
+        const reviewData = await reviewsApi.findCourseReview(Number(courseId), Number(reviewId));  // Reviews API'sini kullanarak değerlendirmeyi bul
         
         if (!reviewData) {  // ReviewData yoksa
           setError('Değerlendirme bulunamadı');  // Error state'ini set et
@@ -13,6 +13,7 @@ export default function CourseReviewsPage() {  // CourseReviewsPage componenti
   const [reviewsData, setReviewsData] = useState<CourseReviewsResponse | null>(null);  // ReviewsData state'ini kontrol et
   const [loading, setLoading] = useState(true);  // Loading durumunu kontrol et
   const [error, setError] = useState<string | null>(null);  // Error state'ini kontrol et
+  const [loadingMore, setLoadingMore] = useState(false);  // loadingMore state'ini kontrol et
 
   useEffect(() => {  // useEffect hook'u ile component mount edildiğinde veya dependency değiştiğinde çalışır
     // Veri yükleme
@@ -38,6 +39,21 @@ export default function CourseReviewsPage() {  // CourseReviewsPage componenti
     fetchData();  // fetchData fonksiyonunu çağır
   }, [courseId]);  // courseId değiştiğinde çalışır
 
+  const loadMore = async () => {  // Sonraki değerlendirme sayfasını listeye ekle
+    if (!reviewsData?.next_cursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await reviewsApi.getCourseReviews(Number(courseId), { cursor: reviewsData.next_cursor });
+      setReviewsData((current) =>
+        current ? { ...page, reviews: [...current.reviews, ...page.reviews] } : page
+      );
+    } catch (err) {
+      console.error('Error loading more reviews:', err);  // Hata mesajını konsola yazdır
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Format time ago function
   const formatTimeAgo = (dateString: string) => {  // formatTimeAgo fonksiyonu
     const date = new Date(dateString);  // Date objesini oluştur
@@ -162,6 +178,18 @@ export default function CourseReviewsPage() {  // CourseReviewsPage componenti
               )}
             </div>
           ))}
+
+          {reviewsData.next_cursor && (
+            <div className="flex justify-center">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 disabled:opacity-50"
+              >
+                {loadingMore ? 'Yükleniyor...' : 'Daha Fazla Yükle'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -4,7 +4,6 @@ import { useState, useEffect } from 'react';  // Client-side rendering için dir
 import { coursesApi, Course } from '@/lib/api/courses';  // coursesApi hook'u içe aktar
 import { toast } from 'react-hot-toast';  // toast hook'u içe aktar
 import Link from 'next/link';  // Link için
-import api from '@/lib/api';  // api hook'u içe aktar
 
 interface InstructorCourse extends Course {  // InstructorCourse interface'i
   student_count: number;
@@ -22,6 +21,19 @@ const stripHtmlTags = (html: string) => {  // stripHtmlTags fonksiyonu
   return tmp.textContent || tmp.innerText || '';  // tmp objesinin textContent veya innerText'ini dön
 };
 
+// Kurslara varsayılan istatistikleri ekler; puan ve son güncellenme kurs listesiyle birlikte gelir
+const addCourseDetails = (allCourses: Course[]): InstructorCourse[] =>
+  allCourses.map((course) => ({
+    ...course,  // course objesini dön
+    // Kayıt verileri doğrudan bir endpoint aracılığıyla alınamaz, bu yüzden varsayılan değerler kullanılır
+    student_count: 0,
+    average_rating: course.average_rating || 0,
+    completion_rate: 0,
+    revenue: 0,
+    last_updated: course.updated_at || course.created_at,
+    published: true
+  }));
+
 export default function InstructorCoursesPage() {  // InstructorCoursesPage componenti
   const [courses, setCourses] = useState<InstructorCourse[]>([]);  // courses state'ini kontrol et
   const [loading, setLoading] = useState(true);  // loading state'ini kontrol et
@@ -30,54 +42,20 @@ export default function InstructorCoursesPage() {  // InstructorCoursesPage comp
   const [sortOrder, setSortOrder] = useState<'asc' | 'desc'>('desc');  // sortOrder state'ini kontrol et
   const [filterStatus, setFilterStatus] = useState<string>('all');  // filterStatus state'ini kontrol et
   const [searchQuery, setSearchQuery] = useState<string>('');  // searchQuery state'ini kontrol et
+  const [nextCursor, setNextCursor] = useState<string | null>(null);  // Sonraki kurs sayfasının imleci
+  const [loadingMore, setLoadingMore] = useState(false);  // loadingMore state'ini kontrol et
 
   useEffect(() => {  // useEffect hook'u ile component mount edildiğinde veya dependency değiştiğinde çalışır
     async function fetchCourses() {  // fetchCourses fonksiyonu
       try {  // Try bloğu
         setLoading(true);  // loading state'ini true yap
         
-        // Tüm kursları al
-        const allCourses = await coursesApi.getAllCourses();
-        
-        // Her kurs için detayları al
-        const detailedCourses = await Promise.all(
-          allCourses.map(async (course) => {
-            try {
-              // Kurs değerlendirmelerini al
-              const reviewsResponse = await api.get(`/courses/${course.id}/reviews`);  // api hook'u içe aktar
-              const reviewsData = reviewsResponse.data;  // reviewsResponse objesinin data'sını al
-              
-              // Kayıt verileri doğrudan bir endpoint aracılığıyla alınamaz, bu yüzden varsayılan değerler kullanılır
-              const enrollmentData = {
-                total_students: 0,
-                average_completion: 0
-              };
-              
-              return {
-                ...course,  // course objesini dön
-                student_count: enrollmentData?.total_students || 0, 
-                average_rating: reviewsData?.average_rating || 0,
-                completion_rate: enrollmentData?.average_completion || 0,
-                revenue: 0,
-                last_updated: course.updated_at || course.created_at,
-                published: true
-              };
-            } catch (err) {
-              console.error(`Error fetching details for course ${course.id}:`, err);  // Hata mesajını konsola yazdır
-              return {
-                ...course,  // course objesini dön
-                student_count: 0, 
-                average_rating: 0, 
-                completion_rate: 0,
-                revenue: 0,
-                last_updated: course.updated_at || course.created_at,
-                published: true
-              };
-            }
-          })
-        );
+        // Kursların ilk sayfasını al; devamı "Daha Fazla Yükle" ile istenir
+        const page = await coursesApi.getAllCourses();
+        const detailedCourses = addCourseDetails(page.courses);
         
         setCourses(detailedCourses);  // detailedCourses objesini set et 
+        setNextCursor(page.next_cursor);  // Sonraki sayfanın imleci
       } catch (err) {  // Hata durumunda
         console.error('Error fetching courses:', err);  // Hata mesajını konsola yazdır
         setError('Kurslar yüklenirken bir hata oluştu.');  // error state'ini set et
@@ -101,6 +79,22 @@ export default function InstructorCoursesPage() {  // InstructorCoursesPage comp
     };  // return bloğu
   }, []);  // useEffect hook'u ile component mount edildiğinde veya dependency değiştiğinde çalışır
 
+  const loadMore = async () => {  // Sonraki kurs sayfasını listeye ekle
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await coursesApi.getAllCourses(nextCursor);
+      const detailedCourses = addCourseDetails(page.courses);
+      setCourses((current) => [...current, ...detailedCourses]);
+      setNextCursor(page.next_cursor);
+    } catch (err) {
+      console.error('Error fetching more courses:', err);
+      toast.error('Kurslar yüklenirken bir hata oluştu.');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Sıralama işlevi
   const sortCourses = (a: InstructorCourse, b: InstructorCourse) => {  // sortCourses fonksiyonu
     if (sortBy === 'title') {  // sortBy 'title' ise
@@ -368,6 +362,17 @@ export default function InstructorCoursesPage() {  // InstructorCoursesPage comp
               </tbody>
             </table>
           </div>
+          {nextCursor && (
+            <div className="flex justify-center p-4 border-t border-gray-200">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="bg-blue-600 text-white py-2 px-4 rounded-md hover:bg-blue-700 disabled:opacity-50"
+              >
+                {loadingMore ? 'Yükleniyor...' : 'Daha Fazla Yükle'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -6,7 +6,6 @@ import { coursesApi, Course } from '@/lib/api/courses'; //coursesApi ve Course i
 import { instructorsApi } from '@/lib/api/instructors'; //instructorsApi için
 import { toast } from 'react-hot-toast'; //toast için
 import Link from 'next/link'; //Link için
-import api from '@/lib/axios'; //api için
 import LoadingSpinner from '@/components/ui/LoadingSpinner'; //LoadingSpinner için
 
 interface DashboardStats { //DashboardStats için
@@ -38,55 +37,29 @@ export default function InstructorDashboard() {
         setLoading(true); //loading için
         
         // Eğitmen kurslarını al
-        const coursesResponse = await coursesApi.getAllCourses(); //coursesResponse için
+        const coursesResponse = (await coursesApi.getAllCourses()).courses; //Panelde yalnızca ilk sayfa gösterilir
         
         // Öğrenci istatistiklerini al
         const studentStats = await instructorsApi.getStudentStats(); //studentStats için
         
-        // Kurs değerlendirmelerini ve bilgilerini al
-        const coursesWithDetails = await Promise.all(
-          coursesResponse.map(async (course) => {
-            try {
-              // Kurs değerlendirmelerini al - backend API'yi doğrudan kullan
-              const reviewsResponse = await api.get(`/courses/${course.id}/reviews`);
-              const reviewsData = reviewsResponse.data;
-              
-              return {
-                ...course,
-                student_count: 0, // Öğrenci sayısı istatistiklerden alınacak
-                reviews_count: reviewsData.total_reviews || 0, 
-                average_rating: reviewsData.average_rating || 0,
-                completion_rate: 0 // Tamamlanma oranı istatistiklerden alınacak
-              };
-            } catch (error) {
-              console.error(`Error fetching details for course ${course.id}:`, error);
-              return {
-                ...course,
-                student_count: 0,
-                reviews_count: 0,
-                average_rating: 0,
-                completion_rate: 0
-              };
-            }
-          })
-        );
+        // Puan ve değerlendirme sayısı kurs listesiyle birlikte gelir; kurs başına ayrı istek yapılmaz
+        const coursesWithDetails = coursesResponse.map((course) => ({
+          ...course,
+          student_count: 0, // Öğrenci sayısı istatistiklerden alınacak
+          reviews_count: course.review_count || 0,
+          average_rating: course.average_rating || 0,
+          completion_rate: 0 // Tamamlanma oranı istatistiklerden alınacak
+        }));
         
         setCourses(coursesWithDetails); //coursesWithDetails için
         
-        // İstatistikleri hesapla
-        if (coursesWithDetails.length > 0 && studentStats) { //coursesWithDetails.length > 0 && studentStats için
-          // Değerlendirmelerin toplamını hesapla
-          const totalReviews = coursesWithDetails.reduce((sum, course) => sum + (course.reviews_count || 0), 0); //totalReviews için
-          
-          // Kursların ortalama puanını hesapla
-          const totalRating = coursesWithDetails.reduce((sum, course) => sum + (course.average_rating || 0), 0);
-          const averageRating = totalRating / coursesWithDetails.length || 0; 
-          
+        // Toplamlar sunucudaki eğitmen istatistiklerinden (tüm kurslar üzerinden) gelir
+        if (studentStats) { //studentStats için
           setStats({
-            totalCourses: coursesWithDetails.length,
+            totalCourses: studentStats.total_courses,
             totalStudents: studentStats.total_students,
-            totalReviews,
-            averageRating,
+            totalReviews: studentStats.total_reviews,
+            averageRating: studentStats.average_rating,
             totalCompletionRate: studentStats.average_course_completion,
             recentEnrollments: studentStats.completions_this_month
           });
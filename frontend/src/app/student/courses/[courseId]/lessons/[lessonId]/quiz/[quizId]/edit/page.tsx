@@ -14,9 +14,11 @@ interface QuizFormValues { //QuizFormValues için
   time_limit: number | null; //time_limit için
   passing_score: number; //passing_score için
   questions: { //questions için
+    id?: number;  // Mevcut sorunun id'si (yeni soruda yok)
     question_text: string; //question_text için
     points: number; //points için
     options: { //options için
+      id?: number;  // Mevcut seçeneğin id'si (yeni seçenekte yok)
       option_text: string; //option_text için
       is_correct: boolean; //is_correct için
     }[];
@@ -33,9 +35,11 @@ const quizSchema = z.object({ //quizSchema için
   ),
   passing_score: z.number().min(0).max(100), //passing_score için
   questions: z.array(z.object({ //questions için
+    id: z.number().optional(),
     question_text: z.string().min(1, 'Soru metni gereklidir'), //question_text için
     points: z.number().min(1, 'Puan 1 veya daha büyük olmalıdır'), //points için
     options: z.array(z.object({ //options için
+      id: z.number().optional(),
       option_text: z.string().min(1, 'Seçenek metni gereklidir'), //option_text için
       is_correct: z.boolean() //is_correct için
     })).min(2, 'En az 2 seçenek gereklidir') //min için
@@ -97,9 +101,11 @@ export default function EditQuizPage() { //EditQuizPage için
           time_limit: quizData.time_limit,
           passing_score: quizData.passing_score,
           questions: quizData.questions.map((question: QuizQuestion) => ({
+            id: question.id,  // Güncellemede soru id ile eşleşir
             question_text: question.question_text,
             points: question.points,
             options: question.options.map(option => ({
+              id: option.id,  // Güncellemede seçenek id ile eşleşir
               option_text: option.option_text,
               is_correct: option.is_correct
             }))
@@ -148,6 +154,7 @@ export default function EditQuizPage() { //EditQuizPage için
         questions: data.questions.map(question => ({
           ...question,
           options: question.options.map(option => ({
+            id: option.id,
             text: option.option_text,
             is_correct: option.is_correct
           }))
@@ -40,8 +40,7 @@ export default function ReviewReplyPage() {
         }
         
         // Değerlendirme verilerini yükle
-        const reviewsResponse = await reviewsApi.getCourseReviews(Number(courseId));
-        const reviewData = reviewsResponse.reviews.find(r => r.id === Number(reviewId));
+        const reviewData = await reviewsApi.findCourseReview(Number(courseId), Number(reviewId));
         
         if (!reviewData) {
           setError('Değerlendirme bulunamadı');
@@ -18,6 +18,7 @@ export default function CourseReviewsPage() {
   const [reviewsData, setReviewsData] = useState<CourseReviewsResponse | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     // Veri yükleme
@@ -43,6 +44,23 @@ export default function CourseReviewsPage() {
     fetchData();
   }, [courseId]);
 
+  // Sonraki değerlendirme sayfasını listeye ekle
+  const loadMore = async () => {
+    if (!reviewsData?.next_cursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await reviewsApi.getCourseReviews(Number(courseId), { cursor: reviewsData.next_cursor });
+      setReviewsData((current) =>
+        current ? { ...page, reviews: [...current.reviews, ...page.reviews] } : page
+      );
+    } catch (err) {
+      console.error('Error loading more reviews:', err);
+      toast.error('Değerlendirmeler yüklenirken bir hata oluştu');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDeleteReview = async (reviewId: number) => {
     if (!user) {
       toast.error('Bu işlemi gerçekleştirmek için giriş yapmalısınız');
@@ -234,6 +252,18 @@ export default function CourseReviewsPage() {
               )}
             </div>
           ))}
+
+          {reviewsData?.next_cursor && (
+            <div className="flex justify-center">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 disabled:opacity-50"
+              >
+                {loadingMore ? 'Yükleniyor...' : 'Daha Fazla Yükle'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
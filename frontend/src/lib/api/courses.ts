@@ -13,6 +13,13 @@ export interface CourseSearchParams { // CourseSearchParams interface'i oluştur
   per_page?: number;
 }
 
+const COURSE_LIST_FIELDS = 'id,title,description,created_at,updated_at,review_count,average_rating'; // Eğitmen kurs listesi ve panelinin kullandığı kolonlar
+
+export interface CourseListPage { // İmleçli kurs listesinin bir sayfası
+  courses: Course[];
+  next_cursor: string | null;
+}
+
 export interface Course { // Course interface'i oluşturduk
   id: number;
   title: string;
@@ -26,6 +33,7 @@ export interface Course { // Course interface'i oluşturduk
   created_at: string;
   updated_at?: string;
   average_rating?: number;
+  review_count?: number;
   duration?: string;
 }
 
@@ -65,6 +73,26 @@ export interface Lesson { // Lesson interface'i oluşturduk
   document_count?: number;
   quiz_count?: number; 
   assignment_count?: number;
+}
+
+export interface CoursePage { // /courses/{id}/page yanıtı: kurs sayfasının tüm verisi tek istekte
+  course: Course;
+  instructor: { id: number; username: string; bio?: string; expertise?: string } | null;
+  lessons: {
+    id: number;
+    title: string;
+    order: number;
+    has_video: boolean;
+    created_at: string | null;
+    document_count: number;
+    quiz_count: number;
+    assignment_count: number;
+    completed: boolean;
+    completed_at: string | null;
+  }[];
+  reviews: { average_rating: number; total_reviews: number; latest: unknown[] };
+  enrollment: { is_enrolled: boolean; enrolled_at: string | null };
+  progress: { completed_lessons: number; total_progress: number } | null;
 } 
 
 export const coursesApi = { // coursesApi objesi oluşturduk
@@ -122,6 +150,11 @@ export const coursesApi = { // coursesApi objesi oluşturduk
     return response.data;
   },
 
+  getCoursePage: async (courseId: number): Promise<CoursePage> => { // getCoursePage fonksiyonu oluşturduk
+    const response = await api.get(`/courses/${courseId}/page`);
+    return response.data;
+  },
+
   enrollInCourse: async (courseId: number): Promise<CourseEnrollment> => { // enrollInCourse fonksiyonu oluşturduk
     const response = await api.post(`/courses/${courseId}/enroll`);
     return response.data;
@@ -149,9 +182,12 @@ export const coursesApi = { // coursesApi objesi oluşturduk
     return response.data;
   },
 
-  getAllCourses: async (): Promise<Course[]> => { // getAllCourses fonksiyonu oluşturduk
-    const response = await api.get('/courses');
-    return response.data;
+  getAllCourses: async (cursor: string | null = null, limit: number = 20): Promise<CourseListPage> => { // getAllCourses fonksiyonu oluşturduk
+    // Tek sayfa döner; devamı için çağıran next_cursor ile yeniden ister. Sadece listede kullanılan kolonlar okunur
+    const response = await api.get('/courses', {
+      params: { limit, fields: COURSE_LIST_FIELDS, ...(cursor ? { cursor } : {}) }
+    });
+    return { courses: response.data.courses, next_cursor: response.data.next_cursor };
   },
 
   getCourseLessons: async (courseId: number): Promise<Lesson[]> => { // getCourseLessons fonksiyonu oluşturduk
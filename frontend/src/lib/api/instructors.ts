@@ -23,6 +23,9 @@ export interface StudentStats { // StudentStats interface'i oluşturduk
   active_students: number;
   completions_this_month: number;
   average_course_completion: number;
+  total_courses: number; // Eğitmenin tüm kursları (sayfalamadan bağımsız)
+  total_reviews: number;
+  average_rating: number;
 }
 
 export interface StudentProgress { // StudentProgress interface'i oluşturduk
@@ -21,6 +21,7 @@ export interface ApiQuizResults { // ApiQuizResults interface'i oluşturduk
     total_score: number;
     max_possible_score: number;
     percentage: number;
+    correct_count: number;
     answers: Array<{
       question_text: string;
       your_answer: string;
@@ -33,6 +34,47 @@ export interface ApiQuizResults { // ApiQuizResults interface'i oluşturduk
   }>;
 }
 
+export interface QuizAttemptStatus { // Kuyruktaki teslimin durumu
+  attempt: {
+    id: number;
+    status: 'queued' | 'processing' | 'graded' | 'failed' | 'in_progress';
+    score: number | null;
+    correct_count?: number;
+    started_at: string | null;
+    completed_at: string | null;
+    error?: string;
+  };
+}
+
+export interface QuizAnalytics { // Eğitmen için soru analizi
+  quiz_id: number;
+  attempts: number;
+  computed_at: string;
+  questions: Array<{
+    id: number;
+    text: string;
+    question_type: string;
+    points: number;
+    p_value: number | null; // Doğru cevaplanma oranı
+    discrimination: number | null; // Nokta-çift serili korelasyon
+    unanswered_rate: number | null;
+    options: Array<{ id: number; text: string; is_correct: boolean; rate: number | null }>;
+    flags: Array<'hard' | 'easy' | 'low_discrimination' | 'misleading_distractor'>;
+  }>;
+  score_distribution: {
+    bins: Array<{ min: number; max: number; count: number }>;
+    mean: number | null;
+    median: number | null;
+    std: number | null;
+    p25: number | null;
+    p75: number | null;
+  };
+}
+
+const ATTEMPT_POLL_INITIAL_MS = 2000; // Kuyruktaki teslim için ilk yoklama beklemesi; her denemede iki katına çıkar
+const ATTEMPT_POLL_MAX_MS = 16000; // En uzun yoklama beklemesi
+const ATTEMPT_POLL_LIMIT = 6; // En fazla yoklama sayısı (toplam ~1 dakika)
+
 export const quizApi = { // quizApi objesi oluşturduk
   // Quiz detaylarını getir
   getQuiz: async (courseId: number, lessonId: number, quizId: number): Promise<Quiz | ApiErrorResponse> => {
@@ -89,11 +131,45 @@ export const quizApi = { // quizApi objesi oluşturduk
   },
 
   // Quiz'i çöz
-  submitQuiz: async (courseId: number, lessonId: number, quizId: number, answers: any): Promise<QuizAttempt> => { // submitQuiz fonksiyonu oluşturduk
+  submitQuiz: async (courseId: number, lessonId: number, quizId: number, answers: any): Promise<QuizAttempt | QuizAttemptStatus> => { // submitQuiz fonksiyonu oluşturduk
     const response = await api.post(
       `/courses/${courseId}/lessons/${lessonId}/quiz/${quizId}/submit`,
       { answers }
     );
+    if (response.status !== 202) {
+      return response.data;
+    }
+    // Kuyruk modu: teslim alındı, puanlanana kadar deneme durumu artan aralıklarla yoklanır.
+    // Süre sonunda tüm sınıf aynı anda teslim eder; sabit aralık ve rastgele sapma olmadan yoklamalar da aynı anda gelirdi
+    const attemptId = response.data.attempt.id;
+    let delay = ATTEMPT_POLL_INITIAL_MS;
+    for (let i = 0; i < ATTEMPT_POLL_LIMIT; i++) {
+      const wait = delay / 2 + Math.random() * delay / 2;
+      await new Promise((resolve) => setTimeout(resolve, wait));
+      delay = Math.min(delay * 2, ATTEMPT_POLL_MAX_MS);
+      const status = await quizApi.getAttemptStatus(courseId, lessonId, quizId, attemptId);
+      if (status.attempt.status === 'graded' || status.attempt.status === 'failed') {
+        return status;
+      }
+    }
+    return response.data; // Puanlama gecikti; sonuç sayfası hazır olduğunda gösterir
+  },
+
+  // Deneme durumunu getir (kuyruktaki teslimler için)
+  getAttemptStatus: async (courseId: number, lessonId: number, quizId: number, attemptId: number): Promise<QuizAttemptStatus> => {
+    const response = await api.get(`/courses/${courseId}/lessons/${lessonId}/quiz/${quizId}/attempts/${attemptId}`);
+    return response.data;
+  },
+
+  // Quiz soru analizini getir (eğitmen)
+  getQuizAnalytics: async (courseId: number, lessonId: number, quizId: number): Promise<QuizAnalytics> => {
+    const response = await api.get(`/courses/${courseId}/lessons/${lessonId}/quiz/${quizId}/analytics`);
+    return response.data;
+  },
+
+  // Cevap anahtarı düzeltildikten sonra denemeleri yeniden puanla (eğitmen)
+  regradeQuiz: async (courseId: number, lessonId: number, quizId: number): Promise<{ message: string; attempts: number; changed: number; answers: number; chunks: number }> => {
+    const response = await api.post(`/courses/${courseId}/lessons/${lessonId}/quiz/${quizId}/regrade`);
     return response.data;
   },
 
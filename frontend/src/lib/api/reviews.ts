@@ -17,7 +17,10 @@ export interface CourseReviewsResponse { // CourseReviewsResponse interface'i ol
   course_id: number;
   average_rating: number;
   total_reviews: number;
+  rating_histogram: Record<string, number>; // Puan (1-5) -> değerlendirme sayısı
   reviews: Review[];
+  next_cursor: string | null; // Sonraki sayfa için cursor parametresi
+  limit: number;
 }
 
 export interface CreateReviewData { // CreateReviewData interface'i oluşturduk
@@ -31,9 +34,9 @@ export interface ReplyData { // ReplyData interface'i oluşturduk
 
 export const reviewsApi = { // reviewsApi objesi oluşturduk
   // Kurs değerlendirmelerini getir
-  getCourseReviews: async (courseId: number): Promise<CourseReviewsResponse> => { // getCourseReviews fonksiyonu oluşturduk
+  getCourseReviews: async (courseId: number, params?: { limit?: number; cursor?: string }): Promise<CourseReviewsResponse> => { // getCourseReviews fonksiyonu oluşturduk
     try {
-      const response = await api.get(`/courses/${courseId}/reviews`);
+      const response = await api.get(`/courses/${courseId}/reviews`, { params });
       return response.data;
     } catch (error) {
       console.error('Error fetching course reviews:', error);
@@ -41,6 +44,18 @@ export const reviewsApi = { // reviewsApi objesi oluşturduk
     }
   },
 
+  // Tek bir değerlendirmeyi bul (değerlendirmeler sayfalı olduğundan sayfalar sırayla taranır)
+  findCourseReview: async (courseId: number, reviewId: number): Promise<Review | null> => { // findCourseReview fonksiyonu oluşturduk
+    let cursor: string | undefined;
+    do {
+      const page = await reviewsApi.getCourseReviews(courseId, { limit: 100, cursor });
+      const review = page.reviews.find(r => r.id === reviewId);
+      if (review) return review;
+      cursor = page.next_cursor ?? undefined;
+    } while (cursor);
+    return null;
+  },
+
   // Yeni değerlendirme oluştur
   createReview: async (courseId: number, reviewData: CreateReviewData): Promise<Review> => { // createReview fonksiyonu oluşturduk
     try {